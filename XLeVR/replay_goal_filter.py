@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Replay benchmark of the VR goal filter (xlevr/inputs/goal_filter.py).
+
+Replays a recorded VR session (set `record_goals_path` in XLeVRConfig to record one) at the
+robot command rate, the way the teleoperation reads the goal mailbox, and compares the raw
+goals with the filtered and extrapolated ones:
+  - jitter: RMS acceleration of the commanded positions
+  - error: distance of the commanded positions to the (smoothed) recorded trajectory at command execution,
+    the trajectory being timed by the sampling times of the goals rather than their jittered arrival
+  - cost: time per filter call
+
+Usage:
+    python replay_goal_filter.py --recording vr_session.jsonl --command-latency 0.03
+    python replay_goal_filter.py --synthetic  # Synthetic session with Wi-Fi like jitter
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from xlevr.inputs.base import ControlGoal
+from xlevr.inputs.goal_filter import GoalFilter, OneEuroConfig, load_goal_recording, sample_time
+
+
+def synthetic_session(duration_s=20.0, rate_hz=72.0, noise_m=0.001, seed=0):
+    """Two controllers moving smoothly, received with tracking noise and network jitter.
+
+    The goals are posted at their arrival time (`timestamp`) and carry their true sampling time
+    (`source_timestamp`), as the VR server maps the browser timestamps of the packets.
+    """
+    rng = np.random.default_rng(seed)
+    goals = []
+    sample_times = np.arange(0.0, duration_s, 1.0 / rate_hz)
+    for arm, phase in (("left", 0.0), ("right", 1.0)):
+        # Bursty delivery: packets are delayed by 0-40 ms, and never overtake each other
+        arrival = np.maximum.accumulate(sample_times + rng.exponential(0.01, len(sample_times)).clip(0, 0.04))
+        for t, received in zip(sample_times, arrival):
+            position = 0.1 * np.array([np.sin(0.8 * t + phase), 0.5 * np.sin(1.3 * t + phase), np.cos(0.6 * t)])
+            goals.append(ControlGoal(
+                arm=arm,
+                target_position=position + rng.normal(0.0, noise_m, 3),
+                wrist_roll_deg=20.0 * np.sin(0.5 * t + phase) + rng.normal(0.0, 0.5),
+                wrist_flex_deg=10.0 * np.cos(0.7 * t) + rng.normal(0.0, 0.5),
+                metadata={},
+                timestamp=float(received),
+                source_timestamp=float(t),
+            ))
+    goals.sort(key=lambda goal: goal.timestamp)
+    for sequence, goal in enumerate(goals, start=1):
+        goal.sequence = sequence
+    return goals
+
+
+def replay(goals, goal_filter, command_rate_hz, command_latency_s):
+    """Commanded positions per arm for the raw and the filtered goals, and the filter call times."""
+    start, end = goals[0].timestamp, goals[-1].timestamp
+    ticks = np.arange(start, end, 1.0 / command_rate_hz)
+    latest = {}
+    raw = {arm: [] for arm in ("left", "right")}
+    filtered = {arm: [] for arm in ("left", "right")}
+    call_times = []
+    next_goal = 0
+    for tick in ticks:
+        while next_goal < len(goals) and goals[next_goal].timestamp <= tick:
+            latest[goals[next_goal].arm] = goals[next_goal]
+            next_goal += 1
+
+        before = time.perf_counter()
+        commanded = goal_filter(latest, tick + command_latency_s)
+        call_times.append(time.perf_counter() - before)
+
+        for arm in raw:
+            if arm in latest:
+                raw[arm].append((tick, latest[arm].target_position))
+                filtered[arm].append((tick, commanded[arm].target_position))
+    return raw, filtered, np.array(call_times)
+
+
+def trajectory(goals, arm, window=7):
+    """Reference trajectory of an arm: its recorded positions by sampling time, smoothed by a centered moving average.
+
+    The goals are timed by their sender sampling times, or by their arrival times for recordings without them.
+    The centered average sees the future samples, which no causal filter can, so it removes the tracking
+    noise without lag. Duplicated timestamps are merged.
+    """
+    times = np.array([sample_time(goal) for goal in goals if goal.arm == arm])
+    positions = np.array([goal.target_position for goal in goals if goal.arm == arm])
+    times, index = np.unique(times, return_index=True)
+    positions = positions[index]
+    kernel = np.ones(window) / window
+    padded = np.pad(positions, ((window // 2, window // 2), (0, 0)), mode="edge")
+    smoothed = np.stack([np.convolve(padded[:, k], kernel, mode="valid") for k in range(3)], axis=1)
+    return times, smoothed
+
+
+def metrics(commands, goals, arm, command_latency_s):
+    """RMS acceleration (m/s^2) and mean error (mm) of the commands of an arm."""
+    ticks = np.array([t for t, _ in commands])
+    positions = np.array([p for _, p in commands])
+    dt = np.diff(ticks).mean()
+    acceleration = np.diff(positions, n=2, axis=0) / dt**2
+    rms_acceleration = np.sqrt((np.linalg.norm(acceleration, axis=1) ** 2).mean())
+
+    times, recorded = trajectory(goals, arm)
+    execution = ticks + command_latency_s
+    valid = execution <= times[-1]
+    reference = np.stack([np.interp(execution[valid], times, recorded[:, k]) for k in range(3)], axis=1)
+    error_mm = 1000.0 * np.linalg.norm(positions[valid] - reference, axis=1).mean()
+    return rms_acceleration, error_mm
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recording", help="JSON Lines goal recording of a VR session")
+    parser.add_argument("--synthetic", action="store_true", help="Replay a synthetic session instead")
+    parser.add_argument("--command-rate", type=float, default=60.0, help="Robot command rate (Hz)")
+    parser.add_argument("--command-latency", type=float, default=0.0, help="Delay until a command is executed (s)")
+    parser.add_argument("--min-cutoff", type=float, default=OneEuroConfig.min_cutoff)
+    parser.add_argument("--beta", type=float, default=OneEuroConfig.beta)
+    parser.add_argument("--d-cutoff", type=float, default=OneEuroConfig.d_cutoff)
+    parser.add_argument("--max-prediction", type=float, default=OneEuroConfig.max_prediction_s)
+    args = parser.parse_args()
+
+    if args.recording:
+        goals = load_goal_recording(args.recording)
+    elif args.synthetic:
+        goals = synthetic_session()
+    else:
+        parser.error("Pass --recording or --synthetic")
+    if not goals:
+        parser.error("The recording has no goals")
+
+    config = OneEuroConfig(args.min_cutoff, args.beta, args.d_cutoff, args.max_prediction)
+    goal_filter = GoalFilter({"left": config, "right": config, "headset": config})
+    raw, filtered, call_times = replay(goals, goal_filter, args.command_rate, args.command_latency)
+
+    duration = goals[-1].timestamp - goals[0].timestamp
+    print(f"Replayed {len(goals)} goals over {duration:.1f} s at {args.command_rate:.0f} Hz, "
+          f"command latency {1000 * args.command_latency:.0f} ms")
+    print(f"Filter call: {1e6 * np.median(call_times):.1f} us median, {1e6 * np.percentile(call_times, 99):.1f} us p99")
+    for arm in raw:
+        if len(raw[arm]) < 3:
+            continue
+        raw_acceleration, raw_error = metrics(raw[arm], goals, arm, args.command_latency)
+        acceleration, error = metrics(filtered[arm], goals, arm, args.command_latency)
+        print(f"[{arm}] jitter (RMS acceleration): raw {raw_acceleration:.2f} m/s^2, filtered {acceleration:.2f} m/s^2")
+        print(f"[{arm}] error at execution: raw {raw_error:.2f} mm, filtered {error:.2f} mm")
+
+
+if __name__ == "__main__":
+    main()
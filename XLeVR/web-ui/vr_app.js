@@ -135,6 +135,54 @@ AFRAME.registerComponent('controller-updater', {
       }
     };
 
+    // --- Binary telemetry packets ---
+    // Same layout as VR_PACKET_DTYPE in xlevr/inputs/vr_ws_server.py, little-endian float32 fields.
+    // Open the page with ?telemetry=json to send the readable JSON messages instead, for debugging.
+    this.useBinaryTelemetry = new URLSearchParams(window.location.search).get('telemetry') !== 'json';
+    this.telemetryView = new DataView(new ArrayBuffer(164));
+    const BUTTON_BITS = ['a', 'b', 'squeeze', 'thumbstick', 'menu'];
+
+    const writeFloats = (offset, values) => {
+      for (let i = 0; i < values.length; i++) {
+        this.telemetryView.setFloat32(offset + 4 * i, values[i] || 0, true);
+      }
+    };
+
+    const writePose = (offset, pose) => {
+      const p = pose.position || {};
+      const r = pose.rotation || {};
+      const q = pose.quaternion || { w: 1 };
+      writeFloats(offset, [p.x, p.y, p.z, r.x, r.y, r.z, q.x, q.y, q.z, q.w]);
+    };
+
+    const writeController = (offset, controller) => {
+      const view = this.telemetryView;
+      writePose(offset, controller);
+      view.setFloat32(offset + 40, controller.trigger || 0, true);
+      const thumbstick = controller.thumbstick || {};
+      writeFloats(offset + 44, [thumbstick.x, thumbstick.y]);
+      let buttons = 0;
+      const pressed = controller.buttons || {};
+      BUTTON_BITS.forEach((name, bit) => { if (pressed[name]) buttons |= 1 << bit; });
+      view.setUint16(offset + 52, buttons, true);
+      const flags = (controller.position ? 1 : 0) | (controller.thumbstick ? 2 : 0) | (controller.gripActive ? 4 : 0);
+      view.setUint16(offset + 54, flags, true);
+    };
+
+    // Returns the packet in a reused buffer, sent before the next one is encoded
+    this.encodeTelemetryPacket = (timestamp, leftController, rightController, headset) => {
+      const view = this.telemetryView;
+      view.setUint8(0, 0x58); // 'X'
+      view.setUint8(1, 0x56); // 'V'
+      view.setUint8(2, 1); // Version
+      view.setUint8(3, headset.position ? 1 : 0);
+      view.setFloat64(4, timestamp, true);
+      writeController(12, leftController);
+      writeController(68, rightController);
+      writePose(124, headset);
+      return view.buffer;
+    };
+
     // --- Helper function to calculate relative rotation ---
     this.calculateRelativeRotation = (currentRotation, initialRotation) => {
       return {
@@ -617,13 +665,17 @@ AFRAME.registerComponent('controller-updater', {
         const hasValidHeadset = headset.position !== null;
         
         if (hasValidLeft || hasValidRight || hasValidHeadset) {
-            const dualControllerData = {
-                timestamp: Date.now(),
-                leftController: leftController,
-                rightController: rightController,
-                headset: headset
-            };
-            this.websocket.send(JSON.stringify(dualControllerData));
+            if (this.useBinaryTelemetry) {
+                this.websocket.send(this.encodeTelemetryPacket(Date.now(), leftController, rightController, headset));
+            } else {
+                const dualControllerData = {
+                    timestamp: Date.now(),
+                    leftController: leftController,
+                    rightController: rightController,
+                    headset: headset
+                };
+                this.websocket.send(JSON.stringify(dualControllerData));
+            }
             
             // 添加调试信息
             console.log('Sending VR data:', {
@@ -120,6 +120,11 @@ class XLeVRConfig:
     enable_keyboard: bool = False
     enable_https: bool = True
     log_level: str = "warning"
+    # Console prints of the controller data, at most once per interval
+    debug_print: bool = False
+    debug_print_interval_s: float = 1.0
+    # Record the VR goals to this JSON Lines file, for replays (see replay_goal_filter.py)
+    record_goals_path: Optional[str] = None
     vr_to_robot_scale: float = VR_TO_ROBOT_SCALE
     # Optionally, webapp_dir if used elsewhere
     webapp_dir: str = "webapp"
@@ -4,9 +4,14 @@ Contains VR WebSocket server and keyboard listener implementations.
 """
 
 from .vr_ws_server import VRWebSocketServer
-from .base import ControlGoal
+from .base import ControlGoal, GoalMailbox, SenderClock
+from .goal_filter import GoalFilter, OneEuroConfig
 
 __all__ = [
     "VRWebSocketServer",
     "ControlGoal",
+    "GoalMailbox",
+    "SenderClock",
+    "GoalFilter",
+    "OneEuroConfig",
 ] 
\ No newline at end of file
@@ -3,10 +3,13 @@ Base classes and data structures for input providers.
 """
 
 import asyncio
+import threading
+import time
 import numpy as np
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional, Literal, Dict, Any
+from typing import Optional, Literal, Dict, Any, List
 from enum import Enum
 
 class ControlMode(Enum):
@@ -27,11 +30,114 @@ class ControlGoal:
     # Additional data for debugging/monitoring
     metadata: Optional[Dict[str, Any]] = None
 
+    # Set by the GoalMailbox when the goal is posted
+    sequence: int = 0                             # Increases with every posted goal
+    timestamp: Optional[float] = None             # time.monotonic() when posted
+
+    # Set by input providers that know when the sender sampled the goal (see SenderClock)
+    source_timestamp: Optional[float] = None      # Sampling time, on the time.monotonic() clock
+
+    @property
+    def age(self) -> float:
+        """Seconds since the goal was posted (0.0 if it was not posted)."""
+        if self.timestamp is None:
+            return 0.0
+        return time.monotonic() - self.timestamp
+
+class SenderClock:
+    """Maps the timestamps of a remote sender to the local `time.monotonic()` clock.
+
+    The offset between the clocks is estimated from the packets with the least network
+    delay: it is the smallest difference between the arrival and the sender time seen so
+    far, so mapped times are never later than the arrival. It may rise by `max_drift`
+    seconds per second to follow the drift of the sender clock, and is estimated again
+    when the sender clock jumps by more than `reset_after_s` (e.g. a new client).
+    """
+
+    def __init__(self, max_drift: float = 1e-3, reset_after_s: float = 1.0):
+        self.max_drift = max_drift
+        self.reset_after_s = reset_after_s
+        self.reset()
+
+    def reset(self):
+        self.offset: Optional[float] = None
+        self._last_arrival = 0.0
+
+    def to_monotonic(self, sender_time: float, arrival: Optional[float] = None) -> float:
+        """Local time at which the sender sampled `sender_time` (seconds on its clock)."""
+        arrival = time.monotonic() if arrival is None else arrival
+        offset = arrival - sender_time
+        if self.offset is not None and abs(offset - self.offset) <= self.reset_after_s:
+            drift = self.max_drift * max(arrival - self._last_arrival, 0.0)
+            offset = min(offset, self.offset + drift)
+        self.offset = offset
+        self._last_arrival = arrival
+        return sender_time + offset
+
+class GoalMailbox:
+    """Latest-value mailbox of control goals, one slot per arm and headset.
+
+    Goals with a target position overwrite the previous goal of their arm, so a slow
+    consumer always reads the newest goal instead of draining stale ones. Goals without
+    a target position (gripper toggles, resets, idle) are edges: they are kept in order
+    as events, see `pop_events`. Safe to use across threads.
+    """
+
+    def __init__(self, max_events: int = 64):
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._latest: Dict[str, ControlGoal] = {}
+        self._events: deque = deque(maxlen=max_events)
+
+    @staticmethod
+    def is_event(goal: ControlGoal) -> bool:
+        return goal.target_position is None
+
+    def put(self, goal: ControlGoal) -> ControlGoal:
+        """Stamp the goal with its sequence number and time, and post it."""
+        with self._lock:
+            self._sequence += 1
+            goal.sequence = self._sequence
+            goal.timestamp = time.monotonic()
+            if self.is_event(goal):
+                self._events.append(goal)
+            else:
+                self._latest[goal.arm] = goal
+        return goal
+
+    def latest(self, arm: str) -> Optional[ControlGoal]:
+        """Latest goal with a target position of `arm`, without consuming it."""
+        with self._lock:
+            return self._latest.get(arm)
+
+    def pop_events(self, arm: Optional[str] = None) -> List[ControlGoal]:
+        """Consume the event goals of `arm` (or of all arms), oldest first."""
+        with self._lock:
+            if arm is None:
+                events = list(self._events)
+                self._events.clear()
+            else:
+                events = [goal for goal in self._events if goal.arm == arm]
+                remaining = [goal for goal in self._events if goal.arm != arm]
+                self._events.clear()
+                self._events.extend(remaining)
+        return events
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the last posted goal."""
+        return self._sequence
+
 class BaseInputProvider(ABC):
-    """Abstract base class for input providers."""
+    """Abstract base class for input providers.
+
+    Goals are posted to the `goals` mailbox. If a command queue is given, they are also
+    put on it, for consumers that need every goal.
+    """
     
-    def __init__(self, command_queue: asyncio.Queue):
+    def __init__(self, command_queue: Optional[asyncio.Queue] = None):
         self.command_queue = command_queue
+        self.goals = GoalMailbox()
         self.is_running = False
     
     @abstractmethod
@@ -45,7 +151,10 @@ class BaseInputProvider(ABC):
         pass
     
     async def send_goal(self, goal: ControlGoal):
-        """Send a control goal to the command queue."""
+        """Post a control goal to the mailbox and the command queue."""
+        self.goals.put(goal)
+        if self.command_queue is None:
+            return
         try:
             await self.command_queue.put(goal)
         except Exception as e:
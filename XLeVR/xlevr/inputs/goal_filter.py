@@ -0,0 +1,244 @@
+"""
+Jitter filtering and latency compensation of the VR control goals.
+
+The goals of the VR server arrive with the network jitter of the Wi-Fi link and are
+already old when the robot executes them. `GoalFilter` sits between the goal mailbox
+and the teleoperation: it smooths the goals of all the tracked devices with a One-Euro
+filter and extrapolates them at constant velocity to the time the robot command is
+executed.
+"""
+
+import json
+import math
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from .base import ControlGoal
+
+DEVICES = ("left", "right", "headset")
+# Filtered channels of a goal: target position x, y, z, wrist roll and wrist flex
+NUM_CHANNELS = 5
+# The channels are filtered in centimeters and degrees, for `beta` to fit both
+CHANNEL_SCALE = np.array([100.0, 100.0, 100.0, 1.0, 1.0])
+
+
+@dataclass
+class OneEuroConfig:
+    """One-Euro filter and extrapolation settings of a device.
+
+    `min_cutoff` (Hz) sets the smoothing at rest, lower is smoother but lags more.
+    `beta` raises the cutoff with the speed (in cm/s or deg/s), so that fast motions are
+    not delayed.
+    `d_cutoff` (Hz) smooths the velocity estimate used by both. Goals are extrapolated
+    along that velocity by at most `max_prediction_s`, 0 disables the extrapolation.
+    """
+    min_cutoff: float = 1.0
+    beta: float = 0.5
+    d_cutoff: float = 1.0
+    max_prediction_s: float = 0.05
+
+
+def sample_time(goal: ControlGoal) -> float:
+    """Time the goal was sampled by its sender if known, otherwise when it was posted."""
+    return goal.timestamp if goal.source_timestamp is None else goal.source_timestamp
+
+
+def smoothing_factor(cutoff: np.ndarray, dt: np.ndarray) -> np.ndarray:
+    """Exponential smoothing factor of a first order low-pass filter."""
+    tau = 1.0 / (2.0 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class GoalFilter:
+    """One-Euro filter with constant-velocity extrapolation of the VR goals.
+
+    The state of all the devices is kept in (device, channel) arrays and each `update`
+    filters the new goals of all the devices at once. The goals are filtered on the time
+    their sender sampled them (`source_timestamp`), or on their `timestamp` when posted to
+    the mailbox if the sender time is unknown, so that the network jitter does not distort
+    the velocity. `predict` extrapolates them to the command time, on the same
+    `time.monotonic()` clock.
+
+    Args:
+        configs: Settings per device ("left", "right", "headset"), as `OneEuroConfig` or
+            dicts of its fields. Devices without settings use the defaults.
+        reset_after_s: A device that sent no goal for that long (lost tracking, paused
+            stream) restarts from its next goal instead of filtering across the gap.
+    """
+
+    def __init__(
+        self,
+        configs: Optional[Dict[str, Union[OneEuroConfig, dict]]] = None,
+        devices: Iterable[str] = DEVICES,
+        reset_after_s: float = 0.5,
+    ):
+        self.devices = tuple(devices)
+        self.index = {device: i for i, device in enumerate(self.devices)}
+        self.reset_after_s = reset_after_s
+        self.configs = {device: OneEuroConfig() for device in self.devices}
+        for device, config in (configs or {}).items():
+            self.configs[device] = OneEuroConfig(**config) if isinstance(config, dict) else config
+
+        # (device, 1) parameters, broadcast over the channels
+        def column(name):
+            return np.array([[getattr(self.configs[d], name)] for d in self.devices], dtype=np.float64)
+        self.min_cutoff = column("min_cutoff")
+        self.beta = column("beta")
+        self.d_cutoff = column("d_cutoff")
+        self.max_prediction_s = column("max_prediction_s")[:, 0]
+
+        n = len(self.devices)
+        self.value = np.full((n, NUM_CHANNELS), np.nan)
+        self.velocity = np.zeros((n, NUM_CHANNELS))
+        self.timestamp = np.full(n, -np.inf)
+        self.sequence = np.zeros(n, dtype=np.int64)
+        self.goals: Dict[str, ControlGoal] = {}
+        # Reused input buffers
+        self._sample = np.empty((n, NUM_CHANNELS))
+        self._sample_time = np.empty(n)
+
+    @staticmethod
+    def goal_channels(goal: ControlGoal, out: np.ndarray) -> np.ndarray:
+        """Write the filtered channels of a goal into `out`, NaN for the missing ones."""
+        out[:3] = goal.target_position
+        out[3] = np.nan if goal.wrist_roll_deg is None else goal.wrist_roll_deg
+        out[4] = np.nan if goal.wrist_flex_deg is None else goal.wrist_flex_deg
+        out *= CHANNEL_SCALE
+        return out
+
+    def reset(self, device: Optional[str] = None):
+        """Forget the filter state of a device, or of all of them."""
+        rows = slice(None) if device is None else self.index[device]
+        self.value[rows] = np.nan
+        self.velocity[rows] = 0.0
+        self.timestamp[rows] = -np.inf
+        if device is None:
+            self.goals.clear()
+        else:
+            self.goals.pop(device, None)
+
+    def update(self, goals: Dict[str, Optional[ControlGoal]]) -> int:
+        """Filter the goals that are new since the last update, returns how many there were.
+
+        `goals` maps device names to their latest goal (e.g. `VRMonitor.get_latest_goal_nowait()`),
+        other keys and goals without a target position are ignored.
+        """
+        rows = []
+        for device, goal in goals.items():
+            i = self.index.get(device)
+            if i is None or goal is None or goal.target_position is None or goal.sequence == self.sequence[i]:
+                continue
+            self.goal_channels(goal, self._sample[i])
+            self._sample_time[i] = sample_time(goal)
+            self.sequence[i] = goal.sequence
+            self.goals[device] = goal
+            rows.append(i)
+        if not rows:
+            return 0
+
+        rows = np.array(rows)
+        sample = self._sample[rows]
+        dt = self._sample_time[rows] - self.timestamp[rows]
+        value = self.value[rows]
+        velocity = self.velocity[rows]
+
+        # Restart after a gap, and on the channels that were missing so far
+        restart = (dt > self.reset_after_s)[:, None] | np.isnan(value)
+        dt = np.maximum(dt, 1e-3)[:, None]
+
+        raw_velocity = (sample - value) / dt
+        alpha_d = smoothing_factor(self.d_cutoff[rows], dt)
+        velocity = np.where(restart, 0.0, alpha_d * raw_velocity + (1.0 - alpha_d) * velocity)
+        cutoff = self.min_cutoff[rows] + self.beta[rows] * np.abs(velocity)
+        alpha = smoothing_factor(cutoff, dt)
+        value = np.where(restart, sample, alpha * sample + (1.0 - alpha) * value)
+
+        # Channels missing from the goal stay missing
+        missing = np.isnan(sample)
+        self.value[rows] = np.where(missing, np.nan, value)
+        self.velocity[rows] = np.where(missing, 0.0, velocity)
+        self.timestamp[rows] = self._sample_time[rows]
+        return len(rows)
+
+    def predict(self, command_time: float) -> Dict[str, ControlGoal]:
+        """Filtered goals of the devices extrapolated to `command_time` (`time.monotonic()` clock).
+
+        The goals are copies of the latest goals of the devices, with the filtered target
+        position and wrist angles, and the extrapolation horizon in `metadata["prediction_s"]`.
+        """
+        horizon = np.clip(command_time - self.timestamp, 0.0, self.max_prediction_s)
+        predicted = (self.value + self.velocity * horizon[:, None]) / CHANNEL_SCALE
+
+        filtered = {}
+        for device, goal in self.goals.items():
+            i = self.index[device]
+            roll, flex = predicted[i, 3], predicted[i, 4]
+            metadata = dict(goal.metadata or {})
+            metadata["prediction_s"] = float(horizon[i])
+            filtered[device] = replace(
+                goal,
+                target_position=predicted[i, :3].copy(),
+                wrist_roll_deg=None if np.isnan(roll) else float(roll),
+                wrist_flex_deg=None if np.isnan(flex) else float(flex),
+                metadata=metadata,
+            )
+        return filtered
+
+    def __call__(self, goals: Dict[str, Optional[ControlGoal]], command_time: float) -> Dict[str, Optional[ControlGoal]]:
+        """Update with the latest goals and return them filtered, in the same dict layout."""
+        self.update(goals)
+        filtered = dict(goals)
+        for device, goal in self.predict(command_time).items():
+            if device in filtered:
+                filtered[device] = goal
+        return filtered
+
+
+class GoalRecorder:
+    """Records the goals with a target position to a JSON Lines file, to replay VR sessions."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, "a", buffering=1 << 16)
+
+    def write(self, goal: ControlGoal):
+        if goal.target_position is None or self.file is None:
+            return
+        record = {
+            "t": goal.timestamp,
+            "source_t": goal.source_timestamp,
+            "arm": goal.arm,
+            "sequence": goal.sequence,
+            "position": [float(v) for v in goal.target_position],
+            "wrist_roll_deg": goal.wrist_roll_deg,
+            "wrist_flex_deg": goal.wrist_flex_deg,
+        }
+        self.file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def load_goal_recording(path: str) -> List[ControlGoal]:
+    """Load the goals recorded by a `GoalRecorder`, in recording order."""
+    goals = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            goals.append(ControlGoal(
+                arm=record["arm"],
+                target_position=np.array(record["position"]),
+                wrist_roll_deg=record.get("wrist_roll_deg"),
+                wrist_flex_deg=record.get("wrist_flex_deg"),
+                metadata={},
+                sequence=record.get("sequence", len(goals) + 1),
+                timestamp=record["t"],
+                source_timestamp=record.get("source_t"),
+            ))
+    return goals
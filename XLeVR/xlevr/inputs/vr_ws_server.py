@@ -10,14 +10,50 @@ import websockets
 import numpy as np
 import math
 import logging
+import time
 from typing import Dict, Optional, Set
 from scipy.spatial.transform import Rotation as R
 
-from .base import BaseInputProvider, ControlGoal, ControlMode
+from .base import BaseInputProvider, ControlGoal, ControlMode, SenderClock
+from .goal_filter import GoalRecorder
 from ..config import XLeVRConfig
 
 logger = logging.getLogger(__name__)
 
+# Binary telemetry packets sent by the web UI (see `encodeTelemetryPacket` in web-ui/vr_app.js).
+# Little-endian and packed: header, left controller, right controller, headset (164 bytes).
+VR_PACKET_MAGIC = b'XV'
+VR_PACKET_VERSION = 1
+PACKET_HEADSET_VALID = 1 << 0
+CONTROLLER_POSE_VALID = 1 << 0
+CONTROLLER_GAMEPAD_VALID = 1 << 1
+CONTROLLER_GRIP_ACTIVE = 1 << 2
+BUTTON_BITS = ('a', 'b', 'squeeze', 'thumbstick', 'menu')
+
+VR_CONTROLLER_DTYPE = np.dtype([
+    ('position', '<f4', 3),
+    ('rotation', '<f4', 3),  # Euler angles in degrees
+    ('quaternion', '<f4', 4),  # x, y, z, w
+    ('trigger', '<f4'),
+    ('thumbstick', '<f4', 2),
+    ('buttons', '<u2'),  # Bit i is BUTTON_BITS[i]
+    ('flags', '<u2'),  # CONTROLLER_* bits
+])
+VR_HEADSET_DTYPE = np.dtype([
+    ('position', '<f4', 3),
+    ('rotation', '<f4', 3),
+    ('quaternion', '<f4', 4),
+])
+VR_PACKET_DTYPE = np.dtype([
+    ('magic', 'S2'),
+    ('version', 'u1'),
+    ('flags', 'u1'),  # PACKET_* bits
+    ('timestamp', '<f8'),  # Milliseconds, Date.now() of the browser
+    ('left', VR_CONTROLLER_DTYPE),
+    ('right', VR_CONTROLLER_DTYPE),
+    ('headset', VR_HEADSET_DTYPE),
+])
+
 
 class VRControllerState:
     """State tracking for a VR controller."""
@@ -44,7 +80,67 @@ class VRControllerState:
         
         # Rotation tracking
         self.origin_wrist_angle = 0.0
-    
+
+        # Latest sample received, preallocated and overwritten in place by the packet decoders
+        self.has_pose = False
+        self.has_rotation = False
+        self.has_quaternion = False
+        self.has_gamepad = False
+        self.position = np.zeros(3)
+        self.rotation = np.zeros(3)  # Euler angles in degrees
+        self.quaternion = np.zeros(4)  # x, y, z, w
+        self.trigger = 0.0
+        self.thumbstick = np.zeros(2)
+        self.buttons = 0  # Bit i is BUTTON_BITS[i]
+        self.sample_grip_active = False
+
+    def load_json(self, data: Dict):
+        """Load a sample from the JSON message of a controller or of the headset."""
+        position = data.get('position')
+        self.has_pose = bool(position) and all(k in position for k in ('x', 'y', 'z'))
+        if self.has_pose:
+            self.position[:] = (position['x'], position['y'], position['z'])
+
+        rotation = data.get('rotation')
+        self.has_rotation = bool(rotation)
+        self.rotation[:] = (rotation.get('x', 0), rotation.get('y', 0), rotation.get('z', 0)) if rotation else 0.0
+
+        quaternion = data.get('quaternion')
+        self.has_quaternion = bool(quaternion) and all(k in quaternion for k in ('x', 'y', 'z', 'w'))
+        if self.has_quaternion:
+            self.quaternion[:] = (quaternion['x'], quaternion['y'], quaternion['z'], quaternion['w'])
+
+        self.trigger = data.get('trigger', 0)
+        self.sample_grip_active = data.get('gripActive', False)
+        thumbstick = data.get('thumbstick')
+        self.has_gamepad = bool(thumbstick)
+        self.thumbstick[:] = (thumbstick.get('x', 0), thumbstick.get('y', 0)) if thumbstick else 0.0
+        buttons = data.get('buttons') or {}
+        self.buttons = sum(1 << i for i, name in enumerate(BUTTON_BITS) if buttons.get(name))
+
+    def load_binary(self, sample: np.void, flags: int):
+        """Load a sample from a controller or headset record of a binary packet."""
+        self.has_pose = bool(flags & CONTROLLER_POSE_VALID)
+        self.has_rotation = self.has_quaternion = self.has_pose
+        self.position[:] = sample['position']
+        self.rotation[:] = sample['rotation']
+        self.quaternion[:] = sample['quaternion']
+        if 'trigger' in sample.dtype.names:
+            self.trigger = float(sample['trigger'])
+            self.has_gamepad = bool(flags & CONTROLLER_GAMEPAD_VALID)
+            self.thumbstick[:] = sample['thumbstick']
+            self.buttons = int(sample['buttons'])
+            self.sample_grip_active = bool(flags & CONTROLLER_GRIP_ACTIVE)
+
+    def thumbstick_metadata(self) -> Dict[str, float]:
+        """Thumbstick as sent in the goal metadata, empty without gamepad."""
+        if not self.has_gamepad:
+            return {}
+        return {'x': float(self.thumbstick[0]), 'y': float(self.thumbstick[1])}
+
+    def pressed_buttons(self) -> list:
+        return [name for i, name in enumerate(BUTTON_BITS) if self.buttons & (1 << i)]
+
     def reset_grip(self):
         """Reset grip state but preserve trigger state."""
         self.grip_active = False
@@ -68,16 +164,22 @@ class VRControllerState:
 class VRWebSocketServer(BaseInputProvider):
     """WebSocket server for VR controller input."""
     
-    def __init__(self, command_queue: asyncio.Queue, config: XLeVRConfig, print_only: bool = False):
+    def __init__(self, command_queue: Optional[asyncio.Queue], config: XLeVRConfig, print_only: bool = False):
         super().__init__(command_queue)
         self.config = config
         self.clients: Set = set()
         self.server = None
         self.print_only = print_only  # New flag for print-only mode
+        self._last_debug_print = 0.0
         
         # Controller states
         self.left_controller = VRControllerState("left")
         self.right_controller = VRControllerState("right")
+        self.headset = VRControllerState("headset")
+        self.recorder = GoalRecorder(config.record_goals_path) if config.record_goals_path else None
+        # Sampling time of the packet being processed, mapped from the browser clock
+        self.sender_clock = SenderClock()
+        self.packet_time: Optional[float] = None
         
         # Robot state tracking (for relative position calculation)
         self.left_arm_origin_position = None
@@ -134,24 +236,30 @@ class VRWebSocketServer(BaseInputProvider):
             self.server.close()
             await self.server.wait_closed()
             logger.info("VR WebSocket server stopped")
+        if self.recorder:
+            self.recorder.close()
     
     async def websocket_handler(self, websocket, path=None):
         """Handle WebSocket connections from VR controllers."""
         client_address = websocket.remote_address
         logger.info(f"VR client connected: {client_address}")
         self.clients.add(websocket)
+        self.sender_clock.reset()
         
         try:
             async for message in websocket:
                 try:
-                    data = json.loads(message)
-                    await self.process_controller_data(data)
+                    # Binary frames carry the telemetry packets, text frames the JSON fallback
+                    if isinstance(message, bytes):
+                        await self.process_binary_packet(message)
+                    else:
+                        await self.process_controller_data(json.loads(message))
                 except json.JSONDecodeError:
                     logger.warning(f"Received non-JSON message: {message}")
                 except Exception as e:
                     logger.error(f"Error processing VR data: {e}")
                     # Add more context for debugging
-                    logger.error(f"Data that caused error: {data}")
+                    logger.error(f"Data that caused error: {message!r}")
                     import traceback
                     logger.error(f"Traceback: {traceback.format_exc()}")
         
@@ -168,40 +276,40 @@ class VRWebSocketServer(BaseInputProvider):
             await self.handle_grip_release('right')
             logger.info(f"VR client {client_address} cleanup complete")
     
-    async def process_controller_data(self, data: Dict):
-        """Process incoming VR controller data."""
+    def _should_debug_print(self) -> bool:
+        """Rate-limit the console prints of the controller data, off unless `debug_print` is set."""
+        if not self.config.debug_print:
+            return False
+        now = time.monotonic()
+        if now - self._last_debug_print < self.config.debug_print_interval_s:
+            return False
+        self._last_debug_print = now
+        return True
+
+    def debug_print_controller_data(self):
+        """Print the thumbstick, button and headset activity of the latest packet."""
         # 检查是否有摇杆或按钮操作，只在有操作时打印
         has_thumbstick_or_button_activity = False
         thumbstick_info = []
         button_info = []
         
         # 检查左右手柄的摇杆和按钮状态
-        for hand in ['leftController', 'rightController']:
-            if hand in data:
-                controller_data = data[hand]
-                hand_name = hand.replace('Controller', '').upper()
-                
-                # 检查摇杆
-                if 'thumbstick' in controller_data:
-                    thumbstick = controller_data['thumbstick']
-                    x = thumbstick.get('x', 0)
-                    y = thumbstick.get('y', 0)
-                    # 只在摇杆有实际输入时打印（阈值0.1）
-                    if abs(x) > 0.1 or abs(y) > 0.1:
-                        has_thumbstick_or_button_activity = True
-                        thumbstick_info.append(f"[{hand_name}] Thumbstick: x={x:.2f}, y={y:.2f}")
-                
-                # 检查按钮
-                if 'buttons' in controller_data:
-                    buttons = controller_data['buttons']
-                    pressed_buttons = []
-                    for button_name, is_pressed in buttons.items():
-                        if is_pressed:
-                            has_thumbstick_or_button_activity = True
-                            pressed_buttons.append(button_name)
-                    
-                    if pressed_buttons:
-                        button_info.append(f"[{hand_name}] Buttons: {', '.join(pressed_buttons)}")
+        for controller in (self.left_controller, self.right_controller):
+            hand_name = controller.hand.upper()
+            
+            # 检查摇杆
+            if controller.has_gamepad:
+                x, y = controller.thumbstick
+                # 只在摇杆有实际输入时打印（阈值0.1）
+                if abs(x) > 0.1 or abs(y) > 0.1:
+                    has_thumbstick_or_button_activity = True
+                    thumbstick_info.append(f"[{hand_name}] Thumbstick: x={x:.2f}, y={y:.2f}")
+            
+            # 检查按钮
+            pressed_buttons = controller.pressed_buttons()
+            if pressed_buttons:
+                has_thumbstick_or_button_activity = True
+                button_info.append(f"[{hand_name}] Buttons: {', '.join(pressed_buttons)}")
         
         # 只在有操作时打印
         if has_thumbstick_or_button_activity:
@@ -210,53 +318,91 @@ class VRWebSocketServer(BaseInputProvider):
                 print(f"  {info}")
             for info in button_info:
                 print(f"  {info}")
-        
+
+        if self.headset.has_pose:
+            pos, rot = self.headset.position, self.headset.rotation
+            print(f"[VR_WS] Headset - Position: [{pos[0]:.3f}, {pos[1]:.3f}, {pos[2]:.3f}], "
+                  f"Rotation: [{rot[0]:.1f}, {rot[1]:.1f}, {rot[2]:.1f}]")
+
+    async def process_controller_data(self, data: Dict):
+        """Process incoming VR controller data."""
         # Process headset data if available
-        if 'headset' in data:
-            headset_data = data['headset']
-            if headset_data and headset_data.get('position'):
-                pos = headset_data['position']
-                rot = headset_data.get('rotation', {})
-                quat = headset_data.get('quaternion', {})
-                
-                print(f"[VR_WS] Headset - Position: [{pos.get('x', 0):.3f}, {pos.get('y', 0):.3f}, {pos.get('z', 0):.3f}], "
-                      f"Rotation: [{rot.get('x', 0):.1f}, {rot.get('y', 0):.1f}, {rot.get('z', 0):.1f}]")
-                
-                # Create headset ControlGoal
-                headset_position = np.array([pos.get('x', 0), pos.get('y', 0), pos.get('z', 0)])
-                headset_goal = ControlGoal(
-                    arm="headset",
-                    mode=ControlMode.POSITION_CONTROL,
-                    target_position=headset_position,
-                    wrist_roll_deg=rot.get('y', 0),  # Yaw rotation
-                    wrist_flex_deg=rot.get('x', 0),   # Pitch rotation
-                    metadata={
-                        "source": "vr_headset",
-                        "relative_position": False,
-                        "vr_position": headset_position.tolist(),
-                        "rotation": rot,
-                        "quaternion": quat
-                    }
-                )
-                await self.send_goal(headset_goal)
+        headset_data = data.get('headset')
+        if headset_data and headset_data.get('position'):
+            self.headset.load_json(headset_data)
+        else:
+            self.headset.has_pose = False
         
         # Process controller data
         if 'leftController' in data:
-            await self.process_single_controller('left', data['leftController'])
-        
+            self.left_controller.load_json(data['leftController'])
         if 'rightController' in data:
-            await self.process_single_controller('right', data['rightController'])
+            self.right_controller.load_json(data['rightController'])
+
+        await self.process_samples(left='leftController' in data, right='rightController' in data,
+                                   sent_ms=data.get('timestamp'))
+
+    async def process_binary_packet(self, message: bytes):
+        """Process a binary telemetry packet, decoded in place into the controller states."""
+        if len(message) != VR_PACKET_DTYPE.itemsize:
+            raise ValueError(f"Expected a {VR_PACKET_DTYPE.itemsize} bytes VR packet, got {len(message)} bytes")
+        packet = np.frombuffer(message, dtype=VR_PACKET_DTYPE, count=1)[0]
+        if packet['magic'] != VR_PACKET_MAGIC or packet['version'] != VR_PACKET_VERSION:
+            raise ValueError(f"Unsupported VR packet {packet['magic']!r} version {packet['version']}")
+
+        headset_flags = CONTROLLER_POSE_VALID if packet['flags'] & PACKET_HEADSET_VALID else 0
+        self.headset.load_binary(packet['headset'], headset_flags)
+        left, right = packet['left'], packet['right']
+        self.left_controller.load_binary(left, int(left['flags']))
+        self.right_controller.load_binary(right, int(right['flags']))
+
+        await self.process_samples(left=True, right=True, sent_ms=float(packet['timestamp']))
+
+    async def process_samples(self, left: bool, right: bool, sent_ms: Optional[float] = None):
+        """Send the goals of the latest headset and controller samples, sampled at `sent_ms` (browser clock)."""
+        self.packet_time = None if sent_ms is None else self.sender_clock.to_monotonic(sent_ms / 1000.0)
+        try:
+            await self._process_samples(left, right)
+        finally:
+            self.packet_time = None
+
+    async def _process_samples(self, left: bool, right: bool):
+        if self._should_debug_print():
+            self.debug_print_controller_data()
+
+        if self.headset.has_pose:
+            headset = self.headset
+            rot = {'x': float(headset.rotation[0]), 'y': float(headset.rotation[1]), 'z': float(headset.rotation[2])}
+            quat = dict(zip(('x', 'y', 'z', 'w'), headset.quaternion.tolist())) if headset.has_quaternion else {}
+            
+            # Create headset ControlGoal
+            headset_position = headset.position.copy()
+            headset_goal = ControlGoal(
+                arm="headset",
+                mode=ControlMode.POSITION_CONTROL,
+                target_position=headset_position,
+                wrist_roll_deg=rot['y'],  # Yaw rotation
+                wrist_flex_deg=rot['x'],   # Pitch rotation
+                metadata={
+                    "source": "vr_headset",
+                    "relative_position": False,
+                    "vr_position": headset_position.tolist(),
+                    "rotation": rot,
+                    "quaternion": quat
+                }
+            )
+            await self.send_goal(headset_goal)
+
+        if left:
+            await self.process_single_controller('left')
+        if right:
+            await self.process_single_controller('right')
     
-    async def process_single_controller(self, hand: str, data: Dict):
-        """Process data for a single controller."""
-        position = data.get('position', {})
-        rotation = data.get('rotation', {})
-        quaternion = data.get('quaternion', {})  # Get quaternion data directly
-        grip_active = data.get('gripActive', False)
-        trigger = data.get('trigger', 0)
-        thumbstick = data.get('thumbstick', {})
-        
+    async def process_single_controller(self, hand: str):
+        """Process the latest sample of a single controller."""
         controller = self.left_controller if hand == 'left' else self.right_controller
+        trigger = controller.trigger
+        thumbstick = controller.thumbstick_metadata()
         
         # Handle trigger for gripper control
         trigger_active = trigger > 0.5
@@ -281,16 +427,18 @@ class VRWebSocketServer(BaseInputProvider):
         
         # 修改：直接响应控制器位置，不需要按squeeze键
         # 检查是否有位置数据
-        if position and all(k in position for k in ['x', 'y', 'z']):
+        if controller.has_pose:
             # 如果还没有设置原点，设置当前位置为原点
             if controller.origin_position is None:
-                controller.origin_position = np.array([position.get('x', 0), position.get('y', 0), position.get('z', 0)])
+                controller.origin_position = controller.position.copy()
                 
                 # 设置四元数原点
-                if quaternion and all(k in quaternion for k in ['x', 'y', 'z', 'w']):
-                    controller.origin_quaternion = np.array([quaternion['x'], quaternion['y'], quaternion['z'], quaternion['w']])
+                if controller.has_quaternion:
+                    controller.origin_quaternion = controller.quaternion.copy()
+                elif controller.has_rotation:
+                    controller.origin_quaternion = self.euler_to_quaternion(dict(zip('xyz', controller.rotation)))
                 else:
-                    controller.origin_quaternion = self.euler_to_quaternion(rotation) if rotation else None
+                    controller.origin_quaternion = None
                 
                 controller.accumulated_rotation_quat = controller.origin_quaternion
                 controller.z_axis_rotation = 0.0
@@ -313,18 +461,18 @@ class VRWebSocketServer(BaseInputProvider):
                 logger.info(f"🎯 {hand.upper()} auto-activated - controlling {hand} arm")
             
             # 计算目标位置 - 改为绝对位置控制
-            position_array = np.array([position.get('x', 0), position.get('y', 0), position.get('z', 0)])
+            position_array = controller.position
             
             # 直接使用VR控制器的绝对位置，应用缩放
             absolute_position = position_array * self.config.vr_to_robot_scale
             
             # 计算手腕旋转
             if controller.origin_quaternion is not None:
-                if quaternion and all(k in quaternion for k in ['x', 'y', 'z', 'w']):
-                    current_quat = np.array([quaternion['x'], quaternion['y'], quaternion['z'], quaternion['w']])
-                    self.update_quaternion_rotation_direct(controller, current_quat)
-                else:
-                    self.update_quaternion_rotation(controller, rotation)
+                if controller.has_quaternion:
+                    # The state array is overwritten by the next sample, keep a copy
+                    self.update_quaternion_rotation_direct(controller, controller.quaternion.copy())
+                elif controller.has_rotation:
+                    self.update_quaternion_rotation(controller, dict(zip('xyz', controller.rotation)))
                 
                 controller.z_axis_rotation = self.extract_roll_from_quaternion(controller.accumulated_rotation_quat, controller.origin_quaternion)
                 controller.x_axis_rotation = self.extract_pitch_from_quaternion(controller.accumulated_rotation_quat, controller.origin_quaternion)
@@ -585,5 +733,10 @@ class VRWebSocketServer(BaseInputProvider):
                 print(f"   Metadata: {goal.metadata}")
             print()
         else:
+            # Goals sent while processing a packet were sampled with it
+            if goal.source_timestamp is None:
+                goal.source_timestamp = self.packet_time
             # Use the parent class method to send to queue
-            await super().send_goal(goal) 
\ No newline at end of file
+            await super().send_goal(goal)
+            if self.recorder:
+                self.recorder.write(goal)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Check the accuracy and the speed of a dynamically quantized policy on dataset samples.
+
+The float and the int8 quantized policies predict action chunks for the same samples (and the same noise for
+generative policies) of the given episodes, ideally episodes held out from training. The script reports, in
+normalized action space:
+- the mean absolute difference between the float and the quantized chunks,
+- the mean squared error of each policy against the dataset actions,
+- the mean inference latency of each policy on CPU.
+
+Usage:
+    uv run python examples/quantization/eval_dataset.py \
+        --policy.path=lerobot/act_aloha_sim_transfer_cube_human \
+        --dataset.repo_id=lerobot/aloha_sim_transfer_cube_human \
+        --dataset.episodes='[45,46,47,48,49]' \
+        --num_samples=100
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+
+import torch
+
+from lerobot.configs import parser
+from lerobot.configs.default import DatasetConfig
+from lerobot.configs.policies import PreTrainedConfig
+from lerobot.datasets.factory import resolve_delta_timestamps
+from lerobot.datasets.lerobot_dataset import LeRobotDataset, LeRobotDatasetMetadata
+from lerobot.policies.factory import get_policy_class, make_pre_post_processors
+from lerobot.utils.constants import ACTION
+from lerobot.utils.random_utils import seeded_context
+from lerobot.utils.utils import init_logging
+
+
+@dataclass
+class QuantizationEvalConfig:
+    """Configuration for the quantization accuracy check."""
+
+    # Policy configuration
+    policy: PreTrainedConfig | None = None
+
+    # Dataset configuration, use `episodes` to select held-out episodes
+    dataset: DatasetConfig = field(default_factory=DatasetConfig)
+
+    # Quantization to evaluate, see `lerobot.utils.quantization.INFERENCE_QUANTIZATIONS`
+    quantization: str = "int8"
+
+    # Number of dataset samples to evaluate
+    num_samples: int = 100
+
+    seed: int = 42
+
+    def __post_init__(self):
+        policy_path = parser.get_path_arg("policy")
+        if policy_path:
+            cli_overrides = parser.get_cli_overrides("policy")
+            self.policy = PreTrainedConfig.from_pretrained(policy_path, cli_overrides=cli_overrides)
+            self.policy.pretrained_path = policy_path
+        else:
+            raise ValueError("Policy path is required (--policy.path)")
+
+    @classmethod
+    def __get_path_fields__(cls) -> list[str]:
+        """This enables the parser to load config from the policy using `--policy.path=local/dir`"""
+        return ["policy"]
+
+
+def load_policy(cfg: QuantizationEvalConfig, quantization: str | None):
+    config = PreTrainedConfig.from_pretrained(cfg.policy.pretrained_path)
+    config.device = "cpu"
+    config.inference_quantization = quantization
+    policy = get_policy_class(cfg.policy.type).from_pretrained(cfg.policy.pretrained_path, config=config)
+    policy.eval()
+    return policy
+
+
+@parser.wrap()
+def main(cfg: QuantizationEvalConfig):
+    init_logging()
+
+    ds_meta = LeRobotDatasetMetadata(cfg.dataset.repo_id, root=cfg.dataset.root)
+    dataset = LeRobotDataset(
+        cfg.dataset.repo_id,
+        root=cfg.dataset.root,
+        episodes=cfg.dataset.episodes,
+        delta_timestamps=resolve_delta_timestamps(cfg.policy, ds_meta),
+    )
+    logging.info(f"Dataset loaded: {len(dataset)} samples, {dataset.num_episodes} episodes")
+
+    preprocessor, _ = make_pre_post_processors(
+        policy_cfg=cfg.policy,
+        pretrained_path=cfg.policy.pretrained_path,
+        preprocessor_overrides={"device_processor": {"device": "cpu"}},
+    )
+    float_policy = load_policy(cfg, None)
+    quantized_policy = load_policy(cfg, cfg.quantization)
+
+    generator = torch.Generator().manual_seed(cfg.seed)
+    indices = torch.randperm(len(dataset), generator=generator)[: cfg.num_samples].tolist()
+
+    abs_diffs, float_errors, quantized_errors = [], [], []
+    latencies = {"float": [], cfg.quantization: []}
+    for i, index in enumerate(indices):
+        batch = preprocessor(torch.utils.data.default_collate([dataset[index]]))
+        chunks = {}
+        for name, policy in [("float", float_policy), (cfg.quantization, quantized_policy)]:
+            with seeded_context(cfg.seed + i), torch.inference_mode():
+                start_t = time.perf_counter()
+                chunks[name] = policy.predict_action_chunk(batch)
+                latencies[name].append(time.perf_counter() - start_t)
+
+        float_chunk, quantized_chunk = chunks["float"], chunks[cfg.quantization]
+        abs_diffs.append((float_chunk - quantized_chunk).abs().mean().item())
+        target = batch[ACTION].reshape(1, -1, float_chunk.shape[-1])
+        horizon = min(target.shape[1], float_chunk.shape[1])
+        float_errors.append(((float_chunk[:, :horizon] - target[:, :horizon]) ** 2).mean().item())
+        quantized_errors.append(((quantized_chunk[:, :horizon] - target[:, :horizon]) ** 2).mean().item())
+
+    def mean(values: list[float]) -> float:
+        return sum(values) / len(values)
+
+    logging.info("=" * 80)
+    logging.info(f"Samples: {len(indices)}")
+    logging.info(f"Mean |float - {cfg.quantization}| (normalized actions): {mean(abs_diffs):.5f}")
+    logging.info(f"MSE vs dataset actions, float: {mean(float_errors):.5f}")
+    logging.info(f"MSE vs dataset actions, {cfg.quantization}: {mean(quantized_errors):.5f}")
+    for name, values in latencies.items():
+        logging.info(f"Mean latency, {name}: {mean(values) * 1000:.1f} ms")
+    logging.info("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
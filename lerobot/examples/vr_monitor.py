@@ -170,11 +170,7 @@ class VRMonitor:
         self.vr_server = None
         self.https_server = None
         self.is_running = False
-        self.latest_goal = None  # Store the latest goal
-        self.left_goal = None    # Store left and right controller goals separately
-        self.right_goal = None
-        self.headset_goal = None  # Add headset goal
-        self._goal_lock = threading.Lock()  # Add thread lock
+        self.goals = None  # Latest-goal mailbox of the VR server
     
     def initialize(self):
         """Initialize VR monitor"""
@@ -195,16 +191,14 @@ class VRMonitor:
         self.config.enable_keyboard = False
         self.config.enable_https = True  # Enable HTTPS server, VR requires web interface
         
-        # Create command queue
-        self.command_queue = asyncio.Queue()
-        
         # Create VR server (print-only mode)
         try:
             self.vr_server = VRWebSocketServer(
-                command_queue=self.command_queue,
+                command_queue=None,  # No command queue, goals are read from the mailbox
                 config=self.config,
-                print_only=False  # Changed to False to send data to queue
+                print_only=False  # Changed to False to post goals to the mailbox
             )
+            self.goals = self.vr_server.goals
         except Exception as e:
             print(f"❌ Failed to create VR WebSocket server: {e}")
             return False
@@ -258,33 +252,11 @@ class VRMonitor:
             await self.stop_monitoring()
     
     async def monitor_commands(self):
-        """Monitor commands from VR controllers"""
+        """Keep running until stopped, the VR server posts the goals to the mailbox"""
         print("📊 Monitoring VR control commands...")
         
         while self.is_running:
-            try:
-                # Wait for command with 1-second timeout
-                goal = await asyncio.wait_for(self.command_queue.get(), timeout=1.0)
-                
-                # Save goal by arm type
-                with self._goal_lock:
-                    if goal.arm == "left":
-                        self.left_goal = goal
-                    elif goal.arm == "right":
-                        self.right_goal = goal
-                    elif goal.arm == "headset":  # Add headset data processing
-                        self.headset_goal = goal
-                    
-                    # Maintain backward compatibility, save latest goal
-                    self.latest_goal = goal
-                
-            except asyncio.TimeoutError:
-                # Timeout, continue loop
-                continue
-            except Exception as e:
-                print(f"❌ Error processing command: {e}")
-                import traceback
-                print(f"Traceback: {traceback.format_exc()}")
+            await asyncio.sleep(1.0)
     
     def print_control_goal(self, goal):
         """Print control goal information"""
@@ -317,29 +289,36 @@ class VRMonitor:
     def get_latest_goal_nowait(self, arm=None):
         """Return the latest VR control goal if available, else None.
         
+        Goals carry their `sequence` number and `age` in seconds. Gripper toggles,
+        resets and idle goals are events, read them with `get_goal_events`.
+        
         Args:
-            arm: If specified ("left" or "right"), return that arm's goal.
-                 If None, return a dict containing both left and right goals.
+            arm: If specified ("left", "right" or "headset"), return that arm's goal.
+                 If None, return a dict containing the left, right and headset goals.
         """
-        with self._goal_lock:
-            if arm == "left":
-                return self.left_goal
-            elif arm == "right":
-                return self.right_goal
-            elif arm == "headset":  # Add headset data retrieval
-                return self.headset_goal
-            else:
-                # Return dictionary containing both left and right controllers
-                dual_goals = {
-                    "left": self.left_goal,
-                    "right": self.right_goal,
-                    "headset": self.headset_goal,  # Add headset data
-                    "has_left": self.left_goal is not None,
-                    "has_right": self.right_goal is not None,
-                    "has_headset": self.headset_goal is not None  # Add headset status
-                }
-                
-                return dual_goals
+        def latest(name):
+            return self.goals.latest(name) if self.goals is not None else None
+        
+        if arm is not None:
+            return latest(arm)
+        
+        left_goal = latest("left")
+        right_goal = latest("right")
+        headset_goal = latest("headset")
+        return {
+            "left": left_goal,
+            "right": right_goal,
+            "headset": headset_goal,
+            "has_left": left_goal is not None,
+            "has_right": right_goal is not None,
+            "has_headset": headset_goal is not None
+        }
+    
+    def get_goal_events(self, arm=None):
+        """Consume the event goals (gripper toggles, resets, idle) of an arm or of all arms, oldest first."""
+        if self.goals is None:
+            return []
+        return self.goals.pop_events(arm)
     
     def get_left_goal_nowait(self):
         """Return the latest left arm goal if available, else None."""
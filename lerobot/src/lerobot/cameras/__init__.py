@@ -13,5 +13,7 @@
 # limitations under the License.
 
 from .camera import Camera
+from .camera_group import CameraGroup, SynchronizedFrames
 from .configs import CameraConfig, ColorMode, Cv2Rotation
+from .frame_buffer import CompressedFrame, FrameBuffer, TimestampedFrame
 from .utils import make_cameras_from_configs
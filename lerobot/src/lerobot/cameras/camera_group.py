@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Synchronized reads of several cameras.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+from .camera import Camera
+from .frame_buffer import TimestampedFrame
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SynchronizedFrames:
+    """The frames of a `CameraGroup` read, with their capture times.
+
+    Attributes:
+        frames: The frame of each camera, by camera name.
+        timestamp: The reference time the frames were picked for, on the `time.perf_counter` clock.
+    """
+
+    frames: dict[str, TimestampedFrame]
+    timestamp: float
+
+    @property
+    def images(self) -> dict[str, NDArray[Any]]:
+        return {name: f.frame for name, f in self.frames.items()}
+
+    @property
+    def skew_s(self) -> float:
+        """Time between the oldest and the most recent capture of the frames, in seconds."""
+        if not self.frames:
+            return 0.0
+        timestamps = [f.timestamp for f in self.frames.values()]
+        return max(timestamps) - min(timestamps)
+
+
+class CameraGroup:
+    """Reads the frames of several cameras captured as close in time as possible.
+
+    Cameras with a `frame_buffer` (`OpenCVCamera`, `RealSenseCamera`) timestamp every frame in their read
+    thread and keep the last ones, so a read picks, for each camera, the buffered frame closest to a reference
+    time without waiting for a new frame. By default, the reference time is the capture time of the oldest of
+    the latest frames of the cameras, which minimizes the skew between the returned frames. Other cameras are
+    read with `async_read` and timestamped on return.
+
+    Args:
+        cameras: The connected cameras, by name.
+        max_skew_ms: Logs a warning when the skew of a read exceeds this value. None disables the check.
+
+    Example:
+        ```python
+        group = CameraGroup(robot.cameras, max_skew_ms=20)
+        frames = group.read()
+        obs.update(frames.images)
+        print(f"skew: {frames.skew_s * 1e3:.1f}ms")
+        ```
+    """
+
+    def __init__(self, cameras: dict[str, Camera], max_skew_ms: float | None = None):
+        self.cameras = cameras
+        self.max_skew_ms = max_skew_ms
+        self._sequences = dict.fromkeys(cameras, 0)
+
+    def _latest_frame(self, name: str, cam: Camera, timeout_ms: float) -> TimestampedFrame:
+        buffer = getattr(cam, "frame_buffer", None)
+        if buffer is None:
+            frame = TimestampedFrame(cam.async_read(timeout_ms), time.perf_counter(), self._sequences[name])
+            self._sequences[name] += 1
+            return frame
+
+        latest = buffer.latest()
+        if latest is None:
+            # Starts the read thread of the camera and waits for its first frame
+            cam.async_read(timeout_ms)
+            latest = buffer.latest()
+        elif time.perf_counter() - latest.timestamp > timeout_ms / 1e3:
+            # The read thread stalled, only return a frame if a new one arrives in time
+            latest = buffer.wait(latest.sequence, timeout_ms / 1e3)
+
+        if latest is None:
+            raise TimeoutError(f"Timed out waiting for a new frame from camera {cam} after {timeout_ms} ms.")
+        return latest
+
+    def read(self, timestamp: float | None = None, timeout_ms: float = 200) -> SynchronizedFrames:
+        """Returns the frame of each camera captured closest to `timestamp`.
+
+        Args:
+            timestamp: Reference time on the `time.perf_counter` clock. Defaults to the capture time of the
+                oldest of the latest frames of the cameras.
+            timeout_ms: Maximum time in milliseconds to wait for a camera that has no recent frame.
+
+        Returns:
+            SynchronizedFrames: The frames, with their capture times and the reference time.
+
+        Raises:
+            TimeoutError: If a camera has not captured a frame within the last `timeout_ms`, and no new frame
+                arrives within `timeout_ms`.
+        """
+        latest = {name: self._latest_frame(name, cam, timeout_ms) for name, cam in self.cameras.items()}
+        if timestamp is None:
+            timestamp = min((f.timestamp for f in latest.values()), default=time.perf_counter())
+
+        frames = {}
+        for name, cam in self.cameras.items():
+            buffer = getattr(cam, "frame_buffer", None)
+            frames[name] = (buffer.closest(timestamp) if buffer is not None else None) or latest[name]
+
+        synchronized = SynchronizedFrames(frames, timestamp)
+        if self.max_skew_ms is not None and synchronized.skew_s * 1e3 > self.max_skew_ms:
+            logger.warning(
+                f"Camera frames are {synchronized.skew_s * 1e3:.1f}ms apart (max {self.max_skew_ms}ms): "
+                + ", ".join(f"{name}={f.timestamp - timestamp:+.4f}s" for name, f in frames.items())
+            )
+        return synchronized
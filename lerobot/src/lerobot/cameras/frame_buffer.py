@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Ring buffer of the most recent timestamped frames of a camera.
+"""
+
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Condition, Lock
+from typing import Any
+
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+
+class CompressedFrame:
+    """A JPEG frame as delivered by the camera, decoded on first access.
+
+    Consumers that only forward the frame (e.g. over the network) use `jpeg` and never pay for the decoding.
+
+    Args:
+        jpeg: The JPEG bytes, as a 1D uint8 array.
+        decode: Converts the JPEG bytes to the processed frame.
+    """
+
+    def __init__(self, jpeg: NDArray[Any], decode: Callable[[NDArray[Any]], NDArray[Any]]):
+        self.jpeg = jpeg
+        self._decode = decode
+        self._frame: NDArray[Any] | None = None
+        self._lock = Lock()
+
+    def decode(self) -> NDArray[Any]:
+        """Returns the processed frame, decoding it once for all the consumers."""
+        with self._lock:
+            if self._frame is None:
+                self._frame = self._decode(self.jpeg)
+            return self._frame
+
+
+@dataclass(frozen=True)
+class TimestampedFrame:
+    """A camera frame with its capture time.
+
+    Attributes:
+        data: The processed frame, or the compressed frame for cameras in MJPEG passthrough mode.
+        timestamp: Capture time in seconds, on the `time.perf_counter` clock shared by all the cameras of the
+            process.
+        sequence: Index of the frame since the buffer was created, to detect frames read twice or dropped.
+    """
+
+    data: NDArray[Any] | CompressedFrame
+    timestamp: float
+    sequence: int
+
+    @property
+    def frame(self) -> NDArray[Any]:
+        """The processed frame, decoded on first access if compressed."""
+        return self.data.decode() if isinstance(self.data, CompressedFrame) else self.data
+
+    @property
+    def jpeg(self) -> NDArray[Any] | None:
+        """The JPEG bytes as delivered by the camera, or None if the frame is not compressed."""
+        return self.data.jpeg if isinstance(self.data, CompressedFrame) else None
+
+
+class FrameBuffer:
+    """Thread-safe ring buffer keeping the last `size` frames of a camera.
+
+    The camera read thread `put`s every captured frame, readers pick the latest frame or the one closest to a
+    given time without consuming it.
+
+    Args:
+        size: Number of frames kept. At 30 fps, the default keeps the last ~260ms.
+    """
+
+    def __init__(self, size: int = 8):
+        if size < 1:
+            raise ValueError(f"`size` must be at least 1, got {size}.")
+        self._frames: deque[TimestampedFrame] = deque(maxlen=size)
+        self._condition = Condition()
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._frames)
+
+    def put(self, frame: NDArray[Any] | CompressedFrame, timestamp: float) -> TimestampedFrame:
+        """Adds a frame captured at `timestamp`, dropping the oldest one if the buffer is full."""
+        with self._condition:
+            timestamped_frame = TimestampedFrame(frame, timestamp, self._sequence)
+            self._sequence += 1
+            self._frames.append(timestamped_frame)
+            self._condition.notify_all()
+        return timestamped_frame
+
+    def latest(self) -> TimestampedFrame | None:
+        """Returns the most recent frame, or None if the buffer is empty."""
+        with self._condition:
+            return self._frames[-1] if self._frames else None
+
+    def closest(self, timestamp: float) -> TimestampedFrame | None:
+        """Returns the frame captured closest to `timestamp`, or None if the buffer is empty."""
+        with self._condition:
+            if not self._frames:
+                return None
+            return min(self._frames, key=lambda f: abs(f.timestamp - timestamp))
+
+    def wait(self, after_sequence: int = -1, timeout: float | None = None) -> TimestampedFrame | None:
+        """Waits for a frame newer than `after_sequence` and returns the most recent frame.
+
+        Args:
+            after_sequence: Sequence number of the last frame seen by the caller, -1 to wait for any frame.
+            timeout: Maximum time to wait in seconds, None to wait forever.
+
+        Returns:
+            The most recent frame, or None if no newer frame arrived before `timeout`.
+        """
+        with self._condition:
+            has_new_frame = self._condition.wait_for(
+                lambda: bool(self._frames) and self._frames[-1].sequence > after_sequence, timeout
+            )
+            return self._frames[-1] if has_new_frame else None
+
+    def clear(self) -> None:
+        """Drops all the frames, e.g. when the camera disconnects."""
+        with self._condition:
+            self._frames.clear()
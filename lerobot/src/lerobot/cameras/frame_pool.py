@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Pool of preallocated frame arrays, reused by the camera read threads.
+"""
+
+import sys
+from threading import Lock
+from typing import Any
+
+import numpy as np
+from numpy.typing import DTypeLike, NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+
+class FramePool:
+    """Ring of frame arrays that are only reused once nothing outside the pool references them.
+
+    The camera read thread captures, color converts and rotates every frame into arrays of the pool instead
+    of allocating new ones. The frames are handed out as is: an array still referenced by a consumer (a
+    `FrameBuffer`, an observation, a queue of images to write...) is never reused. If all the arrays of the
+    pool are referenced, the oldest one is left to its consumers and replaced by a new array.
+
+    Args:
+        size: Number of arrays in the pool. It should exceed the number of frames kept by consumers, e.g. the
+            `FrameBuffer` size plus a few frames, for the pool to stop allocating.
+    """
+
+    def __init__(self, size: int = 12):
+        if size < 1:
+            raise ValueError(f"`size` must be at least 1, got {size}.")
+        self.size = size
+        self._frames: list[NDArray[Any] | None] = [None] * size
+        self._next = 0
+        self._lock = Lock()
+        self.num_allocations = 0
+
+    def _is_free(self, index: int) -> bool:
+        # The only references are the pool list and the argument of `getrefcount`
+        return sys.getrefcount(self._frames[index]) == 2
+
+    def get(self, shape: tuple[int, ...], dtype: DTypeLike = np.uint8) -> NDArray[Any]:
+        """Returns an array of `shape` and `dtype` to write a frame into, without allocating if possible."""
+        dtype = np.dtype(dtype)
+        with self._lock:
+            replaceable = None
+            for _ in range(self.size):
+                index = self._next
+                self._next = (index + 1) % self.size
+                frame = self._frames[index]
+                if frame is None:
+                    replaceable = index if replaceable is None else replaceable
+                    continue
+                matches = frame.shape == shape and frame.dtype == dtype
+                del frame
+                if self._is_free(index):
+                    if matches:
+                        return self._frames[index]
+                    replaceable = index if replaceable is None else replaceable
+
+            # Allocate in an empty or unused slot, or else replace the oldest array
+            index = self._next if replaceable is None else replaceable
+            self._frames[index] = np.empty(shape, dtype=dtype)
+            self._next = (index + 1) % self.size
+            self.num_allocations += 1
+            return self._frames[index]
+
+    def clear(self) -> None:
+        """Drops the references of the pool to its arrays."""
+        with self._lock:
+            self._frames = [None] * self.size
+            self._next = 0
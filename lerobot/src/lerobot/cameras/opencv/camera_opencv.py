@@ -35,6 +35,8 @@ import cv2  # type: ignore  # TODO: add type stubs for OpenCV
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
 from ..camera import Camera
+from ..frame_buffer import CompressedFrame, FrameBuffer
+from ..frame_pool import FramePool
 from ..utils import get_cv2_backend, get_cv2_rotation
 from .configuration_opencv import ColorMode, OpenCVCameraConfig
 
@@ -48,6 +50,11 @@ MAX_OPENCV_INDEX = 60
 logger = logging.getLogger(__name__)
 
 
+def _is_jpeg_buffer(frame: NDArray[Any]) -> bool:
+    """Whether the backend returned the undecoded MJPEG buffer (a single row of bytes) instead of an image."""
+    return frame.ndim == 1 or frame.shape[0] == 1
+
+
 class OpenCVCamera(Camera):
     """
     Manages camera interactions using OpenCV for efficient frame recording.
@@ -122,8 +129,12 @@ class OpenCVCamera(Camera):
         self.thread: Thread | None = None
         self.stop_event: Event | None = None
         self.frame_lock: Lock = Lock()
-        self.latest_frame: NDArray[Any] | None = None
+        self.latest_frame: NDArray[Any] | CompressedFrame | None = None
         self.new_frame_event: Event = Event()
+        self.frame_buffer: FrameBuffer = FrameBuffer()
+        # Captured, converted and rotated frames are written in reused arrays, see `FramePool`
+        self.frame_pool: FramePool = FramePool()
+        self._capture_timestamp: float | None = None
 
         self.rotation: int | None = get_cv2_rotation(config.rotation)
         self.backend: int = get_cv2_backend()
@@ -208,6 +219,10 @@ class OpenCVCamera(Camera):
         if self.videocapture is None:
             raise DeviceNotConnectedError(f"{self} videocapture is not initialized")
 
+        # Ask the backend for the undecoded MJPEG buffer, only honored by some backends (e.g. V4L2)
+        if self.config.mjpeg_passthrough and not self.videocapture.set(cv2.CAP_PROP_CONVERT_RGB, 0):
+            logger.warning(f"{self} backend does not support MJPEG passthrough, frames will be decoded.")
+
         default_width = int(round(self.videocapture.get(cv2.CAP_PROP_FRAME_WIDTH)))
         default_height = int(round(self.videocapture.get(cv2.CAP_PROP_FRAME_HEIGHT)))
 
@@ -367,20 +382,61 @@ class OpenCVCamera(Camera):
 
         start_time = time.perf_counter()
 
+        frame = self._grab_and_retrieve()
+        if self.config.mjpeg_passthrough and _is_jpeg_buffer(frame):
+            processed_frame = self._decode_jpeg(frame.reshape(-1), color_mode)
+        else:
+            processed_frame = self._postprocess_image(frame, color_mode)
+
+        read_duration_ms = (time.perf_counter() - start_time) * 1e3
+        logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
+
+        return processed_frame
+
+    def _grab_and_retrieve(self) -> NDArray[Any]:
+        """Reads the next frame as returned by the backend, recording its capture time."""
         if self.videocapture is None:
             raise DeviceNotConnectedError(f"{self} videocapture is not initialized")
 
-        ret, frame = self.videocapture.read()
+        # Grab and decode separately to timestamp the frame as soon as it is received
+        if not self.videocapture.grab():
+            raise RuntimeError(f"{self} read failed (grab).")
+        self._capture_timestamp = time.perf_counter()
+        if self.config.mjpeg_passthrough or self.capture_height is None or self.capture_width is None:
+            ret, frame = self.videocapture.retrieve()
+        else:
+            capture_buffer = self.frame_pool.get((self.capture_height, self.capture_width, 3))
+            ret, frame = self.videocapture.retrieve(capture_buffer)
 
         if not ret or frame is None:
             raise RuntimeError(f"{self} read failed (status={ret}).")
 
-        processed_frame = self._postprocess_image(frame, color_mode)
+        return frame
 
-        read_duration_ms = (time.perf_counter() - start_time) * 1e3
-        logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
+    def _read_frame(self) -> NDArray[Any] | CompressedFrame:
+        """
+        Reads a frame for the background thread.
 
-        return processed_frame
+        In MJPEG passthrough mode, returns the JPEG bytes delivered by the camera, decoded on first access.
+        Otherwise, or if the backend already decoded the frame, returns the processed frame like `read`.
+        """
+        if not self.config.mjpeg_passthrough:
+            return self.read()
+
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        frame = self._grab_and_retrieve()
+        if not _is_jpeg_buffer(frame):
+            return self._postprocess_image(frame)
+        return CompressedFrame(frame.reshape(-1), self._decode_jpeg)
+
+    def _decode_jpeg(self, jpeg: NDArray[Any], color_mode: ColorMode | None = None) -> NDArray[Any]:
+        """Decodes a JPEG buffer delivered by the camera and applies `_postprocess_image`."""
+        image = cv2.imdecode(jpeg, cv2.IMREAD_COLOR)
+        if image is None:
+            raise RuntimeError(f"{self} failed to decode the MJPEG frame ({jpeg.size} bytes).")
+        return self._postprocess_image(image, color_mode)
 
     def _postprocess_image(self, image: NDArray[Any], color_mode: ColorMode | None = None) -> NDArray[Any]:
         """
@@ -418,10 +474,14 @@ class OpenCVCamera(Camera):
 
         processed_image = image
         if requested_color_mode == ColorMode.RGB:
-            processed_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            processed_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=self.frame_pool.get(image.shape))
 
         if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]:
-            processed_image = cv2.rotate(processed_image, self.rotation)
+            h, w = processed_image.shape[:2]
+            rotated_shape = (h, w, c) if self.rotation == cv2.ROTATE_180 else (w, h, c)
+            processed_image = cv2.rotate(
+                processed_image, self.rotation, dst=self.frame_pool.get(rotated_shape)
+            )
 
         return processed_image
 
@@ -431,7 +491,7 @@ class OpenCVCamera(Camera):
 
         On each iteration:
         1. Reads a color frame
-        2. Stores result in latest_frame (thread-safe)
+        2. Stores result in latest_frame (thread-safe) and, with its capture time, in frame_buffer
         3. Sets new_frame_event to notify listeners
 
         Stops on DeviceNotConnectedError, logs other errors and continues.
@@ -441,7 +501,8 @@ class OpenCVCamera(Camera):
 
         while not self.stop_event.is_set():
             try:
-                color_image = self.read()
+                color_image = self._read_frame()
+                self.frame_buffer.put(color_image, self._capture_timestamp)
 
                 with self.frame_lock:
                     self.latest_frame = color_image
@@ -516,6 +577,8 @@ class OpenCVCamera(Camera):
         if frame is None:
             raise RuntimeError(f"Internal error: Event set but no frame available for {self}.")
 
+        if isinstance(frame, CompressedFrame):
+            return frame.decode()
         return frame
 
     def disconnect(self) -> None:
@@ -533,6 +596,7 @@ class OpenCVCamera(Camera):
 
         if self.thread is not None:
             self._stop_read_thread()
+        self.frame_buffer.clear()
 
         if self.videocapture is not None:
             self.videocapture.release()
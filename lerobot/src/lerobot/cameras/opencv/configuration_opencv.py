@@ -38,6 +38,7 @@ class OpenCVCameraConfig(CameraConfig):
     # Advanced configurations with FOURCC format
     OpenCVCameraConfig(128422271347, 30, 640, 480, rotation=Cv2Rotation.ROTATE_90, fourcc="MJPG")     # With 90° rotation and MJPG format
     OpenCVCameraConfig(0, 30, 1280, 720, fourcc="YUYV")     # With YUYV format
+    OpenCVCameraConfig(0, 30, 1280, 720, fourcc="MJPG", mjpeg_passthrough=True)   # Keeps the camera JPEG bytes
     ```
 
     Attributes:
@@ -50,11 +51,15 @@ class OpenCVCameraConfig(CameraConfig):
         rotation: Image rotation setting (0°, 90°, 180°, or 270°). Defaults to no rotation.
         warmup_s: Time reading frames before returning from connect (in seconds)
         fourcc: FOURCC code for video format (e.g., "MJPG", "YUYV", "I420"). Defaults to None (auto-detect).
+        mjpeg_passthrough: Keep the JPEG bytes delivered by the camera and only decode them when a consumer needs
+            the pixels, so they can be forwarded without re-encoding. Requires `fourcc="MJPG"`. Defaults to False.
 
     Note:
         - Only 3-channel color output (RGB/BGR) is currently supported.
         - FOURCC codes must be 4-character strings (e.g., "MJPG", "YUYV"). Some common FOUCC codes: https://learn.microsoft.com/en-us/windows/win32/medfound/video-fourccs#fourcc-constants
         - Setting FOURCC can help achieve higher frame rates on some cameras.
+        - MJPEG passthrough relies on the backend returning the raw buffer (V4L2 on Linux). The JPEG bytes are
+          neither rotated nor color converted. With other backends, frames are decoded as usual.
     """
 
     index_or_path: int | Path
@@ -62,6 +67,7 @@ class OpenCVCameraConfig(CameraConfig):
     rotation: Cv2Rotation = Cv2Rotation.NO_ROTATION
     warmup_s: int = 1
     fourcc: str | None = None
+    mjpeg_passthrough: bool = False
 
     def __post_init__(self) -> None:
         if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
@@ -83,3 +89,8 @@ class OpenCVCameraConfig(CameraConfig):
             raise ValueError(
                 f"`fourcc` must be a 4-character string (e.g., 'MJPG', 'YUYV'), but '{self.fourcc}' is provided."
             )
+
+        if self.mjpeg_passthrough and self.fourcc != "MJPG":
+            raise ValueError(
+                f"`mjpeg_passthrough` requires `fourcc` to be 'MJPG', but '{self.fourcc}' is provided."
+            )
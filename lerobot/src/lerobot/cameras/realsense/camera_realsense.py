@@ -34,6 +34,8 @@ from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnected
 
 from ..camera import Camera
 from ..configs import ColorMode
+from ..frame_buffer import FrameBuffer
+from ..frame_pool import FramePool
 from ..utils import get_cv2_rotation
 from .configuration_realsense import RealSenseCameraConfig
 
@@ -135,6 +137,11 @@ class RealSenseCamera(Camera):
         self.frame_lock: Lock = Lock()
         self.latest_frame: NDArray[Any] | None = None
         self.new_frame_event: Event = Event()
+        self.frame_buffer: FrameBuffer = FrameBuffer()
+        # Processed color and depth frames are written in reused arrays, see `FramePool`
+        self.frame_pool: FramePool = FramePool()
+        self.depth_frame_pool: FramePool = FramePool(size=4)
+        self._capture_timestamp: float | None = None
 
         self.rotation: int | None = get_cv2_rotation(config.rotation)
 
@@ -390,6 +397,7 @@ class RealSenseCamera(Camera):
 
         if not ret or frame is None:
             raise RuntimeError(f"{self} read failed (status={ret}).")
+        self._capture_timestamp = time.perf_counter()
 
         color_frame = frame.get_color_frame()
         color_image_raw = np.asanyarray(color_frame.get_data())
@@ -439,12 +447,21 @@ class RealSenseCamera(Camera):
                 f"{self} frame width={w} or height={h} do not match configured width={self.capture_width} or height={self.capture_height}."
             )
 
+        pool = self.depth_frame_pool if depth_frame else self.frame_pool
         processed_image = image
-        if self.color_mode == ColorMode.BGR:
-            processed_image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+        if not depth_frame and self.color_mode == ColorMode.BGR:
+            processed_image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR, dst=pool.get(image.shape))
 
         if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]:
-            processed_image = cv2.rotate(processed_image, self.rotation)
+            rotated_shape = image.shape if self.rotation == cv2.ROTATE_180 else (w, h, *image.shape[2:])
+            processed_image = cv2.rotate(
+                processed_image, self.rotation, dst=pool.get(rotated_shape, image.dtype)
+            )
+
+        if processed_image is image:
+            # Copy out of the RealSense frame memory, so that the frame is released to the pipeline
+            processed_image = pool.get(image.shape, image.dtype)
+            np.copyto(processed_image, image)
 
         return processed_image
 
@@ -454,7 +471,7 @@ class RealSenseCamera(Camera):
 
         On each iteration:
         1. Reads a color frame with 500ms timeout
-        2. Stores result in latest_frame (thread-safe)
+        2. Stores result in latest_frame (thread-safe) and, with its capture time, in frame_buffer
         3. Sets new_frame_event to notify listeners
 
         Stops on DeviceNotConnectedError, logs other errors and continues.
@@ -465,6 +482,7 @@ class RealSenseCamera(Camera):
         while not self.stop_event.is_set():
             try:
                 color_image = self.read(timeout_ms=500)
+                self.frame_buffer.put(color_image, self._capture_timestamp)
 
                 with self.frame_lock:
                     self.latest_frame = color_image
@@ -559,6 +577,7 @@ class RealSenseCamera(Camera):
 
         if self.thread is not None:
             self._stop_read_thread()
+        self.frame_buffer.clear()
 
         if self.rs_pipeline is not None:
             self.rs_pipeline.stop()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Camera broker publishing the frames of cameras in shared memory.
+"""
+
+import logging
+import time
+from threading import Event, Thread
+
+from lerobot.utils.errors import DeviceNotConnectedError
+
+from ..camera import Camera
+from ..configs import ColorMode
+from .shared_frame_ring import SharedFrameRing, shared_memory_name
+
+logger = logging.getLogger(__name__)
+
+
+class CameraBroker:
+    """Owns cameras and publishes each of their frames in a shared memory ring.
+
+    One thread per camera waits for the frames of the camera read thread and copies them in the ring of the
+    camera, named after the camera, where `SharedMemoryCamera`s of any process read them. Cameras with a
+    `frame_buffer` publish their capture timestamps, and their compressed frames are decoded once for all the
+    readers.
+
+    Args:
+        cameras: The cameras to publish, by name. The broker connects the cameras that are not connected yet.
+        num_slots: Number of frames kept in shared memory per camera.
+
+    Example:
+        ```python
+        broker = CameraBroker(make_cameras_from_configs(camera_configs))
+        broker.start()
+        ...
+        broker.stop()
+        ```
+    """
+
+    def __init__(self, cameras: dict[str, Camera], num_slots: int = 4):
+        self.cameras = cameras
+        self.num_slots = num_slots
+        self.rings: dict[str, SharedFrameRing] = {}
+        self.threads: dict[str, Thread] = {}
+        self.stop_event = Event()
+        self._connected_by_broker: list[str] = []
+
+    def start(self, timeout_ms: float = 1000) -> None:
+        """Connects the cameras, creates their shared memory rings and starts publishing their frames."""
+        self.stop_event.clear()
+        for name, cam in self.cameras.items():
+            if not cam.is_connected:
+                cam.connect()
+                self._connected_by_broker.append(name)
+
+            # Also starts the read thread of the camera
+            first_frame = cam.async_read(timeout_ms)
+            self.rings[name] = SharedFrameRing.create(
+                shared_memory_name(name),
+                first_frame.shape,
+                color_mode=getattr(cam, "color_mode", ColorMode.RGB),
+                fps=cam.fps or 0.0,
+                num_slots=self.num_slots,
+            )
+            self.threads[name] = Thread(
+                target=self._publish_loop, args=(name, cam), name=f"{name}_publish_loop", daemon=True
+            )
+            self.threads[name].start()
+            logger.info(f"Publishing {cam} as '{name}' ({first_frame.shape[1]}x{first_frame.shape[0]}).")
+
+    def _publish_loop(self, name: str, cam: Camera) -> None:
+        ring = self.rings[name]
+        buffer = getattr(cam, "frame_buffer", None)
+        last_sequence = -1
+        while not self.stop_event.is_set():
+            try:
+                if buffer is not None:
+                    frame = buffer.wait(last_sequence, timeout=0.5)
+                    if frame is None:
+                        continue
+                    last_sequence = frame.sequence
+                    ring.write(frame.frame, frame.timestamp)
+                else:
+                    image = cam.async_read(timeout_ms=500)
+                    ring.write(image, time.perf_counter())
+            except DeviceNotConnectedError:
+                break
+            except Exception as e:
+                logger.warning(f"Error publishing frame of {cam}: {e}")
+
+    def stop(self) -> None:
+        """Stops publishing, removes the shared memory rings and disconnects the cameras it connected."""
+        self.stop_event.set()
+        for thread in self.threads.values():
+            thread.join(timeout=2.0)
+        self.threads = {}
+
+        for ring in self.rings.values():
+            ring.close()
+        self.rings = {}
+
+        for name in self._connected_by_broker:
+            if self.cameras[name].is_connected:
+                self.cameras[name].disconnect()
+        self._connected_by_broker = []
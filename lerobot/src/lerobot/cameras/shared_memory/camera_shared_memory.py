@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides the SharedMemoryCamera class for reading the frames a camera broker publishes in shared memory.
+"""
+
+import logging
+import math
+import time
+from typing import Any
+
+import cv2  # type: ignore  # TODO: add type stubs for OpenCV
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
+
+from ..camera import Camera
+from ..configs import ColorMode
+from ..frame_buffer import TimestampedFrame
+from .configuration_shared_memory import SharedMemoryCameraConfig
+from .shared_frame_ring import SHARED_MEMORY_PREFIX, SharedFrameRing, shared_memory_name
+
+logger = logging.getLogger(__name__)
+
+# Interval between two checks for a new frame in shared memory
+POLL_INTERVAL_S = 0.0005
+
+
+class SharedMemoryCamera(Camera):
+    """
+    Reads the frames of a camera published in shared memory by a camera broker.
+
+    Only one process can open a camera device. The camera broker (`lerobot-camera-broker`) owns the devices
+    and copies every frame in a shared memory ring, from which any number of `SharedMemoryCamera`s, in any
+    number of processes, read it. The frames are decoded, rotated and color converted once by the broker.
+
+    `read` and `async_read` both return the latest frame published since the previous read, waiting for it
+    if needed. The capture time and sequence number of the last frame read are in `last_frame`.
+
+    Example:
+        ```shell
+        lerobot-camera-broker \
+            --cameras="{ head: {type: opencv, index_or_path: /dev/video0, width: 640, height: 480, fps: 30}}"
+        ```
+
+        ```python
+        from lerobot.cameras.shared_memory import SharedMemoryCamera, SharedMemoryCameraConfig
+
+        camera = SharedMemoryCamera(SharedMemoryCameraConfig(name="head"))
+        camera.connect()
+        frame = camera.async_read()
+        camera.disconnect()
+        ```
+    """
+
+    def __init__(self, config: SharedMemoryCameraConfig):
+        """
+        Initializes the SharedMemoryCamera instance.
+
+        Args:
+            config: The configuration settings for the camera.
+        """
+        super().__init__(config)
+
+        self.config = config
+        self.name = config.name
+        self.color_mode = config.color_mode
+
+        self.ring: SharedFrameRing | None = None
+        self.last_frame: TimestampedFrame | None = None
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.name})"
+
+    @property
+    def is_connected(self) -> bool:
+        """Checks if the camera is attached to the shared memory of a running broker."""
+        return self.ring is not None and not self.ring.closed
+
+    def connect(self, warmup: bool = True) -> None:
+        """
+        Attaches to the shared memory of the broker camera and checks its resolution and FPS.
+
+        Raises:
+            DeviceAlreadyConnectedError: If the camera is already connected.
+            ConnectionError: If the broker does not publish the camera.
+            RuntimeError: If the broker camera resolution, FPS or color mode do not match the configuration.
+        """
+        if self.is_connected:
+            raise DeviceAlreadyConnectedError(f"{self} is already connected.")
+
+        try:
+            ring = SharedFrameRing.attach(shared_memory_name(self.name))
+        except FileNotFoundError as e:
+            raise ConnectionError(
+                f"{self} is not published. Start the camera broker with `lerobot-camera-broker` first."
+            ) from e
+
+        try:
+            self._validate_stream(ring)
+        except RuntimeError:
+            ring.close()
+            raise
+        self.ring = ring
+        self.last_frame = None
+
+        if warmup:
+            self.async_read(timeout_ms=1000)
+
+        logger.info(f"{self} connected.")
+
+    def _validate_stream(self, ring: SharedFrameRing) -> None:
+        height, width, _ = ring.shape
+        if (self.width is not None and self.width != width) or (
+            self.height is not None and self.height != height
+        ):
+            raise RuntimeError(
+                f"{self} broker frames are {width}x{height}, but {self.width}x{self.height} is configured."
+            )
+        self.width, self.height = width, height
+
+        if self.fps is not None and ring.fps > 0 and not math.isclose(self.fps, ring.fps, rel_tol=1e-3):
+            raise RuntimeError(f"{self} broker camera runs at {ring.fps} fps, but {self.fps} is configured.")
+        if self.fps is None and ring.fps > 0:
+            self.fps = ring.fps
+
+        if self.config.zero_copy and self.color_mode != ring.color_mode:
+            raise RuntimeError(
+                f"{self} `zero_copy` requires the broker color mode {ring.color_mode.value}, "
+                f"but {self.color_mode.value} is configured."
+            )
+
+    @staticmethod
+    def find_cameras() -> list[dict[str, Any]]:
+        """
+        Lists the cameras published by the camera brokers of the machine (Linux only).
+
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries,
+            where each dictionary contains 'name', 'type', 'id' (shared memory name),
+            and the stream properties (width, height, fps, color mode).
+        """
+        found_cameras_info = []
+        for shm_name in SharedFrameRing.list_names():
+            try:
+                ring = SharedFrameRing.attach(shm_name)
+            except (FileNotFoundError, ValueError):
+                continue
+            height, width, _ = ring.shape
+            found_cameras_info.append(
+                {
+                    "name": shm_name.removeprefix(SHARED_MEMORY_PREFIX),
+                    "type": "SharedMemory",
+                    "id": shm_name,
+                    "default_stream_profile": {
+                        "width": width,
+                        "height": height,
+                        "fps": ring.fps,
+                        "color_mode": ring.color_mode.value,
+                    },
+                }
+            )
+            ring.close()
+
+        return found_cameras_info
+
+    def _wait_for_frame(self, timeout_ms: float) -> TimestampedFrame:
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        last_sequence = self.last_frame.sequence if self.last_frame is not None else -1
+        deadline = time.perf_counter() + timeout_ms / 1e3
+        while True:
+            if self.ring.latest_sequence > last_sequence:
+                frame = self.ring.read(copy=not self.config.zero_copy)
+                if frame is not None:
+                    self.last_frame = frame
+                    return frame
+            if self.ring.closed:
+                raise DeviceNotConnectedError(f"{self} broker stopped.")
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"Timed out waiting for frame from camera {self} after {timeout_ms} ms.")
+            time.sleep(POLL_INTERVAL_S)
+
+    def _postprocess_image(self, image: NDArray[Any], color_mode: ColorMode | None = None) -> NDArray[Any]:
+        requested_color_mode = self.color_mode if color_mode is None else color_mode
+        if requested_color_mode not in (ColorMode.RGB, ColorMode.BGR):
+            raise ValueError(
+                f"Invalid color mode '{requested_color_mode}'. Expected {ColorMode.RGB} or {ColorMode.BGR}."
+            )
+        if requested_color_mode != self.ring.color_mode:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)  # Same as COLOR_RGB2BGR
+        return image
+
+    def read(self, color_mode: ColorMode | None = None) -> NDArray[Any]:
+        """
+        Reads the next frame published by the broker.
+
+        Args:
+            color_mode (Optional[ColorMode]): If specified, overrides the default
+                color mode (`self.color_mode`) for this read operation.
+
+        Returns:
+            np.ndarray: The frame (height, width, channels).
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected or the broker stopped.
+            TimeoutError: If the broker does not publish a new frame within 1 second.
+        """
+        frame = self._wait_for_frame(timeout_ms=1000)
+        return self._postprocess_image(frame.frame, color_mode)
+
+    def async_read(self, timeout_ms: float = 200) -> NDArray[Any]:
+        """
+        Returns the latest frame published by the broker since the previous read.
+
+        Args:
+            timeout_ms (float): Maximum time in milliseconds to wait for a new frame. Defaults to 200ms.
+
+        Returns:
+            np.ndarray: The frame (height, width, channels).
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected or the broker stopped.
+            TimeoutError: If no new frame is published within the specified timeout.
+        """
+        frame = self._wait_for_frame(timeout_ms)
+        return self._postprocess_image(frame.frame)
+
+    def disconnect(self) -> None:
+        """
+        Detaches from the shared memory of the broker.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is already disconnected.
+        """
+        if self.ring is None:
+            raise DeviceNotConnectedError(f"{self} not connected.")
+
+        self.last_frame = None
+        self.ring.close()
+        self.ring = None
+
+        logger.info(f"{self} disconnected.")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+
+from ..configs import CameraConfig, ColorMode
+
+__all__ = ["SharedMemoryCameraConfig", "ColorMode"]
+
+
+@CameraConfig.register_subclass("shared_memory")
+@dataclass
+class SharedMemoryCameraConfig(CameraConfig):
+    """Configuration class for cameras read from a camera broker through shared memory.
+
+    The camera broker (`lerobot-camera-broker`) owns the camera devices and publishes their frames in shared
+    memory, so that several processes can read the same camera.
+
+    Example configurations:
+    ```python
+    SharedMemoryCameraConfig(name="head")  # Resolution and FPS of the broker camera
+    SharedMemoryCameraConfig(name="head", fps=30, width=640, height=480)  # Checked against the broker camera
+    ```
+
+    Attributes:
+        name: Name of the camera in the broker.
+        fps: Expected frames per second. Defaults to the broker camera FPS.
+        width: Expected frame width in pixels. Defaults to the broker camera width.
+        height: Expected frame height in pixels. Defaults to the broker camera height.
+        color_mode: Color mode for image output (RGB or BGR). Defaults to RGB.
+        zero_copy: Return read-only views of the shared memory instead of copies. A view is overwritten by the
+            broker after a few new frames (`num_slots - 1`), so it must be used right away. Defaults to False.
+
+    Note:
+        - The frames are decoded, rotated and color converted once by the broker, for all the readers.
+        - With `zero_copy`, the color mode must match the broker camera one.
+    """
+
+    name: str
+    color_mode: ColorMode = ColorMode.RGB
+    zero_copy: bool = False
+
+    def __post_init__(self) -> None:
+        if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
+            raise ValueError(
+                f"`color_mode` is expected to be {ColorMode.RGB.value} or {ColorMode.BGR.value}, but {self.color_mode} is provided."
+            )
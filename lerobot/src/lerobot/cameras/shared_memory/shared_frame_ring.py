@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Ring of camera frames in shared memory, written by one process and read by any number of processes.
+"""
+
+import contextlib
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+from ..configs import ColorMode
+from ..frame_buffer import TimestampedFrame
+
+SHARED_MEMORY_PREFIX = "lerobot_camera_"
+
+_MAGIC = 0x4C52_4346  # "LRCF"
+_VERSION = 1
+_COLOR_MODES = [ColorMode.RGB, ColorMode.BGR]
+
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "<u4"),
+        ("version", "<u4"),
+        ("num_slots", "<u4"),
+        ("height", "<u4"),
+        ("width", "<u4"),
+        ("channels", "<u4"),
+        ("color_mode", "<u4"),
+        ("closed", "<u4"),
+        ("fps", "<f8"),
+        ("write_sequence", "<i8"),
+    ]
+)
+_SLOT_DTYPE = np.dtype([("sequence", "<i8"), ("timestamp", "<f8")])
+_FRAMES_OFFSET_ALIGNMENT = 64
+
+
+def shared_memory_name(camera_name: str) -> str:
+    """Name of the shared memory block of the broker camera `camera_name`."""
+    return f"{SHARED_MEMORY_PREFIX}{camera_name}"
+
+
+def _frames_offset(num_slots: int) -> int:
+    offset = _HEADER_DTYPE.itemsize + num_slots * _SLOT_DTYPE.itemsize
+    return -(-offset // _FRAMES_OFFSET_ALIGNMENT) * _FRAMES_OFFSET_ALIGNMENT
+
+
+class SharedFrameRing:
+    """Fixed-size ring of uint8 frames in a named shared memory block.
+
+    The writer (the camera broker) copies every frame into the next slot and then publishes its sequence
+    number. Readers map the same block and read the frames without any copy or decoding done by the writer
+    for them. A slot records the sequence number of the frame it holds, which readers check before and after
+    reading a frame to detect frames overwritten in the meantime.
+
+    Use `create` in the writer process and `attach` in the reader processes.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self.owner = owner
+        self._header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=shm.buf)
+        if self._header["magic"] != _MAGIC or self._header["version"] != _VERSION:
+            raise ValueError(f"Shared memory block '{shm.name}' is not a camera frame ring.")
+        self.num_slots = int(self._header["num_slots"])
+        self.shape = (int(self._header["height"]), int(self._header["width"]), int(self._header["channels"]))
+        self._slots = np.ndarray(
+            (self.num_slots,), dtype=_SLOT_DTYPE, buffer=shm.buf, offset=_HEADER_DTYPE.itemsize
+        )
+        self._frames = np.ndarray(
+            (self.num_slots, *self.shape),
+            dtype=np.uint8,
+            buffer=shm.buf,
+            offset=_frames_offset(self.num_slots),
+        )
+        if not owner:
+            self._frames.flags.writeable = False
+
+    @classmethod
+    def create(
+        cls,
+        name: str,
+        shape: tuple[int, int, int],
+        color_mode: ColorMode,
+        fps: float = 0.0,
+        num_slots: int = 4,
+    ) -> "SharedFrameRing":
+        """Creates the shared memory block, replacing a block left over by a previous writer.
+
+        Args:
+            name: Name of the shared memory block.
+            shape: (height, width, channels) of the frames.
+            color_mode: Color mode of the frames.
+            fps: Frame rate of the camera, for the readers.
+            num_slots: Number of frames kept. A frame read without copy stays valid while the writer writes the
+                next `num_slots - 1` frames.
+        """
+        if num_slots < 2:
+            raise ValueError(f"`num_slots` must be at least 2, got {num_slots}.")
+        size = _frames_offset(num_slots) + num_slots * int(np.prod(shape))
+        try:
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=shm.buf)
+        header["magic"] = _MAGIC
+        header["version"] = _VERSION
+        header["num_slots"] = num_slots
+        header["height"], header["width"], header["channels"] = shape
+        header["color_mode"] = _COLOR_MODES.index(ColorMode(color_mode))
+        header["closed"] = 0
+        header["fps"] = fps or 0.0
+        header["write_sequence"] = -1
+        slots = np.ndarray((num_slots,), dtype=_SLOT_DTYPE, buffer=shm.buf, offset=_HEADER_DTYPE.itemsize)
+        slots["sequence"] = -1
+        del header, slots
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedFrameRing":
+        """Maps the shared memory block created by the writer.
+
+        Raises:
+            FileNotFoundError: If there is no shared memory block `name`, i.e. the writer is not running.
+        """
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            # Before Python 3.13, the resource tracker of a reader process unlinks the block when it exits
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        return cls(shm, owner=False)
+
+    @staticmethod
+    def list_names() -> list[str]:
+        """Names of the camera frame rings of the machine (Linux only, empty elsewhere)."""
+        shm_dir = Path("/dev/shm")
+        if not shm_dir.is_dir():
+            return []
+        return sorted(p.name for p in shm_dir.glob(f"{SHARED_MEMORY_PREFIX}*"))
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def color_mode(self) -> ColorMode:
+        return _COLOR_MODES[int(self._header["color_mode"])]
+
+    @property
+    def fps(self) -> float:
+        return float(self._header["fps"])
+
+    @property
+    def closed(self) -> bool:
+        """Whether the writer stopped."""
+        return bool(self._header["closed"])
+
+    @property
+    def latest_sequence(self) -> int:
+        """Sequence number of the last frame written, -1 if none."""
+        return int(self._header["write_sequence"])
+
+    def write(self, frame: NDArray[Any], timestamp: float) -> int:
+        """Copies `frame` in the next slot and publishes it. Returns its sequence number."""
+        if not self.owner:
+            raise RuntimeError(f"Only the process that created '{self.name}' can write frames.")
+        if frame.shape != self.shape:
+            raise ValueError(f"Frame shape {frame.shape} does not match the ring frame shape {self.shape}.")
+        sequence = self.latest_sequence + 1
+        slot = sequence % self.num_slots
+        self._slots["sequence"][slot] = -1
+        self._frames[slot] = frame
+        self._slots["timestamp"][slot] = timestamp
+        self._slots["sequence"][slot] = sequence
+        self._header["write_sequence"] = sequence
+        return sequence
+
+    def read(self, sequence: int | None = None, copy: bool = True) -> TimestampedFrame | None:
+        """Reads the frame `sequence`, by default the latest one.
+
+        Args:
+            sequence: Sequence number of the frame to read. Defaults to the latest frame.
+            copy: If False, returns a read-only view of the slot, which the writer overwrites after
+                `num_slots - 1` new frames.
+
+        Returns:
+            The frame, or None if it was not written yet or was already overwritten.
+        """
+        while True:
+            latest = self.latest_sequence
+            target = latest if sequence is None else sequence
+            if target < 0 or target > latest:
+                return None
+            slot = target % self.num_slots
+            if self._slots["sequence"][slot] != target:
+                if sequence is None:
+                    continue  # The writer is reusing the slot, read the new latest frame
+                return None
+            timestamp = float(self._slots["timestamp"][slot])
+            frame = self._frames[slot].copy() if copy else self._frames[slot]
+            if self._slots["sequence"][slot] == target:
+                return TimestampedFrame(frame, timestamp, target)
+            if sequence is not None:
+                return None
+
+    def close(self) -> None:
+        """Unmaps the block. The writer also marks it closed and removes it."""
+        if self.owner:
+            self._header["closed"] = 1
+        del self._header, self._slots, self._frames
+        # Frames read without copy may still be in use, the block is then unmapped once they are released
+        with contextlib.suppress(BufferError):
+            self._shm.close()
+        if self.owner:
+            with contextlib.suppress(FileNotFoundError):
+                self._shm.unlink()
@@ -31,6 +31,7 @@ from lerobot.optim.optimizers import OptimizerConfig
 from lerobot.optim.schedulers import LRSchedulerConfig
 from lerobot.utils.constants import ACTION, OBS_STATE
 from lerobot.utils.hub import HubMixin
+from lerobot.utils.quantization import INFERENCE_QUANTIZATIONS
 from lerobot.utils.utils import auto_select_torch_device, is_amp_available, is_torch_device_available
 
 T = TypeVar("T", bound="PreTrainedConfig")
@@ -67,6 +68,10 @@ class PreTrainedConfig(draccus.ChoiceRegistry, HubMixin, abc.ABC):  # type: igno
     # Whether the policy employed PEFT for training.
     use_peft: bool = False
 
+    # Dynamic quantization of the Linear layers for CPU inference, applied by `from_pretrained` (None or
+    # "int8"). The quantized weights are cached in `HF_LEROBOT_QUANTIZED`.
+    inference_quantization: str | None = None
+
     push_to_hub: bool = True  # type: ignore[assignment] # TODO: use a different name to avoid override
     repo_id: str | None = None
 
@@ -93,6 +98,19 @@ class PreTrainedConfig(draccus.ChoiceRegistry, HubMixin, abc.ABC):  # type: igno
             )
             self.use_amp = False
 
+        if self.inference_quantization is not None:
+            if self.inference_quantization not in INFERENCE_QUANTIZATIONS:
+                raise ValueError(
+                    f"`inference_quantization` must be one of {INFERENCE_QUANTIZATIONS}, "
+                    f"got '{self.inference_quantization}'."
+                )
+            # Dynamically quantized layers only run on CPU
+            if self.device != "cpu":
+                logger.warning(
+                    f"Inference quantization is only available on 'cpu', not on '{self.device}'. Deactivating it."
+                )
+                self.inference_quantization = None
+
     @property
     def type(self) -> str:
         choice_name = self.get_choice_name(self.__class__)
@@ -18,6 +18,7 @@ from dataclasses import dataclass, field
 from lerobot.configs.policies import PreTrainedConfig
 from lerobot.configs.types import NormalizationMode
 from lerobot.optim.optimizers import AdamWConfig
+from lerobot.policies.inference_engine import INFERENCE_ENGINES
 
 
 @PreTrainedConfig.register_subclass("act")
@@ -127,6 +128,9 @@ class ACTConfig(PreTrainedConfig):
     # Inference.
     # Note: the value used in ACT when temporal ensembling is enabled is 0.01.
     temporal_ensemble_coeff: float | None = None
+    # Engine running the model in `predict_action_chunk`: "eager", "compile" (`torch.compile`) or "cuda_graph"
+    # (the inference is captured into a CUDA graph at the first call and replayed on the following ones).
+    inference_engine: str = "eager"
 
     # Training and loss computation.
     dropout: float = 0.1
@@ -159,6 +163,10 @@ class ACTConfig(PreTrainedConfig):
             raise ValueError(
                 f"Multiple observation steps not handled yet. Got `nobs_steps={self.n_obs_steps}`"
             )
+        if self.inference_engine not in INFERENCE_ENGINES:
+            raise ValueError(
+                f"`inference_engine` must be one of {INFERENCE_ENGINES}. Got {self.inference_engine}."
+            )
 
     def get_optimizer_preset(self) -> AdamWConfig:
         return AdamWConfig(
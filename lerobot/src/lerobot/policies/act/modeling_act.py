@@ -34,6 +34,7 @@ from torchvision.models._utils import IntermediateLayerGetter
 from torchvision.ops.misc import FrozenBatchNorm2d
 
 from lerobot.policies.act.configuration_act import ACTConfig
+from lerobot.policies.inference_engine import InferenceEngine
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.utils.constants import ACTION, OBS_ENV_STATE, OBS_IMAGES, OBS_STATE
 
@@ -62,6 +63,9 @@ class ACTPolicy(PreTrainedPolicy):
         self.config = config
 
         self.model = ACT(config)
+        self._inference_engine = InferenceEngine(
+            self._predict_action_chunk, self.model, engine=config.inference_engine
+        )
 
         if config.temporal_ensemble_coeff is not None:
             self.temporal_ensembler = ACTTemporalEnsembler(config.temporal_ensemble_coeff, config.chunk_size)
@@ -126,6 +130,12 @@ class ACTPolicy(PreTrainedPolicy):
         """Predict a chunk of actions given environment observations."""
         self.eval()
 
+        # Only pass the model inputs to the inference engine, they form the signature of a CUDA graph
+        input_keys = [OBS_STATE, OBS_ENV_STATE, *self.config.image_features]
+        inputs = {key: batch[key] for key in input_keys if key in batch}
+        return self._inference_engine(inputs)
+
+    def _predict_action_chunk(self, batch: dict[str, Tensor]) -> Tensor:
         if self.config.image_features:
             batch = dict(batch)  # shallow copy so that adding a key doesn't modify the original
             batch[OBS_IMAGES] = [batch[key] for key in self.config.image_features]
@@ -450,9 +460,9 @@ class ACT(nn.Module):
         else:
             # When not using the VAE encoder, we set the latent to be all zeros.
             mu = log_sigma_x2 = None
-            # TODO(rcadene, alexander-soare): remove call to `.to` to speedup forward ; precompute and use buffer
-            latent_sample = torch.zeros([batch_size, self.config.latent_dim], dtype=torch.float32).to(
-                batch[OBS_STATE].device
+            # Allocated on the device directly, a host to device copy can't be captured in a CUDA graph.
+            latent_sample = torch.zeros(
+                [batch_size, self.config.latent_dim], dtype=torch.float32, device=batch[OBS_STATE].device
             )
 
         # Prepare transformer encoder inputs.
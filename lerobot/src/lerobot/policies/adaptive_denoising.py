@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-call selection of the number of denoising steps of flow matching policies (pi0, pi05, SmolVLA).
+
+The Euler integration of the flow matching policies runs a fixed number of denoising steps by default.
+`AdaptiveDenoisingScheduler` picks the number of steps of each inference call instead:
+- From the previous chunk: when the actions left over from the previous chunk (e.g. with RTC) barely move,
+  the motion is easy to predict and fewer steps are used.
+- From the latency budget: once the prefix (VLM) forward is done, the remaining budget is divided by the
+  measured duration of a denoising step.
+
+The timings are only measured, with a synchronization with the device, when a latency budget is set or
+`record_stats` is enabled. The step count and the timings of every call are then exposed in `last_stats`.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+
+import torch
+from torch import Tensor
+
+
+@dataclass
+class DenoisingStats:
+    """Step count and timings of one inference call."""
+
+    num_steps: int
+    # Mean absolute difference between consecutive actions of the previous chunk, None without one
+    divergence: float | None
+    prefix_time_s: float
+    denoise_time_s: float
+
+
+def _synchronize(device: torch.device) -> None:
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    elif device.type == "mps":
+        torch.mps.synchronize()
+
+
+def action_divergence(actions: Tensor | None) -> float | None:
+    """Mean absolute difference between consecutive actions of a chunk (..., time, action_dim)."""
+    if actions is None or actions.ndim < 2 or actions.shape[-2] < 2:
+        return None
+    return (actions[..., 1:, :] - actions[..., :-1, :]).abs().mean().item()
+
+
+class AdaptiveDenoisingScheduler:
+    """Picks the number of denoising steps of each inference call and measures its timings.
+
+    Usage in `sample_actions`: call `begin` before the prefix forward, `select_num_steps` before the
+    denoising loop and `end` after it. With a latency budget or `record_stats`, these calls synchronize with
+    the device on accelerators to measure the timings. Otherwise they never wait for the device, except to
+    read the divergence of a previous chunk, and the step count is the same from one call to the next when
+    there is none.
+
+    Args:
+        max_num_steps: Number of steps when neither the previous chunk nor the budget call for fewer.
+        min_num_steps: Lower bound of the number of steps.
+        latency_budget: Latency budget of one inference call in seconds, None for no budget.
+        divergence_threshold: Divergence of the previous chunk at or above which `max_num_steps` are used.
+            Below it, the number of steps scales down linearly to `min_num_steps`.
+        step_time_momentum: Weight of the past in the running estimate of the duration of a step.
+        record_stats: Whether to measure the timings of every call in `last_stats` without a budget.
+    """
+
+    def __init__(
+        self,
+        max_num_steps: int,
+        min_num_steps: int = 1,
+        latency_budget: float | None = None,
+        divergence_threshold: float = 0.05,
+        step_time_momentum: float = 0.8,
+        record_stats: bool = False,
+    ):
+        if not 1 <= min_num_steps <= max_num_steps:
+            raise ValueError(
+                f"Expected 1 <= min_num_steps <= max_num_steps, got {min_num_steps} and {max_num_steps}"
+            )
+        if latency_budget is not None and latency_budget <= 0:
+            raise ValueError(f"latency_budget must be positive, got {latency_budget}")
+        self.max_num_steps = max_num_steps
+        self.min_num_steps = min_num_steps
+        self.latency_budget = latency_budget
+        self.divergence_threshold = divergence_threshold
+        self.step_time_momentum = step_time_momentum
+        self.record_stats = record_stats
+
+        # Running estimate of the duration of a denoising step in seconds, None until measured
+        self.step_time: float | None = None
+        self.last_stats: DenoisingStats | None = None
+
+        self._device = torch.device("cpu")
+        self._start_t = 0.0
+        self._denoise_start_t = 0.0
+        self._num_steps = max_num_steps
+        self._divergence: float | None = None
+
+    @property
+    def timed(self) -> bool:
+        """Whether the calls are timed, which synchronizes with the device."""
+        return self.latency_budget is not None or self.record_stats
+
+    def begin(self, device: torch.device) -> None:
+        """Starts timing an inference call."""
+        self._device = device
+        if self.timed:
+            self._start_t = time.perf_counter()
+
+    def select_num_steps(self, prev_chunk_left_over: Tensor | None = None) -> int:
+        """Returns the number of denoising steps of the current call, once its prefix forward is done."""
+        if self.timed:
+            _synchronize(self._device)
+            self._denoise_start_t = time.perf_counter()
+
+        num_steps = self.max_num_steps
+        self._divergence = (
+            action_divergence(prev_chunk_left_over)
+            if self.divergence_threshold > 0 or self.record_stats
+            else None
+        )
+        if self._divergence is not None and self.divergence_threshold > 0:
+            ratio = min(self._divergence / self.divergence_threshold, 1.0)
+            num_steps = self.min_num_steps + math.ceil((self.max_num_steps - self.min_num_steps) * ratio)
+
+        if self.latency_budget is not None and self.step_time is not None:
+            remaining = self.latency_budget - (self._denoise_start_t - self._start_t)
+            num_steps = min(num_steps, math.floor(remaining / self.step_time))
+
+        self._num_steps = max(self.min_num_steps, min(num_steps, self.max_num_steps))
+        return self._num_steps
+
+    def end(self) -> DenoisingStats | None:
+        """Stops timing the current call and updates the estimate of the duration of a step.
+
+        Returns the stats of the call, None when the calls are not timed.
+        """
+        if not self.timed:
+            return None
+        _synchronize(self._device)
+        end_t = time.perf_counter()
+        denoise_time = end_t - self._denoise_start_t
+        step_time = denoise_time / self._num_steps
+        if self.step_time is None:
+            self.step_time = step_time
+        else:
+            self.step_time = (
+                self.step_time_momentum * self.step_time + (1 - self.step_time_momentum) * step_time
+            )
+
+        self.last_stats = DenoisingStats(
+            num_steps=self._num_steps,
+            divergence=self._divergence,
+            prefix_time_s=self._denoise_start_t - self._start_t,
+            denoise_time_s=denoise_time,
+        )
+        return self.last_stats
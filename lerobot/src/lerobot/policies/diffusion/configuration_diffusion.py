@@ -20,6 +20,7 @@ from lerobot.configs.policies import PreTrainedConfig
 from lerobot.configs.types import NormalizationMode
 from lerobot.optim.optimizers import AdamConfig
 from lerobot.optim.schedulers import DiffuserSchedulerConfig
+from lerobot.policies.inference_engine import INFERENCE_ENGINES
 
 
 @PreTrainedConfig.register_subclass("diffusion")
@@ -147,6 +148,10 @@ class DiffusionConfig(PreTrainedConfig):
 
     # Inference
     num_inference_steps: int | None = None
+    # Engine running the action generation in `predict_action_chunk`: "eager", "compile" (`torch.compile`) or
+    # "cuda_graph" (the inference, including the denoising loop, is captured into a CUDA graph at the first
+    # call and replayed on the following ones).
+    inference_engine: str = "eager"
 
     # Loss computation
     do_mask_loss_for_padding: bool = False
@@ -179,6 +184,10 @@ class DiffusionConfig(PreTrainedConfig):
                 f"`noise_scheduler_type` must be one of {supported_noise_schedulers}. "
                 f"Got {self.noise_scheduler_type}."
             )
+        if self.inference_engine not in INFERENCE_ENGINES:
+            raise ValueError(
+                f"`inference_engine` must be one of {INFERENCE_ENGINES}. Got {self.inference_engine}."
+            )
 
         # Check that the horizon size and U-Net downsampling is compatible.
         # U-Net downsamples by 2 with each stage.
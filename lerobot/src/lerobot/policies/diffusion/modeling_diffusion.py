@@ -34,6 +34,7 @@ from diffusers.schedulers.scheduling_ddpm import DDPMScheduler
 from torch import Tensor, nn
 
 from lerobot.policies.diffusion.configuration_diffusion import DiffusionConfig
+from lerobot.policies.inference_engine import InferenceEngine
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.policies.utils import (
     get_device_from_parameters,
@@ -73,6 +74,9 @@ class DiffusionPolicy(PreTrainedPolicy):
         self._queues = None
 
         self.diffusion = DiffusionModel(config)
+        self._inference_engine = InferenceEngine(
+            self._generate_actions, self.diffusion, engine=config.inference_engine
+        )
 
         self.reset()
 
@@ -95,10 +99,17 @@ class DiffusionPolicy(PreTrainedPolicy):
         """Predict a chunk of actions given environment observations."""
         # stack n latest observations from the queue
         batch = {k: torch.stack(list(self._queues[k]), dim=1) for k in batch if k in self._queues}
-        actions = self.diffusion.generate_actions(batch, noise=noise)
+        if noise is not None:
+            batch["noise"] = noise
+        actions = self._inference_engine(batch)
 
         return actions
 
+    def _generate_actions(self, batch: dict[str, Tensor]) -> Tensor:
+        batch = dict(batch)
+        noise = batch.pop("noise", None)
+        return self.diffusion.generate_actions(batch, noise=noise)
+
     @torch.no_grad()
     def select_action(self, batch: dict[str, Tensor], noise: Tensor | None = None) -> Tensor:
         """Select a single action given environment observations.
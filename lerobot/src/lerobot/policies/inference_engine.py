@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Inference engines running the static shape inference of a policy eagerly, compiled or as a CUDA graph.
+
+At batch size 1, inference of small policies is dominated by kernel launch overhead, especially when it
+loops over a network (e.g. the denoising loop of Diffusion). `InferenceEngine` wraps a function of a dict
+of tensors and runs it:
+- "eager": as is.
+- "compile": through `torch.compile`.
+- "cuda_graph": captured once per input signature into a CUDA graph at the first (warmup) call, and
+  replayed on the following calls after copying the inputs into the static input buffers of the graph.
+
+The engine is only used for inference: in training mode or with gradients enabled it runs eagerly.
+"""
+
+import logging
+from collections.abc import Callable
+from itertools import chain
+
+import torch
+from torch import Tensor, nn
+
+INFERENCE_ENGINES = ["eager", "compile", "cuda_graph"]
+
+
+class _CapturedGraph:
+    def __init__(self, graph: "torch.cuda.CUDAGraph", inputs: dict[str, Tensor], output: Tensor):
+        self.graph = graph
+        self.inputs = inputs
+        self.output = output
+
+
+class InferenceEngine:
+    """Runs `fn(inputs)` eagerly, with `torch.compile` or by replaying a CUDA graph.
+
+    Args:
+        fn: The function to run. It takes a dict of tensors and returns a tensor. For CUDA graphs it must
+            not synchronize with the host (no `.item()`, no data dependent shapes).
+        module: The module whose parameters and buffers `fn` reads. A CUDA graph reads them from the memory
+            they occupied at capture, so graphs are captured again when they are moved or replaced.
+        engine: One of `INFERENCE_ENGINES`.
+        num_warmup_steps: Number of eager runs before a CUDA graph capture, on a side stream.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[dict[str, Tensor]], Tensor],
+        module: nn.Module,
+        engine: str = "eager",
+        num_warmup_steps: int = 2,
+    ):
+        if engine not in INFERENCE_ENGINES:
+            raise ValueError(f"Unsupported inference engine '{engine}'. Expected one of {INFERENCE_ENGINES}.")
+        self.fn = fn
+        self.module = module
+        self.engine = engine
+        self.num_warmup_steps = num_warmup_steps
+
+        self._compiled_fn = None
+        self._graphs: dict[tuple, _CapturedGraph] = {}
+        self._warned_fallback = False
+
+    def reset(self) -> None:
+        """Drops the captured graphs and the compiled function."""
+        self._compiled_fn = None
+        self._graphs.clear()
+
+    def __call__(self, inputs: dict[str, Tensor]) -> Tensor:
+        if self.engine == "eager" or self.module.training or torch.is_grad_enabled():
+            return self.fn(inputs)
+
+        if self.engine == "compile":
+            if self._compiled_fn is None:
+                self._compiled_fn = torch.compile(self.fn, mode="reduce-overhead")
+            # Outputs of "reduce-overhead" compiled functions are overwritten by the next call
+            return self._compiled_fn(inputs).clone()
+
+        if not all(value.is_cuda for value in inputs.values()):
+            if not self._warned_fallback:
+                logging.warning("CUDA graph inference requires CUDA inputs, running eagerly instead.")
+                self._warned_fallback = True
+            return self.fn(inputs)
+        return self._replay(inputs)
+
+    def _signature(self, inputs: dict[str, Tensor]) -> tuple:
+        return (
+            tuple((key, value.shape, value.dtype, value.device) for key, value in sorted(inputs.items())),
+            tuple(tensor.data_ptr() for tensor in chain(self.module.parameters(), self.module.buffers())),
+            torch.is_autocast_enabled(),
+        )
+
+    def _replay(self, inputs: dict[str, Tensor]) -> Tensor:
+        signature = self._signature(inputs)
+        captured = self._graphs.get(signature)
+        if captured is None:
+            captured = self._graphs[signature] = self._capture(inputs)
+            # The capture does not run the graph
+            captured.graph.replay()
+            return captured.output.clone()
+
+        for key, value in inputs.items():
+            captured.inputs[key].copy_(value)
+        captured.graph.replay()
+        return captured.output.clone()
+
+    def _capture(self, inputs: dict[str, Tensor]) -> _CapturedGraph:
+        static_inputs = {key: value.clone() for key, value in inputs.items()}
+
+        # Warm up on a side stream, as required before a capture (e.g. for cuBLAS workspaces)
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(self.num_warmup_steps):
+                self.fn(static_inputs)
+        torch.cuda.current_stream().wait_stream(stream)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph):
+            static_output = self.fn(static_inputs)
+        return _CapturedGraph(graph, static_inputs, static_output)
@@ -50,6 +50,15 @@ class PI0Config(PreTrainedConfig):
     min_period: float = 4e-3
     max_period: float = 4.0
 
+    # Adaptive denoising: pick the number of denoising steps of each inference call between
+    # `min_num_inference_steps` and `num_inference_steps`, see `AdaptiveDenoisingScheduler`
+    adaptive_denoising: bool = False
+    min_num_inference_steps: int = 2
+    # Latency budget of one inference call in seconds (None = only adapt to the previous chunk)
+    denoising_latency_budget: float | None = None
+    # Previous chunk divergence (normalized action units) at or above which all the steps are used
+    denoising_divergence_threshold: float = 0.05
+
     # Real-Time Chunking (RTC) configuration
     rtc_config: RTCConfig | None = None
 
@@ -105,6 +114,12 @@ class PI0Config(PreTrainedConfig):
                 f"n_action_steps ({self.n_action_steps}) cannot be greater than chunk_size ({self.chunk_size})"
             )
 
+        if self.adaptive_denoising and not 1 <= self.min_num_inference_steps <= self.num_inference_steps:
+            raise ValueError(
+                f"min_num_inference_steps ({self.min_num_inference_steps}) must be between 1 and "
+                f"num_inference_steps ({self.num_inference_steps})"
+            )
+
         if self.paligemma_variant not in ["gemma_300m", "gemma_2b"]:
             raise ValueError(f"Invalid paligemma_variant: {self.paligemma_variant}")
 
@@ -41,9 +41,11 @@ else:
     PaliGemmaForConditionalGeneration = None
 
 from lerobot.configs.policies import PreTrainedConfig
+from lerobot.policies.adaptive_denoising import AdaptiveDenoisingScheduler
 from lerobot.policies.pi0.configuration_pi0 import DEFAULT_IMAGE_SIZE, PI0Config
 from lerobot.policies.pretrained import PreTrainedPolicy, T
 from lerobot.policies.rtc.modeling_rtc import RTCProcessor
+from lerobot.policies.utils import PrefixCache
 from lerobot.utils.constants import (
     ACTION,
     OBS_LANGUAGE_ATTENTION_MASK,
@@ -540,6 +542,19 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         super().__init__()
         self.config = config
         self.rtc_processor = rtc_processor
+        # Attention mask patterns, uploaded once
+        self.prefix_cache = PrefixCache()
+        # Picks the number of denoising steps of each inference call when `adaptive_denoising` is enabled
+        self.denoising_scheduler = (
+            AdaptiveDenoisingScheduler(
+                max_num_steps=config.num_inference_steps,
+                min_num_steps=config.min_num_inference_steps,
+                latency_budget=config.denoising_latency_budget,
+                divergence_threshold=config.denoising_divergence_threshold,
+            )
+            if config.adaptive_denoising
+            else None
+        )
 
         paligemma_config = get_gemma_config(config.paligemma_variant)
         action_expert_config = get_gemma_config(config.action_expert_variant)
@@ -670,7 +685,7 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
 
         embs = torch.cat(embs, dim=1)
         pad_masks = torch.cat(pad_masks, dim=1)
-        att_masks = torch.tensor(att_masks, dtype=torch.bool, device=pad_masks.device)
+        att_masks = self.prefix_cache.attention_mask(att_masks, pad_masks.device)
 
         bsize = pad_masks.shape[0]
         att_masks = att_masks[None, :].expand(bsize, len(att_masks))
@@ -735,7 +750,7 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
 
         embs = torch.cat(embs, dim=1)
         pad_masks = torch.cat(pad_masks, dim=1)
-        att_masks = torch.tensor(att_masks, dtype=embs.dtype, device=embs.device)
+        att_masks = self.prefix_cache.attention_mask(att_masks, embs.device, embs.dtype)
         att_masks = att_masks[None, :].expand(bsize, len(att_masks))
 
         return embs, pad_masks, att_masks, adarms_cond
@@ -812,6 +827,8 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
         **kwargs: Unpack[ActionSelectKwargs],
     ) -> Tensor:
         """Do a full inference forward and compute the action."""
+        # An explicit `num_steps` disables the adaptive number of steps
+        scheduler = self.denoising_scheduler if num_steps is None else None
         if num_steps is None:
             num_steps = self.config.num_inference_steps
 
@@ -827,6 +844,9 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
             )  # Use config max_action_dim for internal processing
             noise = self.sample_noise(actions_shape, device)
 
+        if scheduler is not None:
+            scheduler.begin(device)
+
         prefix_embs, prefix_pad_masks, prefix_att_masks = self.embed_prefix(
             images, img_masks, lang_tokens, lang_masks
         )
@@ -844,6 +864,8 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
             use_cache=True,
         )
 
+        if scheduler is not None:
+            num_steps = scheduler.select_num_steps(kwargs.get("prev_chunk_left_over"))
         dt = -1.0 / num_steps
 
         x_t = noise
@@ -881,6 +903,8 @@ class PI0Pytorch(nn.Module):  # see openpi `PI0Pytorch`
             if self.rtc_processor is not None and self.rtc_processor.is_debug_enabled():
                 self.rtc_processor.track(time=time, x_t=x_t, v_t=v_t)
 
+        if scheduler is not None:
+            scheduler.end()
         return x_t
 
     def denoise_step(
@@ -1133,6 +1157,7 @@ class PI0Policy(PreTrainedPolicy):
         self._queues = {
             ACTION: deque(maxlen=self.config.n_action_steps),
         }
+        self.model.prefix_cache.clear()
 
     def init_rtc_processor(self):
         """Initialize RTC processor if RTC is enabled in config."""
@@ -33,6 +33,12 @@ from lerobot.configs.policies import PreTrainedConfig
 from lerobot.configs.train import TrainPipelineConfig
 from lerobot.policies.utils import log_model_loading_keys
 from lerobot.utils.hub import HubMixin
+from lerobot.utils.quantization import (
+    load_quantized_model,
+    quantize_for_inference,
+    quantized_model_file,
+    save_quantized_model,
+)
 
 T = TypeVar("T", bound="PreTrainedPolicy")
 
@@ -108,7 +114,6 @@ class PreTrainedPolicy(nn.Module, HubMixin, abc.ABC):
         if os.path.isdir(model_id):
             print("Loading weights from local directory")
             model_file = os.path.join(model_id, SAFETENSORS_SINGLE_FILE)
-            policy = cls._load_as_safetensor(instance, model_file, config.device, strict)
         else:
             try:
                 model_file = hf_hub_download(
@@ -122,12 +127,16 @@ class PreTrainedPolicy(nn.Module, HubMixin, abc.ABC):
                     token=token,
                     local_files_only=local_files_only,
                 )
-                policy = cls._load_as_safetensor(instance, model_file, config.device, strict)
             except HfHubHTTPError as e:
                 raise FileNotFoundError(
                     f"{SAFETENSORS_SINGLE_FILE} not found on the HuggingFace Hub in {model_id}"
                 ) from e
 
+        if config.inference_quantization is not None:
+            policy = cls._load_quantized(instance, model_file, config.inference_quantization, strict)
+        else:
+            policy = cls._load_as_safetensor(instance, model_file, config.device, strict)
+
         policy.to(config.device)
         policy.eval()
         return policy
@@ -156,6 +165,18 @@ class PreTrainedPolicy(nn.Module, HubMixin, abc.ABC):
             model.to(map_location)
         return model
 
+    @classmethod
+    def _load_quantized(cls, model: T, model_file: str, quantization: str, strict: bool) -> T:
+        quantized_file = quantized_model_file(model_file, quantization)
+        if load_quantized_model(model, quantized_file, model_file, quantization):
+            logging.info(f"Loaded {quantization} quantized weights from {quantized_file}")
+            return model
+
+        model = cls._load_as_safetensor(model, model_file, "cpu", strict)
+        quantize_for_inference(model, quantization)
+        save_quantized_model(model, quantized_file, model_file)
+        return model
+
     @abc.abstractmethod
     def get_optim_params(self) -> dict:
         """
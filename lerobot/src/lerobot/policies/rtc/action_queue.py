@@ -24,7 +24,6 @@ handling action merging and leftover tracking.
 import logging
 from threading import Lock
 
-import torch
 from torch import Tensor
 
 from lerobot.policies.rtc.configuration_rtc import RTCConfig
@@ -43,41 +42,72 @@ class ActionQueue:
     1. RTC-enabled: Replaces the entire queue with new actions, accounting for inference delay
     2. RTC-disabled: Appends new actions to the queue, maintaining continuity
 
+    Actions are stored in preallocated ring buffers, allocated at the first merge with twice the chunk
+    length (or `capacity`). Merges copy the new chunk into the buffers in place and `get` only moves a read
+    cursor, so popping an action is O(1) and allocates no memory. A merge only reuses the front of the buffers
+    up to, and excluding, the last action returned by `get` and the leftover returned by `get_left_over`, so
+    that these views are not overwritten while the robot or the policy still use them. In RTC mode,
+    consecutive chunks of the same length alternate between the two halves of the buffers, as long as the
+    current chunk is consumed before the leftover is requested. The buffers only grow when more actions are
+    queued than they can hold, e.g. when appending faster than actions are consumed.
+
     Args:
         cfg (RTCConfig): Configuration for Real-Time Chunking behavior.
+        capacity (int | None): Initial number of actions the buffers can hold. Defaults to twice the length
+            of the first merged chunk.
 
     Attributes:
-        queue (Tensor | None): Processed actions for robot rollout (time_steps, action_dim).
-        original_queue (Tensor | None): Original actions for RTC computation (time_steps, action_dim).
-        last_index (int): Current consumption index in the queue.
+        last_index (int): Current consumption index in the current chunk.
     """
 
-    def __init__(self, cfg: RTCConfig):
+    def __init__(self, cfg: RTCConfig, capacity: int | None = None):
         """Initialize the action queue.
 
         Args:
             cfg: RTC configuration controlling queue behavior.
+            capacity: Initial number of actions the buffers can hold.
         """
-        self.queue = None  # Processed actions for robot rollout
-        self.original_queue = None  # Original actions for RTC
+        self._processed: Tensor | None = None  # Ring buffer of processed actions for robot rollout
+        self._original: Tensor | None = None  # Ring buffer of original actions for RTC
+        # The current chunk occupies [_start, _end) in the buffers, the next action is at _start + last_index
+        self._start = 0
+        self._end = 0
+        # Start of the last leftover returned by get_left_over since the last merge, if any
+        self._left_over_start: int | None = None
         self.lock = Lock()
         self.last_index = 0
         self.cfg = cfg
+        self.capacity = capacity
+
+    @property
+    def queue(self) -> Tensor | None:
+        """Processed actions of the current chunk (time_steps, action_dim), including the consumed ones."""
+        if self._processed is None:
+            return None
+        return self._processed[self._start : self._end]
+
+    @property
+    def original_queue(self) -> Tensor | None:
+        """Original actions of the current chunk (time_steps, action_dim), including the consumed ones."""
+        if self._original is None:
+            return None
+        return self._original[self._start : self._end]
 
     def get(self) -> Tensor | None:
         """Get the next action from the queue.
 
         Returns:
             Tensor | None: The next action (action_dim,) or None if queue is empty.
-                          Returns a clone to prevent external modifications.
+                          It is a view of the queue buffers, left untouched by merges until the next
+                          action is returned: clone it before modifying it in place or keeping it longer.
         """
         with self.lock:
-            if self.queue is None or self.last_index >= len(self.queue):
+            index = self._start + self.last_index
+            if self._processed is None or index >= self._end:
                 return None
 
-            action = self.queue[self.last_index]
             self.last_index += 1
-            return action.clone()
+            return self._processed[index]
 
     def qsize(self) -> int:
         """Get the number of remaining actions in the queue.
@@ -85,10 +115,9 @@ class ActionQueue:
         Returns:
             int: Number of unconsumed actions.
         """
-        if self.queue is None:
+        if self._processed is None:
             return 0
-        length = len(self.queue)
-        return length - self.last_index
+        return max(self._end - self._start - self.last_index, 0)
 
     def empty(self) -> bool:
         """Check if the queue is empty.
@@ -96,11 +125,7 @@ class ActionQueue:
         Returns:
             bool: True if no actions remain, False otherwise.
         """
-        if self.queue is None:
-            return True
-
-        length = len(self.queue)
-        return length - self.last_index <= 0
+        return self.qsize() <= 0
 
     def get_action_index(self) -> int:
         """Get the current action consumption index.
@@ -118,12 +143,15 @@ class ActionQueue:
 
         Returns:
             Tensor | None: Remaining original actions (remaining_steps, action_dim),
-                          or None if no original queue exists.
+                          or None if no original queue exists. It is a view of the queue buffers, left
+                          untouched by the next merge even if actions are consumed in between, but not by
+                          the following ones.
         """
         with self.lock:
-            if self.original_queue is None:
+            if self._original is None:
                 return None
-            return self.original_queue[self.last_index :]
+            self._left_over_start = min(self._start + self.last_index, self._end)
+            return self._original[self._left_over_start : self._end]
 
     def merge(
         self,
@@ -149,9 +177,20 @@ class ActionQueue:
 
             if self.cfg.enabled:
                 self._replace_actions_queue(original_actions, processed_actions, real_delay)
-                return
+            else:
+                self._append_actions_queue(original_actions, processed_actions)
+            self._left_over_start = None
+
+    def _reusable_front(self) -> int:
+        """Number of actions at the front of the buffers that a merge can overwrite.
 
-            self._append_actions_queue(original_actions, processed_actions)
+        They end before the last action returned by `get`, and before the leftover returned by
+        `get_left_over` since the last merge, even if more actions were consumed since then.
+        """
+        read_index = min(self._start + self.last_index, self._end)
+        if self._left_over_start is not None:
+            read_index = min(read_index, self._left_over_start)
+        return max(read_index - 1, 0)
 
     def _replace_actions_queue(self, original_actions: Tensor, processed_actions: Tensor, real_delay: int):
         """Replace the queue with new actions (RTC mode).
@@ -164,11 +203,26 @@ class ActionQueue:
             processed_actions: Post-processed actions for robot.
             real_delay: Number of time steps to skip due to inference delay.
         """
-        self.original_queue = original_actions[real_delay:].clone()
-        self.queue = processed_actions[real_delay:].clone()
-
-        logger.debug(f"original_actions shape: {self.original_queue.shape}")
-        logger.debug(f"processed_actions shape: {self.queue.shape}")
+        original_actions = original_actions[real_delay:]
+        processed_actions = processed_actions[real_delay:]
+        length = len(processed_actions)
+        self._ensure_buffers(original_actions, processed_actions, 2 * length)
+
+        # Write after the current chunk, or at the beginning of the buffers if the new chunk fits before the
+        # views still in use, so that the leftover handed to the policy is never overwritten
+        if self._end + length <= len(self._processed):
+            position = self._end
+        elif length <= self._reusable_front():
+            position = 0
+        else:
+            self._grow(2 * length, keep_from=self._end)
+            position = 0
+
+        self._write(position, original_actions, processed_actions)
+        self._start, self._end = position, position + length
+
+        logger.debug(f"original_actions shape: {original_actions.shape}")
+        logger.debug(f"processed_actions shape: {processed_actions.shape}")
         logger.debug(f"real_delay: {real_delay}")
 
         self.last_index = 0
@@ -183,19 +237,60 @@ class ActionQueue:
             original_actions: Unprocessed actions from policy.
             processed_actions: Post-processed actions for robot.
         """
-        if self.queue is None:
-            self.original_queue = original_actions.clone()
-            self.queue = processed_actions.clone()
-            return
-
-        self.original_queue = torch.cat([self.original_queue, original_actions.clone()])
-        self.original_queue = self.original_queue[self.last_index :]
+        length = len(processed_actions)
+        self._ensure_buffers(original_actions, processed_actions, 2 * length)
+
+        read_index = min(self._start + self.last_index, self._end)
+        num_left = self._end - read_index
+        if self._end + length > len(self._processed):
+            if num_left + length <= self._reusable_front():
+                # Move the unconsumed actions to the beginning of the buffers, without overlap, and append
+                # the new ones after them
+                self._processed[:num_left].copy_(self._processed[read_index : self._end])
+                self._original[:num_left].copy_(self._original[read_index : self._end])
+            else:
+                self._grow(2 * (num_left + length), keep_from=read_index)
+            read_index, self._end = 0, num_left
+
+        self._write(self._end, original_actions, processed_actions)
+        self._start, self._end = read_index, self._end + length
+        self.last_index = 0
 
-        self.queue = torch.cat([self.queue, processed_actions.clone()])
-        self.queue = self.queue[self.last_index :]
+    def _ensure_buffers(self, original_actions: Tensor, processed_actions: Tensor, min_capacity: int):
+        """Allocates the buffers at the first merge, or again when the actions change shape or type."""
+        if (
+            self._processed is not None
+            and self._processed.shape[1:] == processed_actions.shape[1:]
+            and self._original.shape[1:] == original_actions.shape[1:]
+            and self._processed.dtype == processed_actions.dtype
+            and self._original.dtype == original_actions.dtype
+            and self._processed.device == processed_actions.device
+            and self._original.device == original_actions.device
+        ):
+            return
+        capacity = max(self.capacity or 0, min_capacity, 1)
+        self._processed = processed_actions.new_empty((capacity, *processed_actions.shape[1:]))
+        self._original = original_actions.new_empty((capacity, *original_actions.shape[1:]))
+        self._start = self._end = 0
+        self.last_index = 0
 
+    def _grow(self, min_capacity: int, keep_from: int):
+        """Reallocates larger buffers, keeping the actions in [keep_from, _end) at their beginning."""
+        capacity = max(2 * len(self._processed), min_capacity)
+        num_kept = self._end - keep_from
+        processed = self._processed.new_empty((capacity, *self._processed.shape[1:]))
+        original = self._original.new_empty((capacity, *self._original.shape[1:]))
+        processed[:num_kept].copy_(self._processed[keep_from : self._end])
+        original[:num_kept].copy_(self._original[keep_from : self._end])
+        self._processed, self._original = processed, original
+        self._start, self._end = 0, num_kept
         self.last_index = 0
 
+    def _write(self, position: int, original_actions: Tensor, processed_actions: Tensor):
+        length = len(processed_actions)
+        self._original[position : position + length].copy_(original_actions)
+        self._processed[position : position + length].copy_(processed_actions)
+
     def _check_delays(self, real_delay: int, action_index_before_inference: int | None = None):
         """Validate that computed delays match expectations.
 
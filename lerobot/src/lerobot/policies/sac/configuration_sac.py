@@ -53,6 +53,10 @@ class ActorLearnerConfig:
     learner_port: int = 50051
     policy_parameters_push_frequency: int = 4
     queue_get_timeout: float = 2
+    # Parameters are pushed as a full keyframe every `parameters_full_sync_interval` pushes and as
+    # changed tensors in between, optionally compressed to `parameters_delta_dtype` ("float16" or "bfloat16")
+    parameters_full_sync_interval: int = 10
+    parameters_delta_dtype: str | None = None
 
 
 @dataclass
@@ -145,6 +149,22 @@ class SACConfig(PreTrainedConfig):
     offline_buffer_capacity: int = 100000
     # Whether to use asynchronous prefetching for the buffers
     async_prefetch: bool = False
+    # Dtype of the image features in the replay buffers ("float32" or "uint8"). "uint8" stores the
+    # images in [0, 1] as 8-bit integers and converts them back to float when sampling
+    buffer_image_dtype: str = "float32"
+    # Whether to stage sampled batches in pinned memory (only when storing on cpu and training on cuda)
+    buffer_pin_memory: bool = False
+    # Whether to save a raw snapshot of the replay buffers with each checkpoint. On resume the snapshot is
+    # memory-mapped instead of rebuilding the buffers from the saved datasets
+    buffer_snapshot: bool = False
+    # Whether to sample transitions proportionally to their TD error (prioritized experience replay)
+    prioritized_replay: bool = False
+    # How much prioritization is used (0 means uniform sampling)
+    prioritized_replay_alpha: float = 0.6
+    # Importance-sampling correction exponent (1 fully corrects the sampling bias)
+    prioritized_replay_beta: float = 0.4
+    # Small constant added to the TD errors so that no transition has a zero priority
+    prioritized_replay_eps: float = 1e-6
     # Number of steps before learning starts
     online_step_before_learning: int = 100
     # Frequency of policy updates
@@ -200,6 +220,10 @@ class SACConfig(PreTrainedConfig):
     def __post_init__(self):
         super().__post_init__()
         # Any validation specific to SAC configuration
+        if self.buffer_image_dtype not in ("float32", "uint8"):
+            raise ValueError(
+                f"buffer_image_dtype must be 'float32' or 'uint8', got '{self.buffer_image_dtype}'"
+            )
 
     def get_optimizer_preset(self) -> MultiAdamConfig:
         return MultiAdamConfig(
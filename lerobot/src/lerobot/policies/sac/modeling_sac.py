@@ -152,10 +152,12 @@ class SACPolicy(
                 - done: Done mask tensor
                 - observation_feature: Optional pre-computed observation features
                 - next_observation_feature: Optional pre-computed next observation features
+                - weights: Optional importance-sampling weights of a prioritized replay buffer
             model: Which model to compute the loss for ("actor", "critic", "discrete_critic", or "temperature")
 
         Returns:
-            The computed loss tensor
+            The computed loss tensor. The critic output also contains the per-sample absolute TD errors
+            under "td_error", used to update the priorities of a prioritized replay buffer.
         """
         # Extract common components from batch
         actions: Tensor = batch[ACTION]
@@ -168,8 +170,9 @@ class SACPolicy(
             next_observations: dict[str, Tensor] = batch["next_state"]
             done: Tensor = batch["done"]
             next_observation_features: Tensor = batch.get("next_observation_feature")
+            weights: Tensor | None = batch.get("weights")
 
-            loss_critic = self.compute_loss_critic(
+            loss_critic, td_error = self.compute_loss_critic(
                 observations=observations,
                 actions=actions,
                 rewards=rewards,
@@ -177,9 +180,11 @@ class SACPolicy(
                 done=done,
                 observation_features=observation_features,
                 next_observation_features=next_observation_features,
+                weights=weights,
+                return_td_error=True,
             )
 
-            return {"loss_critic": loss_critic}
+            return {"loss_critic": loss_critic, "td_error": td_error}
 
         if model == "discrete_critic" and self.config.num_discrete_actions is not None:
             # Extract critic-specific components
@@ -251,7 +256,9 @@ class SACPolicy(
         done,
         observation_features: Tensor | None = None,
         next_observation_features: Tensor | None = None,
-    ) -> Tensor:
+        weights: Tensor | None = None,
+        return_td_error: bool = False,
+    ) -> Tensor | tuple[Tensor, Tensor]:
         with torch.no_grad():
             next_action_preds, next_log_probs, _ = self.actor(next_observations, next_observation_features)
 
@@ -294,13 +301,19 @@ class SACPolicy(
         # Compute state-action value loss (TD loss) for all of the Q functions in the ensemble.
         td_target_duplicate = einops.repeat(td_target, "b -> e b", e=q_preds.shape[0])
         # You compute the mean loss of the batch for each critic and then to compute the final loss you sum them up
-        critics_loss = (
-            F.mse_loss(
-                input=q_preds,
-                target=td_target_duplicate,
-                reduction="none",
-            ).mean(dim=1)
-        ).sum()
+        critics_loss = F.mse_loss(
+            input=q_preds,
+            target=td_target_duplicate,
+            reduction="none",
+        )
+        if weights is not None:
+            # Correct the bias introduced by prioritized sampling
+            critics_loss = critics_loss * weights
+        critics_loss = critics_loss.mean(dim=1).sum()
+
+        if return_td_error:
+            td_error = (q_preds - td_target_duplicate).abs().mean(dim=0).detach()
+            return critics_loss, td_error
         return critics_loss
 
     def compute_loss_discrete_critic(
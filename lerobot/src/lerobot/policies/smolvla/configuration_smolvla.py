@@ -64,6 +64,14 @@ class SmolVLAConfig(PreTrainedConfig):
 
     # Decoding
     num_steps: int = 10
+    # Adaptive denoising: pick the number of denoising steps of each inference call between
+    # `min_num_steps` and `num_steps`, see `AdaptiveDenoisingScheduler`
+    adaptive_denoising: bool = False
+    min_num_steps: int = 2
+    # Latency budget of one inference call in seconds (None = only adapt to the previous chunk)
+    denoising_latency_budget: float | None = None
+    # Previous chunk divergence (normalized action units) at or above which all the steps are used
+    denoising_divergence_threshold: float = 0.05
 
     # Attention utils
     use_cache: bool = True
@@ -119,6 +127,10 @@ class SmolVLAConfig(PreTrainedConfig):
             raise NotImplementedError(
                 "`use_delta_joint_actions_aloha` is used by smolvla for aloha real models. It is not ported yet in LeRobot."
             )
+        if self.adaptive_denoising and not 1 <= self.min_num_steps <= self.num_steps:
+            raise ValueError(
+                f"`min_num_steps` must be between 1 and `num_steps` ({self.num_steps}), got {self.min_num_steps}."
+            )
 
     def validate_features(self) -> None:
         for i in range(self.empty_cameras):
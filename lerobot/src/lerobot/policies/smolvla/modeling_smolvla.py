@@ -61,11 +61,13 @@ import torch.nn.functional as F  # noqa: N812
 from torch import Tensor, nn
 from typing_extensions import Unpack
 
+from lerobot.policies.adaptive_denoising import AdaptiveDenoisingScheduler
 from lerobot.policies.pretrained import PreTrainedPolicy
 from lerobot.policies.rtc.modeling_rtc import RTCProcessor
 from lerobot.policies.smolvla.configuration_smolvla import SmolVLAConfig
 from lerobot.policies.smolvla.smolvlm_with_expert import SmolVLMWithExpertModel
 from lerobot.policies.utils import (
+    PrefixCache,
     populate_queues,
 )
 from lerobot.utils.constants import ACTION, OBS_LANGUAGE_ATTENTION_MASK, OBS_LANGUAGE_TOKENS, OBS_STATE
@@ -251,6 +253,7 @@ class SmolVLAPolicy(PreTrainedPolicy):
         self._queues = {
             ACTION: deque(maxlen=self.config.n_action_steps),
         }
+        self.model.prefix_cache.clear()
 
     def init_rtc_processor(self):
         """Initialize RTC processor if RTC is enabled in config."""
@@ -570,6 +573,19 @@ class VLAFlowMatching(nn.Module):
         self.image_end_token = torch.tensor([self.fake_image_token], dtype=torch.long)
         self.prefix_length = self.config.prefix_length
         self.rtc_processor = rtc_processor
+        # Embeddings of the image special tokens, reused across the inference calls of an episode
+        self.prefix_cache = PrefixCache()
+        # Picks the number of denoising steps of each inference call when `adaptive_denoising` is enabled
+        self.denoising_scheduler = (
+            AdaptiveDenoisingScheduler(
+                max_num_steps=config.num_steps,
+                min_num_steps=config.min_num_steps,
+                latency_budget=config.denoising_latency_budget,
+                divergence_threshold=config.denoising_divergence_threshold,
+            )
+            if config.adaptive_denoising
+            else None
+        )
 
     def _rtc_enabled(self):
         return self.config.rtc_config is not None and self.config.rtc_config.enabled
@@ -594,6 +610,15 @@ class VLAFlowMatching(nn.Module):
         time = time_beta * 0.999 + 0.001
         return time
 
+    def _embed_cached_tokens(self, name: str, tokens: Tensor) -> Tensor:
+        return self.prefix_cache.embed(
+            name,
+            self.vlm_with_expert.get_vlm_model().text_model.get_input_embeddings().weight,
+            lambda: self.vlm_with_expert.embed_language_tokens(
+                tokens.to(device=self.vlm_with_expert.vlm.device)
+            ),
+        )
+
     def embed_prefix(
         self, images, img_masks, lang_tokens, lang_masks, state: torch.Tensor = None
     ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
@@ -609,9 +634,7 @@ class VLAFlowMatching(nn.Module):
         ) in enumerate(zip(images, img_masks, strict=False)):
             if self.add_image_special_tokens:
                 image_start_token = (
-                    self.vlm_with_expert.embed_language_tokens(
-                        self.global_image_start_token.to(device=self.vlm_with_expert.vlm.device)
-                    )
+                    self._embed_cached_tokens("image_start", self.global_image_start_token)
                     .unsqueeze(0)
                     .expand(img.shape[0], -1, -1)
                 )
@@ -638,9 +661,7 @@ class VLAFlowMatching(nn.Module):
             att_masks += [0] * (num_img_embs)
             if self.add_image_special_tokens:
                 image_end_token = (
-                    self.vlm_with_expert.embed_language_tokens(
-                        self.image_end_token.to(device=self.vlm_with_expert.vlm.device)
-                    )
+                    self._embed_cached_tokens("image_end", self.image_end_token)
                     .unsqueeze(0)
                     .expand(img.shape[0], -1, -1)
                 )
@@ -675,7 +696,7 @@ class VLAFlowMatching(nn.Module):
         att_masks += [1] * (states_seq_len)
         embs = torch.cat(embs, dim=1)
         pad_masks = torch.cat(pad_masks, dim=1)
-        att_masks = torch.tensor(att_masks, dtype=torch.bool, device=pad_masks.device)
+        att_masks = self.prefix_cache.attention_mask(att_masks, pad_masks.device)
         att_masks = att_masks[None, :]
 
         seq_len = pad_masks.shape[1]
@@ -727,7 +748,7 @@ class VLAFlowMatching(nn.Module):
         att_masks += [1] * self.config.chunk_size
         embs = torch.cat(embs, dim=1)
         pad_masks = torch.cat(pad_masks, dim=1)
-        att_masks = torch.tensor(att_masks, dtype=embs.dtype, device=embs.device)
+        att_masks = self.prefix_cache.attention_mask(att_masks, embs.device, embs.dtype)
         att_masks = att_masks[None, :].expand(bsize, len(att_masks))
         return embs, pad_masks, att_masks
 
@@ -787,6 +808,10 @@ class VLAFlowMatching(nn.Module):
             actions_shape = (bsize, self.config.chunk_size, self.config.max_action_dim)
             noise = self.sample_noise(actions_shape, device)
 
+        scheduler = self.denoising_scheduler
+        if scheduler is not None:
+            scheduler.begin(device)
+
         prefix_embs, prefix_pad_masks, prefix_att_masks = self.embed_prefix(
             images, img_masks, lang_tokens, lang_masks, state=state
         )
@@ -802,6 +827,8 @@ class VLAFlowMatching(nn.Module):
             fill_kv_cache=True,
         )
         num_steps = self.config.num_steps
+        if scheduler is not None:
+            num_steps = scheduler.select_num_steps(kwargs.get("prev_chunk_left_over"))
         dt = -1.0 / num_steps
 
         x_t = noise
@@ -838,6 +865,8 @@ class VLAFlowMatching(nn.Module):
             if self.rtc_processor is not None and self.rtc_processor.is_debug_enabled():
                 self.rtc_processor.track(time=time, x_t=x_t, v_t=v_t)
 
+        if scheduler is not None:
+            scheduler.end()
         return x_t
 
     def denoise_step(
@@ -16,6 +16,7 @@
 
 import logging
 from collections import deque
+from collections.abc import Callable
 from typing import Any
 
 import numpy as np
@@ -95,12 +96,121 @@ def log_model_loading_keys(missing_keys: list[str], unexpected_keys: list[str])
         logging.warning(f"Unexpected key(s) when loading model: {unexpected_keys}")
 
 
+class ObservationStager:
+    """Reusable host staging buffers for uploading observations to an accelerator.
+
+    Every observation array is copied into a host buffer allocated once per key, pinned on CUDA, and
+    uploaded with a single non-blocking copy. Before the buffers are overwritten by the next observation,
+    the stager waits for the previous uploads to complete. On CPU no copy is needed and arrays are used
+    as is.
+
+    Args:
+        device: The device observations are uploaded to.
+    """
+
+    def __init__(self, device: torch.device | str):
+        self.device = torch.device(device)
+        self.enabled = self.device.type != "cpu"
+        self.pin_memory = self.device.type == "cuda"
+        self._buffers: dict[str, torch.Tensor] = {}
+        self._upload_done: torch.cuda.Event | None = None
+
+    def allocate(self, features: dict[str, dict]) -> None:
+        """Preallocates the staging buffers of the observation features.
+
+        Args:
+            features: Dataset features, e.g. `hw_to_dataset_features(robot.observation_features, OBS_STR)`.
+                Images are staged as uint8 arrays.
+        """
+        if not self.enabled:
+            return
+        for name, feature in features.items():
+            if not name.startswith(OBS_STR):
+                continue
+            dtype = np.uint8 if feature["dtype"] in ["image", "video"] else np.dtype(feature["dtype"])
+            self._buffers[name] = self._new_buffer(np.empty(feature["shape"], dtype=dtype))
+
+    def to_device(self, name: str, array: np.ndarray) -> torch.Tensor:
+        """Copies `array` into the staging buffer of `name` and uploads it to the device."""
+        if not self.enabled:
+            return torch.from_numpy(array)
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != array.shape or buffer.numpy().dtype != array.dtype:
+            buffer = self._buffers[name] = self._new_buffer(array)
+        np.copyto(buffer.numpy(), array)
+        return buffer.to(self.device, non_blocking=self.pin_memory)
+
+    def wait_for_uploads(self) -> None:
+        """Blocks until the uploads of the previous observation have read the staging buffers."""
+        if self._upload_done is not None:
+            self._upload_done.synchronize()
+            self._upload_done = None
+
+    def record_uploads(self) -> None:
+        """Marks the end of the uploads of the current observation."""
+        if self.pin_memory:
+            self._upload_done = torch.cuda.Event()
+            self._upload_done.record()
+
+    def _new_buffer(self, array: np.ndarray) -> torch.Tensor:
+        buffer = torch.empty(array.shape, dtype=torch.from_numpy(np.empty(0, dtype=array.dtype)).dtype)
+        return buffer.pin_memory() if self.pin_memory else buffer
+
+
+class PrefixCache:
+    """Caches the parts of a VLA prefix that are constant across the inference calls of an episode.
+
+    The embeddings of constant tokens (e.g. the special tokens surrounding the images) are computed once and
+    reused while the embedding weights are unchanged. Attention mask patterns, built from Python lists, are
+    uploaded once per pattern instead of at every call of the prefix and of each denoising step. Cache hits
+    are decided from host data only, so that they never wait for the device. Embeddings are not cached when
+    gradients are enabled.
+
+    Call `clear` when the episode ends (e.g. from the policy `reset`).
+    """
+
+    def __init__(self):
+        self._embeddings: dict[str, tuple[tuple[int, int], torch.Tensor]] = {}
+        self._masks: dict[tuple, torch.Tensor] = {}
+
+    def clear(self) -> None:
+        self._embeddings.clear()
+        self._masks.clear()
+
+    def embed(self, name: str, weight: torch.Tensor, embed_fn: Callable[[], torch.Tensor]) -> torch.Tensor:
+        """Returns `embed_fn()`, the embedding of constant tokens, reusing the previous result of `name`.
+
+        Args:
+            name: Name of the constant tokens, e.g. "image_start".
+            weight: The embedding weight read by `embed_fn`, the entry is recomputed when it changes.
+            embed_fn: Computes the embedding of the tokens.
+        """
+        if torch.is_grad_enabled():
+            return embed_fn()
+        weight_version = (id(weight), weight._version)
+        entry = self._embeddings.get(name)
+        if entry is None or entry[0] != weight_version:
+            entry = self._embeddings[name] = (weight_version, embed_fn())
+        return entry[1]
+
+    def attention_mask(
+        self, pattern: list[int], device: torch.device, dtype: torch.dtype = torch.bool
+    ) -> torch.Tensor:
+        """Returns `pattern` as a tensor on `device`, uploaded at the first call only."""
+        key = (tuple(pattern), device, dtype)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._masks[key] = torch.tensor(pattern, dtype=dtype, device=device)
+        return mask
+
+
 # TODO(Steven): Move this function to a proper preprocessor step
 def prepare_observation_for_inference(
     observation: dict[str, np.ndarray],
     device: torch.device,
     task: str | None = None,
     robot_type: str | None = None,
+    stager: ObservationStager | None = None,
 ) -> RobotObservation:
     """Converts observation data to model-ready PyTorch tensors.
 
@@ -119,19 +229,28 @@ def prepare_observation_for_inference(
             tensors will be moved.
         task: An optional string identifier for the current task.
         robot_type: An optional string identifier for the robot being used.
+        stager: An optional `ObservationStager` for `device`. Arrays are then uploaded from reusable
+            (pinned) host buffers and images are converted to float on the device.
 
     Returns:
         A dictionary where values are PyTorch tensors preprocessed for
         inference, residing on the target device. Image tensors are reshaped
         to (C, H, W) and normalized to a [0, 1] range.
     """
+    if stager is not None:
+        stager.wait_for_uploads()
     for name in observation:
-        observation[name] = torch.from_numpy(observation[name])
+        if stager is not None:
+            observation[name] = stager.to_device(name, observation[name])
+        else:
+            observation[name] = torch.from_numpy(observation[name])
         if "image" in name:
             observation[name] = observation[name].type(torch.float32) / 255
             observation[name] = observation[name].permute(2, 0, 1).contiguous()
         observation[name] = observation[name].unsqueeze(0)
         observation[name] = observation[name].to(device)
+    if stager is not None:
+        stager.record_uploads()
 
     observation["task"] = task if task else ""
     observation["robot_type"] = robot_type if robot_type else ""
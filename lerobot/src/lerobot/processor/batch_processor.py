@@ -21,6 +21,7 @@ These steps are designed to process actions, observations, and complementary dat
 """
 
 from dataclasses import dataclass, field
+from typing import Any, ClassVar
 
 from torch import Tensor
 
@@ -218,6 +219,8 @@ class AddBatchDimensionProcessorStep(ProcessorStep):
         default_factory=AddBatchDimensionComplementaryDataStep
     )
 
+    fusable: ClassVar[bool] = True
+
     def __call__(self, transition: EnvTransition) -> EnvTransition:
         """
         Applies the batching process to all relevant parts of an environment transition.
@@ -236,6 +239,24 @@ class AddBatchDimensionProcessorStep(ProcessorStep):
             transition = self.to_batch_complementary_data_processor(transition)
         return transition
 
+    def entry_plan(self, transition_key: TransitionKey, key: str | None) -> tuple[str | None, bool]:
+        if transition_key == TransitionKey.ACTION:
+            return key, True
+        if transition_key == TransitionKey.OBSERVATION:
+            return key, key in (OBS_STATE, OBS_ENV_STATE, OBS_IMAGE) or key.startswith(f"{OBS_IMAGES}.")
+        if transition_key == TransitionKey.COMPLEMENTARY_DATA:
+            return key, key in ("task", "index", "task_index")
+        return key, False
+
+    def apply_entry(self, transition_key: TransitionKey, key: str | None, value: Any) -> Any:
+        if transition_key == TransitionKey.ACTION:
+            if not isinstance(value, PolicyAction):
+                raise ValueError(f"Action should be a PolicyAction type (tensor), but got {type(value)}")
+            return self.to_batch_action_processor.action(value)
+        if transition_key == TransitionKey.OBSERVATION:
+            return self.to_batch_observation_processor.observation({key: value})[key]
+        return self.to_batch_complementary_data_processor.complementary_data({key: value})[key]
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -20,7 +20,7 @@ its floating-point precision.
 """
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar
 
 import torch
 
@@ -30,6 +30,16 @@ from lerobot.utils.utils import get_safe_torch_device
 from .core import EnvTransition, PolicyAction, TransitionKey
 from .pipeline import ProcessorStep, ProcessorStepRegistry
 
+# Parts of a transition whose tensors are moved by `DeviceProcessorStep`.
+_TENSOR_TRANSITION_KEYS = (
+    TransitionKey.ACTION,
+    TransitionKey.REWARD,
+    TransitionKey.DONE,
+    TransitionKey.TRUNCATED,
+    TransitionKey.OBSERVATION,
+    TransitionKey.COMPLEMENTARY_DATA,
+)
+
 
 @ProcessorStepRegistry.register("device_processor")
 @dataclass
@@ -49,6 +59,8 @@ class DeviceProcessorStep(ProcessorStep):
     device: str = "cpu"
     float_dtype: str | None = None
 
+    fusable: ClassVar[bool] = True
+
     DTYPE_MAPPING = {
         "float16": torch.float16,
         "float32": torch.float32,
@@ -168,6 +180,14 @@ class DeviceProcessorStep(ProcessorStep):
 
         return new_transition
 
+    def entry_plan(self, transition_key: TransitionKey, key: str | None) -> tuple[str | None, bool]:
+        return key, transition_key in _TENSOR_TRANSITION_KEYS
+
+    def apply_entry(self, transition_key: TransitionKey, key: str | None, value: Any) -> Any:
+        if transition_key == TransitionKey.ACTION and not isinstance(value, PolicyAction):
+            raise ValueError(f"If action is not None should be a PolicyAction type got {type(value)}")
+        return self._process_tensor(value) if isinstance(value, torch.Tensor) else value
+
     def get_config(self) -> dict[str, Any]:
         """
         Returns the serializable configuration of the processor.
@@ -19,7 +19,7 @@ from __future__ import annotations
 
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 
 import torch
 from torch import Tensor
@@ -32,6 +32,19 @@ from .converters import from_tensor_to_numpy, to_tensor
 from .core import EnvTransition, PolicyAction, TransitionKey
 from .pipeline import PolicyProcessorPipeline, ProcessorStep, ProcessorStepRegistry
 
+# Affine normalization modes, with the names of the statistics mapped to [-1, 1] for range based modes.
+_AFFINE_NORMALIZATION_MODES = {
+    NormalizationMode.MEAN_STD: None,
+    NormalizationMode.MIN_MAX: ("min", "max"),
+    NormalizationMode.QUANTILES: ("q01", "q99"),
+    NormalizationMode.QUANTILE10: ("q10", "q90"),
+}
+
+
+def _affine_compute_dtype(dtype: torch.dtype) -> torch.dtype:
+    """Low precision stats are converted to float32 to compute the affine parameters."""
+    return dtype if dtype == torch.float64 else torch.float32
+
 
 @dataclass
 class _NormalizationMixin:
@@ -82,6 +95,9 @@ class _NormalizationMixin:
             normalization to specific observation features.
         _tensor_stats: An internal dictionary holding the normalization statistics as
             PyTorch tensors.
+        _affine: An internal dictionary holding, for each feature, the precomputed
+            `(scale, offset, inverse_scale, inverse_offset)` tensors so that (un)normalization
+            is a single multiply-add.
         _stats_explicitly_provided: Internal flag tracking whether stats were explicitly
             provided during construction (used for override preservation).
     """
@@ -95,6 +111,9 @@ class _NormalizationMixin:
     normalize_observation_keys: set[str] | None = None
 
     _tensor_stats: dict[str, dict[str, Tensor]] = field(default_factory=dict, init=False, repr=False)
+    _affine: dict[str, tuple[Tensor, Tensor, Tensor, Tensor]] = field(
+        default_factory=dict, init=False, repr=False
+    )
     _stats_explicitly_provided: bool = field(default=False, init=False, repr=False)
 
     def __post_init__(self):
@@ -131,6 +150,7 @@ class _NormalizationMixin:
         if self.dtype is None:
             self.dtype = torch.float32
         self._tensor_stats = to_tensor(self.stats, device=self.device, dtype=self.dtype)
+        self._compile_affine()
 
     def to(
         self, device: torch.device | str | None = None, dtype: torch.dtype | None = None
@@ -149,6 +169,7 @@ class _NormalizationMixin:
         if dtype is not None:
             self.dtype = dtype
         self._tensor_stats = to_tensor(self.stats, device=self.device, dtype=self.dtype)
+        self._compile_affine()
         return self
 
     def state_dict(self) -> dict[str, Tensor]:
@@ -198,6 +219,7 @@ class _NormalizationMixin:
             # Don't load from state_dict, keep the explicitly provided stats
             # But ensure _tensor_stats is properly initialized
             self._tensor_stats = to_tensor(self.stats, device=self.device, dtype=self.dtype)  # type: ignore[assignment]
+            self._compile_affine()
             return
 
         # Normal behavior: load stats from state_dict
@@ -218,6 +240,80 @@ class _NormalizationMixin:
                 # Convert tensor back to python/numpy format
                 self.stats[key][stat_name] = from_tensor_to_numpy(tensor)
 
+        self._compile_affine()
+
+    def _compile_affine(self) -> None:
+        """
+        Precomputes the affine (un)normalization parameters of every feature from `_tensor_stats`.
+
+        Must be called whenever `_tensor_stats` changes. Features whose required statistics are missing
+        are skipped here and reported when they are (un)normalized.
+        """
+        self._affine = {}
+        for key, stats in self._tensor_stats.items():
+            feature = self.features.get(key)
+            if feature is not None:
+                feature_type = feature.type
+            elif key == ACTION:
+                feature_type = FeatureType.ACTION
+            else:
+                continue
+            norm_mode = self.norm_map.get(feature_type, NormalizationMode.IDENTITY)
+            if norm_mode not in _AFFINE_NORMALIZATION_MODES:
+                continue
+            try:
+                self._affine[key] = self._compute_affine(stats, norm_mode)
+            except ValueError:
+                continue
+
+    def _compute_affine(
+        self, stats: dict[str, Tensor], norm_mode: NormalizationMode
+    ) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+        """
+        Expresses a normalization mode as `normalized = tensor * scale + offset` and
+        `tensor = normalized * inverse_scale + inverse_offset`.
+
+        Args:
+            stats: The statistics of the feature.
+            norm_mode: The normalization mode of the feature.
+
+        Returns:
+            The `(scale, offset, inverse_scale, inverse_offset)` tensors, in the dtype of the stats.
+
+        Raises:
+            ValueError: If the statistics required by the normalization mode are missing.
+        """
+        if norm_mode == NormalizationMode.MEAN_STD:
+            if stats.get("mean") is None or stats.get("std") is None:
+                raise ValueError(
+                    "MEAN_STD normalization mode requires mean and std stats, please update the dataset with the correct stats"
+                )
+            dtype = stats["mean"].dtype
+            mean, std = (stats[name].to(_affine_compute_dtype(dtype)) for name in ("mean", "std"))
+            # Avoid division by zero by adding a small epsilon.
+            scale = 1.0 / (std + self.eps)
+            params = (scale, -mean * scale, std, mean)
+        else:
+            low_name, high_name = _AFFINE_NORMALIZATION_MODES[norm_mode]
+            if stats.get(low_name) is None or stats.get(high_name) is None:
+                if norm_mode == NormalizationMode.MIN_MAX:
+                    raise ValueError(
+                        "MIN_MAX normalization mode requires min and max stats, please update the dataset with the correct stats"
+                    )
+                raise ValueError(
+                    f"{norm_mode.name} normalization mode requires {low_name} and {high_name} stats, please update the dataset with the correct stats using the `augment_dataset_quantile_stats.py` script"
+                )
+            dtype = stats[low_name].dtype
+            low, high = (stats[name].to(_affine_compute_dtype(dtype)) for name in (low_name, high_name))
+            denom = high - low
+            # When low == high, substitute the denominator with a small epsilon to prevent division by zero.
+            # This consistently maps an input equal to low to -1, ensuring a stable transformation.
+            denom = torch.where(denom == 0, torch.full_like(denom, self.eps), denom)
+            # Map from [low, high] to [-1, 1] and back
+            scale = 2.0 / denom
+            params = (scale, -low * scale - 1.0, denom / 2.0, denom / 2.0 + low)
+        return tuple(param.to(dtype) for param in params)
+
     def get_config(self) -> dict[str, Any]:
         """
         Returns a serializable dictionary of the processor's configuration.
@@ -256,10 +352,34 @@ class _NormalizationMixin:
                 continue
             if feature.type != FeatureType.ACTION and key in new_observation:
                 # Convert to tensor but preserve original dtype for adaptation logic
-                tensor = torch.as_tensor(new_observation[key])
+                tensor = new_observation[key]
+                if not isinstance(tensor, Tensor):
+                    tensor = torch.as_tensor(tensor)
                 new_observation[key] = self._apply_transform(tensor, key, feature.type, inverse=inverse)
         return new_observation
 
+    def _entry_plan(self, transition_key: TransitionKey, key: str | None) -> tuple[str | None, bool]:
+        """Selects the entries (un)normalized by `_normalize_observation` and `_normalize_action`."""
+        if transition_key == TransitionKey.ACTION:
+            return key, True
+        if transition_key != TransitionKey.OBSERVATION or key not in self.features:
+            return key, False
+        if self.normalize_observation_keys is not None and key not in self.normalize_observation_keys:
+            return key, False
+        feature_type = self.features[key].type
+        norm_mode = self.norm_map.get(feature_type, NormalizationMode.IDENTITY)
+        return key, feature_type != FeatureType.ACTION and norm_mode != NormalizationMode.IDENTITY
+
+    def _apply_entry(self, transition_key: TransitionKey, key: str | None, value: Any, inverse: bool) -> Any:
+        """(Un)normalizes a single entry selected by `_entry_plan`."""
+        if transition_key == TransitionKey.ACTION:
+            if not isinstance(value, PolicyAction):
+                raise ValueError(f"Action should be a PolicyAction type got {type(value)}")
+            return self._normalize_action(value, inverse=inverse)
+        if not isinstance(value, Tensor):
+            value = torch.as_tensor(value)
+        return self._apply_transform(value, key, self.features[key].type, inverse=inverse)
+
     def _normalize_action(self, action: Tensor, inverse: bool) -> Tensor:
         # Convert to tensor but preserve original dtype for adaptation logic
         """
@@ -306,95 +426,24 @@ class _NormalizationMixin:
         if norm_mode == NormalizationMode.IDENTITY or key not in self._tensor_stats:
             return tensor
 
-        if norm_mode not in (
-            NormalizationMode.MEAN_STD,
-            NormalizationMode.MIN_MAX,
-            NormalizationMode.QUANTILES,
-            NormalizationMode.QUANTILE10,
-        ):
+        if norm_mode not in _AFFINE_NORMALIZATION_MODES:
             raise ValueError(f"Unsupported normalization mode: {norm_mode}")
 
+        affine = self._get_affine(key, norm_mode)
         # For Accelerate compatibility: Ensure stats are on the same device and dtype as the input tensor
-        if self._tensor_stats and key in self._tensor_stats:
-            first_stat = next(iter(self._tensor_stats[key].values()))
-            if first_stat.device != tensor.device or first_stat.dtype != tensor.dtype:
-                self.to(device=tensor.device, dtype=tensor.dtype)
+        if affine[0].device != tensor.device or affine[0].dtype != tensor.dtype:
+            self.to(device=tensor.device, dtype=tensor.dtype)
+            affine = self._get_affine(key, norm_mode)
 
-        stats = self._tensor_stats[key]
-
-        if norm_mode == NormalizationMode.MEAN_STD:
-            mean = stats.get("mean", None)
-            std = stats.get("std", None)
-            if mean is None or std is None:
-                raise ValueError(
-                    "MEAN_STD normalization mode requires mean and std stats, please update the dataset with the correct stats"
-                )
+        scale, offset = affine[2:] if inverse else affine[:2]
+        return torch.addcmul(offset, tensor, scale)
 
-            mean, std = stats["mean"], stats["std"]
-            # Avoid division by zero by adding a small epsilon.
-            denom = std + self.eps
-            if inverse:
-                return tensor * std + mean
-            return (tensor - mean) / denom
-
-        if norm_mode == NormalizationMode.MIN_MAX:
-            min_val = stats.get("min", None)
-            max_val = stats.get("max", None)
-            if min_val is None or max_val is None:
-                raise ValueError(
-                    "MIN_MAX normalization mode requires min and max stats, please update the dataset with the correct stats"
-                )
-
-            min_val, max_val = stats["min"], stats["max"]
-            denom = max_val - min_val
-            # When min_val == max_val, substitute the denominator with a small epsilon
-            # to prevent division by zero. This consistently maps an input equal to
-            # min_val to -1, ensuring a stable transformation.
-            denom = torch.where(
-                denom == 0, torch.tensor(self.eps, device=tensor.device, dtype=tensor.dtype), denom
-            )
-            if inverse:
-                # Map from [-1, 1] back to [min, max]
-                return (tensor + 1) / 2 * denom + min_val
-            # Map from [min, max] to [-1, 1]
-            return 2 * (tensor - min_val) / denom - 1
-
-        if norm_mode == NormalizationMode.QUANTILES:
-            q01 = stats.get("q01", None)
-            q99 = stats.get("q99", None)
-            if q01 is None or q99 is None:
-                raise ValueError(
-                    "QUANTILES normalization mode requires q01 and q99 stats, please update the dataset with the correct stats using the `augment_dataset_quantile_stats.py` script"
-                )
-
-            denom = q99 - q01
-            # Avoid division by zero by adding epsilon when quantiles are identical
-            denom = torch.where(
-                denom == 0, torch.tensor(self.eps, device=tensor.device, dtype=tensor.dtype), denom
-            )
-            if inverse:
-                return (tensor + 1.0) * denom / 2.0 + q01
-            return 2.0 * (tensor - q01) / denom - 1.0
-
-        if norm_mode == NormalizationMode.QUANTILE10:
-            q10 = stats.get("q10", None)
-            q90 = stats.get("q90", None)
-            if q10 is None or q90 is None:
-                raise ValueError(
-                    "QUANTILE10 normalization mode requires q10 and q90 stats, please update the dataset with the correct stats using the `augment_dataset_quantile_stats.py` script"
-                )
-
-            denom = q90 - q10
-            # Avoid division by zero by adding epsilon when quantiles are identical
-            denom = torch.where(
-                denom == 0, torch.tensor(self.eps, device=tensor.device, dtype=tensor.dtype), denom
-            )
-            if inverse:
-                return (tensor + 1.0) * denom / 2.0 + q10
-            return 2.0 * (tensor - q10) / denom - 1.0
-
-        # If necessary stats are missing, return input unchanged.
-        return tensor
+    def _get_affine(self, key: str, norm_mode: NormalizationMode) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+        """Returns the precomputed affine parameters of `key`, computing them if they are missing."""
+        affine = self._affine.get(key)
+        if affine is None:
+            affine = self._affine[key] = self._compute_affine(self._tensor_stats[key], norm_mode)
+        return affine
 
 
 @dataclass
@@ -408,6 +457,8 @@ class NormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
     It is typically used in the pre-processing pipeline before feeding data to a policy.
     """
 
+    fusable: ClassVar[bool] = True
+
     @classmethod
     def from_lerobot_dataset(
         cls,
@@ -465,6 +516,12 @@ class NormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
 
         return new_transition
 
+    def entry_plan(self, transition_key: TransitionKey, key: str | None) -> tuple[str | None, bool]:
+        return self._entry_plan(transition_key, key)
+
+    def apply_entry(self, transition_key: TransitionKey, key: str | None, value: Any) -> Any:
+        return self._apply_entry(transition_key, key, value, inverse=False)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -483,6 +540,8 @@ class UnnormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
     environment.
     """
 
+    fusable: ClassVar[bool] = True
+
     @classmethod
     def from_lerobot_dataset(
         cls,
@@ -526,6 +585,12 @@ class UnnormalizerProcessorStep(_NormalizationMixin, ProcessorStep):
 
         return new_transition
 
+    def entry_plan(self, transition_key: TransitionKey, key: str | None) -> tuple[str | None, bool]:
+        return self._entry_plan(transition_key, key)
+
+    def apply_entry(self, transition_key: TransitionKey, key: str | None, value: Any) -> Any:
+        return self._apply_entry(transition_key, key, value, inverse=True)
+
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
     ) -> dict[PipelineFeatureType, dict[str, PolicyFeature]]:
@@ -557,4 +622,5 @@ def hotswap_stats(
             step.stats = stats
             # Re-initialize tensor_stats on the correct device.
             step._tensor_stats = to_tensor(stats, device=step.device, dtype=step.dtype)  # type: ignore[assignment]
+            step._compile_affine()
     return rp
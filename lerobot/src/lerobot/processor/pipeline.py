@@ -39,7 +39,7 @@ from collections.abc import Callable, Iterable, Sequence
 from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Generic, TypeAlias, TypedDict, TypeVar, cast
+from typing import Any, ClassVar, Generic, TypeAlias, TypedDict, TypeVar, cast
 
 import torch
 from huggingface_hub import hf_hub_download
@@ -51,6 +51,9 @@ from lerobot.utils.hub import HubMixin
 from .converters import batch_to_transition, create_transition, transition_to_batch
 from .core import EnvAction, EnvTransition, PolicyAction, RobotAction, TransitionKey
 
+# Parts of a transition holding a dictionary of entries.
+_DICT_TRANSITION_KEYS = (TransitionKey.OBSERVATION, TransitionKey.COMPLEMENTARY_DATA, TransitionKey.INFO)
+
 # Generic type variables for pipeline input and output.
 TInput = TypeVar("TInput")
 TOutput = TypeVar("TOutput")
@@ -152,6 +155,11 @@ class ProcessorStep(ABC):
 
     _current_transition: EnvTransition | None = None
 
+    # Steps that transform each entry of a transition independently (renaming keys, moving tensors, per-key
+    # arithmetic) can set this to True and implement `entry_plan` and `apply_entry`, so that a compiled
+    # `DataProcessorPipeline` can fuse them with their neighbours.
+    fusable: ClassVar[bool] = False
+
     @property
     def transition(self) -> EnvTransition:
         """Provides access to the most recent transition being processed.
@@ -209,6 +217,34 @@ class ProcessorStep(ABC):
         """Resets the internal state of the processor step, if any."""
         return None
 
+    def entry_plan(self, transition_key: TransitionKey, key: str | None) -> tuple[str | None, bool]:
+        """Describes how a fusable step transforms a single entry of a transition.
+
+        The result may only depend on the configuration of the step, as it is cached by compiled pipelines.
+
+        Args:
+            transition_key: The part of the transition holding the entry.
+            key: The key of the entry for dictionary parts (observation, complementary data, info), None
+                for the other parts.
+
+        Returns:
+            The key of the entry after this step, and whether `apply_entry` must be called on its value.
+        """
+        return key, False
+
+    def apply_entry(self, transition_key: TransitionKey, key: str | None, value: Any) -> Any:
+        """Transforms the value of a single entry, for the entries selected by `entry_plan`.
+
+        Args:
+            transition_key: The part of the transition holding the entry.
+            key: The key of the entry before this step, None for non-dictionary parts.
+            value: The value of the entry.
+
+        Returns:
+            The transformed value.
+        """
+        return value
+
     @abstractmethod
     def transform_features(
         self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]]
@@ -281,6 +317,12 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
     before_step_hooks: list[Callable[[int, EnvTransition], None]] = field(default_factory=list, repr=False)
     after_step_hooks: list[Callable[[int, EnvTransition], None]] = field(default_factory=list, repr=False)
 
+    # Set by `compile`: groups of consecutive step indices, and the cached per-entry plans of fused groups
+    _compiled_runs: list[tuple[int, ...]] | None = field(default=None, init=False, repr=False)
+    _entry_plans: dict[tuple, tuple[str | None, tuple[tuple[int, str | None], ...]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     def __call__(self, data: TInput) -> TOutput:
         """Processes input data through the full pipeline.
 
@@ -303,6 +345,10 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
         Returns:
             The final `EnvTransition` after all steps have been applied.
         """
+        # Hooks observe every intermediate transition, which fused steps don't produce
+        if self._compiled_runs is not None and not self.before_step_hooks and not self.after_step_hooks:
+            return self._forward_compiled(transition)
+
         for idx, processor_step in enumerate(self.steps):
             # Execute pre-hooks
             for hook in self.before_step_hooks:
@@ -315,6 +361,105 @@ class DataProcessorPipeline(HubMixin, Generic[TInput, TOutput]):
                 hook(idx, transition)
         return transition
 
+    @property
+    def is_compiled(self) -> bool:
+        """Whether the pipeline runs in the compiled execution mode (see `compile`)."""
+        return self._compiled_runs is not None
+
+    def compile(
+        self, features: dict[PipelineFeatureType, dict[str, PolicyFeature]] | None = None
+    ) -> DataProcessorPipeline[TInput, TOutput]:
+        """Enables the compiled execution mode of the pipeline.
+
+        Runs of consecutive fusable steps (e.g. rename -> add batch dimension -> device -> normalize) are
+        executed as a single step: the transition and each of its dictionaries are copied once for the whole
+        run, only when an entry actually changes, and each entry only goes through the steps that transform
+        it. The per-entry plans are computed the first time a key is seen and cached. Other steps, and the
+        whole pipeline when hooks are registered, run as usual.
+
+        Args:
+            features: If provided, the step list is checked once by propagating these features through
+                `transform_features`, so that incompatible steps fail here rather than at the first call.
+
+        Returns:
+            The pipeline itself, to allow chaining.
+        """
+        if features is not None:
+            self.transform_features(features)
+
+        runs: list[tuple[int, ...]] = []
+        for idx, step in enumerate(self.steps):
+            if step.fusable and runs and self.steps[runs[-1][-1]].fusable:
+                runs[-1] = (*runs[-1], idx)
+            else:
+                runs.append((idx,))
+        self._compiled_runs = runs
+        self._entry_plans = {}
+        return self
+
+    def _forward_compiled(self, transition: EnvTransition) -> EnvTransition:
+        """Executes the steps grouped by `compile`."""
+        for run in self._compiled_runs:
+            if len(run) == 1:
+                transition = self.steps[run[0]](transition)
+            else:
+                transition = self._forward_fused(run, transition)
+        return transition
+
+    def _entry_plan(
+        self, run: tuple[int, ...], transition_key: TransitionKey, key: str | None
+    ) -> tuple[str | None, tuple[tuple[int, str | None], ...]]:
+        """Returns the final key of an entry and the (step index, input key) pairs that transform it."""
+        cache_key = (run, transition_key, key)
+        plan = self._entry_plans.get(cache_key)
+        if plan is None:
+            calls = []
+            current_key = key
+            for idx in run:
+                new_key, transforms = self.steps[idx].entry_plan(transition_key, current_key)
+                if transforms:
+                    calls.append((idx, current_key))
+                current_key = new_key
+            plan = (current_key, tuple(calls))
+            self._entry_plans[cache_key] = plan
+        return plan
+
+    def _forward_fused(self, run: tuple[int, ...], transition: EnvTransition) -> EnvTransition:
+        """Applies a run of fusable steps to a transition, entry by entry."""
+        observation = transition.get(TransitionKey.OBSERVATION)
+        if not isinstance(observation, dict) and (
+            observation is not None
+            or any(isinstance(self.steps[idx], ObservationProcessorStep) for idx in run)
+        ):
+            # Let the steps raise their usual errors
+            for idx in run:
+                transition = self.steps[idx](transition)
+            return transition
+
+        new_transition = transition.copy()
+        for transition_key, value in transition.items():
+            if value is None:
+                continue
+
+            if transition_key in _DICT_TRANSITION_KEYS and isinstance(value, dict):
+                new_value = {}
+                changed = False
+                for key, entry in value.items():
+                    new_key, calls = self._entry_plan(run, transition_key, key)
+                    for idx, input_key in calls:
+                        entry = self.steps[idx].apply_entry(transition_key, input_key, entry)
+                    new_value[new_key] = entry
+                    changed = changed or bool(calls) or new_key != key
+                if changed:
+                    new_transition[transition_key] = new_value
+                continue
+
+            _, calls = self._entry_plan(run, transition_key, None)
+            for idx, input_key in calls:
+                value = self.steps[idx].apply_entry(transition_key, input_key, value)
+            new_transition[transition_key] = value
+        return new_transition
+
     def step_through(self, data: TInput) -> Iterable[EnvTransition]:
         """Processes data step-by-step, yielding the transition at each stage.
 
@@ -15,10 +15,11 @@
 # limitations under the License.
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 
 from lerobot.configs.types import PipelineFeatureType, PolicyFeature
 
+from .core import TransitionKey
 from .pipeline import ObservationProcessorStep, ProcessorStepRegistry
 
 
@@ -40,6 +41,8 @@ class RenameObservationsProcessorStep(ObservationProcessorStep):
 
     rename_map: dict[str, str] = field(default_factory=dict)
 
+    fusable: ClassVar[bool] = True
+
     def observation(self, observation):
         processed_obs = {}
         for key, value in observation.items():
@@ -50,6 +53,11 @@ class RenameObservationsProcessorStep(ObservationProcessorStep):
 
         return processed_obs
 
+    def entry_plan(self, transition_key: TransitionKey, key: str | None) -> tuple[str | None, bool]:
+        if transition_key == TransitionKey.OBSERVATION:
+            return self.rename_map.get(key, key), False
+        return key, False
+
     def get_config(self) -> dict[str, Any]:
         return {"rename_map": self.rename_map}
 
@@ -23,6 +23,7 @@ token IDs and attention masks, which are then added to the observation dictionar
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -62,6 +63,9 @@ class TokenizerProcessorStep(ObservationProcessorStep):
         padding_side: The side to pad on ('left' or 'right').
         padding: The padding strategy ('max_length', 'longest', etc.).
         truncation: Whether to truncate sequences longer than `max_length`.
+        cache_size: The maximum number of tokenized prompts kept in an LRU cache, on the device they
+            were last requested on. The task usually stays the same for a whole episode or inference
+            session, so it is only tokenized once. Set to 0 to disable the cache.
         input_tokenizer: The internal tokenizer instance, loaded during initialization.
     """
 
@@ -72,9 +76,14 @@ class TokenizerProcessorStep(ObservationProcessorStep):
     padding_side: str = "right"
     padding: str = "max_length"
     truncation: bool = True
+    cache_size: int = 128
 
     # Internal tokenizer instance (not part of the config)
     input_tokenizer: Any = field(default=None, init=False, repr=False)
+    # LRU cache of tokenized prompts, see `_tokenize_cached`
+    _cache: OrderedDict[tuple, tuple[torch.Tensor, torch.Tensor]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
 
     def __post_init__(self):
         """
@@ -149,28 +158,102 @@ class TokenizerProcessorStep(ObservationProcessorStep):
         if task is None:
             raise ValueError("Task cannot be None")
 
-        # Tokenize the task (this will create CPU tensors)
-        tokenized_prompt = self._tokenize_text(task)
-
         # Detect the device from existing tensors in the transition to ensure consistency
         target_device = self._detect_device(self.transition)
 
-        # Move new tokenized tensors to the detected device
-        if target_device is not None:
-            tokenized_prompt = {
-                k: v.to(target_device) if isinstance(v, torch.Tensor) else v
-                for k, v in tokenized_prompt.items()
-            }
+        # Tokenize the task, or fetch it from the cache, directly on the detected device
+        input_ids, attention_mask = self._tokenize_cached(task, target_device)
 
         # Create a new observation dict to avoid modifying the original in place
         new_observation = dict(observation)
 
         # Add tokenized data to the observation
-        new_observation[OBS_LANGUAGE_TOKENS] = tokenized_prompt["input_ids"]
-        new_observation[OBS_LANGUAGE_ATTENTION_MASK] = tokenized_prompt["attention_mask"].to(dtype=torch.bool)
+        new_observation[OBS_LANGUAGE_TOKENS] = input_ids
+        new_observation[OBS_LANGUAGE_ATTENTION_MASK] = attention_mask
 
         return new_observation
 
+    def clear_cache(self) -> None:
+        """Drops every cached tokenized prompt."""
+        self._cache.clear()
+
+    def _tokenize_cached(
+        self, task: list[str], device: torch.device | None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """
+        Tokenizes `task` and moves the result to `device`, reusing previously tokenized prompts.
+
+        Cache entries are keyed by the prompt, the tokenizer, the tokenization parameters and the device. With
+        `max_length` padding and truncation every prompt is tokenized to the same length independently
+        of the rest of the batch, so prompts of a batch are cached one by one and a batch of repeated
+        prompts only tokenizes the new ones. Otherwise the padding depends on the whole batch, which is
+        then cached as a single entry.
+
+        Args:
+            task: The list of task strings to tokenize.
+            device: The device to put the tensors on, or None to keep them on the CPU.
+
+        Returns:
+            The token IDs and the boolean attention mask. Cached tensors are copied so that callers can
+            modify them freely.
+        """
+        if self.cache_size <= 0:
+            return self._tokenize_to_device(task, device)
+
+        tokenizer = (getattr(self.input_tokenizer, "name_or_path", None), id(self.input_tokenizer))
+        config = (tokenizer, self.max_length, self.padding, self.padding_side, self.truncation, str(device))
+        if len(task) == 1 or self.padding != "max_length" or not self.truncation:
+            key = (tuple(task), *config)
+            entry = self._cache_get(key)
+            if entry is None:
+                entry = self._tokenize_to_device(task, device)
+                self._cache_put(key, entry)
+            return entry[0].clone(), entry[1].clone()
+
+        keys = [(text, *config) for text in task]
+        entries = {key: self._cache_get(key) for key in dict.fromkeys(keys)}
+        missing = [key for key, entry in entries.items() if entry is None]
+        if missing:
+            input_ids, attention_mask = self._tokenize_to_device([key[0] for key in missing], device)
+            # A single prompt may be returned without its batch dimension
+            input_ids, attention_mask = (
+                input_ids.reshape(len(missing), -1),
+                attention_mask.reshape(len(missing), -1),
+            )
+            for i, key in enumerate(missing):
+                entries[key] = (input_ids[i].clone(), attention_mask[i].clone())
+                self._cache_put(key, entries[key])
+
+        return (
+            torch.stack([entries[key][0] for key in keys]),
+            torch.stack([entries[key][1] for key in keys]),
+        )
+
+    def _cache_get(self, key: tuple) -> tuple[torch.Tensor, torch.Tensor] | None:
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+        return entry
+
+    def _cache_put(self, key: tuple, entry: tuple[torch.Tensor, torch.Tensor]) -> None:
+        self._cache[key] = entry
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _tokenize_to_device(
+        self, task: list[str], device: torch.device | None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Tokenizes `task` and moves the token IDs and the boolean attention mask to `device`."""
+        # Tokenize the task (this will create CPU tensors)
+        tokenized_prompt = self._tokenize_text(task)
+        input_ids = tokenized_prompt["input_ids"]
+        attention_mask = tokenized_prompt["attention_mask"].to(dtype=torch.bool)
+
+        # Move new tokenized tensors to the detected device
+        if device is not None:
+            input_ids, attention_mask = input_ids.to(device), attention_mask.to(device)
+        return input_ids, attention_mask
+
     def _detect_device(self, transition: EnvTransition) -> torch.device | None:
         """
         Detects the torch.device from existing tensors in the transition.
@@ -232,6 +315,7 @@ class TokenizerProcessorStep(ObservationProcessorStep):
             "padding_side": self.padding_side,
             "padding": self.padding,
             "truncation": self.truncation,
+            "cache_size": self.cache_size,
         }
 
         # Only save tokenizer_name if it was used to create the tokenizer
@@ -63,14 +63,18 @@ from lerobot.configs.train import TrainRLServerPipelineConfig
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
 from lerobot.processor import TransitionKey
+from lerobot.rl.parameter_sync import (
+    ParameterSyncReceiver,
+    bytes_to_update,
+    get_last_updates_from_queue,
+    get_sync_modules,
+)
 from lerobot.rl.process import ProcessSignalHandler
-from lerobot.rl.queue import get_last_item_from_queue
 from lerobot.robots import so100_follower  # noqa: F401
 from lerobot.teleoperators import gamepad, so101_leader  # noqa: F401
 from lerobot.teleoperators.utils import TeleopEvents
 from lerobot.transport import services_pb2, services_pb2_grpc
 from lerobot.transport.utils import (
-    bytes_to_state_dict,
     grpc_channel_options,
     python_object_to_bytes,
     receive_bytes_in_chunks,
@@ -81,8 +85,10 @@ from lerobot.utils.random_utils import set_seed
 from lerobot.utils.robot_utils import precise_sleep
 from lerobot.utils.transition import (
     Transition,
-    move_state_dict_to_device,
-    move_transition_to_device,
+    find_nan_transitions,
+    quantize_transition_images,
+    select_transitions,
+    stack_transitions,
 )
 from lerobot.utils.utils import (
     TimerManager,
@@ -241,7 +247,7 @@ def act_with_policy(
     env_processor, action_processor = make_processors(online_env, teleop_device, cfg.env, cfg.policy.device)
 
     set_seed(cfg.seed)
-    device = get_safe_torch_device(cfg.policy.device, log=True)
+    get_safe_torch_device(cfg.policy.device, log=True)
 
     torch.backends.cudnn.benchmark = True
     torch.backends.cuda.matmul.allow_tf32 = True
@@ -258,6 +264,8 @@ def act_with_policy(
     policy = policy.eval()
     assert isinstance(policy, nn.Module)
 
+    parameter_sync = ParameterSyncReceiver()
+
     obs, info = online_env.reset()
     env_processor.reset()
     action_processor.reset()
@@ -351,7 +359,9 @@ def act_with_policy(
         if done or truncated:
             logging.info(f"[ACTOR] Global step {interaction_step}: Episode reward: {sum_reward_episode}")
 
-            update_policy_parameters(policy=policy, parameters_queue=parameters_queue, device=device)
+            update_policy_parameters(
+                policy=policy, parameters_queue=parameters_queue, parameter_sync=parameter_sync
+            )
 
             if len(list_transition_to_send_to_learner) > 0:
                 push_transitions_to_transport_queue(
@@ -649,56 +659,64 @@ def interactions_stream(
 #  Policy functions
 
 
-def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue, device):
-    bytes_state_dict = get_last_item_from_queue(parameters_queue, block=False)
-    if bytes_state_dict is not None:
-        logging.info("[ACTOR] Load new parameters from Learner.")
-        state_dicts = bytes_to_state_dict(bytes_state_dict)
-
-        # TODO: check encoder parameter synchronization possible issues:
-        # 1. When shared_encoder=True, we're loading stale encoder params from actor's state_dict
-        #    instead of the updated encoder params from critic (which is optimized separately)
-        # 2. When freeze_vision_encoder=True, we waste bandwidth sending/loading frozen params
-        # 3. Need to handle encoder params correctly for both actor and discrete_critic
-        # Potential fixes:
-        # - Send critic's encoder state when shared_encoder=True
-        # - Skip encoder params entirely when freeze_vision_encoder=True
-        # - Ensure discrete_critic gets correct encoder state (currently uses encoder_critic)
-
-        # Load actor state dict
-        actor_state_dict = move_state_dict_to_device(state_dicts["policy"], device=device)
-        policy.actor.load_state_dict(actor_state_dict)
-
-        # Load discrete critic if present
-        if hasattr(policy, "discrete_critic") and "discrete_critic" in state_dicts:
-            discrete_critic_state_dict = move_state_dict_to_device(
-                state_dicts["discrete_critic"], device=device
+def update_policy_parameters(
+    policy: SACPolicy,
+    parameters_queue: Queue,
+    parameter_sync: ParameterSyncReceiver | None = None,
+):
+    """Apply the most recent parameters update sent by the learner, if any.
+
+    Args:
+        policy: Policy to update in place, the parameters keep their device.
+        parameters_queue: Queue receiving the serialized parameter updates.
+        parameter_sync: Receiver keeping track of the applied versions. It must persist across calls for
+            non-keyframe updates to be applied. If None, only keyframes can be applied.
+    """
+    # The latest update, preceded by its keyframe if it was still queued
+    bytes_updates = get_last_updates_from_queue(parameters_queue, block=False)
+    if not bytes_updates:
+        return
+
+    if parameter_sync is None:
+        parameter_sync = ParameterSyncReceiver()
+
+    for bytes_update in bytes_updates:
+        update = bytes_to_update(bytes_update)
+
+        # NOTE: When shared_encoder=True the actor encoder is the critic encoder, so the updated encoder
+        # parameters are part of the actor state dict. Frozen encoder parameters are only sent once.
+        # TODO: Ensure discrete_critic gets correct encoder state (currently uses encoder_critic)
+        if parameter_sync.apply_update(update, get_sync_modules(policy)):
+            logging.info(
+                f"[ACTOR] Loaded parameters version {update['version']} from Learner "
+                f"(keyframe={update['is_keyframe']})."
             )
-            policy.discrete_critic.load_state_dict(discrete_critic_state_dict)
-            logging.info("[ACTOR] Loaded discrete critic parameters from Learner.")
 
 
 #  Utilities functions
 
 
 def push_transitions_to_transport_queue(transitions: list, transitions_queue):
-    """Send transitions to learner in smaller chunks to avoid network issues.
+    """Send transitions to learner as a single columnar batch.
+
+    Every field is stacked into one tensor for the whole list (e.g. an episode segment) and images are sent
+    as uint8, so serialization and insertion in the replay buffer are done once per batch.
 
     Args:
         transitions: List of transitions to send
-        message_queue: Queue to send messages to learner
-        chunk_size: Size of each chunk to send
+        transitions_queue: Queue to send the serialized batch to learner
     """
-    transition_to_send_to_learner = []
-    for transition in transitions:
-        tr = move_transition_to_device(transition=transition, device="cpu")
-        for key, value in tr["state"].items():
-            if torch.isnan(value).any():
-                logging.warning(f"Found NaN values in transition {key}")
-
-        transition_to_send_to_learner.append(tr)
+    batch = stack_transitions(transitions, device="cpu")
+    # Drop the transitions with NaN values before the images are quantized, which would hide the NaNs
+    has_nan = find_nan_transitions(batch)
+    if has_nan.any():
+        logging.warning(f"[ACTOR] NaN detected in {int(has_nan.sum())} transitions, skipping")
+        if has_nan.all():
+            return
+        batch = select_transitions(batch, ~has_nan)
+    batch = quantize_transition_images(batch)
 
-    transitions_queue.put(transitions_to_bytes(transition_to_send_to_learner))
+    transitions_queue.put(transitions_to_bytes(batch))
 
 
 def get_frequency_stats(timer: TimerManager) -> dict[str, float]:
@@ -15,10 +15,15 @@
 # limitations under the License.
 
 import functools
+import json
+import shutil
+import threading
 from collections.abc import Callable, Sequence
 from contextlib import suppress
+from pathlib import Path
 from typing import TypedDict
 
+import numpy as np
 import torch
 import torch.nn.functional as F  # noqa: N812
 from tqdm import tqdm
@@ -27,6 +32,8 @@ from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, REWARD
 from lerobot.utils.transition import Transition
 
+SNAPSHOT_METADATA_FILE = "metadata.json"
+
 
 class BatchTransition(TypedDict):
     state: dict[str, torch.Tensor]
@@ -36,6 +43,9 @@ class BatchTransition(TypedDict):
     done: torch.Tensor
     truncated: torch.Tensor
     complementary_info: dict[str, torch.Tensor | float | int] | None = None
+    # Only set by prioritized replay buffers: sampled buffer slots and importance-sampling weights
+    indices: torch.Tensor | None = None
+    weights: torch.Tensor | None = None
 
 
 def random_crop_vectorized(images: torch.Tensor, output_size: tuple) -> torch.Tensor:
@@ -77,6 +87,58 @@ def random_shift(images: torch.Tensor, pad: int = 4):
     return random_crop_vectorized(images=images, output_size=(h, w))
 
 
+class SumTree:
+    """
+    Binary sum tree over `capacity` slots, used for prioritized experience replay.
+
+    Updates and prefix-sum searches are batched: each of the O(log N) levels of the tree is processed with a
+    single vectorized operation for the whole batch.
+
+    `update` holds `lock` while it rewrites the tree. Readers that sample from another thread (e.g. the
+    prefetching iterator of the replay buffer) must hold it too, otherwise they can read partial sums that
+    are not consistent with the leaves.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.depth = max(1, (capacity - 1).bit_length())
+        self.num_leaves = 1 << self.depth
+        # Node i has children 2i and 2i + 1, the root is node 1 and the leaves start at `num_leaves`
+        self.tree = torch.zeros(2 * self.num_leaves, dtype=torch.float64)
+        self.lock = threading.Lock()
+
+    @property
+    def total(self) -> float:
+        return self.tree[1].item()
+
+    @property
+    def leaves(self) -> torch.Tensor:
+        return self.tree[self.num_leaves : self.num_leaves + self.capacity]
+
+    def update(self, indices: torch.Tensor, priorities: torch.Tensor) -> None:
+        """Set the priorities of the slots `indices` and update the partial sums."""
+        nodes = indices.cpu().long() + self.num_leaves
+        priorities = priorities.detach().cpu().to(torch.float64)
+        with self.lock:
+            self.tree[nodes] = priorities
+            for _ in range(self.depth):
+                nodes = torch.unique(nodes // 2)
+                self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def find(self, values: torch.Tensor) -> torch.Tensor:
+        """Return, for each value in [0, total), the slot whose priority interval contains it."""
+        values = values.to(torch.float64).clone()
+        nodes = torch.ones_like(values, dtype=torch.long)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            left_sums = self.tree[left]
+            # Never descend into an empty subtree, which could happen because of rounding errors
+            go_right = (values >= left_sums) & (self.tree[left + 1] > 0)
+            values = torch.where(go_right, values - left_sums, values)
+            nodes = torch.where(go_right, left + 1, left)
+        return (nodes - self.num_leaves).clamp_(max=self.capacity - 1)
+
+
 class ReplayBuffer:
     def __init__(
         self,
@@ -87,6 +149,12 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        storage_dtypes: dict[str, torch.dtype | str] | None = None,
+        pin_memory: bool = False,
+        prioritized: bool = False,
+        priority_alpha: float = 0.6,
+        priority_beta: float = 0.4,
+        priority_eps: float = 1e-6,
     ):
         """
         Replay buffer for storing transitions.
@@ -104,6 +172,18 @@ class ReplayBuffer:
                 Using "cpu" can help save GPU memory.
             optimize_memory (bool): If True, optimizes memory by not storing duplicate next_states when
                 they can be derived from states. This is useful for large datasets where next_state[i] = state[i+1].
+            storage_dtypes (dict[str, torch.dtype | str] | None): Storage dtype per state key, float32 if not
+                specified. With `uint8`, values in [0, 1] (e.g. images) are stored as 8-bit integers, 4x smaller
+                than float32. Sampled batches are always converted back to float32 on `device`.
+            pin_memory (bool): If True, and the storage is on CPU while `device` is a CUDA device, sampled
+                states are gathered into reusable pinned buffers and copied with a single non blocking copy
+                per key.
+            prioritized (bool): If True, transitions are sampled proportionally to their priority with a sum
+                tree instead of uniformly, and sampled batches contain the buffer `indices` and the
+                importance-sampling `weights`. Priorities are updated with `update_priorities`.
+            priority_alpha (float): How much prioritization is used, 0 corresponds to uniform sampling.
+            priority_beta (float): Importance-sampling correction exponent, 1 fully compensates the bias.
+            priority_eps (float): Small constant added to the TD errors so that no transition has a zero priority.
         """
         if capacity <= 0:
             raise ValueError("Capacity must be greater than 0.")
@@ -115,6 +195,24 @@ class ReplayBuffer:
         self.size = 0
         self.initialized = False
         self.optimize_memory = optimize_memory
+        self.storage_dtypes = {
+            key: getattr(torch, dtype) if isinstance(dtype, str) else dtype
+            for key, dtype in (storage_dtypes or {}).items()
+        }
+        self.pin_memory = (
+            pin_memory and torch.device(storage_device).type == "cpu" and torch.device(device).type == "cuda"
+        )
+        # Pinned staging buffers used by `sample`, allocated lazily per state key
+        self._staging: dict[str, torch.Tensor] = {}
+        self._staging_event = None
+
+        self.prioritized = prioritized
+        self.priority_alpha = priority_alpha
+        self.priority_beta = priority_beta
+        self.priority_eps = priority_eps
+        # New transitions get the highest priority seen so far, so they are sampled at least once
+        self.max_priority = 1.0
+        self.sum_tree = SumTree(capacity) if prioritized else None
 
         # Track episode boundaries for memory optimization
         self.episode_ends = torch.zeros(capacity, dtype=torch.bool, device=storage_device)
@@ -142,7 +240,11 @@ class ReplayBuffer:
 
         # Pre-allocate tensors for storage
         self.states = {
-            key: torch.empty((self.capacity, *shape), device=self.storage_device)
+            key: torch.empty(
+                (self.capacity, *shape),
+                dtype=self.storage_dtypes.get(key, torch.float32),
+                device=self.storage_device,
+            )
             for key, shape in state_shapes.items()
         }
         self.actions = torch.empty((self.capacity, *action_shape), device=self.storage_device)
@@ -151,7 +253,11 @@ class ReplayBuffer:
         if not self.optimize_memory:
             # Standard approach: store states and next_states separately
             self.next_states = {
-                key: torch.empty((self.capacity, *shape), device=self.storage_device)
+                key: torch.empty(
+                    (self.capacity, *shape),
+                    dtype=self.storage_dtypes.get(key, torch.float32),
+                    device=self.storage_device,
+                )
                 for key, shape in state_shapes.items()
             }
         else:
@@ -187,6 +293,47 @@ class ReplayBuffer:
     def __len__(self):
         return self.size
 
+    def _to_storage_dtype(self, key: str, value: torch.Tensor) -> torch.Tensor:
+        """Convert a state tensor to the storage dtype of `key`."""
+        dtype = self.states[key].dtype
+        if dtype == torch.uint8 and value.is_floating_point():
+            return value.mul(255).round_().clamp_(0, 255).to(torch.uint8)
+        if dtype != torch.uint8 and value.dtype == torch.uint8:
+            # uint8 images, e.g. sent by the actors, are quantized values in [0, 1]
+            return value.to(dtype).div_(255)
+        return value
+
+    def _from_storage_dtype(self, key: str, value: torch.Tensor) -> torch.Tensor:
+        """Convert a stored state tensor back to float32."""
+        if value.dtype == torch.uint8:
+            return value.float().div_(255)
+        return value.float()
+
+    def _gather_states(self, key: str, idx: torch.Tensor, next_idx: torch.Tensor) -> torch.Tensor:
+        """Gather `states[idx]` and `next_states[next_idx]` for `key`, stacked along the batch dimension,
+        in a single host to device copy."""
+        batch_size = idx.shape[0]
+        sources = (self.states[key], self.next_states[key])
+
+        if not self.pin_memory:
+            if self.optimize_memory:
+                gathered = self.states[key][torch.cat([idx, next_idx])]
+            else:
+                gathered = torch.cat([sources[0][idx], sources[1][next_idx]])
+            return self._from_storage_dtype(key, gathered.to(self.device))
+
+        staging = self._staging.get(key)
+        if staging is None or staging.shape[0] < 2 * batch_size:
+            staging = torch.empty(
+                (2 * batch_size, *self.states[key].shape[1:]), dtype=self.states[key].dtype, pin_memory=True
+            )
+            self._staging[key] = staging
+        staging = staging[: 2 * batch_size]
+
+        torch.index_select(sources[0], 0, idx, out=staging[:batch_size])
+        torch.index_select(sources[1], 0, next_idx, out=staging[batch_size:])
+        return self._from_storage_dtype(key, staging.to(self.device, non_blocking=True))
+
     def add(
         self,
         state: dict[str, torch.Tensor],
@@ -204,11 +351,13 @@ class ReplayBuffer:
 
         # Store the transition in pre-allocated tensors
         for key in self.states:
-            self.states[key][self.position].copy_(state[key].squeeze(dim=0))
+            self.states[key][self.position].copy_(self._to_storage_dtype(key, state[key].squeeze(dim=0)))
 
             if not self.optimize_memory:
                 # Only store next_states if not optimizing memory
-                self.next_states[key][self.position].copy_(next_state[key].squeeze(dim=0))
+                self.next_states[key][self.position].copy_(
+                    self._to_storage_dtype(key, next_state[key].squeeze(dim=0))
+                )
 
         self.actions[self.position].copy_(action.squeeze(dim=0))
         self.rewards[self.position] = reward
@@ -226,9 +375,135 @@ class ReplayBuffer:
                     elif isinstance(value, (int | float)):
                         self.complementary_info[key][self.position] = value
 
+        if self.prioritized:
+            self._set_new_transitions_priority(1)
+
         self.position = (self.position + 1) % self.capacity
         self.size = min(self.size + 1, self.capacity)
 
+    def add_batch(
+        self,
+        state: dict[str, torch.Tensor],
+        action: torch.Tensor,
+        reward: torch.Tensor,
+        next_state: dict[str, torch.Tensor],
+        done: torch.Tensor,
+        truncated: torch.Tensor,
+        complementary_info: dict[str, torch.Tensor] | None = None,
+    ):
+        """
+        Saves consecutive transitions stacked along the first dimension, as built by `stack_transitions`.
+
+        Every field is written to a contiguous slice of the storage with a single copy (two when the batch
+        wraps around the end of the buffer) instead of one copy per transition.
+        """
+        num_transitions = action.shape[0]
+        if num_transitions == 0:
+            return
+        if num_transitions > self.capacity:
+            # Only the most recent transitions would survive anyway, at the slots where `add` would put them
+            self.position = (self.position + num_transitions - self.capacity) % self.capacity
+            return self.add_batch(
+                state={key: value[-self.capacity :] for key, value in state.items()},
+                action=action[-self.capacity :],
+                reward=reward[-self.capacity :],
+                next_state={key: value[-self.capacity :] for key, value in next_state.items()},
+                done=done[-self.capacity :],
+                truncated=truncated[-self.capacity :],
+                complementary_info=(
+                    {key: value[-self.capacity :] for key, value in complementary_info.items()}
+                    if complementary_info is not None
+                    else None
+                ),
+            )
+
+        if not self.initialized:
+            self._initialize_storage(
+                state={key: value[0] for key, value in state.items()},
+                action=action[0],
+                complementary_info=(
+                    {key: value[0] for key, value in complementary_info.items()}
+                    if complementary_info is not None
+                    else None
+                ),
+            )
+
+        for key in self.states:
+            self._write_slice(self.states[key], self._to_storage_dtype(key, state[key]))
+            if not self.optimize_memory:
+                self._write_slice(self.next_states[key], self._to_storage_dtype(key, next_state[key]))
+
+        self._write_slice(self.actions, action)
+        self._write_slice(self.rewards, torch.as_tensor(reward))
+        self._write_slice(self.dones, torch.as_tensor(done))
+        self._write_slice(self.truncateds, torch.as_tensor(truncated))
+
+        if complementary_info is not None and self.has_complementary_info:
+            for key in self.complementary_info_keys:
+                if key in complementary_info:
+                    self._write_slice(self.complementary_info[key], torch.as_tensor(complementary_info[key]))
+
+        if self.prioritized:
+            self._set_new_transitions_priority(num_transitions)
+
+        self.position = (self.position + num_transitions) % self.capacity
+        self.size = min(self.size + num_transitions, self.capacity)
+
+    def _write_slice(self, storage: torch.Tensor, values: torch.Tensor):
+        """Copy `values` to the slots of `storage` starting at `self.position`, wrapping around the end."""
+        num_transitions = values.shape[0]
+        values = values.to(self.storage_device).reshape(num_transitions, *storage.shape[1:])
+        first = min(num_transitions, self.capacity - self.position)
+        storage[self.position : self.position + first].copy_(values[:first])
+        if first < num_transitions:
+            storage[: num_transitions - first].copy_(values[first:])
+
+    def _set_new_transitions_priority(self, num_transitions: int):
+        """Give the `num_transitions` transitions added at `self.position` the maximum priority."""
+        positions = (self.position + torch.arange(num_transitions)) % self.capacity
+        priorities = torch.full((num_transitions,), self.max_priority, dtype=torch.float64)
+        if self.optimize_memory:
+            # With memory optimization the next state of the newest transition is only stored with the next
+            # transition: it can't be sampled before, and its predecessor becomes valid now
+            priorities[-1] = 0.0
+            if self.size > 0 and num_transitions < self.capacity:
+                positions = torch.cat([torch.tensor([(self.position - 1) % self.capacity]), positions])
+                priorities = torch.cat([torch.tensor([self.max_priority], dtype=torch.float64), priorities])
+        self.sum_tree.update(positions, priorities)
+
+    def update_priorities(self, indices: torch.Tensor, td_errors: torch.Tensor) -> None:
+        """
+        Update the priorities of sampled transitions from their TD errors.
+
+        Args:
+            indices (torch.Tensor): Buffer slots, as returned in the `indices` of a sampled batch.
+            td_errors (torch.Tensor): TD errors of the transitions, one per index.
+        """
+        if not self.prioritized:
+            raise RuntimeError("Priorities can only be updated in a prioritized replay buffer.")
+
+        priorities = (td_errors.detach().abs().double().cpu() + self.priority_eps) ** self.priority_alpha
+        self.sum_tree.update(indices, priorities)
+        self.max_priority = max(self.max_priority, priorities.max().item())
+
+    def _sample_prioritized_indices(self, batch_size: int) -> tuple[torch.Tensor, torch.Tensor]:
+        """Sample slots proportionally to their priority, with one sample per segment of the total priority.
+
+        Returns:
+            The sampled slots and their normalized importance-sampling weights.
+        """
+        segments = torch.arange(batch_size, dtype=torch.float64) + torch.rand(batch_size, dtype=torch.float64)
+        # The learner updates the priorities while the prefetching thread samples
+        with self.sum_tree.lock:
+            total = self.sum_tree.total
+            idx = self.sum_tree.find(segments * (total / batch_size))
+            priorities = self.sum_tree.leaves[idx]
+
+        probabilities = (priorities / total).clamp_min(torch.finfo(torch.float64).tiny)
+        weights = (self.size * probabilities) ** (-self.priority_beta)
+        weights = weights / weights.max()
+        return idx.to(self.storage_device), weights.float().to(self.device)
+
     def sample(self, batch_size: int) -> BatchTransition:
         """Sample a random batch of transitions and collate them into batched tensors."""
         if not self.initialized:
@@ -237,27 +512,35 @@ class ReplayBuffer:
         batch_size = min(batch_size, self.size)
         high = max(0, self.size - 1) if self.optimize_memory and self.size < self.capacity else self.size
 
-        # Random indices for sampling - create on the same device as storage
-        idx = torch.randint(low=0, high=high, size=(batch_size,), device=self.storage_device)
+        if self.prioritized:
+            idx, weights = self._sample_prioritized_indices(batch_size)
+        else:
+            # Random indices for sampling - create on the same device as storage
+            idx = torch.randint(low=0, high=high, size=(batch_size,), device=self.storage_device)
 
         # Identify image keys that need augmentation
         image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if self.use_drq else []
 
+        # Next state indices: with memory optimization the next state is stored at the next index
+        next_idx = (idx + 1) % self.capacity if self.optimize_memory else idx
+
+        # The pinned staging buffers are reused, wait for the copies of the previous batch to be done
+        if self._staging_event is not None:
+            self._staging_event.synchronize()
+
         # Create batched state and next_state
         batch_state = {}
         batch_next_state = {}
 
         # First pass: load all state tensors to target device
         for key in self.states:
-            batch_state[key] = self.states[key][idx].to(self.device)
+            states = self._gather_states(key, idx, next_idx)
+            batch_state[key] = states[:batch_size]
+            batch_next_state[key] = states[batch_size:]
 
-            if not self.optimize_memory:
-                # Standard approach - load next_states directly
-                batch_next_state[key] = self.next_states[key][idx].to(self.device)
-            else:
-                # Memory-optimized approach - get next_state from the next index
-                next_idx = (idx + 1) % self.capacity
-                batch_next_state[key] = self.states[key][next_idx].to(self.device)
+        if self.pin_memory:
+            self._staging_event = torch.cuda.Event()
+            self._staging_event.record()
 
         # Apply image augmentation in a batched way if needed
         if self.use_drq and image_keys:
@@ -293,7 +576,7 @@ class ReplayBuffer:
             for key in self.complementary_info_keys:
                 batch_complementary_info[key] = self.complementary_info[key][idx].to(self.device)
 
-        return BatchTransition(
+        batch = BatchTransition(
             state=batch_state,
             action=batch_actions,
             reward=batch_rewards,
@@ -302,6 +585,10 @@ class ReplayBuffer:
             truncated=batch_truncateds,
             complementary_info=batch_complementary_info,
         )
+        if self.prioritized:
+            batch["indices"] = idx
+            batch["weights"] = weights
+        return batch
 
     def get_iterator(
         self,
@@ -422,6 +709,12 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        storage_dtypes: dict[str, torch.dtype | str] | None = None,
+        pin_memory: bool = False,
+        prioritized: bool = False,
+        priority_alpha: float = 0.6,
+        priority_beta: float = 0.4,
+        priority_eps: float = 1e-6,
     ) -> "ReplayBuffer":
         """
         Convert a LeRobotDataset into a ReplayBuffer.
@@ -437,6 +730,13 @@ class ReplayBuffer:
             use_drq (bool): Whether to use DrQ image augmentation when sampling.
             storage_device (str): Device for storing tensor data. Using "cpu" saves GPU memory.
             optimize_memory (bool): If True, reduces memory usage by not duplicating state data.
+            storage_dtypes (dict[str, torch.dtype | str] | None): Storage dtype per state key.
+            pin_memory (bool): Whether to stage sampled batches in pinned memory.
+            prioritized (bool): Whether to use prioritized sampling. Dataset transitions start with the
+                same priority.
+            priority_alpha (float): How much prioritization is used.
+            priority_beta (float): Importance-sampling correction exponent.
+            priority_eps (float): Small constant added to the TD errors.
 
         Returns:
             ReplayBuffer: The replay buffer with dataset transitions.
@@ -458,6 +758,12 @@ class ReplayBuffer:
             use_drq=use_drq,
             storage_device=storage_device,
             optimize_memory=optimize_memory,
+            storage_dtypes=storage_dtypes,
+            pin_memory=pin_memory,
+            prioritized=prioritized,
+            priority_alpha=priority_alpha,
+            priority_beta=priority_beta,
+            priority_eps=priority_eps,
         )
 
         # Convert dataset to transitions
@@ -539,7 +845,7 @@ class ReplayBuffer:
 
         # Add state keys
         for key in self.states:
-            sample_val = self.states[key][0]
+            sample_val = self._from_storage_dtype(key, self.states[key][0])
             f_info = guess_feature_info(t=sample_val, name=key)
             features[key] = f_info
 
@@ -574,7 +880,7 @@ class ReplayBuffer:
 
             # Fill the data for state keys
             for key in self.states:
-                frame_dict[key] = self.states[key][actual_idx].cpu()
+                frame_dict[key] = self._from_storage_dtype(key, self.states[key][actual_idx]).cpu()
 
             # Fill action, reward, done
             frame_dict[ACTION] = self.actions[actual_idx].cpu()
@@ -611,6 +917,167 @@ class ReplayBuffer:
 
         return lerobot_dataset
 
+    def _storage_tensors(self) -> dict[str, torch.Tensor]:
+        """Return all the storage tensors of the buffer, keyed by a unique name."""
+        tensors = {f"states.{key}": value for key, value in self.states.items()}
+        if not self.optimize_memory:
+            tensors.update({f"next_states.{key}": value for key, value in self.next_states.items()})
+        tensors["actions"] = self.actions
+        tensors["rewards"] = self.rewards
+        tensors["dones"] = self.dones
+        tensors["truncateds"] = self.truncateds
+        tensors.update({f"complementary_info.{key}": value for key, value in self.complementary_info.items()})
+        if self.prioritized:
+            tensors["priorities"] = self.sum_tree.leaves
+        return tensors
+
+    def save_snapshot(self, path: str | Path) -> None:
+        """
+        Save the raw storage of the buffer to `path`, so that it can be reopened with `from_snapshot`.
+
+        Each storage tensor is written to its own `.npy` file, the unused slots of a buffer that is not full
+        yet are not written. The snapshot is first written next to `path` and then moved in place, so an
+        interrupted save never corrupts the previous snapshot.
+
+        Args:
+            path (str | Path): Directory of the snapshot. It is replaced if it already exists.
+        """
+        if not self.initialized:
+            raise ValueError("The replay buffer is empty. Cannot save a snapshot.")
+
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        if tmp_path.exists():
+            shutil.rmtree(tmp_path)
+        tmp_path.mkdir(parents=True)
+
+        dtypes = {}
+        for name, tensor in self._storage_tensors().items():
+            dtypes[name] = str(tensor.dtype).removeprefix("torch.")
+            # numpy has no bfloat16, its bits are stored as int16
+            array_dtype = torch.int16 if tensor.dtype == torch.bfloat16 else tensor.dtype
+            array = np.lib.format.open_memmap(
+                tmp_path / f"{name}.npy",
+                mode="w+",
+                dtype=torch.empty(0, dtype=array_dtype).numpy().dtype,
+                shape=tuple(tensor.shape),
+            )
+            array[: self.size] = tensor[: self.size].view(array_dtype).cpu().numpy()
+            array.flush()
+            del array
+
+        metadata = {
+            "capacity": self.capacity,
+            "position": self.position,
+            "size": self.size,
+            "optimize_memory": self.optimize_memory,
+            "state_keys": list(self.states),
+            "has_complementary_info": self.has_complementary_info,
+            "complementary_info_keys": self.complementary_info_keys,
+            "max_priority": self.max_priority,
+            "dtypes": dtypes,
+        }
+        with open(tmp_path / SNAPSHOT_METADATA_FILE, "w") as f:
+            json.dump(metadata, f, indent=4)
+
+        if path.exists():
+            shutil.rmtree(path)
+        tmp_path.rename(path)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        path: str | Path,
+        device: str = "cuda:0",
+        image_augmentation_function: Callable | None = None,
+        use_drq: bool = True,
+        storage_device: str = "cpu",
+        pin_memory: bool = False,
+        prioritized: bool = False,
+        priority_alpha: float = 0.6,
+        priority_beta: float = 0.4,
+        priority_eps: float = 1e-6,
+    ) -> "ReplayBuffer":
+        """
+        Reopen a replay buffer saved with `save_snapshot`.
+
+        With a CPU `storage_device`, the storage tensors are memory-mapped copy-on-write: they are read
+        lazily from disk when sampled, and the transitions added afterwards never modify the snapshot.
+
+        Args:
+            path (str | Path): Directory of the snapshot.
+            device (str): The device for sampling tensors.
+            image_augmentation_function (Callable | None): Function for image augmentation.
+            use_drq (bool): Whether to use DrQ image augmentation when sampling.
+            storage_device (str): Device for storing tensor data.
+            pin_memory (bool): Whether to stage sampled batches in pinned memory.
+            prioritized (bool): Whether to use prioritized sampling. The priorities of the snapshot are
+                restored if it was saved by a prioritized buffer, otherwise all transitions get the same priority.
+            priority_alpha (float): How much prioritization is used.
+            priority_beta (float): Importance-sampling correction exponent.
+            priority_eps (float): Small constant added to the TD errors.
+
+        Returns:
+            ReplayBuffer: The replay buffer with the snapshot transitions.
+        """
+        path = Path(path)
+        with open(path / SNAPSHOT_METADATA_FILE) as f:
+            metadata = json.load(f)
+
+        replay_buffer = cls(
+            capacity=metadata["capacity"],
+            device=device,
+            state_keys=metadata["state_keys"],
+            image_augmentation_function=image_augmentation_function,
+            use_drq=use_drq,
+            storage_device=storage_device,
+            optimize_memory=metadata["optimize_memory"],
+            storage_dtypes={key: metadata["dtypes"][f"states.{key}"] for key in metadata["state_keys"]},
+            pin_memory=pin_memory,
+            prioritized=prioritized,
+            priority_alpha=priority_alpha,
+            priority_beta=priority_beta,
+            priority_eps=priority_eps,
+        )
+
+        tensors = {}
+        for name, dtype in metadata["dtypes"].items():
+            array = np.load(path / f"{name}.npy", mmap_mode="c")
+            tensors[name] = torch.from_numpy(array).view(getattr(torch, dtype)).to(storage_device)
+
+        replay_buffer.states = {key: tensors[f"states.{key}"] for key in metadata["state_keys"]}
+        if replay_buffer.optimize_memory:
+            replay_buffer.next_states = replay_buffer.states
+        else:
+            replay_buffer.next_states = {key: tensors[f"next_states.{key}"] for key in metadata["state_keys"]}
+        replay_buffer.actions = tensors["actions"]
+        replay_buffer.rewards = tensors["rewards"]
+        replay_buffer.dones = tensors["dones"]
+        replay_buffer.truncateds = tensors["truncateds"]
+        replay_buffer.has_complementary_info = metadata["has_complementary_info"]
+        replay_buffer.complementary_info_keys = metadata["complementary_info_keys"]
+        replay_buffer.complementary_info = {
+            key: tensors[f"complementary_info.{key}"] for key in metadata["complementary_info_keys"]
+        }
+
+        replay_buffer.position = metadata["position"]
+        replay_buffer.size = metadata["size"]
+        replay_buffer.initialized = True
+
+        if prioritized:
+            if "priorities" in tensors:
+                priorities = tensors["priorities"].cpu()
+                replay_buffer.max_priority = metadata["max_priority"]
+            else:
+                priorities = torch.zeros(replay_buffer.capacity, dtype=torch.float64)
+                priorities[: replay_buffer.size] = replay_buffer.max_priority
+                if replay_buffer.optimize_memory:
+                    # The newest transition has no next state yet
+                    priorities[(replay_buffer.position - 1) % replay_buffer.capacity] = 0.0
+            replay_buffer.sum_tree.update(torch.arange(replay_buffer.capacity), priorities)
+
+        return replay_buffer
+
     @staticmethod
     def _lerobotdataset_to_transitions(
         dataset: LeRobotDataset,
@@ -779,6 +1246,10 @@ def concatenate_batch_transitions(
     Warning:
         This function modifies the left_batch_transitions object in place.
     """
+    # Batch sizes before concatenation, to weight uniformly sampled transitions
+    left_size = len(left_batch_transitions["reward"])
+    right_size = len(right_batch_transition["reward"])
+
     # Concatenate state fields
     left_batch_transitions["state"] = {
         key: torch.cat(
@@ -831,4 +1302,16 @@ def concatenate_batch_transitions(
                 else:
                     left_info[key] = right_info[key]
 
+    # Handle prioritized replay fields. The buffer indices only make sense for the buffer they were
+    # sampled from, so they are dropped, while uniformly sampled transitions get a weight of one.
+    left_weights = left_batch_transitions.get("weights")
+    right_weights = right_batch_transition.get("weights")
+    if left_weights is not None or right_weights is not None:
+        if left_weights is None:
+            left_weights = right_weights.new_ones(left_size)
+        if right_weights is None:
+            right_weights = left_weights.new_ones(right_size)
+        left_batch_transitions["weights"] = torch.cat([left_weights, right_weights], dim=0)
+    left_batch_transitions.pop("indices", None)
+
     return left_batch_transitions
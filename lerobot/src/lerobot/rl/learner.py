@@ -67,6 +67,7 @@ from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
 from lerobot.rl.buffer import ReplayBuffer, concatenate_batch_transitions
+from lerobot.rl.parameter_sync import ParameterSyncSender, get_sync_modules, update_to_bytes
 from lerobot.rl.process import ProcessSignalHandler
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.robots import so100_follower  # noqa: F401
@@ -77,12 +78,12 @@ from lerobot.transport.utils import (
     MAX_MESSAGE_SIZE,
     bytes_to_python_object,
     bytes_to_transitions,
-    state_to_bytes,
 )
 from lerobot.utils.constants import (
     ACTION,
     CHECKPOINTS_DIR,
     LAST_CHECKPOINT_LINK,
+    OBS_IMAGE,
     PRETRAINED_MODEL_DIR,
     TRAINING_STATE_DIR,
 )
@@ -93,7 +94,7 @@ from lerobot.utils.train_utils import (
     save_checkpoint,
     update_last_checkpoint,
 )
-from lerobot.utils.transition import move_state_dict_to_device, move_transition_to_device
+from lerobot.utils.transition import find_nan_transitions, select_transitions, stack_transitions
 from lerobot.utils.utils import (
     format_big_number,
     get_safe_torch_device,
@@ -315,7 +316,13 @@ def add_actor_information_and_train(
 
     policy.train()
 
-    push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+    parameter_sync = ParameterSyncSender(
+        delta_dtype=cfg.policy.actor_learner_config.parameters_delta_dtype,
+        full_sync_interval=cfg.policy.actor_learner_config.parameters_full_sync_interval,
+    )
+    push_actor_policy_to_queue(
+        parameters_queue=parameters_queue, policy=policy, parameter_sync=parameter_sync
+    )
 
     last_time_policy_pushed = time.time()
 
@@ -363,7 +370,6 @@ def add_actor_information_and_train(
             transition_queue=transition_queue,
             replay_buffer=replay_buffer,
             offline_replay_buffer=offline_replay_buffer,
-            device=device,
             dataset_repo_id=dataset_repo_id,
             shutdown_event=shutdown_event,
         )
@@ -394,9 +400,11 @@ def add_actor_information_and_train(
         for _ in range(utd_ratio - 1):
             # Sample from the iterators
             batch = next(online_iterator)
+            priority_slices = [get_priority_slice(replay_buffer, batch)]
 
             if dataset_repo_id is not None:
                 batch_offline = next(offline_iterator)
+                priority_slices.append(get_priority_slice(offline_replay_buffer, batch_offline))
                 batch = concatenate_batch_transitions(
                     left_batch_transitions=batch, right_batch_transition=batch_offline
                 )
@@ -422,10 +430,12 @@ def add_actor_information_and_train(
                 "observation_feature": observation_features,
                 "next_observation_feature": next_observation_features,
                 "complementary_info": batch["complementary_info"],
+                "weights": batch.get("weights"),
             }
 
             # Use the forward method for critic loss
             critic_output = policy.forward(forward_batch, model="critic")
+            update_replay_buffer_priorities(priority_slices, critic_output["td_error"])
 
             # Main critic optimization
             loss_critic = critic_output["loss_critic"]
@@ -452,9 +462,11 @@ def add_actor_information_and_train(
 
         # Sample for the last update in the UTD ratio
         batch = next(online_iterator)
+        priority_slices = [get_priority_slice(replay_buffer, batch)]
 
         if dataset_repo_id is not None:
             batch_offline = next(offline_iterator)
+            priority_slices.append(get_priority_slice(offline_replay_buffer, batch_offline))
             batch = concatenate_batch_transitions(
                 left_batch_transitions=batch, right_batch_transition=batch_offline
             )
@@ -480,9 +492,11 @@ def add_actor_information_and_train(
             "done": done,
             "observation_feature": observation_features,
             "next_observation_feature": next_observation_features,
+            "weights": batch.get("weights"),
         }
 
         critic_output = policy.forward(forward_batch, model="critic")
+        update_replay_buffer_priorities(priority_slices, critic_output["td_error"])
 
         loss_critic = critic_output["loss_critic"]
         optimizers["critic"].zero_grad()
@@ -550,7 +564,9 @@ def add_actor_information_and_train(
 
         # Push policy to actors if needed
         if time.time() - last_time_policy_pushed > policy_parameters_push_frequency:
-            push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+            push_actor_policy_to_queue(
+                parameters_queue=parameters_queue, policy=policy, parameter_sync=parameter_sync
+            )
             last_time_policy_pushed = time.time()
 
         # Update target networks (main and discrete)
@@ -696,6 +712,7 @@ def save_training_checkpoint(
     4. Updates the "last" checkpoint symlink to point to this checkpoint
     5. Saves the replay buffer as a dataset for later use
     6. If an offline replay buffer exists, saves it as a separate dataset
+    7. If enabled, saves raw snapshots of the replay buffers
 
     Args:
         cfg: Training configuration
@@ -758,6 +775,14 @@ def save_training_checkpoint(
             root=dataset_offline_dir,
         )
 
+    # Save raw snapshots of the buffers, reopened on resume instead of rebuilding them from the datasets
+    if cfg.policy.buffer_snapshot:
+        replay_buffer.save_snapshot(os.path.join(cfg.output_dir, "replay_buffer_snapshot"))
+        if offline_replay_buffer is not None:
+            offline_replay_buffer.save_snapshot(
+                os.path.join(cfg.output_dir, "replay_buffer_offline_snapshot")
+            )
+
     logging.info("Resume training")
 
 
@@ -936,7 +961,7 @@ def initialize_replay_buffer(
     cfg: TrainRLServerPipelineConfig, device: str, storage_device: str
 ) -> ReplayBuffer:
     """
-    Initialize a replay buffer, either empty or from a dataset if resuming.
+    Initialize a replay buffer, either empty or, if resuming, from a snapshot or a dataset.
 
     Args:
         cfg (TrainRLServerPipelineConfig): Training configuration
@@ -953,6 +978,20 @@ def initialize_replay_buffer(
             state_keys=cfg.policy.input_features.keys(),
             storage_device=storage_device,
             optimize_memory=True,
+            storage_dtypes=get_buffer_storage_dtypes(cfg),
+            pin_memory=cfg.policy.buffer_pin_memory,
+            **get_buffer_priority_kwargs(cfg),
+        )
+
+    snapshot_path = os.path.join(cfg.output_dir, "replay_buffer_snapshot")
+    if cfg.policy.buffer_snapshot and os.path.exists(snapshot_path):
+        logging.info("Resume training load the online replay buffer snapshot")
+        return ReplayBuffer.from_snapshot(
+            snapshot_path,
+            device=device,
+            storage_device=storage_device,
+            pin_memory=cfg.policy.buffer_pin_memory,
+            **get_buffer_priority_kwargs(cfg),
         )
 
     logging.info("Resume training load the online dataset")
@@ -972,6 +1011,9 @@ def initialize_replay_buffer(
         device=device,
         state_keys=cfg.policy.input_features.keys(),
         optimize_memory=True,
+        storage_dtypes=get_buffer_storage_dtypes(cfg),
+        pin_memory=cfg.policy.buffer_pin_memory,
+        **get_buffer_priority_kwargs(cfg),
     )
 
 
@@ -995,6 +1037,17 @@ def initialize_offline_replay_buffer(
         logging.info("make_dataset offline buffer")
         offline_dataset = make_dataset(cfg)
     else:
+        snapshot_path = os.path.join(cfg.output_dir, "replay_buffer_offline_snapshot")
+        if cfg.policy.buffer_snapshot and os.path.exists(snapshot_path):
+            logging.info("load offline replay buffer snapshot")
+            return ReplayBuffer.from_snapshot(
+                snapshot_path,
+                device=device,
+                storage_device=storage_device,
+                pin_memory=cfg.policy.buffer_pin_memory,
+                **get_buffer_priority_kwargs(cfg),
+            )
+
         logging.info("load offline dataset")
         dataset_offline_path = os.path.join(cfg.output_dir, "dataset_offline")
         offline_dataset = LeRobotDataset(
@@ -1010,13 +1063,76 @@ def initialize_offline_replay_buffer(
         storage_device=storage_device,
         optimize_memory=True,
         capacity=cfg.policy.offline_buffer_capacity,
+        storage_dtypes=get_buffer_storage_dtypes(cfg),
+        pin_memory=cfg.policy.buffer_pin_memory,
+        **get_buffer_priority_kwargs(cfg),
     )
     return offline_replay_buffer
 
 
+def get_buffer_storage_dtypes(cfg: TrainRLServerPipelineConfig) -> dict[str, str]:
+    """
+    Get the storage dtype of the image features of the replay buffers.
+
+    Args:
+        cfg (TrainRLServerPipelineConfig): Training configuration
+
+    Returns:
+        dict[str, str]: Storage dtype per image feature key
+    """
+    return {
+        key: cfg.policy.buffer_image_dtype for key in cfg.policy.input_features if key.startswith(OBS_IMAGE)
+    }
+
+
+def get_buffer_priority_kwargs(cfg: TrainRLServerPipelineConfig) -> dict:
+    """
+    Get the prioritized experience replay arguments of the replay buffers.
+
+    Args:
+        cfg (TrainRLServerPipelineConfig): Training configuration
+
+    Returns:
+        dict: Keyword arguments for the ReplayBuffer constructors
+    """
+    return {
+        "prioritized": cfg.policy.prioritized_replay,
+        "priority_alpha": cfg.policy.prioritized_replay_alpha,
+        "priority_beta": cfg.policy.prioritized_replay_beta,
+        "priority_eps": cfg.policy.prioritized_replay_eps,
+    }
+
+
 # Utilities/Helpers functions
 
 
+def get_priority_slice(
+    replay_buffer: ReplayBuffer, batch: dict
+) -> tuple[ReplayBuffer, torch.Tensor | None, int]:
+    """Remember which buffer slots a batch was sampled from, before it is concatenated with another one.
+
+    Returns:
+        tuple: The buffer, the sampled slots (None if the buffer is not prioritized) and the batch size.
+    """
+    return replay_buffer, batch.get("indices"), batch["reward"].shape[0]
+
+
+def update_replay_buffer_priorities(
+    priority_slices: list[tuple[ReplayBuffer, torch.Tensor | None, int]], td_error: torch.Tensor
+) -> None:
+    """Update the priorities of the prioritized replay buffers a (concatenated) batch was sampled from.
+
+    Args:
+        priority_slices: The slices returned by `get_priority_slice`, in concatenation order.
+        td_error: Per-sample absolute TD errors of the concatenated batch.
+    """
+    offset = 0
+    for replay_buffer, indices, batch_size in priority_slices:
+        if indices is not None:
+            replay_buffer.update_priorities(indices, td_error[offset : offset + batch_size])
+        offset += batch_size
+
+
 def get_observation_features(
     policy: SACPolicy, observations: torch.Tensor, next_observations: torch.Tensor
 ) -> tuple[torch.Tensor | None, torch.Tensor | None]:
@@ -1094,21 +1210,29 @@ def check_nan_in_transition(
     return nan_detected
 
 
-def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module):
+def push_actor_policy_to_queue(
+    parameters_queue: Queue, policy: nn.Module, parameter_sync: ParameterSyncSender | None = None
+):
+    """Push the actor (and discrete critic) parameters to the queue streamed to the actors.
+
+    Args:
+        parameters_queue: Queue for sending policy parameters to the actor
+        policy: Policy whose parameters are pushed
+        parameter_sync: Sender keeping track of the last keyframe, so that only changed tensors are pushed.
+            If None, a full keyframe is pushed.
+    """
     logging.debug("[LEARNER] Pushing actor policy to the queue")
 
-    # Create a dictionary to hold all the state dicts
-    state_dicts = {"policy": move_state_dict_to_device(policy.actor.state_dict(), device="cpu")}
+    if parameter_sync is None:
+        parameter_sync = ParameterSyncSender()
 
-    # Add discrete critic if it exists
-    if hasattr(policy, "discrete_critic") and policy.discrete_critic is not None:
-        state_dicts["discrete_critic"] = move_state_dict_to_device(
-            policy.discrete_critic.state_dict(), device="cpu"
-        )
-        logging.debug("[LEARNER] Including discrete critic in state dict push")
+    update = parameter_sync.build_update(get_sync_modules(policy))
+    logging.debug(
+        f"[LEARNER] Parameters version {update['version']} (keyframe {update['keyframe_version']}, "
+        f"is_keyframe={update['is_keyframe']})"
+    )
 
-    state_bytes = state_to_bytes(state_dicts)
-    parameters_queue.put(state_bytes)
+    parameters_queue.put(update_to_bytes(update))
 
 
 def process_interaction_message(
@@ -1130,43 +1254,40 @@ def process_transitions(
     transition_queue: Queue,
     replay_buffer: ReplayBuffer,
     offline_replay_buffer: ReplayBuffer,
-    device: str,
     dataset_repo_id: str | None,
     shutdown_event: any,
 ):
     """Process all available transitions from the queue.
 
+    Each message is a columnar batch of transitions (see `stack_transitions`), added to the replay buffers
+    with a single `add_batch`. Lists of transitions sent by older actors are stacked first.
+
     Args:
         transition_queue: Queue for receiving transitions from the actor
         replay_buffer: Replay buffer to add transitions to
         offline_replay_buffer: Offline replay buffer to add transitions to
-        device: Device to move transitions to
         dataset_repo_id: Repository ID for dataset
         shutdown_event: Event to signal shutdown
     """
     while not transition_queue.empty() and not shutdown_event.is_set():
-        transition_list = transition_queue.get()
-        transition_list = bytes_to_transitions(buffer=transition_list)
-
-        for transition in transition_list:
-            transition = move_transition_to_device(transition=transition, device=device)
-
-            # Skip transitions with NaN values
-            if check_nan_in_transition(
-                observations=transition["state"],
-                actions=transition[ACTION],
-                next_state=transition["next_state"],
-            ):
-                logging.warning("[LEARNER] NaN detected in transition, skipping")
+        batch = bytes_to_transitions(buffer=transition_queue.get())
+        if isinstance(batch, list):
+            if len(batch) == 0:
                 continue
+            batch = stack_transitions(batch)
+
+        # Skip transitions with NaN values
+        has_nan = find_nan_transitions(batch)
+        if has_nan.any():
+            logging.warning(f"[LEARNER] NaN detected in {int(has_nan.sum())} transitions, skipping")
+            batch = select_transitions(batch, ~has_nan)
 
-            replay_buffer.add(**transition)
+        replay_buffer.add_batch(**batch)
 
-            # Add to offline buffer if it's an intervention
-            if dataset_repo_id is not None and transition.get("complementary_info", {}).get(
-                TeleopEvents.IS_INTERVENTION
-            ):
-                offline_replay_buffer.add(**transition)
+        # Add to offline buffer if it's an intervention
+        is_intervention = (batch.get("complementary_info") or {}).get(TeleopEvents.IS_INTERVENTION)
+        if dataset_repo_id is not None and is_intervention is not None:
+            offline_replay_buffer.add_batch(**select_transitions(batch, is_intervention.reshape(-1).bool()))
 
 
 def process_interaction_messages(
@@ -19,7 +19,7 @@ import logging
 import time
 from multiprocessing import Event, Queue
 
-from lerobot.rl.queue import get_last_item_from_queue
+from lerobot.rl.parameter_sync import get_last_updates_from_queue, has_frozen_bytes, is_keyframe_bytes
 from lerobot.transport import services_pb2, services_pb2_grpc
 from lerobot.transport.utils import receive_bytes_in_chunks, send_bytes_in_chunks
 
@@ -49,6 +49,10 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
         self.transition_queue = transition_queue
         self.interaction_message_queue = interaction_message_queue
         self.queue_get_timeout = queue_get_timeout
+        # Last keyframe streamed, sent first to every new stream since the later updates are relative to it,
+        # preceded by the keyframe carrying the frozen parameters
+        self.frozen_keyframe: bytes | None = None
+        self.last_keyframe: bytes | None = None
 
     def StreamParameters(self, request, context):  # noqa: N802
         # TODO: authorize the request
@@ -56,6 +60,19 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
 
         last_push_time = 0
 
+        keyframes = [self.last_keyframe]
+        if self.frozen_keyframe is not self.last_keyframe:
+            keyframes.insert(0, self.frozen_keyframe)
+        for keyframe in keyframes:
+            if keyframe is None:
+                continue
+            yield from send_bytes_in_chunks(
+                keyframe,
+                services_pb2.Parameters,
+                log_prefix="[LEARNER] Sending last keyframe",
+                silent=True,
+            )
+
         while not self.shutdown_event.is_set():
             time_since_last_push = time.time() - last_push_time
             if time_since_last_push < self.seconds_between_pushes:
@@ -65,19 +82,24 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
                 continue
 
             logging.info("[LEARNER] Push parameters to the Actor")
-            buffer = get_last_item_from_queue(
+            buffers = get_last_updates_from_queue(
                 self.parameters_queue, block=True, timeout=self.queue_get_timeout
             )
 
-            if buffer is None:
+            if not buffers:
                 continue
 
-            yield from send_bytes_in_chunks(
-                buffer,
-                services_pb2.Parameters,
-                log_prefix="[LEARNER] Sending parameters",
-                silent=True,
-            )
+            for buffer in buffers:
+                if has_frozen_bytes(buffer):
+                    self.frozen_keyframe = buffer
+                if is_keyframe_bytes(buffer):
+                    self.last_keyframe = buffer
+                yield from send_bytes_in_chunks(
+                    buffer,
+                    services_pb2.Parameters,
+                    log_prefix="[LEARNER] Sending parameters",
+                    silent=True,
+                )
 
             last_push_time = time.time()
             logging.info("[LEARNER] Parameters sent")
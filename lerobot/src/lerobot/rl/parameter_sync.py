@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Incremental parameter synchronization between the learner and the actors.
+
+The learner used to push the full actor state dict at every push interval. The classes in this module
+send a full *keyframe* only every `full_sync_interval` pushes and, in between, only the tensors that
+changed since that keyframe, optionally as low precision deltas. Every update is expressed relative to
+the keyframe (and not to the previous update), so intermediate updates can be dropped, but keyframes can not:
+the queues on both ends are drained with `get_last_updates_from_queue`, which keeps the latest keyframe along
+with the latest update, and the learner service re-sends its last keyframe to every new parameter stream.
+
+Updates are tagged with the session id of their sender, so that an actor accepts the keyframes of a restarted
+learner even though their versions start over.
+
+Frozen parameters (`requires_grad=False`, e.g. a frozen vision encoder) never change, so they are only sent
+with the first keyframe of a session. That keyframe is kept like the latest one by
+`get_last_updates_from_queue`, and the learner service sends it first to every new parameter stream, so that
+actors connecting later also receive the frozen parameters.
+"""
+
+import logging
+import uuid
+from typing import Any
+
+import torch
+from torch import nn
+
+from lerobot.rl.queue import get_all_items_from_queue
+from lerobot.transport.utils import bytes_to_state_dict, state_to_bytes
+
+SUPPORTED_DELTA_DTYPES = {
+    "float16": torch.float16,
+    "bfloat16": torch.bfloat16,
+}
+
+
+# First byte of the serialized updates, so that keyframes are recognized without deserializing them
+KEYFRAME_FLAG = b"\x01"
+DELTA_FLAG = b"\x00"
+# Keyframe that also carries the frozen parameters
+FROZEN_KEYFRAME_FLAG = b"\x02"
+
+
+def update_to_bytes(update: dict) -> bytes:
+    """Serialize an update payload of `ParameterSyncSender`, prefixed with its keyframe flag."""
+    if update.get("has_frozen"):
+        flag = FROZEN_KEYFRAME_FLAG
+    else:
+        flag = KEYFRAME_FLAG if update["is_keyframe"] else DELTA_FLAG
+    return flag + state_to_bytes(update)
+
+
+def bytes_to_update(buffer: bytes) -> dict:
+    return bytes_to_state_dict(buffer[1:])
+
+
+def is_keyframe_bytes(buffer: bytes) -> bool:
+    return buffer[:1] in (KEYFRAME_FLAG, FROZEN_KEYFRAME_FLAG)
+
+
+def has_frozen_bytes(buffer: bytes) -> bool:
+    return buffer[:1] == FROZEN_KEYFRAME_FLAG
+
+
+def get_last_updates_from_queue(queue: Any, block: bool = True, timeout: float = 0.1) -> list[bytes]:
+    """Drain a queue of serialized updates, keeping only what is needed to catch up with the latest one.
+
+    Returns, in queue order, the latest keyframe carrying the frozen parameters, the latest keyframe and the
+    latest update of the queue (each once), or an empty list if the queue is empty.
+    """
+    updates = get_all_items_from_queue(queue, block=block, timeout=timeout)
+    if not updates:
+        return []
+
+    frozen_keyframe = next((update for update in reversed(updates) if has_frozen_bytes(update)), None)
+    keyframe = next((update for update in reversed(updates) if is_keyframe_bytes(update)), None)
+    kept = []
+    for update in (frozen_keyframe, keyframe, updates[-1]):
+        if update is not None and all(update is not other for other in kept):
+            kept.append(update)
+    return kept
+
+
+def get_sync_modules(policy: nn.Module) -> dict[str, nn.Module]:
+    """Return the sub-modules of the policy that the learner streams to the actors."""
+    modules = {"policy": policy.actor}
+    if hasattr(policy, "discrete_critic") and policy.discrete_critic is not None:
+        modules["discrete_critic"] = policy.discrete_critic
+    return modules
+
+
+def _frozen_parameter_names(module: nn.Module) -> set[str]:
+    return {name for name, param in module.named_parameters() if not param.requires_grad}
+
+
+class ParameterSyncSender:
+    """Learner side of the parameter synchronization.
+
+    Builds versioned update payloads that can be serialized with `state_to_bytes`.
+
+    Args:
+        delta_dtype: If set ("float16" or "bfloat16"), floating point tensors of non-keyframe updates
+            are sent as `value - keyframe` in this dtype instead of as full precision values.
+        full_sync_interval: Number of pushes between two full keyframes.
+    """
+
+    def __init__(self, delta_dtype: str | None = None, full_sync_interval: int = 10):
+        if delta_dtype is not None and delta_dtype not in SUPPORTED_DELTA_DTYPES:
+            raise ValueError(
+                f"Unsupported delta dtype '{delta_dtype}'. Expected one of {list(SUPPORTED_DELTA_DTYPES)}."
+            )
+        if full_sync_interval < 1:
+            raise ValueError(f"full_sync_interval must be >= 1, got {full_sync_interval}")
+
+        self.delta_dtype = SUPPORTED_DELTA_DTYPES[delta_dtype] if delta_dtype is not None else None
+        self.full_sync_interval = full_sync_interval
+
+        self.session_id = uuid.uuid4().hex
+        self.version = 0
+        self.keyframe_version = 0
+        self._keyframe: dict[str, dict[str, torch.Tensor]] | None = None
+
+    def build_update(self, modules: dict[str, nn.Module]) -> dict:
+        """Build the next update payload for `modules` and advance the version."""
+        self.version += 1
+        has_frozen = self._keyframe is None
+        is_keyframe = has_frozen or self.version - self.keyframe_version >= self.full_sync_interval
+
+        state_dicts = {}
+        deltas = {}
+        for module_name, module in modules.items():
+            frozen = _frozen_parameter_names(module)
+            state_dict = {
+                name: tensor.detach().to("cpu", copy=True) for name, tensor in module.state_dict().items()
+            }
+
+            if is_keyframe:
+                # Frozen parameters never change, only the first keyframe carries them
+                state_dicts[module_name] = {
+                    name: tensor for name, tensor in state_dict.items() if has_frozen or name not in frozen
+                }
+                continue
+
+            keyframe = self._keyframe[module_name]
+            state_dicts[module_name] = {}
+            deltas[module_name] = {}
+            for name, tensor in state_dict.items():
+                if name in frozen or torch.equal(tensor, keyframe[name]):
+                    continue
+                if self.delta_dtype is not None and tensor.is_floating_point():
+                    deltas[module_name][name] = (tensor - keyframe[name]).to(self.delta_dtype)
+                else:
+                    state_dicts[module_name][name] = tensor
+
+        if is_keyframe:
+            self.keyframe_version = self.version
+            self._keyframe = {
+                module_name: {
+                    name: tensor.detach().to("cpu", copy=True) for name, tensor in module.state_dict().items()
+                }
+                for module_name, module in modules.items()
+            }
+
+        return {
+            "session_id": self.session_id,
+            "version": self.version,
+            "keyframe_version": self.keyframe_version,
+            "is_keyframe": is_keyframe,
+            "has_frozen": has_frozen,
+            "state_dicts": state_dicts,
+            "deltas": deltas,
+        }
+
+
+class ParameterSyncReceiver:
+    """Actor side of the parameter synchronization.
+
+    Applies update payloads built by `ParameterSyncSender` in place, without reallocating the parameters
+    of the policy.
+    """
+
+    def __init__(self):
+        self.session_id = None
+        self.version = 0
+        self.keyframe_version = 0
+        self._keyframe: dict[str, dict[str, torch.Tensor]] | None = None
+
+    @torch.no_grad()
+    def apply_update(self, update: dict, modules: dict[str, nn.Module]) -> bool:
+        """Apply `update` to `modules`.
+
+        Updates of the current session are applied in version order. Keyframes of another session are always
+        applied, so that the keyframes of a restarted learner (whose versions start over) are accepted.
+
+        Returns:
+            bool: True if the update was applied, False if it was stale or its keyframe was never received.
+        """
+        same_session = update.get("session_id") == self.session_id
+        if same_session and update["version"] <= self.version:
+            logging.debug(f"[ACTOR] Skip stale parameters version {update['version']}")
+            return False
+
+        if not update["is_keyframe"] and (
+            not same_session or update["keyframe_version"] != self.keyframe_version
+        ):
+            logging.warning(
+                f"[ACTOR] Parameters version {update['version']} refers to keyframe "
+                f"{update['keyframe_version']} which was not received, waiting for the next keyframe."
+            )
+            return False
+
+        for module_name, module in modules.items():
+            targets = module.state_dict()
+            for name, value in update["state_dicts"].get(module_name, {}).items():
+                targets[name].copy_(value)
+            for name, delta in update["deltas"].get(module_name, {}).items():
+                keyframe_value = self._keyframe[module_name][name]
+                targets[name].copy_(keyframe_value + delta.to(keyframe_value))
+
+        if update["is_keyframe"]:
+            self.session_id = update.get("session_id")
+            self.keyframe_version = update["keyframe_version"]
+            self._keyframe = {
+                module_name: {name: tensor.detach().clone() for name, tensor in module.state_dict().items()}
+                for module_name, module in modules.items()
+            }
+
+        self.version = update["version"]
+        return True
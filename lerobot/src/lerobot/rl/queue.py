@@ -50,3 +50,32 @@ def get_last_item_from_queue(queue: Queue, block=True, timeout: float = 0.1) ->
             item = queue.get_nowait()
 
     return item
+
+
+def get_all_items_from_queue(queue: Queue, block=True, timeout: float = 0.1) -> list[Any]:
+    """Drain the queue and return all its items, oldest first.
+
+    If `block`, waits up to `timeout` for the first item. Returns an empty list if there is none.
+    """
+    items = []
+    if block:
+        try:
+            items.append(queue.get(timeout=timeout))
+        except Empty:
+            return items
+
+    if platform.system() == "Darwin":
+        # On Mac, avoid using `qsize` due to unreliable implementation, see `get_last_item_from_queue`
+        try:
+            while True:
+                items.append(queue.get_nowait())
+        except Empty:
+            pass
+
+        return items
+
+    while queue.qsize() > 0:
+        with suppress(Empty):
+            items.append(queue.get_nowait())
+
+    return items
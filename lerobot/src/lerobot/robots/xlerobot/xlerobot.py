@@ -22,6 +22,7 @@ from typing import Any
 
 import numpy as np
 
+from lerobot.cameras.camera_group import CameraGroup
 from lerobot.cameras.utils import make_cameras_from_configs
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 from lerobot.motors import Motor, MotorCalibration, MotorNormMode
@@ -126,6 +127,9 @@ class XLerobot(Robot):
         self.head_motors = [motor for motor in self.bus1.motors if motor.startswith("head")]
         self.base_motors = [motor for motor in self.bus2.motors if motor.startswith("base")]
         self.cameras = make_cameras_from_configs(config.cameras)
+        # Picks the camera frames captured closest in time, see `get_camera_observation`
+        self.camera_group = CameraGroup(self.cameras, max_skew_ms=50)
+        self.last_camera_frames = None
 
     @property
     def _state_ft(self) -> dict[str, type]:
@@ -523,7 +527,13 @@ class XLerobot(Robot):
             "theta.vel": theta_cmd,
         }
 
-    def get_observation(self) -> dict[str, Any]:
+    def get_observation(self, decode_images: bool = True) -> dict[str, Any]:
+        """Reads the motors state and the camera frames.
+
+        Args:
+            decode_images: If False, the camera entries are the `TimestampedFrame`s of the cameras, so that the
+                JPEG bytes of cameras in MJPEG passthrough mode can be forwarded without being decoded.
+        """
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
@@ -547,22 +557,24 @@ class XLerobot(Robot):
         logger.debug(f"{self} read state: {dt_ms:.1f}ms")
 
         # Capture images from cameras
-        camera_obs = self.get_camera_observation()
+        camera_obs = self.get_camera_observation(decode_images)
 
         # Combine all observations
         obs_dict = {**left_arm_state, **right_arm_state, **head_state, **base_vel, **camera_obs}
 
         return obs_dict
     
-    def get_camera_observation(self):
-        obs_dict = {}
-        for cam_key, cam in self.cameras.items():
-            start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
-            dt_ms = (time.perf_counter() - start) * 1e3
-            logger.debug(f"{self} read {cam_key}: {dt_ms:.1f}ms")
-        
-        return obs_dict
+    def get_camera_observation(self, decode_images: bool = True):
+        # The frames of all the cameras are picked from their recent frames in one call, so that they are
+        # captured at about the same time. Their capture times are kept in `last_camera_frames`.
+        start = time.perf_counter()
+        self.last_camera_frames = self.camera_group.read()
+        dt_ms = (time.perf_counter() - start) * 1e3
+        logger.debug(f"{self} read cameras: {dt_ms:.1f}ms, skew: {self.last_camera_frames.skew_s * 1e3:.1f}ms")
+
+        if not decode_images:
+            return dict(self.last_camera_frames.frames)
+        return self.last_camera_frames.images
 
     def send_action(self, action: dict[str, Any]) -> dict[str, Any]:
         """Command lekiwi to move to a target joint configuration.
@@ -210,11 +210,15 @@ class XLerobotClient(Robot):
         obs_dict: Dict[str, Any] = {**flat_state, "observation.state": state_vec}
 
         # Decode images
+        # Frames forwarded from cameras in MJPEG passthrough mode decode to BGR
+        jpeg_passthrough = observation.get("jpeg_passthrough", {})
         current_frames: Dict[str, np.ndarray] = {}
         for cam_name, image_b64 in observation.items():
             if cam_name not in self._cameras_ft:
                 continue
             frame = self._decode_image_from_b64(image_b64)
+            if frame is not None and jpeg_passthrough.get(cam_name) == "rgb":
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             if frame is not None:
                 current_frames[cam_name] = frame
 
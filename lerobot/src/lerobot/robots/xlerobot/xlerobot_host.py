@@ -88,17 +88,23 @@ def main():
                 watchdog_active = True
                 robot.stop_base()
 
-            last_observation = robot.get_observation()
-
-            # Encode ndarrays to base64 strings
-            for cam_key, _ in robot.cameras.items():
-                ret, buffer = cv2.imencode(
-                    ".jpg", last_observation[cam_key], [int(cv2.IMWRITE_JPEG_QUALITY), 90]
-                )
+            last_observation = robot.get_observation(decode_images=False)
+
+            # Encode frames to base64 JPEG strings. The JPEG bytes of cameras in MJPEG passthrough mode are
+            # forwarded as is, they decode to BGR and the client converts them to the camera color mode.
+            jpeg_passthrough = {}
+            for cam_key, cam in robot.cameras.items():
+                frame = last_observation[cam_key]
+                if frame.jpeg is not None and getattr(cam, "rotation", None) is None:
+                    ret, buffer = True, frame.jpeg
+                    jpeg_passthrough[cam_key] = cam.color_mode.value
+                else:
+                    ret, buffer = cv2.imencode(".jpg", frame.frame, [int(cv2.IMWRITE_JPEG_QUALITY), 90])
                 if ret:
                     last_observation[cam_key] = base64.b64encode(buffer).decode("utf-8")
                 else:
                     last_observation[cam_key] = ""
+            last_observation["jpeg_passthrough"] = jpeg_passthrough
 
             # Send the observation to the remote agent
             try:
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Opens cameras once and publishes their frames in shared memory, so that several processes can read them.
+
+Other processes read the cameras with `SharedMemoryCamera`s, e.g. `{type: shared_memory, name: head}` in
+`--robot.cameras`.
+
+Example:
+
+```shell
+lerobot-camera-broker \
+    --cameras="{ head: {type: opencv, index_or_path: /dev/video0, width: 640, height: 480, fps: 30}, \
+                 wrist: {type: opencv, index_or_path: /dev/video2, width: 640, height: 480, fps: 30}}"
+```
+"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from pprint import pformat
+
+from lerobot.cameras import CameraConfig
+from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
+from lerobot.cameras.realsense.configuration_realsense import RealSenseCameraConfig  # noqa: F401
+from lerobot.cameras.shared_memory import CameraBroker
+from lerobot.cameras.utils import make_cameras_from_configs
+from lerobot.configs import parser
+from lerobot.utils.import_utils import register_third_party_plugins
+from lerobot.utils.utils import init_logging
+
+
+@dataclass
+class CameraBrokerConfig:
+    # Cameras to publish, by name. Readers use these names.
+    cameras: dict[str, CameraConfig] = field(default_factory=dict)
+    # Number of frames kept in shared memory per camera
+    num_slots: int = 4
+
+    def __post_init__(self):
+        if not self.cameras:
+            raise ValueError("At least one camera is required (--cameras).")
+
+
+@parser.wrap()
+def camera_broker(cfg: CameraBrokerConfig):
+    init_logging()
+    logging.info(pformat(asdict(cfg)))
+
+    broker = CameraBroker(make_cameras_from_configs(cfg.cameras), num_slots=cfg.num_slots)
+    broker.start()
+    logging.info("Publishing cameras, press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        broker.stop()
+
+
+def main():
+    register_third_party_plugins()
+    camera_broker()
+
+
+if __name__ == "__main__":
+    main()
@@ -70,6 +70,7 @@ from lerobot.cameras import (  # noqa: F401
 )
 from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
 from lerobot.cameras.realsense.configuration_realsense import RealSenseCameraConfig  # noqa: F401
+from lerobot.cameras.shared_memory.configuration_shared_memory import SharedMemoryCameraConfig  # noqa: F401
 from lerobot.configs import parser
 from lerobot.configs.policies import PreTrainedConfig
 from lerobot.datasets.image_writer import safe_stop_image_writer
@@ -79,7 +80,7 @@ from lerobot.datasets.utils import build_dataset_frame, combine_feature_dicts
 from lerobot.datasets.video_utils import VideoEncodingManager
 from lerobot.policies.factory import make_policy, make_pre_post_processors
 from lerobot.policies.pretrained import PreTrainedPolicy
-from lerobot.policies.utils import make_robot_action
+from lerobot.policies.utils import ObservationStager, make_robot_action
 from lerobot.processor import (
     PolicyAction,
     PolicyProcessorPipeline,
@@ -122,6 +123,7 @@ from lerobot.utils.control_utils import (
     sanity_check_dataset_robot_compatibility,
 )
 from lerobot.utils.import_utils import register_third_party_plugins
+from lerobot.utils.inference_worker import AsyncInferenceWorker
 from lerobot.utils.robot_utils import precise_sleep
 from lerobot.utils.utils import (
     get_safe_torch_device,
@@ -189,6 +191,13 @@ class RecordConfig:
     play_sounds: bool = True
     # Resume recording on an existing dataset.
     resume: bool = False
+    # Run the policy in a background thread that keeps a queue of action chunks filled, so that inference of
+    # slow chunked policies (e.g. SmolVLA, pi0, diffusion) overlaps with the control loop instead of stalling it.
+    async_inference: bool = False
+    # Number of queued actions at or below which the background thread computes a new action chunk. Defaults to
+    # the number of actions executed during an inference (95th percentile of the recent latencies, after warmup)
+    # plus one, so that the next chunk is ready before the queue runs out.
+    async_inference_queue_threshold: int | None = None
 
     def __post_init__(self):
         # HACK: We parse again the cli args here to get the pretrained path if there was one.
@@ -261,6 +270,7 @@ def record_loop(
     control_time_s: int | None = None,
     single_task: str | None = None,
     display_data: bool = False,
+    inference_worker: AsyncInferenceWorker | None = None,
 ):
     if dataset is not None and dataset.fps != fps:
         raise ValueError(f"The dataset fps should be equal to requested fps ({dataset.fps} != {fps}).")
@@ -290,11 +300,21 @@ def record_loop(
                 "For multi-teleop, the list must contain exactly one KeyboardTeleop and one arm teleoperator. Currently only supported for LeKiwi robot."
             )
 
+    # Reuse the observation upload buffers across the steps of the episode
+    stager = None
+    if policy is not None and inference_worker is None:
+        stager = ObservationStager(get_safe_torch_device(policy.config.device))
+        stager.allocate(dataset.features)
+
     # Reset policy and processor if they are provided
     if policy is not None and preprocessor is not None and postprocessor is not None:
-        policy.reset()
-        preprocessor.reset()
-        postprocessor.reset()
+        if inference_worker is not None:
+            # The worker owns the policy, it resets it before its next inference
+            inference_worker.reset()
+        else:
+            policy.reset()
+            preprocessor.reset()
+            postprocessor.reset()
 
     timestamp = 0
     start_episode_t = time.perf_counter()
@@ -316,16 +336,22 @@ def record_loop(
 
         # Get action from either policy or teleop
         if policy is not None and preprocessor is not None and postprocessor is not None:
-            action_values = predict_action(
-                observation=observation_frame,
-                policy=policy,
-                device=get_safe_torch_device(policy.config.device),
-                preprocessor=preprocessor,
-                postprocessor=postprocessor,
-                use_amp=policy.config.use_amp,
-                task=single_task,
-                robot_type=robot.robot_type,
-            )
+            if inference_worker is not None:
+                # Inference runs in the background, only wait when no action is queued yet
+                inference_worker.submit_observation(observation_frame)
+                action_values = inference_worker.get_action()
+            else:
+                action_values = predict_action(
+                    observation=observation_frame,
+                    policy=policy,
+                    device=get_safe_torch_device(policy.config.device),
+                    preprocessor=preprocessor,
+                    postprocessor=postprocessor,
+                    use_amp=policy.config.use_amp,
+                    task=single_task,
+                    robot_type=robot.robot_type,
+                    stager=stager,
+                )
 
             act_processed_policy: RobotAction = make_robot_action(action_values, dataset.features)
 
@@ -408,6 +434,7 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
 
     dataset = None
     listener = None
+    inference_worker = None
 
     try:
         if cfg.resume:
@@ -457,6 +484,20 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
         if teleop is not None:
             teleop.connect()
 
+        if policy is not None and cfg.async_inference:
+            inference_worker = AsyncInferenceWorker(
+                policy=policy,
+                preprocessor=preprocessor,
+                postprocessor=postprocessor,
+                device=get_safe_torch_device(policy.config.device),
+                fps=cfg.dataset.fps,
+                use_amp=policy.config.use_amp,
+                task=cfg.dataset.single_task,
+                robot_type=robot.robot_type,
+                queue_threshold=cfg.async_inference_queue_threshold,
+            )
+            inference_worker.start()
+
         listener, events = init_keyboard_listener()
 
         with VideoEncodingManager(dataset):
@@ -478,6 +519,7 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                     control_time_s=cfg.dataset.episode_time_s,
                     single_task=cfg.dataset.single_task,
                     display_data=cfg.display_data,
+                    inference_worker=inference_worker,
                 )
 
                 # Execute a few seconds without recording to give time to manually reset the environment
@@ -511,6 +553,9 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
     finally:
         log_say("Stop recording", cfg.play_sounds, blocking=True)
 
+        if inference_worker is not None:
+            inference_worker.stop()
+
         if dataset:
             dataset.finalize()
 
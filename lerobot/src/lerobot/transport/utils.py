@@ -26,7 +26,7 @@ from typing import Any
 import torch
 
 from lerobot.transport import services_pb2
-from lerobot.utils.transition import Transition
+from lerobot.utils.transition import BatchedTransitions, Transition
 
 # FIX for protobuf: Assign the enum to a variable and ignore the type error once
 TransferState = services_pb2.TransferState  # type: ignore[attr-defined]
@@ -137,14 +137,14 @@ def bytes_to_python_object(buffer: bytes) -> Any:
     return obj
 
 
-def bytes_to_transitions(buffer: bytes) -> list[Transition]:
+def bytes_to_transitions(buffer: bytes) -> list[Transition] | BatchedTransitions:
     bytes_buffer = io.BytesIO(buffer)
     bytes_buffer.seek(0)
     transitions = torch.load(bytes_buffer, weights_only=True)
     return transitions
 
 
-def transitions_to_bytes(transitions: list[Transition]) -> bytes:
+def transitions_to_bytes(transitions: list[Transition] | BatchedTransitions) -> bytes:
     bytes_buffer = io.BytesIO()
     torch.save(transitions, bytes_buffer)
     return bytes_buffer.getvalue()
@@ -63,6 +63,10 @@ HF_LEROBOT_HOME = Path(os.getenv("HF_LEROBOT_HOME", default_cache_path)).expandu
 default_calibration_path = HF_LEROBOT_HOME / "calibration"
 HF_LEROBOT_CALIBRATION = Path(os.getenv("HF_LEROBOT_CALIBRATION", default_calibration_path)).expanduser()
 
+# quantized weights cache dir
+default_quantized_path = HF_LEROBOT_HOME / "quantized"
+HF_LEROBOT_QUANTIZED = Path(os.getenv("HF_LEROBOT_QUANTIZED", default_quantized_path)).expanduser()
+
 
 # streaming datasets
 LOOKBACK_BACKTRACKTABLE = 100
@@ -31,7 +31,7 @@ from deepdiff import DeepDiff
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.datasets.utils import DEFAULT_FEATURES
 from lerobot.policies.pretrained import PreTrainedPolicy
-from lerobot.policies.utils import prepare_observation_for_inference
+from lerobot.policies.utils import ObservationStager, prepare_observation_for_inference
 from lerobot.processor import PolicyAction, PolicyProcessorPipeline
 from lerobot.robots import Robot
 
@@ -73,6 +73,7 @@ def predict_action(
     use_amp: bool,
     task: str | None = None,
     robot_type: str | None = None,
+    stager: ObservationStager | None = None,
 ):
     """
     Performs a single-step inference to predict a robot action from an observation.
@@ -93,6 +94,8 @@ def predict_action(
         use_amp: A boolean to enable/disable Automatic Mixed Precision for CUDA inference.
         task: An optional string identifier for the task.
         robot_type: An optional string identifier for the robot type.
+        stager: An optional `ObservationStager` reused across calls to upload the observation from
+            pinned host buffers with non-blocking copies.
 
     Returns:
         A `torch.Tensor` containing the predicted action, ready for the robot.
@@ -103,7 +106,7 @@ def predict_action(
         torch.autocast(device_type=device.type) if device.type == "cuda" and use_amp else nullcontext(),
     ):
         # Convert to pytorch format: channel first and float32 in [0,1] with batch dimension
-        observation = prepare_observation_for_inference(observation, device, task, robot_type)
+        observation = prepare_observation_for_inference(observation, device, task, robot_type, stager)
         observation = preprocessor(observation)
 
         # Compute the next action with the policy
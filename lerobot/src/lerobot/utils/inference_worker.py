@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-process asynchronous inference for chunked policies.
+
+`AsyncInferenceWorker` runs the policy in a background thread so that computing the next action chunk
+overlaps with the execution of the current one, like the remote async inference stack
+(`lerobot.async_inference`) but without a server. The control loop hands over the latest observation with
+`submit_observation` and drains actions at its own rate with `get_action`. The worker computes a new chunk
+once the queue falls to `queue_threshold` actions and merges it with the RTC `ActionQueue` semantics:
+RTC enabled replaces the queue and skips the actions executed during inference, RTC disabled appends.
+
+When appending, the first actions of a new chunk are planned for the steps already covered by the actions
+that were queued when its observation was submitted. Those are dropped, as the remote async inference
+client drops the actions of past timesteps, so that every action is executed at the step it was planned for.
+"""
+
+import logging
+import math
+import time
+from contextlib import nullcontext
+from copy import copy
+from threading import Condition, Thread
+from typing import Any
+
+import numpy as np
+import torch
+from torch import Tensor
+
+from lerobot.policies.pretrained import PreTrainedPolicy
+from lerobot.policies.rtc.action_queue import ActionQueue
+from lerobot.policies.rtc.configuration_rtc import RTCConfig
+from lerobot.policies.rtc.latency_tracker import LatencyTracker
+from lerobot.policies.utils import ObservationStager, prepare_observation_for_inference
+from lerobot.processor import PolicyAction, PolicyProcessorPipeline
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncInferenceWorker:
+    """Background thread filling an action chunk queue from the latest observation.
+
+    The policy is queried with `predict_action_chunk`, so policy side action selection (e.g. ACT temporal
+    ensembling) is bypassed: every action of a chunk is executed in order.
+
+    Args:
+        policy: The policy to run. It is only used from the worker thread once the worker is started.
+        preprocessor: The `PolicyProcessorPipeline` for preprocessing observations.
+        postprocessor: The `PolicyProcessorPipeline` for postprocessing action chunks.
+        device: The `torch.device` to run inference on.
+        fps: The control frequency, used to convert the inference latency into a number of actions.
+        use_amp: Whether to enable Automatic Mixed Precision for CUDA inference.
+        task: An optional string identifier for the task.
+        robot_type: An optional string identifier for the robot type.
+        rtc_config: The RTC configuration of the `ActionQueue`. Defaults to the policy `rtc_config` if it
+            has one, otherwise to RTC disabled.
+        queue_threshold: Number of queued actions at or below which a new chunk is computed. None uses the
+            number of actions executed during an inference (see `inference_steps`), plus one, so that the next
+            chunk is ready when the queue runs out.
+        num_warmup_inferences: Number of first inferences left out of the latency estimate, since they
+            include one-off costs such as `torch.compile` warmup or CUDA graph capture.
+        latency_window: Number of recent inferences the latency estimate is computed over.
+    """
+
+    def __init__(
+        self,
+        policy: PreTrainedPolicy,
+        preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]],
+        postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction],
+        device: torch.device,
+        fps: int,
+        use_amp: bool = False,
+        task: str | None = None,
+        robot_type: str | None = None,
+        rtc_config: RTCConfig | None = None,
+        queue_threshold: int | None = None,
+        num_warmup_inferences: int = 2,
+        latency_window: int = 100,
+    ):
+        if queue_threshold is not None and queue_threshold < 0:
+            raise ValueError(f"queue_threshold must be >= 0, got {queue_threshold}")
+
+        self.policy = policy
+        self.preprocessor = preprocessor
+        self.postprocessor = postprocessor
+        self.device = device
+        self.fps = fps
+        self.use_amp = use_amp
+        self.task = task
+        self.robot_type = robot_type
+        self.rtc_config = rtc_config or getattr(policy.config, "rtc_config", None) or RTCConfig(enabled=False)
+        self.queue_threshold = queue_threshold
+        self.num_warmup_inferences = num_warmup_inferences
+
+        self.action_queue = ActionQueue(self.rtc_config)
+        self.latency_tracker = LatencyTracker(maxlen=latency_window)
+        self._num_inferences = 0
+        self.stager = ObservationStager(device)
+
+        self._condition = Condition()
+        self._observation: dict[str, np.ndarray] | None = None
+        # Number of actions popped so far, and when the pending observation was submitted
+        self._num_actions = 0
+        self._observation_step = 0
+        # Incremented on every reset, chunks computed for a previous episode are dropped
+        self._generation = 0
+        self._reset_requested = False
+        self._running = False
+        self._error: Exception | None = None
+        self._thread: Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """Starts the worker thread."""
+        if self._running:
+            raise RuntimeError("AsyncInferenceWorker is already running.")
+        self._running = True
+        self._error = None
+        self._thread = Thread(target=self._run, name="AsyncInferenceWorker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stops the worker thread, waiting at most `timeout` seconds for the current inference."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def reset(self) -> None:
+        """Clears the queued actions and resets the policy and the processors before the next inference.
+
+        Call it at the start of every episode instead of resetting the policy directly, since the policy
+        is owned by the worker thread.
+        """
+        with self._condition:
+            self._generation += 1
+            self._reset_requested = True
+            self._observation = None
+            self.action_queue = ActionQueue(self.rtc_config)
+
+    def submit_observation(self, observation: dict[str, np.ndarray]) -> None:
+        """Hands the latest observation over to the worker, replacing any observation not yet consumed."""
+        self._raise_worker_error()
+        with self._condition:
+            self._observation = observation
+            self._observation_step = self._num_actions
+            self._condition.notify_all()
+
+    def get_action(self, timeout: float | None = None) -> Tensor | None:
+        """Pops the next action from the queue.
+
+        Args:
+            timeout: Maximum number of seconds to wait for an action when the queue is empty, e.g. while
+                the first chunk of an episode is computed. None waits until an action is available.
+
+        Returns:
+            The next action (action_dim,), or None if none became available before the timeout.
+
+        Raises:
+            RuntimeError: If the worker thread failed, or is stopped and no action is left.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self._condition:
+            while True:
+                self._raise_worker_error()
+                action = self.action_queue.get()
+                if action is not None:
+                    self._num_actions += 1
+                    # The queue may now be at the threshold for a new chunk
+                    self._condition.notify_all()
+                    return action
+                if not self._running:
+                    raise RuntimeError("AsyncInferenceWorker is not running.")
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+
+    def _raise_worker_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("AsyncInferenceWorker failed") from self._error
+
+    def inference_steps(self) -> int:
+        """Number of actions executed during an inference: the 95th percentile of the recent latencies."""
+        return math.ceil(self.latency_tracker.p95() * self.fps)
+
+    def _record_latency(self, latency: float) -> None:
+        self._num_inferences += 1
+        if self._num_inferences > self.num_warmup_inferences:
+            self.latency_tracker.add(latency)
+
+    def _queue_threshold(self) -> int:
+        if self.queue_threshold is not None:
+            return self.queue_threshold
+        return self.inference_steps() + 1
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._condition:
+                    while self._running and (
+                        self._observation is None or self.action_queue.qsize() > self._queue_threshold()
+                    ):
+                        self._condition.wait()
+                    if not self._running:
+                        return
+                    if self._reset_requested:
+                        self.policy.reset()
+                        self.preprocessor.reset()
+                        self.postprocessor.reset()
+                        self._reset_requested = False
+                    observation, self._observation = self._observation, None
+                    observation_step = self._observation_step
+                    generation = self._generation
+                    action_queue = self.action_queue
+
+                self._infer(observation, observation_step, generation, action_queue)
+        except Exception as e:
+            logger.exception("[ASYNC_INFERENCE] Inference worker failed")
+            with self._condition:
+                self._error = e
+                self._running = False
+                self._condition.notify_all()
+
+    def _infer(
+        self,
+        observation: dict[str, np.ndarray],
+        observation_step: int,
+        generation: int,
+        action_queue: ActionQueue,
+    ) -> None:
+        start_t = time.perf_counter()
+        action_index_before_inference = action_queue.get_action_index()
+        kwargs = {}
+        if self.rtc_config.enabled:
+            kwargs["inference_delay"] = self.inference_steps()
+            kwargs["prev_chunk_left_over"] = action_queue.get_left_over()
+
+        observation = copy(observation)
+        with (
+            torch.inference_mode(),
+            torch.autocast(device_type=self.device.type)
+            if self.device.type == "cuda" and self.use_amp
+            else nullcontext(),
+        ):
+            observation = prepare_observation_for_inference(
+                observation, self.device, self.task, self.robot_type, self.stager
+            )
+            observation = self.preprocessor(observation)
+            actions = self.policy.predict_action_chunk(observation, **kwargs)
+            # Keep the original actions (before postprocessing) for RTC
+            original_actions = actions.squeeze(0).clone()
+            processed_actions = self.postprocessor(actions).squeeze(0)
+
+        latency = time.perf_counter() - start_t
+        self._record_latency(latency)
+        delay = math.ceil(latency * self.fps)
+
+        with self._condition:
+            if generation != self._generation:
+                # The episode was reset during inference
+                return
+            if not self.rtc_config.enabled:
+                # Skip the steps covered by the actions queued when the observation was submitted: the ones
+                # executed since then and the ones still queued
+                skip = self._num_actions - observation_step + action_queue.qsize()
+                original_actions = original_actions[skip:]
+                processed_actions = processed_actions[skip:]
+                if len(processed_actions) == 0:
+                    logger.debug(f"[ASYNC_INFERENCE] Dropped a chunk planned for {skip} past or queued steps")
+                    return
+            action_queue.merge(
+                original_actions,
+                processed_actions,
+                delay,
+                action_index_before_inference if self.rtc_config.enabled else None,
+            )
+            self._condition.notify_all()
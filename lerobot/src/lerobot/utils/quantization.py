@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Dynamic quantization of models for CPU inference.
+
+With dynamic quantization, the weights of the `nn.Linear` layers are stored in int8 and their activations are
+quantized on the fly, which speeds up the matrix multiplications on CPU. The quantized (packed) weights are
+cached in the lerobot cache dir (`HF_LEROBOT_QUANTIZED`) so that following loads skip the quantization of the
+float weights. Checkpoints downloaded from the Hub live in the shared, read-only snapshots of the Hub cache,
+so the quantized weights are never written next to them.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+import torch
+from torch import nn
+
+from lerobot.utils.constants import HF_LEROBOT_QUANTIZED
+
+INFERENCE_QUANTIZATIONS = ["int8"]
+
+_QUANTIZED_DTYPES = {"int8": torch.qint8}
+
+
+def quantize_for_inference(model: nn.Module, quantization: str) -> nn.Module:
+    """Replaces the `nn.Linear` layers of `model` by dynamically quantized ones, in place.
+
+    The model is converted to float32 first, since dynamic quantization only supports float32 weights. The
+    quantized model only runs on CPU and cannot be trained.
+
+    Args:
+        model: The model to quantize.
+        quantization: One of `INFERENCE_QUANTIZATIONS`.
+
+    Returns:
+        The quantized model.
+    """
+    if quantization not in INFERENCE_QUANTIZATIONS:
+        raise ValueError(
+            f"Unsupported inference quantization '{quantization}'. Expected one of {INFERENCE_QUANTIZATIONS}."
+        )
+    model.float()
+    return torch.ao.quantization.quantize_dynamic(
+        model, {nn.Linear}, dtype=_QUANTIZED_DTYPES[quantization], inplace=True
+    )
+
+
+def quantized_model_file(
+    model_file: str | Path, quantization: str, cache_dir: str | Path | None = None
+) -> Path:
+    """Path of the cached quantized weights of the checkpoint `model_file`.
+
+    The cache entry is keyed by the path of the checkpoint, which includes the repo and revision of the
+    checkpoints downloaded from the Hub, by the quantization, and by the torch version and quantized engine
+    that packed the weights.
+
+    Args:
+        model_file: The float checkpoint.
+        quantization: One of `INFERENCE_QUANTIZATIONS`.
+        cache_dir: Directory of the cached quantized weights, `HF_LEROBOT_QUANTIZED` by default.
+    """
+    cache_dir = HF_LEROBOT_QUANTIZED if cache_dir is None else Path(cache_dir)
+    key = "\n".join(
+        [os.path.abspath(model_file), quantization, torch.__version__, torch.backends.quantized.engine]
+    )
+    digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+    return cache_dir / f"{digest}.{quantization}.pt"
+
+
+def _source_signature(model_file: str | Path) -> tuple[int, int]:
+    stat = os.stat(model_file)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def save_quantized_model(model: nn.Module, quantized_file: str | Path, model_file: str | Path) -> None:
+    """Caches the weights of a quantized model, recording the float checkpoint `model_file` they come from.
+
+    The cache is optional: failing to write it (e.g. in a read-only directory) only logs a warning, and the
+    quantized model is only kept in memory.
+    """
+    try:
+        Path(quantized_file).parent.mkdir(parents=True, exist_ok=True)
+        torch.save(
+            {"source": _source_signature(model_file), "state_dict": model.state_dict()},
+            quantized_file,
+        )
+    except (OSError, RuntimeError) as e:
+        logging.warning(f"Could not cache the quantized weights in {quantized_file}: {e}")
+
+
+def load_quantized_model(
+    model: nn.Module, quantized_file: str | Path, model_file: str | Path, quantization: str
+) -> bool:
+    """Quantizes `model` and loads its cached quantized weights, if they are up to date.
+
+    Args:
+        model: The float model, with the same architecture as the cached one.
+        quantized_file: The cached quantized weights, see `quantized_model_file`.
+        model_file: The float checkpoint the cached weights must come from.
+        quantization: One of `INFERENCE_QUANTIZATIONS`.
+
+    Returns:
+        True if the cached weights were loaded, False if there is no up to date cache, in which case `model`
+        is left untouched.
+    """
+    if not os.path.isfile(quantized_file):
+        return False
+    checkpoint = torch.load(quantized_file, map_location="cpu", weights_only=True)
+    if tuple(checkpoint["source"]) != _source_signature(model_file):
+        logging.info(f"Ignoring outdated quantized weights {quantized_file}")
+        return False
+    quantize_for_inference(model, quantization)
+    model.load_state_dict(checkpoint["state_dict"])
+    return True
@@ -14,11 +14,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 from typing import TypedDict
 
 import torch
 
-from lerobot.utils.constants import ACTION
+from lerobot.utils.constants import ACTION, OBS_IMAGE
 
 
 class Transition(TypedDict):
@@ -31,6 +32,101 @@ class Transition(TypedDict):
     complementary_info: dict[str, torch.Tensor | float | int] | None = None
 
 
+class BatchedTransitions(TypedDict):
+    """Columnar version of a list of transitions: every field is stacked along a new first dimension."""
+
+    state: dict[str, torch.Tensor]
+    action: torch.Tensor
+    reward: torch.Tensor
+    next_state: dict[str, torch.Tensor]
+    done: torch.Tensor
+    truncated: torch.Tensor
+    complementary_info: dict[str, torch.Tensor] | None
+
+
+def _stack(values: list, device: torch.device) -> torch.Tensor:
+    return torch.stack([torch.as_tensor(value).to(device) for value in values])
+
+
+def stack_transitions(transitions: list[Transition], device: str = "cpu") -> BatchedTransitions:
+    """Stack a list of transitions, e.g. an episode segment, into one tensor per key.
+
+    Args:
+        transitions: Non-empty list of transitions with the same keys and shapes.
+        device: Device of the stacked tensors.
+
+    Returns:
+        BatchedTransitions: The stacked transitions.
+    """
+    device = torch.device(device)
+    first = transitions[0]
+    complementary_info = None
+    if first.get("complementary_info") is not None:
+        complementary_info = {
+            key: _stack([t["complementary_info"][key] for t in transitions], device)
+            for key in first["complementary_info"]
+        }
+    return BatchedTransitions(
+        state={key: _stack([t["state"][key] for t in transitions], device) for key in first["state"]},
+        action=_stack([t[ACTION] for t in transitions], device),
+        reward=_stack([t["reward"] for t in transitions], device),
+        next_state={
+            key: _stack([t["next_state"][key] for t in transitions], device) for key in first["next_state"]
+        },
+        done=_stack([t["done"] for t in transitions], device),
+        truncated=_stack([t["truncated"] for t in transitions], device),
+        complementary_info=complementary_info,
+    )
+
+
+def select_transitions(batch: BatchedTransitions, mask: torch.Tensor) -> BatchedTransitions:
+    """Keep the stacked transitions selected by a boolean `mask`."""
+    complementary_info = None
+    if batch.get("complementary_info") is not None:
+        complementary_info = {key: value[mask] for key, value in batch["complementary_info"].items()}
+    return BatchedTransitions(
+        state={key: value[mask] for key, value in batch["state"].items()},
+        action=batch[ACTION][mask],
+        reward=batch["reward"][mask],
+        next_state={key: value[mask] for key, value in batch["next_state"].items()},
+        done=batch["done"][mask],
+        truncated=batch["truncated"][mask],
+        complementary_info=complementary_info,
+    )
+
+
+def quantize_transition_images(batch: BatchedTransitions) -> BatchedTransitions:
+    """Convert the float images in [0, 1] of stacked transitions to uint8, in place.
+
+    Images are 4x smaller to send, and camera frames are 8-bit to begin with. The replay buffer converts them
+    back to float when they are added.
+    """
+    for observations in (batch["state"], batch["next_state"]):
+        for key, value in observations.items():
+            if key.startswith(OBS_IMAGE) and value.is_floating_point():
+                observations[key] = value.mul(255).round_().clamp_(0, 255).to(torch.uint8)
+    return batch
+
+
+def find_nan_transitions(batch: BatchedTransitions) -> torch.Tensor:
+    """Return a boolean mask of the stacked transitions that contain NaN values.
+
+    The NaN values are also logged, once per key.
+    """
+    has_nan = torch.zeros(batch[ACTION].shape[0], dtype=torch.bool, device=batch[ACTION].device)
+    tensors = {f"state.{key}": value for key, value in batch["state"].items()}
+    tensors.update({f"next_state.{key}": value for key, value in batch["next_state"].items()})
+    tensors[ACTION] = batch[ACTION]
+    for key, value in tensors.items():
+        if not value.is_floating_point():
+            continue
+        nan_rows = torch.isnan(value.reshape(value.shape[0], -1)).any(dim=1)
+        if nan_rows.any():
+            logging.warning(f"Found NaN values in {int(nan_rows.sum())} transitions for {key}")
+            has_nan |= nan_rows
+    return has_nan
+
+
 def move_transition_to_device(transition: Transition, device: str = "cpu") -> Transition:
     device = torch.device(device)
     non_blocking = device.type == "cuda"
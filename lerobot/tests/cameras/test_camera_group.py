@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import numpy as np
+import pytest
+
+from lerobot.cameras import CameraGroup, FrameBuffer
+
+
+class BufferedCamera:
+    """Camera whose read thread already filled its frame buffer."""
+
+    def __init__(self, timestamps: list[float]):
+        self.frame_buffer = FrameBuffer(size=4)
+        for ts in timestamps:
+            self.frame_buffer.put(np.full((2, 2, 3), ts), ts)
+
+    def async_read(self, timeout_ms: float = 200):
+        raise AssertionError("A camera with buffered frames must not be waited for")
+
+
+class UnbufferedCamera:
+    def __init__(self):
+        self.num_reads = 0
+
+    def async_read(self, timeout_ms: float = 200):
+        self.num_reads += 1
+        return np.zeros((2, 2, 3))
+
+
+def test_frame_buffer():
+    buffer = FrameBuffer(size=3)
+    assert buffer.latest() is None
+    assert buffer.closest(0.0) is None
+    assert buffer.wait(timeout=0.01) is None
+
+    for ts in [1.0, 2.0, 3.0, 4.0]:
+        buffer.put(np.zeros(1), ts)
+    assert len(buffer) == 3
+    assert buffer.latest().timestamp == 4.0
+    assert buffer.latest().sequence == 3
+    assert buffer.closest(2.4).timestamp == 2.0
+    assert buffer.closest(0.0).timestamp == 2.0
+    assert buffer.wait(after_sequence=2).sequence == 3
+    assert buffer.wait(after_sequence=3, timeout=0.01) is None
+
+    with pytest.raises(ValueError):
+        FrameBuffer(size=0)
+
+
+def test_camera_group_picks_closest_frames():
+    now = time.perf_counter()
+    cameras = {
+        "fast": BufferedCamera([now - 0.09, now - 0.06, now - 0.03, now]),
+        "slow": BufferedCamera([now - 0.1, now - 0.05]),
+        "other": UnbufferedCamera(),
+    }
+    group = CameraGroup(cameras)
+    frames = group.read()
+
+    # The reference is the oldest latest frame, the one of the slow camera
+    assert frames.timestamp == pytest.approx(now - 0.05)
+    assert frames.frames["slow"].timestamp == pytest.approx(now - 0.05)
+    assert frames.frames["fast"].timestamp == pytest.approx(now - 0.06)
+    assert frames.frames["other"].sequence == 0
+    assert set(frames.images) == {"fast", "slow", "other"}
+    assert cameras["other"].num_reads == 1
+    assert group.read().frames["other"].sequence == 1
+
+    frames = group.read(timestamp=now)
+    assert frames.frames["fast"].timestamp == pytest.approx(now)
+    assert frames.frames["slow"].timestamp == pytest.approx(now - 0.05)
+
+
+def test_camera_group_skew():
+    now = time.perf_counter()
+    cameras = {"a": BufferedCamera([now - 0.02]), "b": BufferedCamera([now])}
+    frames = CameraGroup(cameras).read()
+    assert frames.skew_s == pytest.approx(0.02)
+
+
+def test_camera_group_stalled_camera():
+    cameras = {"stalled": BufferedCamera([time.perf_counter() - 1.0])}
+    with pytest.raises(TimeoutError):
+        CameraGroup(cameras).read(timeout_ms=10)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from lerobot.cameras.frame_pool import FramePool
+
+SHAPE = (4, 6, 3)
+
+
+def test_frame_pool_reuses_released_arrays():
+    pool = FramePool(size=3)
+    first = pool.get(SHAPE)
+    first_id = id(first)
+    del first
+    for _ in range(10):
+        frame = pool.get(SHAPE)
+        del frame
+    assert pool.num_allocations == 1
+    assert id(pool.get(SHAPE)) == first_id
+
+
+def test_frame_pool_never_reuses_referenced_arrays():
+    pool = FramePool(size=2)
+    kept = [pool.get(SHAPE) for _ in range(2)]
+    for i, frame in enumerate(kept):
+        frame[:] = i
+    view = kept[0][1:]
+    del kept[0]
+
+    # All the arrays are referenced (the first one through a view), a new one replaces the oldest
+    for _ in range(3):
+        pool.get(SHAPE)[:] = 255
+    assert pool.num_allocations == 3
+    assert (view == 0).all() and (kept[0] == 1).all()
+
+
+def test_frame_pool_shapes_and_dtypes():
+    pool = FramePool(size=2)
+    color = pool.get(SHAPE)
+    depth = pool.get(SHAPE[:2], np.uint16)
+    assert color.shape == SHAPE and color.dtype == np.uint8
+    assert depth.shape == SHAPE[:2] and depth.dtype == np.uint16
+    del color, depth
+    # A released array of another shape is replaced
+    assert pool.get((6, 4, 3)).shape == (6, 4, 3)
+    assert pool.num_allocations == 3
+
+    with pytest.raises(ValueError):
+        FramePool(size=0)
@@ -21,9 +21,11 @@
 
 from pathlib import Path
 
+import cv2
 import numpy as np
 import pytest
 
+from lerobot.cameras import CompressedFrame
 from lerobot.cameras.configs import Cv2Rotation
 from lerobot.cameras.opencv import OpenCVCamera, OpenCVCameraConfig
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
@@ -195,6 +197,30 @@ def test_fourcc_with_camera():
     camera.disconnect()
 
 
+def test_mjpeg_passthrough(monkeypatch):
+    with pytest.raises(ValueError):
+        OpenCVCameraConfig(index_or_path=0, mjpeg_passthrough=True)
+
+    config = OpenCVCameraConfig(index_or_path=0, width=64, height=48, fourcc="MJPG", mjpeg_passthrough=True)
+    camera = OpenCVCamera(config)
+    bgr = np.zeros((48, 64, 3), dtype=np.uint8)
+    bgr[..., 2] = 255  # red
+    _, jpeg = cv2.imencode(".jpg", bgr)
+    # The V4L2 backend returns the undecoded buffer as a single row of bytes
+    monkeypatch.setattr(OpenCVCamera, "is_connected", property(lambda self: True))
+    monkeypatch.setattr(camera, "_grab_and_retrieve", lambda: jpeg.reshape(1, -1))
+
+    frame = camera._read_frame()
+    assert isinstance(frame, CompressedFrame)
+    np.testing.assert_array_equal(frame.jpeg, jpeg.reshape(-1))
+    rgb = frame.decode()
+    assert rgb.shape == (48, 64, 3)
+    assert rgb[..., 0].min() > 240 and rgb[..., 2].max() < 15
+    assert frame.decode() is rgb
+
+    np.testing.assert_array_equal(camera.read(), rgb)
+
+
 @pytest.mark.parametrize("index_or_path", TEST_IMAGE_PATHS, ids=TEST_IMAGE_SIZES)
 @pytest.mark.parametrize(
     "rotation",
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+import time
+import uuid
+
+import numpy as np
+import pytest
+
+from lerobot.cameras.configs import ColorMode
+from lerobot.cameras.shared_memory import (
+    CameraBroker,
+    SharedFrameRing,
+    SharedMemoryCamera,
+    SharedMemoryCameraConfig,
+)
+from lerobot.cameras.shared_memory.shared_frame_ring import shared_memory_name
+from lerobot.utils.errors import DeviceNotConnectedError
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Named shared memory is POSIX only here")
+
+HEIGHT, WIDTH = 12, 16
+
+
+class CountingCamera:
+    """Fake camera whose frames are filled with their index."""
+
+    def __init__(self):
+        self.fps = 100
+        self.color_mode = ColorMode.RGB
+        self.is_connected = True
+        self.index = 0
+
+    def async_read(self, timeout_ms: float = 200):
+        time.sleep(1 / self.fps)
+        self.index += 1
+        frame = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        frame[..., 0] = self.index % 256
+        return frame
+
+
+@pytest.fixture
+def camera_name():
+    return f"test_{uuid.uuid4().hex[:8]}"
+
+
+def test_shared_frame_ring(camera_name):
+    writer = SharedFrameRing.create(
+        shared_memory_name(camera_name), (HEIGHT, WIDTH, 3), ColorMode.BGR, num_slots=3
+    )
+    reader = SharedFrameRing.attach(shared_memory_name(camera_name))
+    assert reader.shape == (HEIGHT, WIDTH, 3) and reader.color_mode == ColorMode.BGR
+    assert reader.read() is None
+
+    for i in range(5):
+        writer.write(np.full((HEIGHT, WIDTH, 3), i, dtype=np.uint8), timestamp=float(i))
+    latest = reader.read()
+    assert latest.sequence == 4 and latest.timestamp == 4.0 and latest.frame.max() == 4
+    assert reader.read(sequence=2).frame.max() == 2
+    assert reader.read(sequence=1) is None  # Overwritten
+    view = reader.read(copy=False).frame
+    assert not view.flags.writeable
+
+    # Other processes read the same frames
+    code = (
+        "from lerobot.cameras.shared_memory import SharedFrameRing;"
+        f"print(SharedFrameRing.attach('{shared_memory_name(camera_name)}').read().frame.max())"
+    )
+    assert subprocess.check_output([sys.executable, "-c", code], text=True).strip() == "4"
+
+    writer.close()
+    assert reader.closed
+    reader.close()
+    with pytest.raises(FileNotFoundError):
+        SharedFrameRing.attach(shared_memory_name(camera_name))
+
+
+def test_broker_and_shared_memory_camera(camera_name):
+    broker = CameraBroker({camera_name: CountingCamera()})
+    broker.start()
+    try:
+        camera = SharedMemoryCamera(SharedMemoryCameraConfig(name=camera_name, width=WIDTH, height=HEIGHT))
+        camera.connect()
+        assert camera.is_connected and camera.fps == 100
+
+        first = camera.async_read()
+        second = camera.read()
+        assert first.shape == (HEIGHT, WIDTH, 3)
+        assert second[0, 0, 0] != first[0, 0, 0]
+        assert camera.read(color_mode=ColorMode.BGR)[0, 0, 2] > 0
+
+        with pytest.raises(RuntimeError):
+            SharedMemoryCamera(SharedMemoryCameraConfig(name=camera_name, width=WIDTH * 2)).connect()
+    finally:
+        broker.stop()
+
+    with pytest.raises(DeviceNotConnectedError):
+        camera.async_read()
+    camera.disconnect()
+
+
+def test_connect_without_broker(camera_name):
+    with pytest.raises(ConnectionError):
+        SharedMemoryCamera(SharedMemoryCameraConfig(name=camera_name)).connect()
@@ -823,3 +823,87 @@ def test_typical_non_rtc_workflow(action_queue_rtc_disabled, sample_actions):
 
     # Should have 10 remaining + 50 new = 60
     assert action_queue_rtc_disabled.qsize() == 60
+
+
+# ====================== Ring Buffer Tests ======================
+
+
+def test_rtc_merges_reuse_buffers(action_queue_rtc_enabled):
+    """Test RTC merges alternate between the halves of the buffers without reallocating them."""
+    chunks = [torch.randn(50, 6) for _ in range(6)]
+    action_queue_rtc_enabled.merge(chunks[0], chunks[0], real_delay=0)
+    buffer_ptr = action_queue_rtc_enabled.queue.untyped_storage().data_ptr()
+
+    for chunk in chunks[1:]:
+        for _ in range(10):
+            action_queue_rtc_enabled.get()
+        leftover = action_queue_rtc_enabled.get_left_over()
+        expected_leftover = leftover.clone()
+
+        action_queue_rtc_enabled.merge(chunk, chunk, real_delay=5)
+
+        # The leftover handed to the policy is not overwritten by the merge
+        assert torch.equal(leftover, expected_leftover)
+        assert action_queue_rtc_enabled.queue.untyped_storage().data_ptr() == buffer_ptr
+        assert action_queue_rtc_enabled.qsize() == 45
+        assert torch.equal(action_queue_rtc_enabled.get(), chunk[5])
+
+
+def test_get_returns_views(action_queue_rtc_enabled, sample_actions):
+    """Test get() returns views of the queue buffers instead of copies."""
+    action_queue_rtc_enabled.merge(sample_actions["original"], sample_actions["processed"], real_delay=0)
+    action = action_queue_rtc_enabled.get()
+    assert action.untyped_storage().data_ptr() == action_queue_rtc_enabled.queue.untyped_storage().data_ptr()
+
+
+def test_append_keeps_order_when_wrapping_and_growing(action_queue_rtc_disabled):
+    """Test appended actions are returned in order when the buffers are compacted or grown."""
+    expected = []
+    next_value = 0
+
+    def merge(length):
+        nonlocal next_value
+        chunk = torch.arange(next_value, next_value + length, dtype=torch.float32)[:, None].repeat(1, 2)
+        next_value += length
+        expected.extend(chunk)
+        action_queue_rtc_disabled.merge(chunk, chunk, real_delay=0)
+
+    received = []
+    for length, num_gets in [(10, 8), (10, 9), (10, 9), (30, 5), (10, 40)]:
+        merge(length)
+        for _ in range(num_gets):
+            action = action_queue_rtc_disabled.get()
+            if action is not None:
+                received.append(action.clone())
+
+    assert len(received) == len(expected) - action_queue_rtc_disabled.qsize()
+    for action, expected_action in zip(received, expected, strict=False):
+        assert torch.equal(action, expected_action)
+
+
+@pytest.mark.parametrize("rtc_enabled", [True, False])
+def test_merges_do_not_overwrite_views_in_use(rtc_enabled):
+    """Test the leftover and the last returned action are kept when actions are consumed before the merge."""
+    generator = torch.Generator().manual_seed(0)
+    queue = ActionQueue(RTCConfig(enabled=rtc_enabled, execution_horizon=10))
+    chunk_size = 20
+    queue.merge(torch.randn(chunk_size, 3), torch.randn(chunk_size, 3), real_delay=0)
+
+    for _ in range(1000):
+        num_gets = torch.randint(0, chunk_size, (1,), generator=generator).item()
+        for _ in range(num_gets):
+            queue.get()
+        leftover = queue.get_left_over()
+        expected_leftover = leftover.clone()
+        delay = torch.randint(0, chunk_size, (1,), generator=generator).item()
+        action = None
+        for _ in range(delay):
+            action = queue.get() if queue.qsize() > 0 else action
+        expected_action = None if action is None else action.clone()
+
+        chunk = torch.randn(chunk_size, 3)
+        queue.merge(chunk, chunk, real_delay=delay)
+
+        assert torch.equal(leftover, expected_leftover)
+        if action is not None:
+            assert torch.equal(action, expected_action)
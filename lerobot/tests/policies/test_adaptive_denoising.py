@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+import torch
+
+from lerobot.policies import adaptive_denoising
+from lerobot.policies.adaptive_denoising import AdaptiveDenoisingScheduler, action_divergence
+
+CPU = torch.device("cpu")
+
+
+def run_call(scheduler, prev_chunk_left_over=None, step_duration=0.0):
+    scheduler.begin(CPU)
+    num_steps = scheduler.select_num_steps(prev_chunk_left_over)
+    time.sleep(step_duration * num_steps)
+    stats = scheduler.end()
+    if scheduler.timed:
+        assert stats.num_steps == num_steps
+    return num_steps
+
+
+def test_action_divergence():
+    assert action_divergence(None) is None
+    assert action_divergence(torch.zeros(1, 3)) is None
+    actions = torch.tensor([[0.0, 0.0], [1.0, 0.0], [1.0, 2.0]])
+    assert action_divergence(actions) == pytest.approx(0.75)
+
+
+def test_max_steps_without_previous_chunk_or_budget():
+    scheduler = AdaptiveDenoisingScheduler(max_num_steps=10, min_num_steps=2, record_stats=True)
+    assert run_call(scheduler) == 10
+    stats = scheduler.last_stats
+    assert stats.divergence is None
+    assert stats.prefix_time_s >= 0 and stats.denoise_time_s >= 0
+
+
+def test_never_synchronizes_without_budget_or_stats(monkeypatch):
+    def fail(device):
+        raise AssertionError("Synchronized with the device")
+
+    monkeypatch.setattr(adaptive_denoising, "_synchronize", fail)
+    scheduler = AdaptiveDenoisingScheduler(max_num_steps=10, min_num_steps=2)
+    scheduler.begin(CPU)
+    assert scheduler.select_num_steps() == 10
+    assert scheduler.end() is None
+    assert scheduler.last_stats is None
+    assert scheduler.step_time is None
+
+
+def test_steps_scale_with_previous_chunk_divergence():
+    scheduler = AdaptiveDenoisingScheduler(max_num_steps=10, min_num_steps=2, divergence_threshold=0.5)
+    still = torch.zeros(20, 4)
+    assert run_call(scheduler, still) == 2
+
+    moving = torch.linspace(0, 10, 20)[:, None].expand(20, 4)
+    assert run_call(scheduler, moving) == 10
+
+    halfway = torch.arange(20.0)[:, None].expand(20, 4) * 0.25
+    assert run_call(scheduler, halfway) == 6
+
+
+def test_steps_capped_by_latency_budget():
+    scheduler = AdaptiveDenoisingScheduler(max_num_steps=10, min_num_steps=2, latency_budget=0.1)
+    # The first call measures the duration of a step
+    assert run_call(scheduler, step_duration=0.02) == 10
+    assert scheduler.step_time == pytest.approx(0.02, abs=0.01)
+    num_steps = run_call(scheduler, step_duration=0.02)
+    assert 2 <= num_steps <= 5
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        AdaptiveDenoisingScheduler(max_num_steps=4, min_num_steps=5)
+    with pytest.raises(ValueError):
+        AdaptiveDenoisingScheduler(max_num_steps=4, latency_budget=0.0)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+from torch import nn
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.act.configuration_act import ACTConfig
+from lerobot.policies.act.modeling_act import ACTPolicy
+from lerobot.policies.diffusion.configuration_diffusion import DiffusionConfig
+from lerobot.policies.diffusion.modeling_diffusion import DiffusionPolicy
+from lerobot.policies.inference_engine import InferenceEngine
+from lerobot.utils.constants import ACTION, OBS_IMAGES, OBS_STATE
+from lerobot.utils.random_utils import seeded_context
+from tests.utils import require_cuda
+
+IMAGE_KEY = f"{OBS_IMAGES}.top"
+STATE_DIM = 3
+ACTION_DIM = 2
+
+
+def make_features():
+    input_features = {
+        OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(STATE_DIM,)),
+        IMAGE_KEY: PolicyFeature(type=FeatureType.VISUAL, shape=(3, 32, 32)),
+    }
+    output_features = {ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(ACTION_DIM,))}
+    return input_features, output_features
+
+
+def make_act_policy(inference_engine: str, device: str = "cpu") -> ACTPolicy:
+    input_features, output_features = make_features()
+    config = ACTConfig(
+        input_features=input_features,
+        output_features=output_features,
+        pretrained_backbone_weights=None,
+        chunk_size=10,
+        n_action_steps=10,
+        dim_model=64,
+        dim_feedforward=128,
+        n_encoder_layers=1,
+        n_vae_encoder_layers=1,
+        inference_engine=inference_engine,
+        device=device,
+    )
+    with seeded_context(0):
+        return ACTPolicy(config).to(device)
+
+
+def make_diffusion_policy(inference_engine: str, device: str = "cpu") -> DiffusionPolicy:
+    input_features, output_features = make_features()
+    config = DiffusionConfig(
+        input_features=input_features,
+        output_features=output_features,
+        crop_shape=None,
+        down_dims=(32, 64),
+        horizon=8,
+        n_action_steps=4,
+        num_inference_steps=10,
+        noise_scheduler_type="DDIM",
+        inference_engine=inference_engine,
+        device=device,
+    )
+    with seeded_context(0):
+        return DiffusionPolicy(config).to(device)
+
+
+def make_batch(seed: int, device: str = "cpu") -> dict[str, torch.Tensor]:
+    generator = torch.Generator().manual_seed(seed)
+    batch = {
+        OBS_STATE: torch.randn(1, STATE_DIM, generator=generator),
+        IMAGE_KEY: torch.rand(1, 3, 32, 32, generator=generator),
+    }
+    return {key: value.to(device) for key, value in batch.items()}
+
+
+def make_noise(seed: int, device: str = "cpu") -> torch.Tensor:
+    generator = torch.Generator().manual_seed(seed)
+    return torch.randn(1, 8, ACTION_DIM, generator=generator).to(device)
+
+
+def test_inference_engine_invalid_engine():
+    with pytest.raises(ValueError, match="Unsupported inference engine"):
+        InferenceEngine(lambda inputs: inputs["x"], nn.Linear(1, 1), engine="tensorrt")
+    with pytest.raises(ValueError, match="inference_engine"):
+        make_act_policy("tensorrt")
+
+
+def test_inference_engine_runs_eagerly_for_training():
+    module = nn.Linear(2, 2)
+    calls = []
+
+    def fn(inputs):
+        calls.append(torch.is_grad_enabled())
+        return module(inputs["x"])
+
+    engine = InferenceEngine(fn, module, engine="cuda_graph")
+    x = torch.randn(1, 2)
+    torch.testing.assert_close(engine({"x": x}), module(x))
+    with torch.no_grad():
+        module.train()
+        torch.testing.assert_close(engine({"x": x}), module(x))
+        # CPU inputs can't be captured into a CUDA graph
+        module.eval()
+        torch.testing.assert_close(engine({"x": x}), module(x))
+    assert len(calls) == 3
+    assert not engine._graphs
+
+
+def test_inference_engine_compile_matches_eager():
+    with seeded_context(0):
+        module = nn.Sequential(nn.Linear(4, 8), nn.ReLU(), nn.Linear(8, 2)).eval()
+    engine = InferenceEngine(lambda inputs: module(inputs["x"]), module, engine="compile")
+    with torch.no_grad():
+        for seed in range(2):
+            x = torch.randn(1, 4, generator=torch.Generator().manual_seed(seed))
+            torch.testing.assert_close(engine({"x": x}), module(x))
+
+
+@pytest.mark.parametrize("make_policy", [make_act_policy, make_diffusion_policy])
+def test_cuda_graph_engine_falls_back_to_eager_on_cpu(make_policy):
+    eager = make_policy("eager")
+    graphed = make_policy("cuda_graph")
+    kwargs = {"noise": make_noise(0)} if isinstance(eager, DiffusionPolicy) else {}
+    batch = make_batch(0)
+    torch.testing.assert_close(
+        graphed.select_action(dict(batch), **kwargs), eager.select_action(dict(batch), **kwargs)
+    )
+
+
+@require_cuda
+@pytest.mark.parametrize("make_policy", [make_act_policy, make_diffusion_policy])
+def test_cuda_graph_engine_matches_eager(make_policy):
+    eager = make_policy("eager", device="cuda")
+    graphed = make_policy("cuda_graph", device="cuda")
+    is_diffusion = isinstance(eager, DiffusionPolicy)
+
+    for seed in range(3):
+        eager.reset()
+        graphed.reset()
+        kwargs = {"noise": make_noise(seed, "cuda")} if is_diffusion else {}
+        batch = make_batch(seed, device="cuda")
+        if is_diffusion:
+            # Fill the observation queues of both policies, the chunk is then predicted from the queues
+            eager.select_action(dict(batch), **kwargs)
+            graphed.select_action(dict(batch), **kwargs)
+            batch[OBS_IMAGES] = batch[IMAGE_KEY].unsqueeze(1)
+        torch.testing.assert_close(
+            graphed.predict_action_chunk(dict(batch), **kwargs),
+            eager.predict_action_chunk(dict(batch), **kwargs),
+            rtol=1e-4,
+            atol=1e-4,
+        )
+    # The graph is captured once and replayed afterwards
+    assert len(graphed._inference_engine._graphs) == 1
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from copy import copy
+
+import numpy as np
+import torch
+
+from lerobot.policies.utils import ObservationStager, PrefixCache, prepare_observation_for_inference
+from lerobot.utils.constants import OBS_IMAGES, OBS_STATE
+from tests.utils import require_cuda
+
+IMAGE_KEY = f"{OBS_IMAGES}.front"
+
+
+def make_observation(seed: int = 0) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        IMAGE_KEY: rng.integers(0, 256, size=(4, 6, 3), dtype=np.uint8),
+        OBS_STATE: rng.standard_normal(3).astype(np.float32),
+    }
+
+
+def assert_observations_close(observation, expected):
+    assert observation.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, torch.Tensor):
+            assert observation[key].device.type == value.device.type
+            torch.testing.assert_close(observation[key], value)
+        else:
+            assert observation[key] == value
+
+
+def test_prepare_observation_for_inference():
+    raw = make_observation()
+    observation = prepare_observation_for_inference(copy(raw), torch.device("cpu"), "task", "robot")
+
+    assert observation[IMAGE_KEY].shape == (1, 3, 4, 6)
+    assert observation[IMAGE_KEY].dtype == torch.float32
+    torch.testing.assert_close(
+        observation[IMAGE_KEY][0], torch.from_numpy(raw[IMAGE_KEY]).permute(2, 0, 1).float() / 255
+    )
+    torch.testing.assert_close(observation[OBS_STATE], torch.from_numpy(raw[OBS_STATE])[None])
+    assert observation["task"] == "task"
+    assert observation["robot_type"] == "robot"
+
+
+def test_stager_matches_unstaged_on_cpu():
+    stager = ObservationStager("cpu")
+    assert not stager.enabled
+
+    raw = make_observation()
+    expected = prepare_observation_for_inference(copy(raw), torch.device("cpu"))
+    observation = prepare_observation_for_inference(copy(raw), torch.device("cpu"), stager=stager)
+    assert_observations_close(observation, expected)
+
+
+@require_cuda
+def test_stager_reuses_pinned_buffers():
+    device = torch.device("cuda")
+    stager = ObservationStager(device)
+    stager.allocate(
+        {
+            IMAGE_KEY: {"dtype": "video", "shape": (4, 6, 3), "names": ["height", "width", "channels"]},
+            OBS_STATE: {"dtype": "float32", "shape": (3,), "names": None},
+        }
+    )
+    buffers = dict(stager._buffers)
+    assert all(buffer.is_pinned() for buffer in buffers.values())
+    assert buffers[IMAGE_KEY].dtype == torch.uint8
+
+    for seed in range(3):
+        raw = make_observation(seed)
+        expected = prepare_observation_for_inference(copy(raw), device)
+        observation = prepare_observation_for_inference(copy(raw), device, stager=stager)
+        assert_observations_close(observation, expected)
+        # Buffers are allocated once and reused
+        assert all(stager._buffers[key] is buffer for key, buffer in buffers.items())
+
+
+def test_prefix_cache_reuses_embeddings_until_weights_change():
+    embedding = torch.nn.Embedding(10, 4)
+    cache = PrefixCache()
+    tokens = torch.tensor([[1, 2, 3]])
+    calls = []
+
+    def embed():
+        calls.append(tokens)
+        return embedding(tokens)
+
+    with torch.no_grad():
+        first = cache.embed("image_start", embedding.weight, embed)
+        assert cache.embed("image_start", embedding.weight, embed) is first
+        assert len(calls) == 1
+
+        # New weights, e.g. after `load_state_dict`
+        embedding.weight.add_(1.0)
+        updated = cache.embed("image_start", embedding.weight, embed)
+        torch.testing.assert_close(updated, embedding(tokens))
+        assert len(calls) == 2
+
+        cache.clear()
+        cache.embed("image_start", embedding.weight, embed)
+        assert len(calls) == 3
+
+    # Not cached when gradients are enabled
+    cache.embed("image_start", embedding.weight, embed)
+    cache.embed("image_start", embedding.weight, embed)
+    assert len(calls) == 5
+
+
+def test_prefix_cache_attention_mask():
+    cache = PrefixCache()
+    mask = cache.attention_mask([0, 0, 1], torch.device("cpu"))
+    assert mask.dtype == torch.bool
+    torch.testing.assert_close(mask, torch.tensor([False, False, True]))
+    assert cache.attention_mask([0, 0, 1], torch.device("cpu")) is mask
+
+    float_mask = cache.attention_mask([0, 0, 1], torch.device("cpu"), torch.float32)
+    torch.testing.assert_close(float_mask, torch.tensor([0.0, 0.0, 1.0]))
@@ -420,6 +420,29 @@ def test_sac_policy_with_discrete_critic():
         )
 
 
+def test_sac_policy_critic_with_importance_sampling_weights():
+    batch_size = 4
+    batch = create_default_train_batch(batch_size=batch_size, action_dim=6, state_dim=6)
+    config = create_default_config(state_dim=6, continuous_action_dim=6)
+    config.num_subsample_critics = None
+
+    policy = SACPolicy(config=config)
+    policy.train()
+
+    with seeded_context(0):
+        critic_output = policy.forward(batch, model="critic")
+    assert critic_output["td_error"].shape == (batch_size,)
+    assert torch.all(critic_output["td_error"] >= 0)
+
+    batch["weights"] = torch.ones(batch_size)
+    with seeded_context(0):
+        weighted_loss = policy.forward(batch, model="critic")["loss_critic"]
+    assert torch.allclose(weighted_loss, critic_output["loss_critic"])
+
+    batch["weights"] = torch.zeros(batch_size)
+    assert policy.forward(batch, model="critic")["loss_critic"].item() == 0.0
+
+
 def test_sac_policy_with_default_entropy():
     config = create_default_config(continuous_action_dim=10, state_dim=10)
     policy = SACPolicy(config=config)
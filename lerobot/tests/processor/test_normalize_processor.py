@@ -2128,3 +2128,84 @@ def test_stats_reconstruction_after_load_state_dict():
         new_result[TransitionKey.OBSERVATION][OBS_STATE],
     )
     torch.testing.assert_close(original_result[TransitionKey.ACTION], new_result[TransitionKey.ACTION])
+
+
+@pytest.mark.parametrize(
+    "norm_mode, stats",
+    [
+        (NormalizationMode.MEAN_STD, {"mean": np.array([0.5, -1.0, 2.0]), "std": np.array([0.2, 0.0, 3.0])}),
+        (NormalizationMode.MIN_MAX, {"min": np.array([-1.0, 0.0, 2.0]), "max": np.array([1.0, 4.0, 2.0])}),
+        (NormalizationMode.QUANTILES, {"q01": np.array([-2.0, 0.1, 1.0]), "q99": np.array([2.0, 0.9, 5.0])}),
+        (NormalizationMode.QUANTILE10, {"q10": np.array([-1.5, 0.2, 0.0]), "q90": np.array([1.5, 0.8, 3.0])}),
+    ],
+)
+def test_affine_matches_reference_formulas(norm_mode, stats):
+    """The precomputed multiply-add matches the textbook (un)normalization formulas."""
+    eps = 1e-8
+    features = {OBS_STATE: PolicyFeature(FeatureType.STATE, (3,))}
+    norm_map = {FeatureType.STATE: norm_mode}
+    normalizer = NormalizerProcessorStep(
+        features=features, norm_map=norm_map, stats={OBS_STATE: stats}, eps=eps
+    )
+    unnormalizer = UnnormalizerProcessorStep(
+        features=features, norm_map=norm_map, stats={OBS_STATE: stats}, eps=eps
+    )
+    assert OBS_STATE in normalizer._affine
+
+    x = torch.randn(4, 3)
+    s = {name: torch.tensor(value, dtype=torch.float32) for name, value in stats.items()}
+    if norm_mode == NormalizationMode.MEAN_STD:
+        expected = (x - s["mean"]) / (s["std"] + eps)
+        expected_inverse = x * s["std"] + s["mean"]
+    else:
+        low, high = (s[name] for name in stats)
+        denom = torch.where(high == low, torch.full_like(low, eps), high - low)
+        expected = 2 * (x - low) / denom - 1
+        expected_inverse = (x + 1) / 2 * denom + low
+
+    out = normalizer(create_transition(observation={OBS_STATE: x}))
+    torch.testing.assert_close(out[TransitionKey.OBSERVATION][OBS_STATE], expected)
+    out = unnormalizer(create_transition(observation={OBS_STATE: x}))
+    torch.testing.assert_close(out[TransitionKey.OBSERVATION][OBS_STATE], expected_inverse)
+
+
+def test_affine_missing_stats_raise_when_used():
+    features = {OBS_STATE: PolicyFeature(FeatureType.STATE, (1,))}
+    norm_map = {FeatureType.STATE: NormalizationMode.MIN_MAX}
+    normalizer = NormalizerProcessorStep(
+        features=features, norm_map=norm_map, stats={OBS_STATE: {"mean": np.array([0.0])}}
+    )
+    assert OBS_STATE not in normalizer._affine
+
+    with pytest.raises(ValueError, match="MIN_MAX normalization mode requires min and max stats"):
+        normalizer(create_transition(observation={OBS_STATE: torch.tensor([1.0])}))
+
+
+def test_affine_recompiled_on_stats_change():
+    features = {OBS_STATE: PolicyFeature(FeatureType.STATE, (1,))}
+    norm_map = {FeatureType.STATE: NormalizationMode.MEAN_STD}
+    normalizer = NormalizerProcessorStep(
+        features=features, norm_map=norm_map, stats={OBS_STATE: {"mean": [1.0], "std": [1.0]}}, eps=0.0
+    )
+    observation = {OBS_STATE: torch.tensor([3.0])}
+
+    # hotswap_stats
+    pipeline = hotswap_stats(DataProcessorPipeline([normalizer]), {OBS_STATE: {"mean": [1.0], "std": [2.0]}})
+    out = pipeline.steps[0](create_transition(observation=observation))
+    torch.testing.assert_close(out[TransitionKey.OBSERVATION][OBS_STATE], torch.tensor([1.0]))
+
+    # load_state_dict
+    normalizer = NormalizerProcessorStep(features=features, norm_map=norm_map, eps=0.0)
+    normalizer.load_state_dict(
+        {f"{OBS_STATE}.mean": torch.tensor([3.0]), f"{OBS_STATE}.std": torch.tensor([1.0])}
+    )
+    out = normalizer(create_transition(observation=observation))
+    torch.testing.assert_close(out[TransitionKey.OBSERVATION][OBS_STATE], torch.tensor([0.0]))
+
+    # to() and automatic dtype adaptation
+    out = normalizer(create_transition(observation={OBS_STATE: torch.tensor([4.0], dtype=torch.float64)}))
+    assert out[TransitionKey.OBSERVATION][OBS_STATE].dtype == torch.float64
+    assert normalizer._affine[OBS_STATE][0].dtype == torch.float64
+    torch.testing.assert_close(
+        out[TransitionKey.OBSERVATION][OBS_STATE], torch.tensor([1.0], dtype=torch.float64)
+    )
@@ -25,13 +25,17 @@ import pytest
 import torch
 import torch.nn as nn
 
-from lerobot.configs.types import FeatureType, PipelineFeatureType, PolicyFeature
+from lerobot.configs.types import FeatureType, NormalizationMode, PipelineFeatureType, PolicyFeature
 from lerobot.datasets.pipeline_features import aggregate_pipeline_dataset_features
 from lerobot.processor import (
+    AddBatchDimensionProcessorStep,
     DataProcessorPipeline,
+    DeviceProcessorStep,
     EnvTransition,
+    NormalizerProcessorStep,
     ProcessorStep,
     ProcessorStepRegistry,
+    RenameObservationsProcessorStep,
     TransitionKey,
 )
 from lerobot.processor.converters import create_transition, identity_transition
@@ -2198,3 +2202,131 @@ def test_initial_camera_not_overridden_by_step_image():
     key = f"{OBS_IMAGES}.front"
     assert key in out
     assert out[key]["shape"] == (240, 320, 3)  # from the step, not from initial
+
+
+def create_fusable_preprocessor() -> DataProcessorPipeline:
+    features = {
+        OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(4,)),
+        f"{OBS_IMAGES}.top": PolicyFeature(type=FeatureType.VISUAL, shape=(3, 8, 8)),
+        ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(2,)),
+    }
+    stats = {
+        OBS_STATE: {"mean": torch.arange(4.0), "std": torch.full((4,), 2.0)},
+        f"{OBS_IMAGES}.top": {"mean": torch.zeros(3, 1, 1), "std": torch.ones(3, 1, 1)},
+        ACTION: {"min": torch.full((2,), -2.0), "max": torch.full((2,), 2.0)},
+    }
+    norm_map = {
+        FeatureType.STATE: NormalizationMode.MEAN_STD,
+        FeatureType.VISUAL: NormalizationMode.IDENTITY,
+        FeatureType.ACTION: NormalizationMode.MIN_MAX,
+    }
+    return DataProcessorPipeline(
+        steps=[
+            RenameObservationsProcessorStep(rename_map={"observation.joints": OBS_STATE}),
+            AddBatchDimensionProcessorStep(),
+            DeviceProcessorStep(device="cpu", float_dtype="float64"),
+            NormalizerProcessorStep(features=features, norm_map=norm_map, stats=stats),
+        ],
+        to_transition=identity_transition,
+        to_output=identity_transition,
+    )
+
+
+def create_fusable_transition() -> EnvTransition:
+    return create_transition(
+        observation={
+            "observation.joints": torch.randn(4),
+            f"{OBS_IMAGES}.top": torch.rand(3, 8, 8),
+            "observation.extra": torch.randn(2),
+        },
+        action=torch.randn(2),
+        reward=torch.tensor(1.0),
+        complementary_data={"task": "pick the cube", "index": torch.tensor(3)},
+        info={"step": 1},
+    )
+
+
+def assert_transitions_close(left: EnvTransition, right: EnvTransition):
+    assert left.keys() == right.keys()
+    for transition_key in left:
+        left_value, right_value = left[transition_key], right[transition_key]
+        if isinstance(left_value, dict):
+            assert list(left_value) == list(right_value)
+            for key in left_value:
+                if isinstance(left_value[key], torch.Tensor):
+                    assert left_value[key].dtype == right_value[key].dtype
+                    assert torch.allclose(left_value[key], right_value[key])
+                else:
+                    assert left_value[key] == right_value[key]
+        elif isinstance(left_value, torch.Tensor):
+            assert left_value.dtype == right_value.dtype
+            assert torch.allclose(left_value, right_value)
+        else:
+            assert left_value == right_value
+
+
+def test_compile_groups_consecutive_fusable_steps():
+    pipeline = create_fusable_preprocessor()
+    pipeline.steps.insert(2, MockStep())
+
+    assert not pipeline.is_compiled
+    assert pipeline.compile() is pipeline
+    assert pipeline.is_compiled
+    assert pipeline._compiled_runs == [(0, 1), (2,), (3, 4)]
+
+
+def test_compiled_pipeline_matches_eager_pipeline():
+    eager = create_fusable_preprocessor()
+    compiled = create_fusable_preprocessor().compile()
+    transition = create_fusable_transition()
+
+    for _ in range(2):  # The second call uses the cached entry plans
+        expected = eager(transition)
+        result = compiled(transition)
+        assert_transitions_close(result, expected)
+
+    assert result[TransitionKey.OBSERVATION][OBS_STATE].shape == (1, 4)
+    assert result[TransitionKey.OBSERVATION][OBS_STATE].dtype == torch.float64
+    assert result[TransitionKey.COMPLEMENTARY_DATA]["task"] == ["pick the cube"]
+    # The input transition is never modified
+    assert "observation.joints" in transition[TransitionKey.OBSERVATION]
+    assert transition[TransitionKey.ACTION].dtype == torch.float32
+    # Untouched dictionaries are not copied
+    assert result[TransitionKey.INFO] is transition[TransitionKey.INFO]
+
+
+def test_compiled_pipeline_runs_steps_one_by_one_with_hooks():
+    pipeline = create_fusable_preprocessor().compile()
+    called_steps = []
+    pipeline.register_after_step_hook(lambda idx, transition: called_steps.append(idx))
+
+    transition = create_fusable_transition()
+    assert_transitions_close(pipeline(transition), create_fusable_preprocessor()(transition))
+    assert called_steps == [0, 1, 2, 3]
+
+
+def test_compiled_pipeline_keeps_step_errors():
+    pipeline = create_fusable_preprocessor().compile()
+
+    with pytest.raises(ValueError, match="requires an observation"):
+        pipeline(create_transition(action=torch.randn(2)))
+
+    with pytest.raises(ValueError, match="PolicyAction"):
+        pipeline(create_transition(observation={OBS_STATE: torch.randn(4)}, action={"x": 1.0}))
+
+
+def test_compile_checks_features():
+    @dataclass
+    class FeatureCheckingStep(ProcessorStep):
+        def __call__(self, transition: EnvTransition) -> EnvTransition:
+            return transition
+
+        def transform_features(self, features):
+            if OBS_STATE not in features[PipelineFeatureType.OBSERVATION]:
+                raise ValueError(f"{OBS_STATE} is required")
+            return features
+
+    pipeline = DataProcessorPipeline([FeatureCheckingStep()])
+    with pytest.raises(ValueError, match="is required"):
+        pipeline.compile({PipelineFeatureType.OBSERVATION: {}, PipelineFeatureType.ACTION: {}})
+    assert not pipeline.is_compiled
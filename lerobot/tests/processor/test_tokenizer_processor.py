@@ -317,6 +317,7 @@ def test_get_config_with_tokenizer_name(mock_auto_tokenizer):
         "padding_side": "right",
         "padding": "longest",
         "truncation": False,
+        "cache_size": 128,
     }
 
     assert config == expected
@@ -344,6 +345,7 @@ def test_get_config_with_tokenizer_object():
         "padding_side": "right",
         "padding": "longest",
         "truncation": False,
+        "cache_size": 128,
     }
 
     assert config == expected
@@ -1038,3 +1040,90 @@ def test_simulated_accelerate_scenario():
     # MockTokenizer squeezes single-item batches, so shape is (max_length,) not (1, max_length)
     assert tokens.shape == (10,)  # MockTokenizer behavior for single string in list
     assert attention_mask.shape == (10,)
+
+
+@require_package("transformers")
+def test_tokenization_cache_reuses_prompts():
+    """Repeated prompts are tokenized once, single and batched lookups share the per-prompt entries."""
+    mock_tokenizer = MockTokenizer(vocab_size=100)
+    processor = TokenizerProcessorStep(tokenizer=mock_tokenizer, max_length=8, cache_size=4)
+
+    with patch.object(processor, "_tokenize_text", wraps=processor._tokenize_text) as tokenize:
+        first = processor(create_transition(observation={}, complementary_data={"task": "pick the cube"}))
+        second = processor(create_transition(observation={}, complementary_data={"task": "pick the cube"}))
+        assert tokenize.call_count == 1
+        torch.testing.assert_close(
+            first[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"],
+            second[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"],
+        )
+
+        batch_task = ["open the door", "pick the cube", "open the door"]
+        batched = processor(create_transition(observation={}, complementary_data={"task": batch_task}))
+        # Only the two distinct prompts of the batch are tokenized, in a single call
+        assert tokenize.call_count == 2
+        assert tokenize.call_args.args[0] == ["open the door", "pick the cube"]
+        processor(create_transition(observation={}, complementary_data={"task": batch_task}))
+        assert tokenize.call_count == 2
+
+    tokens = batched[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"]
+    attention_mask = batched[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.attention_mask"]
+    expected = mock_tokenizer(batch_task, max_length=8)
+    torch.testing.assert_close(tokens, expected["input_ids"])
+    torch.testing.assert_close(attention_mask, expected["attention_mask"].bool())
+
+
+@require_package("transformers")
+def test_tokenization_cache_lru_eviction_and_config_key():
+    mock_tokenizer = MockTokenizer(vocab_size=100)
+    processor = TokenizerProcessorStep(tokenizer=mock_tokenizer, max_length=8, cache_size=2)
+
+    def run(task):
+        return processor(create_transition(observation={}, complementary_data={"task": task}))
+
+    with patch.object(processor, "_tokenize_text", wraps=processor._tokenize_text) as tokenize:
+        run("a")
+        run("b")
+        run("a")  # "a" becomes the most recently used entry
+        run("c")  # evicts "b"
+        assert tokenize.call_count == 3
+        assert len(processor._cache) == 2
+        run("a")
+        assert tokenize.call_count == 3
+        run("b")
+        assert tokenize.call_count == 4
+
+        # Changing the tokenization parameters does not reuse stale entries
+        processor.max_length = 4
+        result = run("b")
+        assert tokenize.call_count == 5
+        assert result[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"].shape == (4,)
+
+        processor.clear_cache()
+        run("b")
+        assert tokenize.call_count == 6
+
+
+@require_package("transformers")
+def test_tokenization_cache_is_keyed_by_tokenizer():
+    tokenizers = [MockTokenizer(vocab_size=100), MockTokenizer(vocab_size=7)]
+    processors = [TokenizerProcessorStep(tokenizer=tokenizer, max_length=8) for tokenizer in tokenizers]
+    # A shallow copy of a step shares its cache, e.g. when the tokenizer of the copy is replaced
+    processors[1]._cache = processors[0]._cache
+
+    for tokenizer, processor in zip(tokenizers, processors, strict=True):
+        for task in ("pick the cube", ["pick the cube", "open the door"]):
+            result = processor(create_transition(observation={}, complementary_data={"task": task}))
+            expected = tokenizer(task if isinstance(task, list) else [task], max_length=8)["input_ids"]
+            tokens = result[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"]
+            torch.testing.assert_close(tokens, expected.reshape(tokens.shape))
+
+
+@require_package("transformers")
+def test_tokenization_cache_returns_copies():
+    processor = TokenizerProcessorStep(tokenizer=MockTokenizer(vocab_size=100), max_length=8)
+    transition = create_transition(observation={}, complementary_data={"task": "pick the cube"})
+
+    first = processor(transition)[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"]
+    first.zero_()
+    second = processor(transition)[TransitionKey.OBSERVATION][f"{OBS_LANGUAGE}.tokens"]
+    assert second.any()
@@ -21,7 +21,7 @@ import pytest
 import torch
 from torch.multiprocessing import Event, Queue
 
-from lerobot.utils.constants import OBS_STR
+from lerobot.utils.constants import ACTION, OBS_IMAGE, OBS_STR
 from lerobot.utils.transition import Transition
 from tests.utils import require_package
 
@@ -104,19 +104,23 @@ def test_establish_learner_connection_failure():
 def test_push_transitions_to_transport_queue():
     from lerobot.rl.actor import push_transitions_to_transport_queue
     from lerobot.transport.utils import bytes_to_transitions
-    from tests.transport.test_transport_utils import assert_transitions_equal
+    from tests.transport.test_transport_utils import assert_transitions_equal, unstack_transitions
 
     """Test pushing transitions to transport queue."""
     # Create mock transitions
     transitions = []
     for i in range(3):
         transition = Transition(
-            state={OBS_STR: torch.randn(3, 64, 64), "state": torch.randn(10)},
+            state={OBS_STR: torch.randn(3, 64, 64), "state": torch.randn(10), OBS_IMAGE: torch.rand(3, 8, 8)},
             action=torch.randn(5),
             reward=torch.tensor(1.0 + i),
             done=torch.tensor(False),
             truncated=torch.tensor(False),
-            next_state={OBS_STR: torch.randn(3, 64, 64), "state": torch.randn(10)},
+            next_state={
+                OBS_STR: torch.randn(3, 64, 64),
+                "state": torch.randn(10),
+                OBS_IMAGE: torch.rand(3, 8, 8),
+            },
             complementary_info={"step": torch.tensor(i)},
         )
         transitions.append(transition)
@@ -129,10 +133,59 @@ def test_push_transitions_to_transport_queue():
     # Verify the data can be retrieved
     serialized_data = transitions_queue.get()
     assert isinstance(serialized_data, bytes)
-    deserialized_transitions = bytes_to_transitions(serialized_data)
+    batch = bytes_to_transitions(serialized_data)
+    # All the transitions are sent as one columnar batch, with uint8 images
+    assert batch[ACTION].shape == (3, 5)
+    assert batch["state"][OBS_IMAGE].dtype == torch.uint8
+    for observations in (batch["state"], batch["next_state"]):
+        observations[OBS_IMAGE] = observations[OBS_IMAGE].float() / 255
+
+    deserialized_transitions = unstack_transitions(batch)
     assert len(deserialized_transitions) == len(transitions)
-    for i, deserialized_transition in enumerate(deserialized_transitions):
-        assert_transitions_equal(deserialized_transition, transitions[i])
+    for deserialized_transition, transition in zip(deserialized_transitions, transitions, strict=True):
+        for observations in ("state", "next_state"):
+            image = deserialized_transition[observations].pop(OBS_IMAGE)
+            expected_image = transition[observations].pop(OBS_IMAGE)
+            assert torch.allclose(image, expected_image, atol=0.5 / 255)
+        assert_transitions_equal(deserialized_transition, transition)
+
+
+@require_package("grpc")
+def test_transitions_with_nan_images_never_reach_the_buffer():
+    from queue import Queue as ThreadQueue
+
+    from lerobot.rl.actor import push_transitions_to_transport_queue
+    from lerobot.rl.buffer import ReplayBuffer
+    from lerobot.rl.learner import process_transitions
+
+    transitions = []
+    for i in range(3):
+        image = torch.rand(3, 8, 8)
+        if i == 1:
+            image[0, 0, 0] = float("nan")
+        transitions.append(
+            Transition(
+                state={"state": torch.randn(10), OBS_IMAGE: image},
+                action=torch.randn(5),
+                reward=torch.tensor(1.0 + i),
+                done=torch.tensor(False),
+                truncated=torch.tensor(False),
+                next_state={"state": torch.randn(10), OBS_IMAGE: torch.rand(3, 8, 8)},
+            )
+        )
+
+    transitions_queue = ThreadQueue()
+    push_transitions_to_transport_queue(transitions, transitions_queue)
+    replay_buffer = ReplayBuffer(10, "cpu", ["state", OBS_IMAGE], use_drq=False)
+    process_transitions(transitions_queue, replay_buffer, None, None, Event())
+
+    # The image quantized on the actor would no longer contain NaN values, the transition is dropped before
+    assert replay_buffer.size == 2
+    assert replay_buffer.rewards[:2].tolist() == [1.0, 3.0]
+
+    # A batch of NaN transitions only is not sent at all
+    push_transitions_to_transport_queue(transitions[1:2], transitions_queue)
+    assert transitions_queue.empty()
 
 
 @require_package("grpc")
@@ -99,7 +99,7 @@ def test_end_to_end_transitions_flow(cfg):
     )
     from lerobot.rl.learner import start_learner
     from lerobot.transport.utils import bytes_to_transitions
-    from tests.transport.test_transport_utils import assert_transitions_equal
+    from tests.transport.test_transport_utils import assert_transitions_equal, unstack_transitions
 
     """Test complete transitions flow from actor to learner."""
     transitions_actor_queue = Queue()
@@ -143,7 +143,9 @@ def test_end_to_end_transitions_flow(cfg):
 
     received_transitions = []
     while not transitions_learner_queue.empty():
-        received_transitions.extend(bytes_to_transitions(transitions_learner_queue.get()))
+        received_transitions.extend(
+            unstack_transitions(bytes_to_transitions(transitions_learner_queue.get()))
+        )
 
     assert len(received_transitions) == len(input_transitions)
     for i, transition in enumerate(received_transitions):
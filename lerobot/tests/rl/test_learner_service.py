@@ -267,6 +267,43 @@ def test_stream_parameters():
     assert time_diff == pytest.approx(seconds_between_pushes, abs=0.1)
 
 
+@require_package("grpc")
+@pytest.mark.timeout(3)  # force cross-platform watchdog
+def test_stream_parameters_keeps_and_resends_keyframes():
+    from lerobot.rl.parameter_sync import DELTA_FLAG, FROZEN_KEYFRAME_FLAG, KEYFRAME_FLAG
+    from lerobot.transport import services_pb2
+
+    shutdown_event = Event()
+    parameters_queue = Queue()
+    transitions_queue = Queue()
+    interactions_queue = Queue()
+    seconds_between_pushes = 0.1
+
+    client, channel, server = create_learner_service_stub(
+        shutdown_event, parameters_queue, transitions_queue, interactions_queue, seconds_between_pushes
+    )
+
+    frozen_keyframe = FROZEN_KEYFRAME_FLAG + b"keyframe_1"
+    keyframe = KEYFRAME_FLAG + b"keyframe_3"
+    for param in [frozen_keyframe, DELTA_FLAG + b"delta_2", keyframe, DELTA_FLAG + b"delta_4"]:
+        parameters_queue.put(param)
+    time.sleep(0.05)
+
+    # The keyframes are sent before the latest update instead of being dropped with the older updates
+    stream = client.StreamParameters(services_pb2.Empty())
+    received_params = [next(stream).data for _ in range(3)]
+    assert received_params == [frozen_keyframe, keyframe, DELTA_FLAG + b"delta_4"]
+    stream.cancel()
+
+    # A new stream (e.g. a restarted actor) first gets the keyframe with the frozen parameters and the last one
+    stream = client.StreamParameters(services_pb2.Empty())
+    assert [next(stream).data, next(stream).data] == [frozen_keyframe, keyframe]
+    stream.cancel()
+
+    shutdown_event.set()
+    close_learner_service_stub(channel, server)
+
+
 @require_package("grpc")
 @pytest.mark.timeout(3)  # force cross-platform watchdog
 def test_stream_parameters_with_shutdown():
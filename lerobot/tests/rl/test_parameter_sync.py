@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from queue import Queue
+
+import pytest
+import torch
+from torch import nn
+
+from lerobot.rl.parameter_sync import (
+    ParameterSyncReceiver,
+    ParameterSyncSender,
+    bytes_to_update,
+    get_last_updates_from_queue,
+    has_frozen_bytes,
+    is_keyframe_bytes,
+    update_to_bytes,
+)
+from lerobot.transport.utils import bytes_to_state_dict, state_to_bytes
+
+
+class TinyActor(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.encoder = nn.Linear(4, 8)
+        self.head = nn.Linear(8, 2)
+        for param in self.encoder.parameters():
+            param.requires_grad = False
+
+
+def make_pair():
+    torch.manual_seed(0)
+    learner = TinyActor()
+    torch.manual_seed(0)
+    actor = TinyActor()
+    return learner, actor
+
+
+def train_step(module: nn.Module):
+    with torch.no_grad():
+        for param in module.head.parameters():
+            param.add_(torch.randn_like(param) * 0.1)
+
+
+def roundtrip(update: dict) -> dict:
+    return bytes_to_state_dict(state_to_bytes(update))
+
+
+def assert_modules_close(left: nn.Module, right: nn.Module, atol: float = 0.0):
+    for (name, left_tensor), right_tensor in zip(
+        left.state_dict().items(), right.state_dict().values(), strict=True
+    ):
+        assert torch.allclose(left_tensor, right_tensor, atol=atol), name
+
+
+def test_first_update_is_full_keyframe():
+    learner, _ = make_pair()
+    sender = ParameterSyncSender()
+
+    update = sender.build_update({"policy": learner})
+
+    assert update["version"] == 1
+    assert update["is_keyframe"]
+    assert update["state_dicts"]["policy"].keys() == learner.state_dict().keys()
+
+
+def test_non_keyframe_only_sends_changed_trainable_tensors():
+    learner, actor = make_pair()
+    sender = ParameterSyncSender(full_sync_interval=10)
+    receiver = ParameterSyncReceiver()
+
+    assert receiver.apply_update(roundtrip(sender.build_update({"policy": learner})), {"policy": actor})
+
+    # Nothing changed: nothing to send
+    update = sender.build_update({"policy": learner})
+    assert not update["is_keyframe"]
+    assert update["state_dicts"]["policy"] == {}
+
+    train_step(learner)
+    update = sender.build_update({"policy": learner})
+    assert set(update["state_dicts"]["policy"]) == {"head.weight", "head.bias"}
+
+    head_weight_ptr = actor.head.weight.data_ptr()
+    assert receiver.apply_update(roundtrip(update), {"policy": actor})
+    assert actor.head.weight.data_ptr() == head_weight_ptr
+    assert_modules_close(learner, actor)
+    assert receiver.version == 3
+
+
+def test_later_keyframes_skip_frozen_parameters():
+    learner, _ = make_pair()
+    sender = ParameterSyncSender(full_sync_interval=2)
+
+    sender.build_update({"policy": learner})
+    sender.build_update({"policy": learner})
+    update = sender.build_update({"policy": learner})
+
+    assert update["is_keyframe"]
+    assert set(update["state_dicts"]["policy"]) == {"head.weight", "head.bias"}
+
+
+@pytest.mark.parametrize("delta_dtype", ["float16", "bfloat16"])
+def test_delta_updates(delta_dtype):
+    learner, actor = make_pair()
+    sender = ParameterSyncSender(delta_dtype=delta_dtype, full_sync_interval=100)
+    receiver = ParameterSyncReceiver()
+    receiver.apply_update(roundtrip(sender.build_update({"policy": learner})), {"policy": actor})
+
+    for _ in range(5):
+        train_step(learner)
+        update = roundtrip(sender.build_update({"policy": learner}))
+        assert update["deltas"]["policy"]["head.weight"].dtype == getattr(torch, delta_dtype)
+        assert receiver.apply_update(update, {"policy": actor})
+
+    # Deltas are relative to the keyframe, so the error does not accumulate over updates
+    assert_modules_close(learner, actor, atol=1e-2)
+
+
+def test_dropped_updates_are_harmless():
+    learner, actor = make_pair()
+    sender = ParameterSyncSender(full_sync_interval=100)
+    receiver = ParameterSyncReceiver()
+    receiver.apply_update(roundtrip(sender.build_update({"policy": learner})), {"policy": actor})
+
+    train_step(learner)
+    sender.build_update({"policy": learner})  # Dropped by the queue
+    train_step(learner)
+    assert receiver.apply_update(roundtrip(sender.build_update({"policy": learner})), {"policy": actor})
+
+    assert_modules_close(learner, actor)
+
+
+def test_missing_keyframe_and_stale_updates_are_skipped():
+    learner, actor = make_pair()
+    sender = ParameterSyncSender(full_sync_interval=2)
+    receiver = ParameterSyncReceiver()
+
+    sender.build_update({"policy": learner})  # Keyframe dropped by the queue
+    train_step(learner)
+    update = roundtrip(sender.build_update({"policy": learner}))
+    assert not receiver.apply_update(update, {"policy": actor})
+
+    keyframe = roundtrip(sender.build_update({"policy": learner}))
+    assert receiver.apply_update(keyframe, {"policy": actor})
+    assert not receiver.apply_update(keyframe, {"policy": actor})
+    assert_modules_close(learner, actor)
+
+
+def test_draining_the_queue_keeps_the_keyframe():
+    learner, actor = make_pair()
+    sender = ParameterSyncSender(full_sync_interval=3)
+    receiver = ParameterSyncReceiver()
+    queue = Queue()
+
+    # Versions 1 to 5, the latest keyframe (version 4) is neither the first nor the last queued update
+    for _ in range(5):
+        train_step(learner)
+        queue.put(update_to_bytes(sender.build_update({"policy": learner})))
+
+    # The first keyframe is kept too, since it is the only one carrying the frozen parameters
+    updates = get_last_updates_from_queue(queue, block=False)
+    assert [is_keyframe_bytes(update) for update in updates] == [True, True, False]
+    assert [has_frozen_bytes(update) for update in updates] == [True, False, False]
+    assert queue.empty()
+    assert all(receiver.apply_update(bytes_to_update(update), {"policy": actor}) for update in updates)
+    assert receiver.version == 5
+    assert_modules_close(learner, actor)
+
+    # The following deltas refer to the kept keyframe
+    train_step(learner)
+    queue.put(update_to_bytes(sender.build_update({"policy": learner})))
+    (update,) = get_last_updates_from_queue(queue, block=False)
+    assert receiver.apply_update(bytes_to_update(update), {"policy": actor})
+    assert_modules_close(learner, actor)
+
+    assert get_last_updates_from_queue(queue, block=False) == []
+
+
+def test_late_actor_receives_frozen_parameters():
+    learner, _ = make_pair()
+    sender = ParameterSyncSender(full_sync_interval=2)
+    updates = []
+    for _ in range(5):
+        train_step(learner)
+        updates.append(roundtrip(sender.build_update({"policy": learner})))
+
+    # An actor connecting later gets the first keyframe, then the latest one
+    torch.manual_seed(1)
+    late_actor = TinyActor()
+    receiver = ParameterSyncReceiver()
+    assert updates[0]["has_frozen"]
+    assert receiver.apply_update(updates[0], {"policy": late_actor})
+    assert receiver.apply_update(updates[4], {"policy": late_actor})
+    assert_modules_close(learner, late_actor)
+
+    # The first keyframe is stale for an actor that is already up to date
+    assert not receiver.apply_update(updates[0], {"policy": late_actor})
+    assert_modules_close(learner, late_actor)
+
+
+def test_keyframes_of_a_restarted_learner_are_applied():
+    learner, actor = make_pair()
+    sender = ParameterSyncSender(full_sync_interval=2)
+    receiver = ParameterSyncReceiver()
+    for _ in range(5):
+        train_step(learner)
+        receiver.apply_update(roundtrip(sender.build_update({"policy": learner})), {"policy": actor})
+    assert receiver.version == 5
+
+    # The restarted learner starts over from version 1, in a new session
+    restarted = ParameterSyncSender(full_sync_interval=2)
+    train_step(learner)
+    assert receiver.apply_update(roundtrip(restarted.build_update({"policy": learner})), {"policy": actor})
+    train_step(learner)
+    assert receiver.apply_update(roundtrip(restarted.build_update({"policy": learner})), {"policy": actor})
+    assert receiver.version == 2
+    assert_modules_close(learner, actor)
+
+    # A delta of the old session can not be applied on the keyframe of the new one
+    train_step(learner)
+    assert not receiver.apply_update(roundtrip(sender.build_update({"policy": learner})), {"policy": actor})
+
+
+def test_invalid_sender_arguments():
+    with pytest.raises(ValueError):
+        ParameterSyncSender(delta_dtype="int8")
+    with pytest.raises(ValueError):
+        ParameterSyncSender(full_sync_interval=0)
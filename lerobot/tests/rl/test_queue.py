@@ -20,7 +20,7 @@ from queue import Queue
 
 from torch.multiprocessing import Queue as TorchMPQueue
 
-from lerobot.rl.queue import get_last_item_from_queue
+from lerobot.rl.queue import get_all_items_from_queue, get_last_item_from_queue
 
 
 def test_get_last_item_single_item():
@@ -164,3 +164,15 @@ def test_get_last_item_blocking_waits_for_item():
 
     assert result == ["item2"]
     assert queue.empty()
+
+
+def test_get_all_items_from_queue():
+    queue = TorchMPQueue()
+    items = ["first", "second", "last"]
+    for item in items:
+        queue.put(item)
+    time.sleep(0.1)  # Let the feeder thread flush the items
+
+    assert get_all_items_from_queue(queue) == items
+    assert get_all_items_from_queue(queue, block=True, timeout=0.01) == []
+    assert get_all_items_from_queue(queue, block=False) == []
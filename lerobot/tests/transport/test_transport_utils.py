@@ -22,7 +22,7 @@ import pytest
 import torch
 
 from lerobot.utils.constants import ACTION
-from lerobot.utils.transition import Transition
+from lerobot.utils.transition import BatchedTransitions, Transition
 from tests.utils import require_cuda, require_package
 
 
@@ -519,6 +519,27 @@ def assert_transitions_equal(t1: Transition, t2: Transition):
     assert_observation_equal(t1["next_state"], t2["next_state"])
 
 
+def unstack_transitions(batch: BatchedTransitions) -> list[Transition]:
+    """Split stacked transitions back into a list of transitions (inverse of `stack_transitions`)."""
+    transitions = []
+    for i in range(batch[ACTION].shape[0]):
+        complementary_info = None
+        if batch.get("complementary_info") is not None:
+            complementary_info = {key: value[i] for key, value in batch["complementary_info"].items()}
+        transitions.append(
+            Transition(
+                state={key: value[i] for key, value in batch["state"].items()},
+                action=batch[ACTION][i],
+                reward=batch["reward"][i],
+                next_state={key: value[i] for key, value in batch["next_state"].items()},
+                done=batch["done"][i],
+                truncated=batch["truncated"][i],
+                complementary_info=complementary_info,
+            )
+        )
+    return transitions
+
+
 @require_package("grpc")
 def assert_observation_equal(o1: dict, o2: dict):
     """Helper to assert two observations are equal."""
@@ -551,6 +572,43 @@ def test_transitions_to_bytes_multiple_transitions():
         assert_transitions_equal(original, reconstructed_item)
 
 
+@require_package("grpc")
+def test_batched_transitions_to_bytes():
+    from lerobot.transport.utils import bytes_to_transitions, transitions_to_bytes
+    from lerobot.utils.transition import stack_transitions
+
+    """Test converting transitions stacked in a columnar batch."""
+    transitions = []
+    for i in range(5):
+        transition = Transition(
+            state={"data": torch.randn(10)},
+            action=torch.randn(3),
+            reward=float(i),
+            done=i == 4,
+            truncated=False,
+            next_state={"data": torch.randn(10)},
+            complementary_info={"discrete_penalty": torch.tensor([0.5 * i]), "episode_id": 1},
+        )
+        transitions.append(transition)
+
+    batch = stack_transitions(transitions)
+    assert batch["state"]["data"].shape == (5, 10)
+    assert batch["complementary_info"]["discrete_penalty"].shape == (5, 1)
+
+    reconstructed = unstack_transitions(bytes_to_transitions(transitions_to_bytes(batch)))
+
+    assert len(reconstructed) == len(transitions)
+    for original, reconstructed_item in zip(transitions, reconstructed, strict=True):
+        assert_observation_equal(original["state"], reconstructed_item["state"])
+        assert torch.equal(original[ACTION], reconstructed_item[ACTION])
+        assert reconstructed_item["reward"].item() == original["reward"]
+        assert reconstructed_item["done"].item() == original["done"]
+        assert torch.equal(
+            original["complementary_info"]["discrete_penalty"],
+            reconstructed_item["complementary_info"]["discrete_penalty"],
+        )
+
+
 @require_package("grpc")
 def test_receive_bytes_in_chunks_unknown_state():
     from lerobot.transport.utils import receive_bytes_in_chunks
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import torch
+
+from lerobot.policies.rtc.configuration_rtc import RTCConfig
+from lerobot.utils.constants import OBS_STATE
+from lerobot.utils.inference_worker import AsyncInferenceWorker
+
+CHUNK_SIZE = 5
+ACTION_DIM = 2
+
+
+class DummyChunkPolicy:
+    """Returns chunks whose actions count the chunks and steps: chunk * 100 + step."""
+
+    def __init__(self, latency_s: float = 0.0, fail: bool = False):
+        self.config = SimpleNamespace()
+        self.latency_s = latency_s
+        self.fail = fail
+        self.num_chunks = 0
+        self.num_resets = 0
+        self.kwargs = []
+        self.thread_names = set()
+
+    def reset(self):
+        self.num_resets += 1
+
+    def predict_action_chunk(self, batch, **kwargs):
+        self.thread_names.add(threading.current_thread().name)
+        self.kwargs.append(kwargs)
+        if self.fail:
+            raise ValueError("inference failed")
+        time.sleep(self.latency_s)
+        assert batch[OBS_STATE].shape == (1, ACTION_DIM)
+        steps = torch.arange(CHUNK_SIZE, dtype=torch.float32) + self.num_chunks * 100
+        self.num_chunks += 1
+        return steps[None, :, None].expand(1, CHUNK_SIZE, ACTION_DIM).clone()
+
+
+class StepPolicy(DummyChunkPolicy):
+    """Plans the actions of the steps following the step number passed as observation state."""
+
+    def predict_action_chunk(self, batch, **kwargs):
+        self.thread_names.add(threading.current_thread().name)
+        self.kwargs.append(kwargs)
+        step = batch[OBS_STATE][0, 0].item()
+        time.sleep(self.latency_s)
+        self.num_chunks += 1
+        steps = torch.arange(CHUNK_SIZE, dtype=torch.float32) + step
+        return steps[None, :, None].expand(1, CHUNK_SIZE, ACTION_DIM).clone()
+
+
+class IdentityProcessor:
+    def __init__(self):
+        self.num_resets = 0
+
+    def __call__(self, data):
+        return data
+
+    def reset(self):
+        self.num_resets += 1
+
+
+def make_worker(policy, **kwargs):
+    return AsyncInferenceWorker(
+        policy=policy,
+        preprocessor=IdentityProcessor(),
+        postprocessor=IdentityProcessor(),
+        device=torch.device("cpu"),
+        fps=30,
+        **kwargs,
+    )
+
+
+def observation(step: int = 0):
+    return {OBS_STATE: np.full(ACTION_DIM, step, dtype=np.float32)}
+
+
+@pytest.mark.parametrize("queue_threshold", [0, 2, None])
+def test_worker_appends_actions_at_their_planned_steps(queue_threshold):
+    policy = StepPolicy(latency_s=0.01)
+    worker = make_worker(policy, queue_threshold=queue_threshold)
+    worker.start()
+    try:
+        worker.reset()
+        actions = []
+        for step in range(4 * CHUNK_SIZE):
+            worker.submit_observation(observation(step))
+            actions.append(worker.get_action(timeout=5.0)[0].item())
+            time.sleep(0.005)
+    finally:
+        worker.stop()
+
+    # RTC is disabled by default: chunks are appended without the actions planned for steps already covered
+    # by the queue, so every action is executed at its planned step and none is skipped or repeated
+    assert actions == [float(step) for step in range(4 * CHUNK_SIZE)]
+    assert policy.num_chunks > 1
+    assert policy.thread_names == {"AsyncInferenceWorker"}
+    assert policy.num_resets == 1
+    assert all(kwargs == {} for kwargs in policy.kwargs)
+
+
+def test_worker_waits_for_queue_threshold():
+    policy = DummyChunkPolicy()
+    worker = make_worker(policy, queue_threshold=0)
+    worker.start()
+    try:
+        worker.submit_observation(observation())
+        assert worker.get_action(timeout=5.0) is not None
+        # The queue still holds actions, new observations must not trigger inference
+        for _ in range(CHUNK_SIZE - 2):
+            worker.submit_observation(observation())
+            assert worker.get_action(timeout=5.0) is not None
+        assert policy.num_chunks == 1
+        assert worker.action_queue.qsize() == 1
+    finally:
+        worker.stop()
+
+
+def test_worker_rtc_replaces_queue_and_passes_leftovers():
+    policy = DummyChunkPolicy(latency_s=0.05)
+    worker = make_worker(
+        policy,
+        rtc_config=RTCConfig(enabled=True, execution_horizon=2),
+        queue_threshold=3,
+        num_warmup_inferences=0,
+    )
+    worker.start()
+    try:
+        worker.submit_observation(observation())
+        first = worker.get_action(timeout=5.0)
+        assert first is not None
+        worker.submit_observation(observation())
+        deadline = time.perf_counter() + 5.0
+        while policy.num_chunks < 2 and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        assert policy.num_chunks == 2
+    finally:
+        worker.stop()
+
+    assert policy.kwargs[0]["prev_chunk_left_over"] is None
+    assert policy.kwargs[1]["inference_delay"] >= 1
+    # The first chunk was trimmed by its inference delay, the unconsumed remainder is passed to the policy
+    leftover = policy.kwargs[1]["prev_chunk_left_over"]
+    assert leftover.shape[1] == ACTION_DIM
+    assert 0 < len(leftover) < CHUNK_SIZE
+
+
+def test_worker_latency_estimate_ignores_warmup_and_old_outliers():
+    worker = make_worker(DummyChunkPolicy(), num_warmup_inferences=1, latency_window=10)
+    # A slow warmup inference (e.g. torch.compile) and a slow inference that falls out of the window
+    for latency in [2.0, 1.0] + [0.01] * 10:
+        worker._record_latency(latency)
+
+    assert worker.inference_steps() == 1
+    assert worker._queue_threshold() == 2
+
+
+def test_worker_reset_drops_queued_actions():
+    policy = DummyChunkPolicy()
+    worker = make_worker(policy)
+    worker.start()
+    try:
+        worker.submit_observation(observation())
+        assert worker.get_action(timeout=5.0)[0].item() == 0.0
+        worker.reset()
+        assert worker.action_queue.empty()
+        worker.submit_observation(observation())
+        assert worker.get_action(timeout=5.0)[0].item() == 100.0
+    finally:
+        worker.stop()
+
+    assert policy.num_resets == 1
+    assert worker.preprocessor.num_resets == 1
+    assert worker.postprocessor.num_resets == 1
+
+
+def test_worker_get_action_timeout():
+    worker = make_worker(DummyChunkPolicy())
+    worker.start()
+    try:
+        assert worker.get_action(timeout=0.05) is None
+    finally:
+        worker.stop()
+    assert not worker.is_running
+
+
+def test_worker_get_action_raises_once_stopped():
+    worker = make_worker(DummyChunkPolicy())
+    worker.start()
+    worker.stop()
+    with pytest.raises(RuntimeError, match="not running"):
+        worker.get_action()
+
+
+def test_worker_error_is_raised_in_control_loop():
+    worker = make_worker(DummyChunkPolicy(fail=True))
+    worker.start()
+    try:
+        worker.submit_observation(observation())
+        with pytest.raises(RuntimeError, match="AsyncInferenceWorker failed"):
+            worker.get_action(timeout=5.0)
+    finally:
+        worker.stop()
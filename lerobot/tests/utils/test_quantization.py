@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+import torch
+from torch import nn
+
+from lerobot.configs.types import FeatureType, PolicyFeature
+from lerobot.policies.act.configuration_act import ACTConfig
+from lerobot.policies.act.modeling_act import ACTPolicy
+from lerobot.utils import quantization
+from lerobot.utils.constants import ACTION, OBS_ENV_STATE, OBS_STATE
+from lerobot.utils.quantization import (
+    load_quantized_model,
+    quantize_for_inference,
+    quantized_model_file,
+    save_quantized_model,
+)
+
+
+def make_act_config(**kwargs) -> ACTConfig:
+    return ACTConfig(
+        input_features={
+            OBS_STATE: PolicyFeature(type=FeatureType.STATE, shape=(6,)),
+            OBS_ENV_STATE: PolicyFeature(type=FeatureType.ENV, shape=(4,)),
+        },
+        output_features={ACTION: PolicyFeature(type=FeatureType.ACTION, shape=(6,))},
+        device="cpu",
+        chunk_size=10,
+        n_action_steps=10,
+        **kwargs,
+    )
+
+
+def count_quantized_linears(module: nn.Module) -> int:
+    return sum(isinstance(m, torch.ao.nn.quantized.dynamic.Linear) for m in module.modules())
+
+
+def test_quantize_for_inference():
+    model = nn.Sequential(nn.Linear(8, 16), nn.ReLU(), nn.Linear(16, 4)).to(torch.bfloat16)
+    reference = nn.Sequential(nn.Linear(8, 16), nn.ReLU(), nn.Linear(16, 4))
+    reference.load_state_dict({k: v.float() for k, v in model.state_dict().items()})
+
+    quantize_for_inference(model, "int8")
+    assert count_quantized_linears(model) == 2
+    x = torch.randn(4, 8)
+    torch.testing.assert_close(model(x), reference(x), atol=0.05, rtol=0.05)
+
+    with pytest.raises(ValueError):
+        quantize_for_inference(reference, "int4")
+
+
+@pytest.fixture
+def quantized_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "quantized"
+    monkeypatch.setattr(quantization, "HF_LEROBOT_QUANTIZED", cache_dir)
+    return cache_dir
+
+
+def test_quantized_model_file(tmp_path, quantized_cache_dir, monkeypatch):
+    model_file = tmp_path / "snapshots" / "rev" / "model.safetensors"
+    quantized_file = quantized_model_file(model_file, "int8")
+    assert quantized_file.parent == quantized_cache_dir
+    assert quantized_file.name.endswith(".int8.pt")
+    assert quantized_model_file(model_file, "int8", tmp_path) == tmp_path / quantized_file.name
+
+    # Keyed by the checkpoint (i.e. the repo and revision on the Hub) and by the torch version
+    assert (
+        quantized_model_file(tmp_path / "snapshots" / "other" / "model.safetensors", "int8") != quantized_file
+    )
+    monkeypatch.setattr(torch, "__version__", "0.0.0")
+    assert quantized_model_file(model_file, "int8") != quantized_file
+
+
+def test_quantized_cache_round_trip(tmp_path, quantized_cache_dir):
+    model_file = tmp_path / "model.safetensors"
+    model_file.write_bytes(b"float weights")
+    quantized_file = quantized_model_file(model_file, "int8")
+
+    model = nn.Sequential(nn.Linear(8, 4))
+    assert not load_quantized_model(nn.Sequential(nn.Linear(8, 4)), quantized_file, model_file, "int8")
+    quantize_for_inference(model, "int8")
+    save_quantized_model(model, quantized_file, model_file)
+
+    loaded = nn.Sequential(nn.Linear(8, 4))
+    assert load_quantized_model(loaded, quantized_file, model_file, "int8")
+    x = torch.randn(2, 8)
+    torch.testing.assert_close(loaded(x), model(x))
+
+    # A new float checkpoint invalidates the cache
+    model_file.write_bytes(b"new float weights")
+    assert not load_quantized_model(nn.Sequential(nn.Linear(8, 4)), quantized_file, model_file, "int8")
+
+
+def test_from_pretrained_quantized(tmp_path, quantized_cache_dir):
+    policy = ACTPolicy(make_act_config())
+    policy.save_pretrained(tmp_path)
+    batch = {OBS_STATE: torch.randn(1, 6), OBS_ENV_STATE: torch.randn(1, 4)}
+    with torch.inference_mode():
+        expected = policy.eval().predict_action_chunk(batch)
+
+    config = make_act_config(inference_quantization="int8")
+    quantized = ACTPolicy.from_pretrained(tmp_path, config=config)
+    assert count_quantized_linears(quantized) > 0
+    cache_file = quantized_model_file(tmp_path / "model.safetensors", "int8")
+    assert cache_file.is_file()
+    # Nothing is written next to the checkpoint
+    assert not list(tmp_path.glob("*.pt"))
+    cache_mtime = os.stat(cache_file).st_mtime_ns
+
+    # The second load uses the cached quantized weights
+    cached = ACTPolicy.from_pretrained(tmp_path, config=config)
+    assert os.stat(cache_file).st_mtime_ns == cache_mtime
+    with torch.inference_mode():
+        actions = quantized.predict_action_chunk(batch)
+        torch.testing.assert_close(cached.predict_action_chunk(batch), actions)
+    torch.testing.assert_close(actions, expected, atol=0.1, rtol=0.1)
+
+
+def test_from_pretrained_quantized_without_writable_cache(tmp_path, monkeypatch):
+    policy = ACTPolicy(make_act_config())
+    policy.save_pretrained(tmp_path / "checkpoint")
+    # The cache dir cannot be created under a file
+    (tmp_path / "file").write_bytes(b"")
+    monkeypatch.setattr(quantization, "HF_LEROBOT_QUANTIZED", tmp_path / "file" / "quantized")
+
+    config = make_act_config(inference_quantization="int8")
+    quantized = ACTPolicy.from_pretrained(tmp_path / "checkpoint", config=config)
+    assert count_quantized_linears(quantized) > 0
+    assert not list(tmp_path.rglob("*.pt"))
+
+
+def test_inference_quantization_config():
+    with pytest.raises(ValueError):
+        make_act_config(inference_quantization="int4")
+    assert make_act_config(inference_quantization="int8").inference_quantization == "int8"
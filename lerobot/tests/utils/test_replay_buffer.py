@@ -15,15 +15,24 @@
 # limitations under the License.
 
 import sys
+import threading
 from collections.abc import Callable
 
 import pytest
 import torch
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
-from lerobot.rl.buffer import BatchTransition, ReplayBuffer, random_crop_vectorized
+from lerobot.rl.buffer import (
+    BatchTransition,
+    ReplayBuffer,
+    SumTree,
+    concatenate_batch_transitions,
+    random_crop_vectorized,
+)
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, OBS_STATE, OBS_STR, REWARD
+from lerobot.utils.transition import quantize_transition_images, stack_transitions
 from tests.fixtures.constants import DUMMY_REPO_ID
+from tests.utils import require_cuda
 
 
 def state_dims() -> list[str]:
@@ -583,6 +592,384 @@ def test_check_image_augmentations_with_drq_and_default_image_augmentation_funct
     assert sampled_transitions["next_state"][OBS_IMAGE].shape == (1, 3, 84, 84)
 
 
+def create_uint8_image_replay_buffer(
+    optimize_memory: bool = False, device: str = "cpu", pin_memory: bool = False
+) -> ReplayBuffer:
+    return ReplayBuffer(
+        10,
+        device,
+        state_dims(),
+        optimize_memory=optimize_memory,
+        use_drq=False,
+        storage_dtypes={OBS_IMAGE: torch.uint8},
+        pin_memory=pin_memory,
+    )
+
+
+def create_quantized_state() -> dict:
+    return {
+        OBS_IMAGE: torch.randint(0, 256, (3, 84, 84)).float() / 255,
+        OBS_STATE: torch.randn(10),
+    }
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_uint8_image_storage(optimize_memory):
+    replay_buffer = create_uint8_image_replay_buffer(optimize_memory=optimize_memory)
+    state = create_quantized_state()
+    next_state = create_quantized_state()
+    replay_buffer.add(state, create_dummy_action(), 1.0, next_state, False, False)
+    replay_buffer.add(next_state, create_dummy_action(), 1.0, next_state, True, True)
+
+    assert replay_buffer.states[OBS_IMAGE].dtype == torch.uint8
+    assert replay_buffer.states[OBS_STATE].dtype == torch.float32
+
+    batch = replay_buffer.sample(1)
+    assert batch["state"][OBS_IMAGE].dtype == torch.float32
+    assert batch["next_state"][OBS_IMAGE].dtype == torch.float32
+    # Images in [0, 1] coming from 8-bit cameras are stored without loss
+    assert torch.allclose(batch["state"][OBS_IMAGE][0], state[OBS_IMAGE]) or torch.allclose(
+        batch["state"][OBS_IMAGE][0], next_state[OBS_IMAGE]
+    )
+    assert torch.allclose(batch["next_state"][OBS_IMAGE][0], next_state[OBS_IMAGE])
+
+
+def test_uint8_image_storage_memory():
+    replay_buffer = create_empty_replay_buffer()
+    uint8_replay_buffer = create_uint8_image_replay_buffer()
+    for buffer in (replay_buffer, uint8_replay_buffer):
+        state = create_quantized_state()
+        buffer.add(state, create_dummy_action(), 1.0, state, False, False)
+
+    image_bytes = get_tensor_memory_consumption(replay_buffer.states[OBS_IMAGE])
+    uint8_image_bytes = get_tensor_memory_consumption(uint8_replay_buffer.states[OBS_IMAGE])
+    assert uint8_image_bytes * 4 == image_bytes
+
+
+def test_pin_memory_is_ignored_without_cuda_device():
+    replay_buffer = create_uint8_image_replay_buffer(pin_memory=True)
+    assert not replay_buffer.pin_memory
+
+
+@require_cuda
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_pinned_staging_sample(optimize_memory):
+    replay_buffer = create_uint8_image_replay_buffer(
+        optimize_memory=optimize_memory, device="cuda", pin_memory=True
+    )
+    state = create_quantized_state()
+    for _ in range(5):
+        replay_buffer.add(state, create_dummy_action(), 1.0, state, False, False)
+
+    for _ in range(3):
+        batch = replay_buffer.sample(4)
+        assert batch["state"][OBS_IMAGE].device.type == "cuda"
+        assert torch.allclose(batch["state"][OBS_IMAGE].cpu(), state[OBS_IMAGE].expand(4, -1, -1, -1))
+        assert torch.allclose(batch["next_state"][OBS_STATE].cpu(), state[OBS_STATE].expand(4, -1))
+    assert replay_buffer._staging[OBS_IMAGE].is_pinned()
+
+
+def assert_buffers_equal(left: ReplayBuffer, right: ReplayBuffer):
+    assert left.capacity == right.capacity
+    assert left.position == right.position
+    assert len(left) == len(right)
+    for key in left.states:
+        assert left.states[key].dtype == right.states[key].dtype
+        assert torch.equal(left.states[key][: len(left)], right.states[key][: len(right)])
+        assert torch.equal(left.next_states[key][: len(left)], right.next_states[key][: len(right)])
+    assert torch.equal(left.actions[: len(left)], right.actions[: len(right)])
+    assert torch.equal(left.rewards[: len(left)], right.rewards[: len(right)])
+    assert torch.equal(left.dones[: len(left)], right.dones[: len(right)])
+    assert torch.equal(left.truncateds[: len(left)], right.truncateds[: len(right)])
+    assert left.complementary_info_keys == right.complementary_info_keys
+    for key in left.complementary_info_keys:
+        assert torch.equal(
+            left.complementary_info[key][: len(left)], right.complementary_info[key][: len(right)]
+        )
+
+
+def test_save_snapshot_with_empty_buffer(replay_buffer, tmp_path):
+    with pytest.raises(ValueError, match="The replay buffer is empty"):
+        replay_buffer.save_snapshot(tmp_path / "snapshot")
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+def test_snapshot_roundtrip(tmp_path, optimize_memory):
+    replay_buffer = ReplayBuffer(
+        10,
+        "cpu",
+        state_dims(),
+        optimize_memory=optimize_memory,
+        use_drq=False,
+        storage_dtypes={OBS_IMAGE: torch.uint8},
+    )
+    for i in range(4):
+        state = create_quantized_state()
+        replay_buffer.add(
+            state,
+            create_dummy_action(),
+            float(i),
+            state,
+            i == 3,
+            i == 3,
+            complementary_info={"discrete_penalty": torch.tensor([0.5 * i])},
+        )
+
+    replay_buffer.save_snapshot(tmp_path / "snapshot")
+    restored = ReplayBuffer.from_snapshot(tmp_path / "snapshot", device="cpu", use_drq=False)
+
+    assert_buffers_equal(replay_buffer, restored)
+    assert restored.optimize_memory == optimize_memory
+    assert restored.sample(2)["state"][OBS_IMAGE].dtype == torch.float32
+
+
+def test_snapshot_of_full_buffer_can_be_extended(tmp_path):
+    replay_buffer = create_empty_replay_buffer()
+    for _ in range(13):
+        state = create_dummy_state()
+        replay_buffer.add(state, create_dummy_action(), 1.0, state, False, False)
+
+    replay_buffer.save_snapshot(tmp_path / "snapshot")
+    restored = ReplayBuffer.from_snapshot(tmp_path / "snapshot", device="cpu", use_drq=False)
+    assert_buffers_equal(replay_buffer, restored)
+
+    # New transitions are written in memory and never modify the snapshot on disk
+    state = create_dummy_state()
+    action = create_dummy_action()
+    for buffer in (replay_buffer, restored):
+        buffer.add(state, action, 2.0, state, True, True)
+    assert torch.equal(restored.states[OBS_IMAGE][3], state[OBS_IMAGE])
+
+    reopened = ReplayBuffer.from_snapshot(tmp_path / "snapshot", device="cpu", use_drq=False)
+    assert reopened.position == 3
+    assert not torch.equal(reopened.states[OBS_IMAGE][3], state[OBS_IMAGE])
+
+    # Saving over an existing snapshot replaces it
+    restored.save_snapshot(tmp_path / "snapshot")
+    reopened = ReplayBuffer.from_snapshot(tmp_path / "snapshot", device="cpu", use_drq=False)
+    assert_buffers_equal(replay_buffer, reopened)
+
+
+def create_transitions(num_transitions: int) -> list[dict]:
+    transitions = []
+    for i in range(num_transitions):
+        state = create_dummy_state()
+        transitions.append(
+            {
+                "state": state,
+                ACTION: create_dummy_action(),
+                "reward": float(i),
+                "next_state": create_dummy_state(),
+                "done": i == num_transitions - 1,
+                "truncated": False,
+                "complementary_info": {"discrete_penalty": torch.tensor([0.5 * i])},
+            }
+        )
+    return transitions
+
+
+@pytest.mark.parametrize("optimize_memory", [False, True])
+@pytest.mark.parametrize("num_transitions", [3, 8, 25])
+def test_add_batch_matches_add(optimize_memory, num_transitions):
+    # Start at position 7 so that batches wrap around the end of the buffer
+    buffer = create_empty_replay_buffer(optimize_memory=optimize_memory)
+    batch_buffer = create_empty_replay_buffer(optimize_memory=optimize_memory)
+    for transition in create_transitions(7):
+        buffer.add(**transition)
+        batch_buffer.add(**transition)
+
+    transitions = create_transitions(num_transitions)
+    for transition in transitions:
+        buffer.add(**transition)
+    batch_buffer.add_batch(**stack_transitions(transitions))
+
+    assert batch_buffer.position == buffer.position
+    assert batch_buffer.size == buffer.size
+    assert_buffers_equal(buffer, batch_buffer)
+
+
+def test_add_batch_to_empty_buffer_with_uint8_images():
+    buffer = ReplayBuffer(10, "cpu", state_dims(), use_drq=False, storage_dtypes={OBS_IMAGE: torch.uint8})
+    float_buffer = create_empty_replay_buffer()
+    transitions = []
+    for _ in range(4):
+        state = create_quantized_state()
+        transitions.append(
+            {
+                "state": state,
+                ACTION: create_dummy_action(),
+                "reward": 1.0,
+                "next_state": state,
+                "done": False,
+                "truncated": False,
+            }
+        )
+    batch = quantize_transition_images(stack_transitions(transitions))
+    assert batch["state"][OBS_IMAGE].dtype == torch.uint8
+
+    buffer.add_batch(**batch)
+    float_buffer.add_batch(**batch)
+
+    assert len(buffer) == len(float_buffer) == 4
+    for i, transition in enumerate(transitions):
+        assert torch.equal(buffer.states[OBS_IMAGE][i].float() / 255, transition["state"][OBS_IMAGE])
+        assert torch.allclose(float_buffer.states[OBS_IMAGE][i], transition["state"][OBS_IMAGE])
+
+
+def test_add_batch_sets_priorities():
+    replay_buffer = ReplayBuffer(
+        10, "cpu", state_dims(), use_drq=False, prioritized=True, optimize_memory=True
+    )
+    replay_buffer.add_batch(**stack_transitions(create_transitions(4)))
+
+    # The newest transition can't be sampled before its next state is stored
+    assert replay_buffer.sum_tree.leaves[:4].tolist() == [1.0, 1.0, 1.0, 0.0]
+    replay_buffer.add_batch(**stack_transitions(create_transitions(2)))
+    assert replay_buffer.sum_tree.leaves[:6].tolist() == [1.0, 1.0, 1.0, 1.0, 1.0, 0.0]
+
+
+def create_prioritized_replay_buffer(capacity: int = 10, optimize_memory: bool = False) -> ReplayBuffer:
+    replay_buffer = ReplayBuffer(
+        capacity,
+        "cpu",
+        state_dims(),
+        optimize_memory=optimize_memory,
+        use_drq=False,
+        prioritized=True,
+        priority_alpha=1.0,
+        priority_eps=0.0,
+    )
+    for _ in range(capacity):
+        state = create_dummy_state()
+        replay_buffer.add(state, create_dummy_action(), 1.0, state, False, False)
+    return replay_buffer
+
+
+def test_sum_tree_update_and_find():
+    tree = SumTree(5)
+    tree.update(torch.arange(5), torch.tensor([1.0, 0.0, 2.0, 3.0, 4.0]))
+    assert tree.total == pytest.approx(10.0)
+
+    values = torch.tensor([0.0, 0.99, 1.0, 2.99, 3.0, 5.99, 6.0, 9.99])
+    assert tree.find(values).tolist() == [0, 0, 2, 2, 3, 3, 4, 4]
+
+    tree.update(torch.tensor([4]), torch.tensor([0.0]))
+    assert tree.total == pytest.approx(6.0)
+    # Values at the upper bound never land on an empty slot
+    assert tree.find(torch.tensor([6.0])).tolist() == [3]
+
+
+def test_update_priorities_requires_prioritized_buffer(replay_buffer):
+    with pytest.raises(RuntimeError):
+        replay_buffer.update_priorities(torch.tensor([0]), torch.tensor([1.0]))
+
+
+def test_prioritized_sample_contains_indices_and_weights():
+    replay_buffer = create_prioritized_replay_buffer()
+    batch = replay_buffer.sample(4)
+
+    assert batch["indices"].shape == (4,)
+    assert batch["weights"].shape == (4,)
+    # All transitions start with the same priority
+    assert torch.allclose(batch["weights"], torch.ones(4))
+    assert "indices" not in create_buffer_with_transitions().sample(2)
+
+
+def create_buffer_with_transitions(num_transitions: int = 2) -> ReplayBuffer:
+    replay_buffer = create_empty_replay_buffer()
+    for _ in range(num_transitions):
+        state = create_dummy_state()
+        replay_buffer.add(state, create_dummy_action(), 1.0, state, False, False)
+    return replay_buffer
+
+
+def test_prioritized_sampling_follows_priorities():
+    torch.manual_seed(0)
+    replay_buffer = create_prioritized_replay_buffer()
+    td_errors = torch.zeros(10)
+    td_errors[2] = 1.0
+    td_errors[7] = 3.0
+    replay_buffer.update_priorities(torch.arange(10), td_errors)
+
+    indices = torch.cat([replay_buffer.sample(8)["indices"] for _ in range(100)])
+    assert set(indices.tolist()) == {2, 7}
+    assert (indices == 7).float().mean().item() == pytest.approx(0.75, abs=0.05)
+
+    # Rarely sampled transitions get the largest importance-sampling weights
+    batch = replay_buffer.sample(8)
+    weights = batch["weights"][batch["indices"] == 2]
+    assert torch.all(batch["weights"] <= 1.0)
+    assert torch.allclose(weights, torch.ones_like(weights))
+
+
+def test_prioritized_sampling_skips_newest_transition_with_memory_optimization():
+    replay_buffer = create_prioritized_replay_buffer(capacity=4, optimize_memory=True)
+    newest = (replay_buffer.position - 1) % replay_buffer.capacity
+
+    indices = torch.cat([replay_buffer.sample(4)["indices"] for _ in range(50)])
+    assert newest not in indices.tolist()
+
+
+def test_prioritized_sampling_is_consistent_with_concurrent_updates():
+    replay_buffer = create_prioritized_replay_buffer(capacity=64)
+    even, odd = torch.arange(0, 64, 2), torch.arange(1, 64, 2)
+    stop = threading.Event()
+
+    def learner():
+        # Alternate between the even and the odd slots, the others having a zero priority
+        while not stop.is_set():
+            for nonzero, zero in ((even, odd), (odd, even)):
+                replay_buffer.sum_tree.update(nonzero, torch.ones(32))
+                replay_buffer.sum_tree.update(zero, torch.zeros(32))
+
+    thread = threading.Thread(target=learner, daemon=True)
+    thread.start()
+    try:
+        # Both configurations give the same probability to the sampled slots, so the weights are all one
+        # unless a sample lands on a zero priority slot of a partially updated tree
+        for _ in range(300):
+            _, weights = replay_buffer._sample_prioritized_indices(16)
+            assert torch.allclose(weights, torch.ones_like(weights))
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_concatenate_prioritized_batch_transitions():
+    prioritized_batch = create_prioritized_replay_buffer().sample(3)
+    uniform_batch = create_buffer_with_transitions().sample(2)
+
+    batch = concatenate_batch_transitions(prioritized_batch, uniform_batch)
+    assert batch["weights"].shape == (5,)
+    assert torch.equal(batch["weights"][3:], torch.ones(2))
+    assert "indices" not in batch
+
+
+def test_concatenate_uniform_and_prioritized_batch_transitions():
+    uniform_batch = create_buffer_with_transitions().sample(2)
+    prioritized_batch = create_prioritized_replay_buffer().sample(3)
+    prioritized_weights = prioritized_batch["weights"].clone()
+
+    batch = concatenate_batch_transitions(uniform_batch, prioritized_batch)
+    assert batch["reward"].shape == (5,)
+    assert batch["weights"].shape == (5,)
+    assert torch.equal(batch["weights"][:2], torch.ones(2))
+    assert torch.equal(batch["weights"][2:], prioritized_weights)
+    assert "indices" not in batch
+
+
+def test_snapshot_restores_priorities(tmp_path):
+    replay_buffer = create_prioritized_replay_buffer()
+    replay_buffer.update_priorities(torch.tensor([1, 4]), torch.tensor([5.0, 0.5]))
+
+    replay_buffer.save_snapshot(tmp_path / "snapshot")
+    restored = ReplayBuffer.from_snapshot(
+        tmp_path / "snapshot", device="cpu", use_drq=False, prioritized=True
+    )
+    assert torch.equal(restored.sum_tree.leaves, replay_buffer.sum_tree.leaves)
+    assert restored.max_priority == replay_buffer.max_priority
+
+
 def test_random_crop_vectorized_basic():
     # Create a batch of 2 images with known patterns
     batch_size, channels, height, width = 2, 3, 10, 8
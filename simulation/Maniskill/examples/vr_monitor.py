@@ -170,11 +170,7 @@ class VRMonitor:
         self.vr_server = None
         self.https_server = None
         self.is_running = False
-        self.latest_goal = None  # Store the latest goal
-        self.left_goal = None    # 分别保存左右控制器的goal
-        self.right_goal = None
-        self.headset_goal = None  # 添加头部goal
-        self._goal_lock = threading.Lock()  # 添加线程锁
+        self.goals = None  # 由VR服务器的最新goal邮箱提供
     
     def initialize(self):
         """初始化VR监控器"""
@@ -195,16 +191,14 @@ class VRMonitor:
         self.config.enable_keyboard = False
         self.config.enable_https = True  # 启用HTTPS服务器，VR需要网页界面
         
-        # 创建命令队列
-        self.command_queue = asyncio.Queue()
-        
         # 创建VR服务器（print-only模式）
         try:
             self.vr_server = VRWebSocketServer(
-                command_queue=self.command_queue,
+                command_queue=None,  # 不使用命令队列，goal从邮箱读取
                 config=self.config,
-                print_only=False  # 改为False，让数据发送到队列
+                print_only=False  # 改为False，让数据发送到邮箱
             )
+            self.goals = self.vr_server.goals
         except Exception as e:
             print(f"❌ Failed to create VR WebSocket server: {e}")
             return False
@@ -258,33 +252,11 @@ class VRMonitor:
             await self.stop_monitoring()
     
     async def monitor_commands(self):
-        """监控来自VR控制器的命令"""
+        """保持运行直到停止，goal由VR服务器写入邮箱"""
         print("📊 Monitoring VR control commands...")
         
         while self.is_running:
-            try:
-                # 等待命令，超时1秒
-                goal = await asyncio.wait_for(self.command_queue.get(), timeout=1.0)
-                
-                # 根据arm分别保存goal
-                with self._goal_lock:
-                    if goal.arm == "left":
-                        self.left_goal = goal
-                    elif goal.arm == "right":
-                        self.right_goal = goal
-                    elif goal.arm == "headset":  # 添加头部数据处理
-                        self.headset_goal = goal
-                    
-                    # 保持向后兼容，保存最新的goal
-                    self.latest_goal = goal
-                
-            except asyncio.TimeoutError:
-                # 超时，继续循环
-                continue
-            except Exception as e:
-                print(f"❌ Error processing command: {e}")
-                import traceback
-                print(f"Traceback: {traceback.format_exc()}")
+            await asyncio.sleep(1.0)
     
     def print_control_goal(self, goal):
         """打印控制目标信息"""
@@ -317,29 +289,36 @@ class VRMonitor:
     def get_latest_goal_nowait(self, arm=None):
         """Return the latest VR control goal if available, else None.
         
+        Goals carry their `sequence` number and `age` in seconds. Gripper toggles,
+        resets and idle goals are events, read them with `get_goal_events`.
+        
         Args:
-            arm: If specified ("left" or "right"), return that arm's goal.
-                 If None, return a dict containing both left and right goals.
+            arm: If specified ("left", "right" or "headset"), return that arm's goal.
+                 If None, return a dict containing the left, right and headset goals.
         """
-        with self._goal_lock:
-            if arm == "left":
-                return self.left_goal
-            elif arm == "right":
-                return self.right_goal
-            elif arm == "headset":  # 添加头部数据获取
-                return self.headset_goal
-            else:
-                # 返回包含左右两个控制器的字典
-                dual_goals = {
-                    "left": self.left_goal,
-                    "right": self.right_goal,
-                    "headset": self.headset_goal,  # 添加头部数据
-                    "has_left": self.left_goal is not None,
-                    "has_right": self.right_goal is not None,
-                    "has_headset": self.headset_goal is not None  # 添加头部状态
-                }
-                
-                return dual_goals
+        def latest(name):
+            return self.goals.latest(name) if self.goals is not None else None
+        
+        if arm is not None:
+            return latest(arm)
+        
+        left_goal = latest("left")
+        right_goal = latest("right")
+        headset_goal = latest("headset")
+        return {
+            "left": left_goal,
+            "right": right_goal,
+            "headset": headset_goal,
+            "has_left": left_goal is not None,
+            "has_right": right_goal is not None,
+            "has_headset": headset_goal is not None
+        }
+    
+    def get_goal_events(self, arm=None):
+        """Consume the event goals (gripper toggles, resets, idle) of an arm or of all arms, oldest first."""
+        if self.goals is None:
+            return []
+        return self.goals.pop_events(arm)
     
     def get_left_goal_nowait(self):
         """Return the latest left arm goal if available, else None."""
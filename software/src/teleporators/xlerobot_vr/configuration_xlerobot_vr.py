@@ -14,12 +14,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from ..config import TeleoperatorConfig
 
 
+@dataclass
+class VRGoalFilterConfig:
+    """One-Euro filter and extrapolation of the VR goals of a device (see `xlevr.inputs.goal_filter`).
+
+    Lower `min_cutoff` (Hz) smooths more at rest, higher `beta` lags less on fast motions, and the goals
+    are extrapolated along their filtered velocity by at most `max_prediction_s` (0 to disable).
+    """
+
+    min_cutoff: float = 1.0
+    beta: float = 0.5
+    d_cutoff: float = 1.0
+    max_prediction_s: float = 0.05
+
+
 @TeleoperatorConfig.register_subclass("xlerobot_vr")
 @dataclass
 class XLerobotVRTeleopConfig(TeleoperatorConfig):
@@ -31,6 +45,13 @@ class XLerobotVRTeleopConfig(TeleoperatorConfig):
     vr_data_timeout: float = 5.0  
 
     kp : float = 1.0 
+
+    # Jitter filtering and latency compensation of the VR goals, per arm
+    vr_goal_filter: bool = True
+    left_arm_filter: VRGoalFilterConfig = field(default_factory=VRGoalFilterConfig)
+    right_arm_filter: VRGoalFilterConfig = field(default_factory=VRGoalFilterConfig)
+    # Delay between `get_action` and the execution of the action by the robot, the goals are extrapolated to it
+    vr_command_latency_s: float = 0.0
     
 
     xlevr_path: Optional[str] = "/your_local_DIR/XLeRobot/XLeVR" # need to be modified
@@ -26,6 +26,7 @@ import sys
 import threading
 import time
 import traceback
+from dataclasses import asdict
 from queue import Queue
 from typing import Any, Dict, Optional
 
@@ -435,6 +436,9 @@ class XLerobotVRTeleop(Teleoperator):
         
         # New: VR event handler
         self.vr_event_handler = None
+
+        # Jitter filtering and latency compensation of the VR goals, created on connect
+        self.goal_filter = None
                     
         # Kinematics instances
         self.kin_left = SO101Kinematics()
@@ -526,6 +530,15 @@ class XLerobotVRTeleop(Teleoperator):
             if not init_success:
                 raise Exception("VR monitor initialization timeout")
                 
+            if self.config.vr_goal_filter:
+                # Importable once the VR monitor has set up the XLeVR path
+                from xlevr.inputs.goal_filter import GoalFilter
+
+                self.goal_filter = GoalFilter({
+                    "left": asdict(self.config.left_arm_filter),
+                    "right": asdict(self.config.right_arm_filter),
+                })
+                
             logger.info("🚀 Starting VR monitoring...")
             self.vr_thread = threading.Thread(
                 target=lambda: asyncio.run(self.vr_monitor.start_monitoring()), 
@@ -602,9 +615,19 @@ class XLerobotVRTeleop(Teleoperator):
                 self.logs["read_pos_dt_s"] = time.perf_counter() - before_read_t
                 return action
                 
+            # Smooth the goals and extrapolate them to the execution of the action
+            if self.goal_filter is not None:
+                command_time = time.monotonic() + self.config.vr_command_latency_s
+                dual_goals = self.goal_filter(dual_goals, command_time)
+                
             left_goal = dual_goals.get("left")
             right_goal = dual_goals.get("right")
             
+            # The VR monitor keeps only the latest goals, log how old they are
+            goal_ages = [goal.age for goal in (left_goal, right_goal) if goal is not None]
+            if goal_ages:
+                self.logs["vr_goal_age_s"] = max(goal_ages)
+            
         except Exception as e:
             logger.warning(f"VR data acquisition failed: {e}")
             self.logs["read_pos_dt_s"] = time.perf_counter() - before_read_t
@@ -75,26 +75,40 @@ export function RobotVideoCanvas({
   useEffect(() => {
     if (!socket) return;
 
-    const handleVideoFrame = (data: any) => {
+    // The server sends the next frame once this one is acknowledged, so a slow client skips frames instead of lagging
+    const handleVideoFrame = (data: any, ack?: () => void) => {
       const canvas = canvasRef.current;
-      if (!canvas) return;
-
-      const ctx = canvas.getContext('2d');
-      if (!ctx) return;
+      const ctx = canvas?.getContext('2d');
+      if (!canvas || !ctx || !data.frame) {
+        ack?.();
+        return;
+      }
 
       const dpr = window.devicePixelRatio || 1;
       const logicalWidth = canvas.width / dpr;
       const logicalHeight = canvas.height / dpr;
+      const format = data.format || ENV.VIDEO_FORMAT;
 
-      if (data.frame) {
-        const img = new Image();
-        img.onload = () => {
-          ctx.clearRect(0, 0, logicalWidth, logicalHeight);
-          ctx.drawImage(img, 0, 0, logicalWidth, logicalHeight);
-          drawVideoOverlays(ctx, logicalWidth, logicalHeight);
-        };
-        img.src = `data:image/${ENV.VIDEO_FORMAT};base64,${data.frame}`;
-      }
+      // Frames are raw binary attachments, base64 strings are still accepted
+      const isBinary = typeof data.frame !== 'string';
+      const src = isBinary
+        ? URL.createObjectURL(new Blob([data.frame], { type: `image/${format}` }))
+        : `data:image/${format};base64,${data.frame}`;
+
+      const release = () => {
+        if (isBinary) URL.revokeObjectURL(src);
+        ack?.();
+      };
+
+      const img = new Image();
+      img.onload = () => {
+        ctx.clearRect(0, 0, logicalWidth, logicalHeight);
+        ctx.drawImage(img, 0, 0, logicalWidth, logicalHeight);
+        drawVideoOverlays(ctx, logicalWidth, logicalHeight);
+        release();
+      };
+      img.onerror = release;
+      img.src = src;
     };
 
     socket.on('video_frame', handleVideoFrame);
@@ -1,5 +1,4 @@
 import asyncio
-import base64
 from typing import TYPE_CHECKING, Optional
 
 import numpy as np
@@ -8,43 +7,165 @@ if TYPE_CHECKING:
     from core.remote_core import RemoteCore
 
 
+# Sequence of the fallback test frame, remote frames are numbered from 1
+FALLBACK_SEQUENCE = 0
+
+
+class ClientVideoSender:
+    """Sends frames to one client, keeping only the latest unsent frame.
+
+    A new frame replaces the pending one instead of queuing behind it, and the next
+    frame is only sent once the client acknowledged the previous one (or after
+    `ack_timeout`), so a slow client gets fewer frames instead of a growing lag.
+    """
+
+    def __init__(self, socket_io, sid: str, ack_timeout: float = 1.0) -> None:
+        self.socket_io = socket_io
+        self.sid = sid
+        self.ack_timeout = ack_timeout
+        self.pending: Optional[dict] = None
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self._new_frame = asyncio.Event()
+        self.task = asyncio.create_task(self._run())
+
+    def push(self, payload: dict) -> None:
+        if self.pending is not None:
+            self.frames_dropped += 1
+        self.pending = payload
+        self._new_frame.set()
+
+    def close(self) -> None:
+        if not self.task.done():
+            self.task.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await self._new_frame.wait()
+                self._new_frame.clear()
+                payload, self.pending = self.pending, None
+                if payload is None:
+                    continue
+
+                acked = loop.create_future()
+
+                def on_ack(*_args) -> None:
+                    if not acked.done():
+                        acked.set_result(None)
+
+                await self.socket_io.emit('video_frame', payload, to=self.sid, callback=on_ack)
+                self.frames_sent += 1
+                try:
+                    await asyncio.wait_for(acked, self.ack_timeout)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            pass
+        except Exception as exc:
+            print(f"Stream error for client {self.sid}: {exc}")
+
+
+class VideoBroadcaster:
+    """Streams the frames of one camera to all its subscribed clients.
+
+    A single task polls the camera and builds the payload of each new frame once, with
+    the JPEG bytes as a binary attachment, then hands it to the sender of every client.
+    Frames that did not change since the last broadcast are not sent again.
+    """
+
+    def __init__(self, manager: 'VideoStreamManager', camera_id: str) -> None:
+        self.manager = manager
+        self.camera_id = camera_id
+        self.senders: dict[str, ClientVideoSender] = {}
+        self.latest_payload: Optional[dict] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def subscribe(self, socket_io, sid: str) -> None:
+        self.unsubscribe(sid)
+        sender = ClientVideoSender(socket_io, sid)
+        self.senders[sid] = sender
+        # New viewers get the current frame right away, even if it does not change
+        if self.latest_payload is not None:
+            sender.push(self.latest_payload)
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+    def unsubscribe(self, sid: str) -> bool:
+        sender = self.senders.pop(sid, None)
+        if sender is None:
+            return False
+
+        sender.close()
+        print(f"Cancelled video stream for client {sid} (camera {self.camera_id})")
+        if not self.senders and self.task is not None:
+            self.task.cancel()
+            self.task = None
+        return True
+
+    async def _run(self) -> None:
+        print(f"Starting video broadcast for camera {self.camera_id}")
+        try:
+            while self.senders:
+                last_sequence = self.latest_payload['sequence'] if self.latest_payload else None
+                payload = await self.manager.get_frame(self.camera_id, last_sequence)
+                if payload is not None:
+                    self.latest_payload = payload
+                    for sender in list(self.senders.values()):
+                        sender.push(payload)
+
+                await asyncio.sleep(self.manager.frame_interval)
+        except asyncio.CancelledError:
+            pass
+        except Exception as exc:
+            print(f"Broadcast error for camera {self.camera_id}: {exc}")
+        finally:
+            print(f"Video broadcast ended for camera {self.camera_id}")
+
+
 class VideoStreamManager:
 
     def __init__(self) -> None:
         self.streaming = False
         self.frame_rate = 30
         self.frame_interval = 1.0 / self.frame_rate
-        self.stream_tasks: dict[str, asyncio.Task] = {}
+        self.broadcasters: dict[str, VideoBroadcaster] = {}
         self.remote_core: Optional['RemoteCore'] = None
+        self._fallback_frame: Optional[bytes] = None
 
     def attach_remote_core(self, remote_core: 'RemoteCore') -> None:
         self.remote_core = remote_core
 
-    async def start_stream(self) -> dict:
+    async def start_stream(self, socket_io, sid: str, camera_id: str = 'main') -> dict:
+        broadcaster = self.broadcasters.get(camera_id)
+        if broadcaster is None:
+            broadcaster = self.broadcasters[camera_id] = VideoBroadcaster(self, camera_id)
+        broadcaster.subscribe(socket_io, sid)
+
         if not self.streaming:
             self.streaming = True
             print("Video stream started")
-        return {'status': 'streaming_started'}
+        return {'status': 'streaming_started', 'camera_id': camera_id}
 
     async def stop_stream(self, sid: Optional[str] = None) -> dict:
-        self.streaming = False
-
-        if sid and sid in self.stream_tasks:
-            task = self.stream_tasks.pop(sid)
-            if not task.cancelled():
-                task.cancel()
-                print(f"Cancelled video stream task for client {sid}")
-        elif sid is None:
-            for client_sid, task in list(self.stream_tasks.items()):
-                if not task.cancelled():
-                    task.cancel()
-                    print(f"Cancelled video stream task for client {client_sid}")
-            self.stream_tasks.clear()
-
-        print("Video stream stopped")
+        for broadcaster in self.broadcasters.values():
+            if sid is None:
+                for client_sid in list(broadcaster.senders):
+                    broadcaster.unsubscribe(client_sid)
+            else:
+                broadcaster.unsubscribe(sid)
+
+        if self.streaming and not any(b.senders for b in self.broadcasters.values()):
+            self.streaming = False
+            print("Video stream stopped")
         return {'status': 'streaming_stopped'}
 
-    def _generate_fallback_frame(self) -> Optional[str]:
+    def _generate_fallback_frame(self) -> Optional[bytes]:
+        if self._fallback_frame is not None:
+            return self._fallback_frame
+
         try:
             import cv2
         except ImportError:
@@ -55,57 +176,42 @@ class VideoStreamManager:
         if not success:
             return None
 
-        return base64.b64encode(buffer).decode('utf-8')
-
-    async def get_frame(self) -> Optional[dict]:
-        frame_base64 = None
-        source = 'test'
+        self._fallback_frame = buffer.tobytes()
+        return self._fallback_frame
 
+    async def get_frame(self, camera_id: str = 'main', last_sequence: Optional[int] = None) -> Optional[dict]:
+        """Builds the payload of the latest frame of a camera, or None if it is the `last_sequence` one."""
+        record = None
         if self.remote_core and self.remote_core.connected:
             try:
-                frame_base64 = await self.remote_core.get_camera_frame_base64()
-                if frame_base64:
-                    source = self.remote_core.config.robot_type.lower()
+                record = await self.remote_core.get_latest_camera_frame(camera_id)
             except Exception as exc:
                 print(f"Error getting frame from remote core: {exc}")
 
-        if not frame_base64:
-            frame_base64 = self._generate_fallback_frame()
-            if frame_base64:
-                source = 'test_jpeg'
+        if record:
+            frame, sequence = record['frame'], record['sequence']
+            width, height = record['width'], record['height']
+            source = self.remote_core.config.robot_type.lower()
+        else:
+            frame, sequence = self._generate_fallback_frame(), FALLBACK_SEQUENCE
+            width, height = 640, 480
+            source = 'test_jpeg'
 
-        if not frame_base64:
+        if frame is None or sequence == last_sequence:
             return None
 
         loop = asyncio.get_running_loop()
         return {
-            'frame': frame_base64,
-            'width': 640,
-            'height': 480,
+            'frame': frame,
+            'format': 'jpeg',
+            'camera_id': camera_id,
+            'sequence': sequence,
+            'width': width,
+            'height': height,
             'channels': 3,
             'timestamp': loop.time(),
             'source': source
         }
 
-    async def stream_frames(self, socket_io, sid: str) -> None:
-        print(f"Starting video stream for client {sid}")
-        try:
-            while self.streaming:
-                if asyncio.current_task().cancelled():
-                    break
-
-                frame_data = await self.get_frame()
-                if frame_data:
-                    await socket_io.emit('video_frame', frame_data, to=sid)
-
-                await asyncio.sleep(self.frame_interval)
-        except asyncio.CancelledError:
-            pass
-        except Exception as exc:
-            print(f"Stream error for client {sid}: {exc}")
-        finally:
-            self.stream_tasks.pop(sid, None)
-            print(f"Video stream ended for client {sid}")
-
 
 video_manager = VideoStreamManager()
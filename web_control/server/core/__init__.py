@@ -8,6 +8,6 @@ This module provides the core components for the simplified architecture:
 """
 
 from .config import ServerConfig
-from .protocol import RobotProtocol
+from .protocol import BinaryRobotProtocol, RobotProtocol
 
-__all__ = ['ServerConfig', 'RobotProtocol']
\ No newline at end of file
+__all__ = ['ServerConfig', 'RobotProtocol', 'BinaryRobotProtocol']
\ No newline at end of file
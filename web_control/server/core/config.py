@@ -26,6 +26,7 @@ class ServerConfig:
     robot_host: str = "localhost" # IP of robot host program
     robot_port_cmd: int = 5555    # Command channel port
     robot_port_data: int = 5556   # Data/observation channel port
+    robot_protocol: str = "binary"  # binary|json, binary is used only if the host supports it
 
     # Video Settings - for camera streams
     video_width: int = 640
@@ -62,6 +63,7 @@ class ServerConfig:
             robot_host=os.getenv('ROBOT_HOST', 'localhost'),
             robot_port_cmd=int(os.getenv('ROBOT_PORT_CMD', '5555')),
             robot_port_data=int(os.getenv('ROBOT_PORT_DATA', '5556')),
+            robot_protocol=os.getenv('ROBOT_PROTOCOL', 'binary'),
 
             # Video Settings
             video_width=int(os.getenv('VIDEO_WIDTH', '640')),
@@ -104,6 +106,10 @@ class ServerConfig:
         if not (1 <= self.robot_port_data <= 65535):
             raise ValueError(f"Invalid robot_port_data: {self.robot_port_data}. Must be between 1-65535")
 
+        valid_protocols = ['binary', 'json']
+        if self.robot_protocol not in valid_protocols:
+            raise ValueError(f"Invalid robot_protocol: {self.robot_protocol}. Must be one of {valid_protocols}")
+
         if not (1 <= self.video_quality <= 100):
             raise ValueError(f"Invalid video_quality: {self.video_quality}. Must be between 1-100")
 
@@ -124,7 +130,7 @@ class ServerConfig:
             f"ServerConfig(\n"
             f"  robot_type={self.robot_type}\n"
             f"  ui_server={self.ui_host}:{self.ui_port}\n"
-            f"  robot_host={self.robot_host}:{self.robot_port_cmd}/{self.robot_port_data}\n"
+            f"  robot_host={self.robot_host}:{self.robot_port_cmd}/{self.robot_port_data} ({self.robot_protocol})\n"
             f"  video={self.video_width}x{self.video_height}@{self.video_fps}fps\n"
             f")"
         )
\ No newline at end of file
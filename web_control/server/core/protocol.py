@@ -7,10 +7,35 @@ for communication between the remote core and robot hosts.
 
 import json
 import base64
+import struct
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence, Union
 from enum import Enum
 
+import numpy as np
+
+
+# JSON messages are kept for debugging and for hosts that do not support the binary framing
+JSON_PROTOCOL_VERSION = 0
+BINARY_PROTOCOL_VERSION = 1
+SUPPORTED_PROTOCOL_VERSIONS = [JSON_PROTOCOL_VERSION, BINARY_PROTOCOL_VERSION]
+
+# Binary messages are ZMQ multipart messages: a fixed header frame followed by payload frames
+BINARY_MAGIC = b'RP'
+# magic, protocol version, message kind, message type code, timestamp
+BINARY_HEADER = struct.Struct('<2sBBBd')
+KIND_COMMAND = 0
+KIND_RESPONSE = 1
+
+# Fixed layouts of the frequent messages, other messages carry their data as a JSON frame
+MOVE_STRUCT = struct.Struct('<16sf')  # direction, speed
+ARM_JOINT_STRUCT = struct.Struct('<8sBf')  # arm, joint index, angle
+CAMERA_STRUCT = struct.Struct('<3f?3f')  # position, has target, target
+VIDEO_STRUCT = struct.Struct('<HHB16s')  # width, height, quality, camera id (followed by a raw JPEG frame)
+STATE_STRUCT = struct.Struct('<3f3f16sBB')  # position, rotation, status, number of left/right arm joints
+
+Message = Union[bytes, List[bytes]]
+
 
 class CommandType(Enum):
     """Standard command types for robot control."""
@@ -33,9 +58,34 @@ class ResponseType(Enum):
     PONG = "pong"
 
 
+COMMAND_CODES = {
+    CommandType.MOVE: 1,
+    CommandType.STOP: 2,
+    CommandType.RESET: 3,
+    CommandType.GET_STATE: 4,
+    CommandType.SET_ARM_JOINT: 5,
+    CommandType.SET_CAMERA_POSITION: 6,
+    CommandType.RESET_CAMERA: 7,
+    CommandType.PING: 8,
+}
+
+RESPONSE_CODES = {
+    ResponseType.SUCCESS: 1,
+    ResponseType.ERROR: 2,
+    ResponseType.STATE: 3,
+    ResponseType.VIDEO: 4,
+    ResponseType.PONG: 5,
+}
+
+COMMANDS_BY_CODE = {code: command for command, code in COMMAND_CODES.items()}
+RESPONSES_BY_CODE = {code: response for response, code in RESPONSE_CODES.items()}
+
+
 class RobotProtocol:
     """Unified protocol for robot communication."""
 
+    version = JSON_PROTOCOL_VERSION
+
     @staticmethod
     def encode_command(command_type: CommandType, data: Optional[Dict[str, Any]] = None) -> bytes:
         """Encode a command message for sending to robot host.
@@ -206,11 +256,14 @@ class RobotProtocol:
                 return None
 
             data = message.get("data", {})
-            frame_b64 = data.get("frame")
-            if not frame_b64:
+            frame = data.get("frame")
+            if not frame:
                 return None
 
-            return base64.b64decode(frame_b64)
+            # Binary messages carry the raw JPEG bytes
+            if isinstance(frame, bytes):
+                return frame
+            return base64.b64decode(frame)
         except Exception:
             return None
 
@@ -237,6 +290,52 @@ class RobotProtocol:
         }
         return RobotProtocol.encode_response(ResponseType.STATE, data)
 
+    @staticmethod
+    def encode_ping(protocol_versions: Sequence[int] = SUPPORTED_PROTOCOL_VERSIONS) -> bytes:
+        """Encode a ping command offering the protocol versions of the remote core.
+
+        Pings are always JSON, so that any host can answer them.
+
+        Args:
+            protocol_versions: Protocol versions the remote core can decode
+
+        Returns:
+            Encoded ping command
+        """
+        return RobotProtocol.encode_command(CommandType.PING, {"protocol_versions": list(protocol_versions)})
+
+    @staticmethod
+    def create_pong_response(ping: Dict[str, Any],
+                             protocol_versions: Sequence[int] = SUPPORTED_PROTOCOL_VERSIONS) -> bytes:
+        """Create the pong response of a host, selecting the protocol version to use.
+
+        Args:
+            ping: Decoded ping command
+            protocol_versions: Protocol versions the host can encode
+
+        Returns:
+            Encoded pong response with the selected 'protocol_version'
+        """
+        offered = ping.get("data", {}).get("protocol_versions", [JSON_PROTOCOL_VERSION])
+        common = set(offered) & set(protocol_versions)
+        version = max(common) if common else JSON_PROTOCOL_VERSION
+        return RobotProtocol.encode_response(ResponseType.PONG, {"protocol_version": version})
+
+    @staticmethod
+    def decode_multipart(frames: Sequence[bytes]) -> Dict[str, Any]:
+        """Decode a message received with `recv_multipart`, in any protocol version.
+
+        Args:
+            frames: Frames of the ZMQ message
+
+        Returns:
+            Decoded message dictionary, with the same fields for both versions
+        """
+        if frames and frames[0][:len(BINARY_MAGIC)] == BINARY_MAGIC:
+            return BinaryRobotProtocol.decode(frames)
+
+        return RobotProtocol.decode_response(frames[0] if frames else b'')
+
     @staticmethod
     def is_valid_message(message: Dict[str, Any]) -> bool:
         """Check if a message has valid structure.
@@ -284,4 +383,206 @@ class RobotProtocol:
         Returns:
             Encoded success response
         """
-        return RobotProtocol.encode_response(ResponseType.SUCCESS, data or {})
\ No newline at end of file
+        return RobotProtocol.encode_response(ResponseType.SUCCESS, data or {})
+
+
+class BinaryRobotProtocol(RobotProtocol):
+    """Binary framing of the robot protocol, for ZMQ multipart messages.
+
+    Each message is a fixed header frame followed by payload frames: a packed struct
+    for the frequent messages (moves, joints, state, video) and the raw JPEG bytes of
+    video frames, so that nothing is base64 or JSON encoded on the hot paths. The
+    encoders return a list of frames, to send with `send_multipart`.
+    """
+
+    version = BINARY_PROTOCOL_VERSION
+
+    @staticmethod
+    def _header(kind: int, code: int) -> bytes:
+        return BINARY_HEADER.pack(BINARY_MAGIC, BINARY_PROTOCOL_VERSION, kind, code, time.time())
+
+    @staticmethod
+    def _json_frames(data: Optional[Dict[str, Any]]) -> List[bytes]:
+        return [json.dumps(data).encode('utf-8')] if data else []
+
+    @staticmethod
+    def _pack_text(text: str, size: int) -> bytes:
+        encoded = text.encode('utf-8')
+        if len(encoded) > size:
+            raise ValueError(f"'{text}' does not fit in {size} bytes")
+        return encoded
+
+    @staticmethod
+    def _unpack_text(raw: bytes) -> str:
+        return raw.rstrip(b'\0').decode('utf-8')
+
+    @staticmethod
+    def encode_command(command_type: CommandType, data: Optional[Dict[str, Any]] = None) -> List[bytes]:
+        """Encode a command message for sending to robot host.
+
+        Args:
+            command_type: Type of command to send
+            data: Optional command data/parameters
+
+        Returns:
+            Frames of the encoded message
+        """
+        data = data or {}
+        header = BinaryRobotProtocol._header(KIND_COMMAND, COMMAND_CODES[command_type])
+        pack_text = BinaryRobotProtocol._pack_text
+
+        if command_type == CommandType.MOVE:
+            return [header, MOVE_STRUCT.pack(pack_text(data["direction"], 16), data.get("speed", 1.0))]
+
+        if command_type == CommandType.SET_ARM_JOINT:
+            payload = ARM_JOINT_STRUCT.pack(pack_text(data["arm"], 8), data["joint_index"], data["angle"])
+            return [header, payload]
+
+        if command_type == CommandType.SET_CAMERA_POSITION:
+            target = data.get("target")
+            payload = CAMERA_STRUCT.pack(*data["position"], target is not None, *(target or (0.0, 0.0, 0.0)))
+            return [header, payload]
+
+        return [header, *BinaryRobotProtocol._json_frames(data)]
+
+    @staticmethod
+    def encode_response(response_type: ResponseType, data: Optional[Dict[str, Any]] = None) -> List[bytes]:
+        """Encode a response message for sending from robot host.
+
+        Args:
+            response_type: Type of response
+            data: Response data
+
+        Returns:
+            Frames of the encoded message
+        """
+        header = BinaryRobotProtocol._header(KIND_RESPONSE, RESPONSE_CODES[response_type])
+        return [header, *BinaryRobotProtocol._json_frames(data)]
+
+    @staticmethod
+    def encode_move_command(direction: str, speed: float = 1.0) -> List[bytes]:
+        return BinaryRobotProtocol.encode_command(CommandType.MOVE, {"direction": direction, "speed": speed})
+
+    @staticmethod
+    def encode_arm_joint_command(arm: str, joint_index: int, angle: float) -> List[bytes]:
+        return BinaryRobotProtocol.encode_command(
+            CommandType.SET_ARM_JOINT,
+            {"arm": arm, "joint_index": joint_index, "angle": angle}
+        )
+
+    @staticmethod
+    def encode_camera_command(position: List[float], target: Optional[List[float]] = None) -> List[bytes]:
+        data = {"position": position}
+        if target:
+            data["target"] = target
+        return BinaryRobotProtocol.encode_command(CommandType.SET_CAMERA_POSITION, data)
+
+    @staticmethod
+    def encode_video_frame(frame_data: bytes, width: int, height: int,
+                          quality: int = 80, camera_id: str = "main") -> List[bytes]:
+        """Encode a video frame for transmission, as a raw JPEG frame.
+
+        Args:
+            frame_data: Raw image data (JPEG encoded)
+            width: Frame width
+            height: Frame height
+            quality: JPEG quality
+            camera_id: Camera identifier
+
+        Returns:
+            Frames of the encoded video message
+        """
+        header = BinaryRobotProtocol._header(KIND_RESPONSE, RESPONSE_CODES[ResponseType.VIDEO])
+        video = VIDEO_STRUCT.pack(width, height, quality, BinaryRobotProtocol._pack_text(camera_id, 16))
+        return [header, video, frame_data]
+
+    @staticmethod
+    def encode_robot_state(position: Dict[str, float], rotation: Dict[str, float],
+                          arm_joints: Dict[str, List[float]], status: str = "connected") -> List[bytes]:
+        """Encode robot state information.
+
+        Args:
+            position: Robot position {x, y, z}
+            rotation: Robot rotation {roll, pitch, yaw}
+            arm_joints: Arm joint positions {"left": [...], "right": [...]}
+            status: Robot status string
+
+        Returns:
+            Frames of the encoded state message
+        """
+        header = BinaryRobotProtocol._header(KIND_RESPONSE, RESPONSE_CODES[ResponseType.STATE])
+        left, right = arm_joints.get("left", []), arm_joints.get("right", [])
+        state = STATE_STRUCT.pack(
+            position["x"], position["y"], position["z"],
+            rotation["roll"], rotation["pitch"], rotation["yaw"],
+            BinaryRobotProtocol._pack_text(status, 16), len(left), len(right)
+        )
+        joints = np.asarray([*left, *right], dtype='<f4').tobytes()
+        return [header, state, joints]
+
+    @staticmethod
+    def decode(frames: Sequence[bytes]) -> Dict[str, Any]:
+        """Decode a binary message, into the same dictionary as the JSON protocol.
+
+        Args:
+            frames: Frames of the ZMQ message
+
+        Returns:
+            Decoded message dictionary, video frames are raw JPEG bytes
+        """
+        try:
+            magic, version, kind, code, timestamp = BINARY_HEADER.unpack(frames[0])
+            if magic != BINARY_MAGIC or version != BINARY_PROTOCOL_VERSION:
+                raise ValueError(f"unsupported binary protocol version {version}")
+
+            unpack_text = BinaryRobotProtocol._unpack_text
+            payload = frames[1:]
+            if kind == KIND_COMMAND:
+                command_type = COMMANDS_BY_CODE[code]
+                if command_type == CommandType.MOVE:
+                    direction, speed = MOVE_STRUCT.unpack(payload[0])
+                    data = {"direction": unpack_text(direction), "speed": speed}
+                elif command_type == CommandType.SET_ARM_JOINT:
+                    arm, joint_index, angle = ARM_JOINT_STRUCT.unpack(payload[0])
+                    data = {"arm": unpack_text(arm), "joint_index": joint_index, "angle": angle}
+                elif command_type == CommandType.SET_CAMERA_POSITION:
+                    values = CAMERA_STRUCT.unpack(payload[0])
+                    data = {"position": list(values[:3])}
+                    if values[3]:
+                        data["target"] = list(values[4:])
+                else:
+                    data = json.loads(payload[0]) if payload else {}
+                return {"type": "command", "command": command_type.value, "data": data, "timestamp": timestamp}
+
+            response_type = RESPONSES_BY_CODE[code]
+            if response_type == ResponseType.VIDEO:
+                width, height, quality, camera_id = VIDEO_STRUCT.unpack(payload[0])
+                data = {
+                    "frame": payload[1],
+                    "width": width,
+                    "height": height,
+                    "quality": quality,
+                    "camera_id": unpack_text(camera_id),
+                    "format": "jpeg"
+                }
+            elif response_type == ResponseType.STATE:
+                x, y, z, roll, pitch, yaw, status, num_left, num_right = STATE_STRUCT.unpack(payload[0])
+                joints = np.frombuffer(payload[1], dtype='<f4').tolist()
+                data = {
+                    "position": {"x": x, "y": y, "z": z},
+                    "rotation": {"roll": roll, "pitch": pitch, "yaw": yaw},
+                    "arm_joints": {"left": joints[:num_left], "right": joints[num_left:num_left + num_right]},
+                    "status": unpack_text(status),
+                    "timestamp": timestamp
+                }
+            else:
+                data = json.loads(payload[0]) if payload else {}
+            return {"type": "response", "response": response_type.value, "data": data, "timestamp": timestamp}
+
+        except (struct.error, KeyError, IndexError, ValueError) as e:
+            return {
+                "type": "error",
+                "response": ResponseType.ERROR.value,
+                "message": f"Failed to decode binary message: {e}",
+                "timestamp": time.time()
+            }
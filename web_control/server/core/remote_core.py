@@ -7,15 +7,25 @@ with robot hosts via ZeroMQ.
 """
 
 import asyncio
+import base64
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 
 import zmq
 import zmq.asyncio
 
 from .config import ServerConfig
-from .protocol import RobotProtocol, CommandType, ResponseType
+from .protocol import (
+    BINARY_PROTOCOL_VERSION,
+    JSON_PROTOCOL_VERSION,
+    BinaryRobotProtocol,
+    CommandType,
+    Message,
+    ResponseType,
+    RobotProtocol,
+)
 
 
 class RemoteCore:
@@ -40,6 +50,18 @@ class RemoteCore:
         self.last_ping_time = 0
         self.ping_interval = 5.0  # Ping every 5 seconds
 
+        # Commands are JSON until the host accepts the binary protocol in its pong
+        self.protocol = RobotProtocol
+
+        # Commands are queued and sent in order by a sender task, so callers never wait
+        # for the robot host. Consecutive moves are merged, only the latest one is sent.
+        self._command_queue: Deque[Tuple[Optional[str], Message]] = deque()
+        self._command_ready = asyncio.Event()
+        self.merged_commands = 0
+
+        # Coroutines called with the robot state whenever the host sends a new one
+        self.state_listeners: List[Callable[[Dict[str, Any]], Awaitable[None]]] = []
+
         # Robot state cache
         self.robot_state = {
             'status': 'disconnected',
@@ -53,6 +75,10 @@ class RemoteCore:
             }
         }
 
+        # Latest video frame of each camera, keyed by camera id
+        self._camera_frames: Dict[str, Dict[str, Any]] = {}
+        self._frame_sequence = 0
+
         # Setup logging
         self.logger = logging.getLogger(f"RemoteCore-{config.robot_type}")
         self.logger.setLevel(logging.INFO)
@@ -97,6 +123,7 @@ class RemoteCore:
                 # Start background tasks
                 asyncio.create_task(self._data_receiver_loop())
                 asyncio.create_task(self._ping_loop())
+                asyncio.create_task(self._command_sender_loop())
 
                 return True
             else:
@@ -118,6 +145,9 @@ class RemoteCore:
         try:
             self.connected = False
             self.robot_state['status'] = 'disconnected'
+            self.protocol = RobotProtocol
+            self._command_queue.clear()
+            self._command_ready.set()
 
             if self.cmd_socket:
                 self.cmd_socket.close()
@@ -137,6 +167,9 @@ class RemoteCore:
     async def move(self, direction: str, speed: float = 1.0) -> Dict[str, Any]:
         """Send movement command to robot.
 
+        The command is queued for the sender task, and replaces a move that was not
+        sent yet, so the call returns without waiting for the robot host.
+
         Args:
             direction: Movement direction (forward, backward, left, right, etc.)
             speed: Movement speed (0.0 to 1.0)
@@ -151,11 +184,11 @@ class RemoteCore:
             # Validate inputs
             speed = max(0.0, min(1.0, speed))  # Clamp speed to [0, 1]
 
-            # Send move command
-            cmd_data = RobotProtocol.encode_move_command(direction, speed)
-            await self.cmd_socket.send(cmd_data)
+            # Queue move command
+            cmd_data = self.protocol.encode_move_command(direction, speed)
+            self._queue_command(cmd_data, merge_key='move')
 
-            self.logger.debug(f"Sent move command: {direction} @ {speed}")
+            self.logger.debug(f"Queued move command: {direction} @ {speed}")
 
             return {
                 'status': 'success',
@@ -203,10 +236,10 @@ class RemoteCore:
             return {'status': 'error', 'message': 'Not connected to robot host'}
 
         try:
-            cmd_data = RobotProtocol.encode_arm_joint_command(arm, joint_index, angle)
-            await self.cmd_socket.send(cmd_data)
+            cmd_data = self.protocol.encode_arm_joint_command(arm, joint_index, angle)
+            self._queue_command(cmd_data)
 
-            self.logger.debug(f"Sent arm joint command: {arm}[{joint_index}] = {angle}")
+            self.logger.debug(f"Queued arm joint command: {arm}[{joint_index}] = {angle}")
 
             return {
                 'status': 'success',
@@ -229,12 +262,12 @@ class RemoteCore:
             return {'status': 'error', 'message': 'Not connected to robot host'}
 
         try:
-            cmd_data = RobotProtocol.encode_command(CommandType.RESET)
-            await self.cmd_socket.send(cmd_data)
+            cmd_data = self.protocol.encode_command(CommandType.RESET)
+            self._queue_command(cmd_data)
 
-            self.logger.info("Sent reset command")
+            self.logger.info("Queued reset command")
 
-            return {'status': 'success', 'message': 'Reset command sent'}
+            return {'status': 'success', 'message': 'Reset command queued'}
 
         except Exception as e:
             self.logger.error(f"Reset command failed: {e}")
@@ -254,7 +287,23 @@ class RemoteCore:
         Returns:
             Base64 encoded JPEG frame or None if unavailable
         """
-        return getattr(self, '_last_frame_b64', None)
+        frame_bytes = getattr(self, '_last_frame_bytes', None)
+        if frame_bytes is None:
+            return None
+        return base64.b64encode(frame_bytes).decode('utf-8')
+
+    async def get_latest_camera_frame(self, camera_id: str = "main") -> Optional[Dict[str, Any]]:
+        """Get the latest frame of a camera, without re-encoding it.
+
+        Args:
+            camera_id: Camera identifier
+
+        Returns:
+            Dict with the raw JPEG 'frame' bytes, its 'width' and 'height', and a
+            'sequence' number that increases with every received frame, or None if
+            no frame was received for this camera
+        """
+        return self._camera_frames.get(camera_id)
 
     async def set_camera_position(self, position: List[float], target: Optional[List[float]] = None) -> Dict[str, Any]:
         """Set camera position and target.
@@ -270,10 +319,10 @@ class RemoteCore:
             return {'status': 'error', 'message': 'Not connected to robot host'}
 
         try:
-            cmd_data = RobotProtocol.encode_camera_command(position, target)
-            await self.cmd_socket.send(cmd_data)
+            cmd_data = self.protocol.encode_camera_command(position, target)
+            self._queue_command(cmd_data)
 
-            self.logger.debug(f"Sent camera command: pos={position}, target={target}")
+            self.logger.debug(f"Queued camera command: pos={position}, target={target}")
 
             return {
                 'status': 'success',
@@ -295,12 +344,12 @@ class RemoteCore:
             return {'status': 'error', 'message': 'Not connected to robot host'}
 
         try:
-            cmd_data = RobotProtocol.encode_command(CommandType.RESET_CAMERA)
-            await self.cmd_socket.send(cmd_data)
+            cmd_data = self.protocol.encode_command(CommandType.RESET_CAMERA)
+            self._queue_command(cmd_data)
 
-            self.logger.debug("Sent camera reset command")
+            self.logger.debug("Queued camera reset command")
 
-            return {'status': 'success', 'message': 'Camera reset command sent'}
+            return {'status': 'success', 'message': 'Camera reset command queued'}
 
         except Exception as e:
             self.logger.error(f"Camera reset failed: {e}")
@@ -323,6 +372,49 @@ class RemoteCore:
             'connected': self.connected
         }
 
+    async def _send(self, message: Message) -> None:
+        """Send an encoded message, JSON bytes or binary frames."""
+        if isinstance(message, bytes):
+            await self.cmd_socket.send(message)
+        else:
+            await self.cmd_socket.send_multipart(message)
+
+    def _queue_command(self, message: Message, merge_key: Optional[str] = None) -> None:
+        """Queue a command for the sender task.
+
+        Args:
+            message: Encoded command
+            merge_key: Commands with a merge key replace the last queued command if it has
+                the same key and was not sent yet (latest wins)
+        """
+        if merge_key is not None and self._command_queue and self._command_queue[-1][0] == merge_key:
+            self._command_queue[-1] = (merge_key, message)
+            self.merged_commands += 1
+        else:
+            self._command_queue.append((merge_key, message))
+        self._command_ready.set()
+
+    async def _command_sender_loop(self):
+        """Background task sending the queued commands to the robot host, in order."""
+        while self.connected:
+            if not self._command_queue:
+                self._command_ready.clear()
+                await self._command_ready.wait()
+                continue
+
+            _, message = self._command_queue.popleft()
+            try:
+                await self._send(message)
+            except Exception as e:
+                self.logger.error(f"Command send failed: {e}")
+
+    def _set_protocol_version(self, version: int) -> None:
+        """Switch commands to the protocol version selected by the host."""
+        protocol = BinaryRobotProtocol if version == BINARY_PROTOCOL_VERSION else RobotProtocol
+        if protocol is not self.protocol:
+            self.protocol = protocol
+            self.logger.info(f"Using protocol version {protocol.version} with robot host")
+
     async def _ping_robot(self) -> bool:
         """Ping the robot host to test connectivity.
 
@@ -330,8 +422,12 @@ class RemoteCore:
             True if ping successful
         """
         try:
-            cmd_data = RobotProtocol.encode_command(CommandType.PING)
-            await self.cmd_socket.send(cmd_data)
+            # Pings are JSON and offer the protocol versions, the pong selects one
+            if self.config.robot_protocol == 'binary':
+                versions = [JSON_PROTOCOL_VERSION, BINARY_PROTOCOL_VERSION]
+            else:
+                versions = [JSON_PROTOCOL_VERSION]
+            await self._send(RobotProtocol.encode_ping(versions))
 
             # Wait for pong response (with timeout)
             start_time = time.time()
@@ -340,16 +436,17 @@ class RemoteCore:
             while time.time() - start_time < timeout:
                 try:
                     # Check for response
-                    data = await asyncio.wait_for(
-                        self.data_socket.recv(),
+                    frames = await asyncio.wait_for(
+                        self.data_socket.recv_multipart(),
                         timeout=0.1
                     )
-                    response = RobotProtocol.decode_response(data)
+                    response = RobotProtocol.decode_multipart(frames)
 
                     if response.get('response') == ResponseType.PONG.value:
+                        self._set_protocol_version(response.get('data', {}).get('protocol_version', JSON_PROTOCOL_VERSION))
                         return True
 
-                except asyncio.TimeoutError:
+                except (asyncio.TimeoutError, zmq.Again):
                     continue
                 except Exception:
                     break
@@ -383,27 +480,31 @@ class RemoteCore:
         while self.connected:
             try:
                 # Receive data with timeout
-                data = await asyncio.wait_for(
-                    self.data_socket.recv(),
+                frames = await asyncio.wait_for(
+                    self.data_socket.recv_multipart(),
                     timeout=self.config.polling_timeout_ms / 1000.0
                 )
 
-                # Decode response
-                response = RobotProtocol.decode_response(data)
+                # Decode response, JSON or binary
+                response = RobotProtocol.decode_multipart(frames)
 
                 # Process different response types
                 response_type = response.get('response')
 
                 if response_type == ResponseType.STATE.value:
                     self._update_robot_state(response.get('data', {}))
+                    await self._notify_state_listeners()
 
                 elif response_type == ResponseType.VIDEO.value:
                     self._update_video_frame(response.get('data', {}))
 
+                elif response_type == ResponseType.PONG.value:
+                    self._set_protocol_version(response.get('data', {}).get('protocol_version', JSON_PROTOCOL_VERSION))
+
                 elif response_type == ResponseType.ERROR.value:
                     self.logger.warning(f"Robot host error: {response.get('data', {}).get('message', 'Unknown error')}")
 
-            except asyncio.TimeoutError:
+            except (asyncio.TimeoutError, zmq.Again):
                 # Normal timeout - continue loop
                 continue
 
@@ -425,17 +526,33 @@ class RemoteCore:
         except Exception as e:
             self.logger.error(f"Failed to update robot state: {e}")
 
+    async def _notify_state_listeners(self):
+        """Push the updated robot state to the listeners."""
+        if not self.state_listeners:
+            return
+
+        state = await self.get_state()
+        for listener in self.state_listeners:
+            try:
+                await listener(state)
+            except Exception as e:
+                self.logger.error(f"State listener error: {e}")
+
     def _update_video_frame(self, video_data: Dict[str, Any]):
         """Update cached video frame from received data."""
         try:
-            # Cache base64 frame
-            frame_b64 = video_data.get('frame')
-            if frame_b64:
-                self._last_frame_b64 = frame_b64
-
+            # Cache raw JPEG frame, base64 is only decoded for JSON messages
+            if video_data.get('frame'):
                 frame_bytes = RobotProtocol.decode_video_frame({'response': ResponseType.VIDEO.value, 'data': video_data})
                 if frame_bytes:
                     self._last_frame_bytes = frame_bytes
+                    self._frame_sequence += 1
+                    self._camera_frames[video_data.get('camera_id', 'main')] = {
+                        'frame': frame_bytes,
+                        'width': video_data.get('width', self.config.video_width),
+                        'height': video_data.get('height', self.config.video_height),
+                        'sequence': self._frame_sequence,
+                    }
 
         except Exception as e:
             self.logger.error(f"Failed to update video frame: {e}")
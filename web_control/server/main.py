@@ -1,5 +1,4 @@
 import time
-import asyncio
 
 import socketio
 import uvicorn
@@ -22,7 +21,7 @@ video_manager.attach_remote_core(remote_core)
 
 
 def _init_client_state() -> dict:
-    now = time.time()
+    now = time.monotonic()
     return {
         'last_command_time': 0.0,
         'command_count': 0,
@@ -63,6 +62,12 @@ sio = socketio.AsyncServer(
     engineio_logger=True
 )
 
+async def broadcast_robot_state(state: dict) -> None:
+    """Push the robot state received from the host to all clients"""
+    await sio.emit('robot_state', state)
+
+remote_core.state_listeners.append(broadcast_robot_state)
+
 app = FastAPI(title="XLeRobot Web Control API", version="0.1.0")
 
 app.add_event_handler("startup", startup_event)
@@ -157,15 +162,9 @@ async def get_camera_info():
     except Exception as e:
         return {"error": f"Get camera info failed: {str(e)}"}
 
-# Rate limiting and throttling functions
-def check_rate_limit(sid: str) -> bool:
+# Rate limiting and throttling functions, on monotonic time
+def check_rate_limit(client_state: dict, current_time: float) -> bool:
     """Check if client is within rate limits"""
-    current_time = time.time()
-    client_state = client_states.get(sid)
-
-    if not client_state:
-        return True
-
     # Reset command count if window has passed
     if current_time - client_state['window_start'] >= RATE_LIMIT_CONFIG['rate_limit_window']:
         client_state['command_count'] = 0
@@ -173,14 +172,8 @@ def check_rate_limit(sid: str) -> bool:
 
     return client_state['command_count'] < RATE_LIMIT_CONFIG['max_commands_per_second']
 
-def check_throttle(sid: str) -> bool:
+def check_throttle(client_state: dict, current_time: float) -> bool:
     """Check if client is throttling commands too fast"""
-    current_time = time.time()
-    client_state = client_states.get(sid)
-
-    if not client_state:
-        return True
-
     # Check if client is in penalty period
     if (client_state['throttle_violations'] >= RATE_LIMIT_CONFIG['max_throttle_violations'] and
         current_time - client_state['last_throttle_time'] < RATE_LIMIT_CONFIG['throttle_penalty_duration']):
@@ -198,9 +191,8 @@ def check_throttle(sid: str) -> bool:
 
     return True
 
-def update_client_state(sid: str, *, timestamp: float) -> None:
+def update_client_state(client_state: dict, *, timestamp: float) -> None:
     """Update client state after successful command"""
-    client_state = client_states.setdefault(sid, _init_client_state())
     client_state['last_command_time'] = timestamp
     client_state['command_count'] += 1
 
@@ -217,12 +209,7 @@ async def disconnect(sid):
     """Client disconnect event"""
     print(f"Client disconnected: {sid}")
 
-    if sid in video_manager.stream_tasks:
-        task = video_manager.stream_tasks[sid]
-        if not task.cancelled():
-            task.cancel()
-            print(f"Cancelled video stream task for disconnected client {sid}")
-        del video_manager.stream_tasks[sid]
+    await video_manager.stop_stream(sid)
 
     if client_states.pop(sid, None) is not None:
         print(f"Cleaned up state for client {sid}")
@@ -235,28 +222,34 @@ async def ping(sid, data):
 
 @sio.event
 async def move_command(sid, data):
-    """Movement command handler with rate limiting and throttling"""
+    """Movement command handler with rate limiting and throttling.
+
+    The command is acknowledged as soon as it is queued to the robot sender task, the
+    robot state is pushed separately with 'robot_state' events.
+    """
     direction = data.get('direction')
     speed = data.get('speed', 1.0)
     timestamp = data.get('timestamp', time.time() * 1000)
 
-    current_time = time.time()
+    # Monotonic time for rate limiting, wall clock time for the client timestamps
+    current_time = time.monotonic()
+    server_timestamp = time.time() * 1000
+    client_state = client_states.setdefault(sid, _init_client_state())
 
     # Check rate limiting
-    if not check_rate_limit(sid):
+    if not check_rate_limit(client_state, current_time):
         await sio.emit('command_received', {
             'type': 'move',
             'status': 'rate_limited',
             'message': f'Rate limit exceeded: maximum {RATE_LIMIT_CONFIG["max_commands_per_second"]} commands per second',
             'max_rate': RATE_LIMIT_CONFIG['max_commands_per_second'],
             'client_timestamp': timestamp,
-            'server_timestamp': current_time * 1000
+            'server_timestamp': server_timestamp
         }, to=sid)
         return
 
     # Check throttling
-    if not check_throttle(sid):
-        client_state = client_states.setdefault(sid, _init_client_state())
+    if not check_throttle(client_state, current_time):
         await sio.emit('command_received', {
             'type': 'move',
             'status': 'throttled',
@@ -265,7 +258,7 @@ async def move_command(sid, data):
             'violations': client_state['throttle_violations'],
             'penalty_remaining': max(0, RATE_LIMIT_CONFIG['throttle_penalty_duration'] - (current_time - client_state['last_throttle_time'])) if client_state['throttle_violations'] >= RATE_LIMIT_CONFIG['max_throttle_violations'] else 0,
             'client_timestamp': timestamp,
-            'server_timestamp': current_time * 1000
+            'server_timestamp': server_timestamp
         }, to=sid)
         return
 
@@ -275,42 +268,40 @@ async def move_command(sid, data):
             'status': 'error',
             'message': 'Remote core not connected to robot host',
             'client_timestamp': timestamp,
-            'server_timestamp': current_time * 1000
+            'server_timestamp': server_timestamp
         }, to=sid)
         return
 
     # Log command with rate limiting info
-    client_state = client_states.setdefault(sid, _init_client_state())
     print(f"[{sid[:8]}] Move command: {direction} (speed={speed:.1f}) - count={client_state['command_count'] + 1}/{RATE_LIMIT_CONFIG['max_commands_per_second']}")
 
-    # Execute robot command
+    # Queue robot command, consecutive moves are merged by the sender task
     try:
         result = await remote_core.move(direction, speed)
+        if result.get('status') != 'success':
+            raise RuntimeError(result.get('message', 'Unknown error'))
 
         # Update client state after successful command
-        update_client_state(sid, timestamp=current_time)
-
-        # Get current robot state
-        robot_state = await remote_core.get_state()
+        update_client_state(client_state, timestamp=current_time)
 
         # Calculate latency
-        latency = (current_time * 1000) - timestamp if timestamp else 0
+        latency = server_timestamp - timestamp if timestamp else 0
 
-        # Send success response with detailed metrics
+        # Send acknowledgement with detailed metrics
         await sio.emit('command_received', {
             'type': 'move',
             'direction': direction,
-            'speed': speed,
-            'status': result.get('status', 'executed'),
-            'robot_state': robot_state,
+            'speed': result['speed'],
+            'status': 'queued',
             'metrics': {
                 'latency': latency,
                 'commands_in_window': client_state['command_count'],
                 'max_commands': RATE_LIMIT_CONFIG['max_commands_per_second'],
-                'throttle_violations': client_state['throttle_violations']
+                'throttle_violations': client_state['throttle_violations'],
+                'merged_commands': remote_core.merged_commands
             },
             'client_timestamp': timestamp,
-            'server_timestamp': current_time * 1000
+            'server_timestamp': server_timestamp
         }, to=sid)
 
     except Exception as e:
@@ -319,25 +310,17 @@ async def move_command(sid, data):
             'status': 'error',
             'message': f'Command execution failed: {str(e)}',
             'client_timestamp': timestamp,
-            'server_timestamp': current_time * 1000
+            'server_timestamp': server_timestamp
         }, to=sid)
 
 @sio.event
 async def start_video_stream(sid):
     """Start video streaming"""
     print(f"Client {sid} requested start video stream")
-    
-    if sid in video_manager.stream_tasks:
-        task = video_manager.stream_tasks[sid]
-        if not task.cancelled():
-            task.cancel()
-        del video_manager.stream_tasks[sid]
-    
-    result = await video_manager.start_stream()
+
+    # Frames are sent by the camera broadcaster, shared by all the clients
+    result = await video_manager.start_stream(sio, sid)
     await sio.emit('stream_status', result, to=sid)
-    
-    task = asyncio.create_task(video_manager.stream_frames(sio, sid))
-    video_manager.stream_tasks[sid] = task
 
 @sio.event
 async def stop_video_stream(sid):